@@ -1,5 +1,12 @@
-﻿import os
-import sys
+﻿import argparse
+import collections
+import os
+import re
+
+# Post-processes the SWIG generated UsdCsPINVOKE.cs. Each P/Invoke declaration is parsed and run
+# through RULES, which may decorate or rewrite it, and a report of the entry points which still
+# marshal non-blittable arguments can be written with --report. With --profile, every extern is
+# also wrapped to record its calls with USD.NET.InteropProfiler when USD_INTEROP_PROFILING is defined.
 
 DECORATORS = ["// ATTRIBUTE AUTOMATICALLY ADDED.",
               "[MonoPInvokeCallback]"]
@@ -22,28 +29,457 @@ METHODS_TO_DECORATE = ["SetPendingApplicationException(",
                       "EntryPoint=\"SWIGRegisterExceptionArgumentCallbacks_UsdCs",
                       "CreateString("]
 
+SUPPRESS_SECURITY_ATTRIBUTE = "[global::System.Security.SuppressUnmanagedCodeSecurity]"
+
+# Entry points registering managed callbacks are left untouched.
+EXCLUDED_ENTRY_POINTS = re.compile(r"^SWIGRegister")
+
+# The suffix of the renamed extern when a P/Invoke is given a managed wrapper.
+BLITTABLE_SUFFIX = "__blittable"
+
+# The suffix of the renamed extern when a P/Invoke is wrapped by profile_calls.
+PROFILE_SUFFIX = "__profiled"
+PROFILE_DEFINE = "USD_INTEROP_PROFILING"
+
+HELPER_MARKER = "// HELPER AUTOMATICALLY ADDED."
+PROFILER_MARKER = "// PROFILER AUTOMATICALLY ADDED."
+
+# Encodes string arguments as null terminated UTF-8, into a stack buffer when they fit. This is
+# what Mono does for string arguments, without the native allocation per call.
+HELPER = """\
+{i}{marker}
+{i}protected class SWIGUtf8Helper
+{i}{{
+{i}{u}public const int StackSize = 256;
+
+{i}{u}public static unsafe byte[] Encode(string value, byte* stackBuffer)
+{i}{u}{{
+{i}{u}{u}if (value == null)
+{i}{u}{u}{{
+{i}{u}{u}{u}return null;
+{i}{u}{u}}}
+
+{i}{u}{u}fixed (char* chars = value)
+{i}{u}{u}{{
+{i}{u}{u}{u}// A UTF-16 code unit never takes more than 3 bytes in UTF-8.
+{i}{u}{u}{u}if (value.Length < StackSize / 3)
+{i}{u}{u}{u}{{
+{i}{u}{u}{u}{u}int count = global::System.Text.Encoding.UTF8.GetBytes(chars, value.Length, stackBuffer, StackSize - 1);
+{i}{u}{u}{u}{u}stackBuffer[count] = 0;
+{i}{u}{u}{u}{u}return null;
+{i}{u}{u}{u}}}
+
+{i}{u}{u}{u}var heapBuffer = new byte[global::System.Text.Encoding.UTF8.GetByteCount(chars, value.Length) + 1];
+{i}{u}{u}{u}fixed (byte* bytes = heapBuffer)
+{i}{u}{u}{u}{{
+{i}{u}{u}{u}{u}global::System.Text.Encoding.UTF8.GetBytes(chars, value.Length, bytes, heapBuffer.Length - 1);
+{i}{u}{u}{u}}}
+{i}{u}{u}{u}return heapBuffer;
+{i}{u}{u}}}
+{i}{u}}}
+
+{i}{u}public static unsafe byte* Select(string value, byte* stackBuffer, byte* heapBuffer)
+{i}{u}{{
+{i}{u}{u}return value == null ? null : heapBuffer != null ? heapBuffer : stackBuffer;
+{i}{u}}}
+{i}}}
+
+"""
+
+BLITTABLE_TYPES = {"byte", "sbyte", "short", "ushort", "int", "uint", "long", "ulong", "float",
+                   "double", "System.IntPtr", "global::System.IntPtr", "System.UIntPtr",
+                   "global::System.UIntPtr"}
+BLITTABLE_PATTERNS = [re.compile(r"^pxr\.Gf\w+Value$"),  # Structs generated by gf.py.
+                      re.compile(r"\*$")]
+
+
+class Param(object):
+    def __init__(self, text):
+        self.text = text.strip()
+        match = re.match(r"^(?P<attrs>(?:\[[^\]]*\]\s*)*)(?P<comment>/\*\w+\*/\s*)?"
+                         r"(?P<mods>(?:(?:ref|out|in)\s+)*)(?P<type>.+?)\s+(?P<name>\w+)$",
+                         self.text)
+        self.attrs = match.group("attrs").strip() if match else ""
+        self.mods = match.group("mods").strip() if match else ""
+        self.type = match.group("type").strip() if match else self.text
+        self.name = match.group("name") if match else ""
+
+    def is_plain(self, type_name):
+        return not self.attrs and not self.mods and self.type == type_name and "/*" not in self.text
+
+
+class PInvoke(object):
+    """A DllImport extern declaration, with the attribute lines above it."""
+
+    DECL = re.compile(r"^(?P<indent>\s*)(?P<mods>(?:(?:public|internal|protected|private|static|unsafe)\s+)*)"
+                      r"extern\s+(?P<ret>\S+)\s+(?P<name>\w+)\s*\((?P<params>.*)\)\s*;\s*$", re.S)
+
+    def __init__(self, attr_lines, decl_lines):
+        self.attr_lines = attr_lines
+        self.decl_lines = decl_lines
+        self.entry_point = ""
+        for line in attr_lines:
+            match = re.search(r"EntryPoint\s*=\s*\"(\w+)\"", line)
+            if match:
+                self.entry_point = match.group(1)
+        self.match = PInvoke.DECL.match("".join(decl_lines).rstrip("\n"))
+        self.params = split_params(self.match.group("params")) if self.match else []
+        self.wrapper = []
+        self.profiled = []
+
+    @property
+    def indent(self):
+        return self.match.group("indent").lstrip("\n") if self.match else ""
+
+    @property
+    def name(self):
+        return self.match.group("name") if self.match else ""
+
+    @property
+    def ret(self):
+        return self.match.group("ret") if self.match else ""
+
+    def has_attribute(self, attribute):
+        return any(attribute in line for line in self.attr_lines)
+
+    def add_attribute(self, attribute):
+        self.attr_lines.append(self.indent + attribute + "\n")
+
+    def lines(self):
+        if self.profiled:
+            return (["#if {0}\n".format(PROFILE_DEFINE)] + self.attr_lines + self.profiled + ["#else\n"]
+                    + self.attr_lines + self.decl_lines + ["#endif\n"] + self.wrapper)
+        return self.attr_lines + self.decl_lines + self.wrapper
+
+
+def split_params(text):
+    """Splits a parameter list on commas which are not nested in brackets or parentheses."""
+    params, depth, current = [], 0, ""
+    for c in text:
+        if c in "[(<":
+            depth += 1
+        elif c in "])>":
+            depth -= 1
+        if c == "," and depth == 0:
+            params.append(Param(current))
+            current = ""
+        else:
+            current += c
+    if current.strip():
+        params.append(Param(current))
+    return params
+
+
+def indent_unit(indent):
+    return "    " if len(indent) % 4 == 0 else "  "
+
+
+# ----------------------------------------------------------------------------------------------- #
+# Rules
+# ----------------------------------------------------------------------------------------------- #
+
+def suppress_unmanaged_code_security(pinvoke):
+    """Skips the stack walk the runtime performs on calls to unmanaged code."""
+    if not pinvoke.has_attribute("SuppressUnmanagedCodeSecurity"):
+        pinvoke.add_attribute(SUPPRESS_SECURITY_ATTRIBUTE)
+
+
+def blittable_strings_and_bools(pinvoke):
+    """
+    Passes string arguments as UTF-8 pointers and bool arguments and results as the unsigned int
+    which SWIG uses for bool in C, through a managed wrapper with the original signature.
+    """
+    strings = [p for p in pinvoke.params if p.is_plain("string")]
+    bools = [p for p in pinvoke.params if p.is_plain("bool")]
+    returns_bool = pinvoke.ret == "bool"
+    if not strings and not bools and not returns_bool:
+        return
+
+    indent = pinvoke.indent
+    unit = indent_unit(indent)
+    name = pinvoke.name
+    extern_name = name + BLITTABLE_SUFFIX
+    unsafe = "unsafe " if strings else ""
+
+    extern_params, args = [], []
+    for p in pinvoke.params:
+        if p in strings:
+            extern_params.append("byte* " + p.name)
+            args.append("SWIGUtf8Helper.Select({0}, {0}_stack, {0}_heap)".format(p.name))
+        elif p in bools:
+            extern_params.append("uint " + p.name)
+            args.append("({0} ? 1u : 0u)".format(p.name))
+        else:
+            extern_params.append(p.text)
+            args.append(("{0} {1}".format(p.mods, p.name)).strip())
+
+    pinvoke.decl_lines = ["{0}static {1}extern {2} {3}({4});\n".format(
+        indent, unsafe, "uint" if returns_bool else pinvoke.ret, extern_name, ", ".join(extern_params))]
+
+    call = "{0}({1})".format(extern_name, ", ".join(args))
+    if returns_bool:
+        call = call + " != 0"
+    statement = ("return " + call if pinvoke.ret != "void" else call) + ";"
+
+    body = []
+    if strings:
+        for p in strings:
+            body.append("byte* {0}_stack = stackalloc byte[SWIGUtf8Helper.StackSize];".format(p.name))
+        body.append("fixed (byte* {0})".format(", ".join(
+            "{0}_heap = SWIGUtf8Helper.Encode({0}, {0}_stack)".format(p.name) for p in strings)))
+        body.append("{")
+        body.append(unit + statement)
+        body.append("}")
+    else:
+        body.append(statement)
+
+    wrapper = ["\n", "{0}public static {1}{2} {3}({4})\n".format(
+        indent, unsafe, pinvoke.ret, name, ", ".join(p.text for p in pinvoke.params))]
+    wrapper.append(indent + "{\n")
+    wrapper += [indent + unit + line + "\n" for line in body]
+    wrapper.append(indent + "}\n")
+    pinvoke.wrapper = wrapper
+
+
+RULES = [suppress_unmanaged_code_security,
+         blittable_strings_and_bools]
+
+
+def profile_calls(pinvoke, entry_id):
+    """
+    Renames the extern, after RULES were applied, and calls it through a wrapper with the same
+    signature which records the call with InteropProfiler. The original declaration is kept for
+    builds without PROFILE_DEFINE.
+    """
+    decl = PInvoke.DECL.match("".join(pinvoke.decl_lines).rstrip("\n"))
+    if not decl:
+        return False
+
+    indent = decl.group("indent").lstrip("\n")
+    unit = indent_unit(indent)
+    mods = decl.group("mods")
+    ret = decl.group("ret")
+    name = decl.group("name")
+    params = split_params(decl.group("params"))
+    extern_name = name + PROFILE_SUFFIX
+    unsafe = "unsafe " if "unsafe" in mods.split() else ""
+
+    call = "{0}({1})".format(extern_name, ", ".join(("{0} {1}".format(p.mods, p.name)).strip() for p in params))
+    statement = ("return " + call if ret != "void" else call) + ";"
+
+    lines = ["{0}static {1}extern {2} {3}({4});\n".format(indent, unsafe, ret, extern_name, decl.group("params")),
+             "\n",
+             "{0}{1} {2}({3})\n".format(mods, ret, name, decl.group("params")),
+             "{\n",
+             unit + "long swigStart = global::USD.NET.InteropProfiler.Begin();\n",
+             unit + "try\n",
+             unit + "{\n",
+             unit + unit + statement + "\n",
+             unit + "}\n",
+             unit + "finally\n",
+             unit + "{\n",
+             unit + unit + "global::USD.NET.InteropProfiler.End(swigProfilerEntryPoints + {0}, swigStart);\n".format(entry_id),
+             unit + "}\n",
+             "}\n"]
+    pinvoke.profiled = lines[:2] + [indent + line if line.strip() else line for line in lines[2:]]
+    return True
+
+
+# ----------------------------------------------------------------------------------------------- #
+# Report
+# ----------------------------------------------------------------------------------------------- #
+
+def marshaling_causes(pinvoke):
+    """Returns why the arguments and result of the extern are not blittable, if they are not."""
+    def cause(type_name, mods=""):
+        if type_name == "void" or type_name in BLITTABLE_TYPES or any(p.search(type_name) for p in BLITTABLE_PATTERNS):
+            return None
+        if type_name.endswith("HandleRef"):
+            return "HandleRef"
+        if type_name.endswith("[]"):
+            return "array"
+        if type_name in ("string", "bool", "char"):
+            return type_name
+        if "Delegate" in type_name:
+            return "delegate"
+        return "other ({0})".format(type_name)
+
+    causes = []
+    decl = PInvoke.DECL.match("".join(pinvoke.decl_lines).rstrip("\n"))
+    if not decl:
+        return ["unparsed"]
+    params = split_params(decl.group("params"))
+    ret = cause(decl.group("ret"))
+    if ret:
+        causes.append(ret + " result")
+    for p in params:
+        c = cause(p.type)
+        if c and c not in causes:
+            causes.append(c)
+    return causes
+
+
+def write_report(pinvokes, report_path):
+    by_cause = collections.Counter()
+    entries = []
+    for pinvoke in pinvokes:
+        causes = marshaling_causes(pinvoke)
+        for c in causes:
+            by_cause[c] += 1
+        if causes:
+            entries.append("  {0}: {1}".format(pinvoke.entry_point, ", ".join(causes)))
+
+    rewritten = len([p for p in pinvokes if p.wrapper])
+    lines = ["P/Invoke marshaling report for UsdCsPINVOKE.cs",
+             "",
+             "Entry points: {0}".format(len(pinvokes)),
+             "Blittable: {0}".format(len(pinvokes) - len(entries)),
+             "Given blittable string/bool signatures: {0}".format(rewritten),
+             "Still marshaling non-blittable arguments: {0}".format(len(entries)),
+             "",
+             "Non-blittable entry points by cause:"]
+    lines += ["  {0:<32} {1}".format(c, n) for c, n in by_cause.most_common()]
+    lines += ["", "Non-blittable entry points:"] + entries
+    with open(report_path, "w") as report:
+        report.write("\n".join(lines) + "\n")
+    print("{0} of {1} P/Invokes still marshal non-blittable arguments, see {2}\n".format(
+        len(entries), len(pinvokes), report_path))
+
+
+# ----------------------------------------------------------------------------------------------- #
+# Main
+# ----------------------------------------------------------------------------------------------- #
+
 def decorate(line):
     leading_spaces = len(line) - len(line.lstrip(' '))
     decorated = ["{0}{1}".format(" "*leading_spaces, d) for d in DECORATORS]
     decorated.append(line)
     return "\n".join(decorated)
 
-#TODO: add proper argument handling
+
+def add_callback_attributes(lines):
+    out = []
+    prev_line = ""
+    for line in lines:
+        if DECORATORS[1] not in prev_line and any(methods in line for methods in METHODS_TO_DECORATE):
+            out += decorate(line).splitlines(True)
+        else:
+            out.append(line)
+        prev_line = line
+    return out
+
+
+def add_helper(lines):
+    if any(HELPER_MARKER in line for line in lines):
+        return lines
+    for i, line in enumerate(lines):
+        if re.match(r"^\s*class UsdCsPINVOKE\b", line):
+            indent = lines[i + 1][:len(lines[i + 1]) - len(lines[i + 1].lstrip())]
+            indent += indent_unit(indent)
+            helper = HELPER.format(i=indent, u=indent_unit(indent), marker=HELPER_MARKER)
+            return lines[:i + 2] + helper.splitlines(True) + lines[i + 2:]
+    return lines
+
+
+def add_profiler_registration(lines, entry_points):
+    """Registers the names of the profiled entry points, in the order of their ids."""
+    for i, line in enumerate(lines):
+        if re.match(r"^\s*class UsdCsPINVOKE\b", line):
+            indent = lines[i + 1][:len(lines[i + 1]) - len(lines[i + 1].lstrip())]
+            indent += indent_unit(indent)
+            unit = indent_unit(indent)
+            registration = ["#if {0}\n".format(PROFILE_DEFINE),
+                            indent + PROFILER_MARKER + "\n",
+                            indent + "static readonly int swigProfilerEntryPoints = "
+                                     "global::USD.NET.InteropProfiler.RegisterEntryPoints(new string[]\n",
+                            indent + "{\n"]
+            registration += [indent + unit + "\"{0}\",\n".format(e) for e in entry_points]
+            registration += [indent + "});\n", "#endif\n", "\n"]
+            return lines[:i + 2] + registration + lines[i + 2:]
+    return lines
+
+
+def process(lines, profiled_entry_points=None):
+    """
+    Splits the lines into P/Invoke declarations, applies RULES to them and joins them back. When
+    given a list, the declarations are also wrapped by profile_calls and their entry points appended
+    to the list.
+    """
+    out, pinvokes = [], []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if "DllImport(" not in line:
+            out.append(line)
+            i += 1
+            continue
+
+        # Attributes above the declaration, including any added by add_callback_attributes.
+        attr_start = len(out)
+        while attr_start > 0 and out[attr_start - 1].strip().startswith(("[", "//")):
+            attr_start -= 1
+        attr_lines = out[attr_start:] + [line]
+        del out[attr_start:]
+        i += 1
+        while i < len(lines) and " extern " not in lines[i]:
+            attr_lines.append(lines[i])
+            i += 1
+        decl_lines = []
+        while i < len(lines):
+            decl_lines.append(lines[i])
+            i += 1
+            if decl_lines[-1].rstrip().endswith(";"):
+                break
+
+        pinvoke = PInvoke(attr_lines, decl_lines)
+        if pinvoke.match and not EXCLUDED_ENTRY_POINTS.match(pinvoke.entry_point) \
+                and not pinvoke.name.endswith(PROFILE_SUFFIX):
+            if not pinvoke.name.endswith(BLITTABLE_SUFFIX):
+                for rule in RULES:
+                    rule(pinvoke)
+            if profiled_entry_points is not None \
+                    and profile_calls(pinvoke, len(profiled_entry_points)):
+                profiled_entry_points.append(pinvoke.entry_point)
+        if pinvoke.match and not pinvoke.name.endswith(PROFILE_SUFFIX):
+            pinvokes.append(pinvoke)
+        out += pinvoke.lines()
+    return out, pinvokes
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Post-processes the SWIG generated UsdCsPINVOKE.cs.")
+    parser.add_argument("build_path", help="The directory holding UsdCsPINVOKE.cs, relative to this script.")
+    parser.add_argument("--report", help="Writes the P/Invokes which still marshal non-blittable arguments to this file.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Records the calls to each P/Invoke when " + PROFILE_DEFINE + " is defined.")
+    args = parser.parse_args()
+
     print("Adding MonoPInvokeCallback attribute to the appropriate methods ...\n")
-    build_path = sys.argv[1]
     cwd = os.path.abspath(os.path.dirname(__file__))
-    filein_path = os.path.join(cwd, build_path, "UsdCsPINVOKE.cs")
-    fileout_path = os.path.join(cwd, build_path, "UsdCsPINVOKE.cs.out")
-    prev_line = ""
-    with open(filein_path, "r") as filein, open(fileout_path, "w") as fileout:
-        for line in filein:
-            if DECORATORS[1] not in prev_line and any(methods in line for methods in METHODS_TO_DECORATE):
-                fileout.write(decorate(line))
-            else:
-                fileout.write(line)
-            prev_line = line
+    filein_path = os.path.join(cwd, args.build_path, "UsdCsPINVOKE.cs")
+    fileout_path = os.path.join(cwd, args.build_path, "UsdCsPINVOKE.cs.out")
+    with open(filein_path, "r", encoding="utf-8-sig") as filein:
+        lines = filein.readlines()
+
+    print("Optimizing P/Invoke marshaling ...\n")
+    lines = add_callback_attributes(lines)
+    lines = add_helper(lines)
+    # Profiling is only added once, as the original declarations are kept next to the wrappers.
+    profiled_entry_points = None
+    if args.profile and not any(PROFILER_MARKER in line for line in lines):
+        print("Adding interop profiling ...\n")
+        profiled_entry_points = []
+    lines, pinvokes = process(lines, profiled_entry_points)
+    if profiled_entry_points:
+        lines = add_profiler_registration(lines, profiled_entry_points)
+
+    with open(fileout_path, "w", encoding="utf-8") as fileout:
+        fileout.writelines(lines)
     os.replace(fileout_path, filein_path)
 
+    if args.report:
+        write_report(pinvokes, args.report)
+
+
 if __name__ == "__main__":
     main()
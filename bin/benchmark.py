@@ -0,0 +1,427 @@
+﻿#!/usr/bin/env python3 -B
+# Copyright 2023 Unity Technologies. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+# Performance benchmarks of USD.NET.
+#
+#   generate: writes synthetic stages with the USD python modules, along with a manifest listing them.
+#   run:      runs the Benchmark tests of the package in Unity batchmode against a manifest and writes
+#             the timings as JSON, optionally comparing them to a baseline.
+#   compare:  compares results to a baseline and fails if any benchmark regressed or is missing.
+#
+# The stages are deterministic, so results are comparable as long as they were generated with the same
+# preset and options.
+#
+
+import argparse
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import sys
+
+MANIFEST_NAME = "benchmark_stages.json"
+RESULTS_NAME = "benchmark_results.json"
+
+# Environment variables read by the C# harness (Tests/USD.NET.Unity/Benchmarks.cs).
+STAGES_ENV = "USD_BENCHMARK_STAGES"
+RESULTS_ENV = "USD_BENCHMARK_RESULTS"
+ITERATIONS_ENV = "USD_BENCHMARK_ITERATIONS"
+
+FORMATS = ["usda", "usdc"]
+
+PRESETS = {
+    "small": {"meshes": 16, "points": 1024, "depth": 6, "breadth": 3, "crowd": 4, "joints": 31,
+              "crowd_points": 1024, "xforms": 64, "frames": 48},
+    "medium": {"meshes": 128, "points": 16384, "depth": 8, "breadth": 3, "crowd": 32, "joints": 63,
+               "crowd_points": 4096, "xforms": 512, "frames": 240},
+    "large": {"meshes": 512, "points": 65536, "depth": 10, "breadth": 3, "crowd": 128, "joints": 127,
+              "crowd_points": 16384, "xforms": 2048, "frames": 1000},
+}
+
+
+def grid_topology(points):
+    """Returns the points per side, face vertex counts and indices of a square grid of about the given
+    number of points."""
+    side = max(2, int(math.sqrt(points)))
+    counts = [4] * ((side - 1) * (side - 1))
+    indices = []
+    for y in range(side - 1):
+        for x in range(side - 1):
+            i = y * side + x
+            indices += [i, i + 1, i + side + 1, i + side]
+    return side, counts, indices
+
+
+def grid_points(side, size=1.0):
+    step = size / (side - 1)
+    return [(x * step - size * 0.5, 0.0, y * step - size * 0.5) for y in range(side) for x in range(side)]
+
+
+def write_meshes(stage, options):
+    """N meshes of M points each, laid out on a grid."""
+    from pxr import Gf, UsdGeom, Vt
+
+    root = UsdGeom.Xform.Define(stage, "/Meshes")
+    side, counts, indices = grid_topology(options.points)
+    points = Vt.Vec3fArray([Gf.Vec3f(*p) for p in grid_points(side)])
+    normals = Vt.Vec3fArray([Gf.Vec3f(0, 1, 0)] * len(points))
+    extent = Vt.Vec3fArray([Gf.Vec3f(-0.5, 0, -0.5), Gf.Vec3f(0.5, 0, 0.5)])
+    counts = Vt.IntArray(counts)
+    indices = Vt.IntArray(indices)
+
+    columns = max(1, int(math.ceil(math.sqrt(options.meshes))))
+    for i in range(options.meshes):
+        mesh = UsdGeom.Mesh.Define(stage, root.GetPath().AppendChild("Mesh_{0}".format(i)))
+        mesh.AddTranslateOp().Set(Gf.Vec3d((i % columns) * 1.5, 0, (i // columns) * 1.5))
+        mesh.CreatePointsAttr(points)
+        mesh.CreateNormalsAttr(normals)
+        mesh.CreateExtentAttr(extent)
+        mesh.CreateFaceVertexCountsAttr(counts)
+        mesh.CreateFaceVertexIndicesAttr(indices)
+
+    return {"rootPath": "/Meshes", "meshes": options.meshes, "points": len(points), "prims": options.meshes + 1}
+
+
+def write_hierarchy(stage, options):
+    """A tree of transforms, breadth children per node down to the given depth."""
+    from pxr import Gf, Sdf, UsdGeom
+
+    count = [0]
+
+    def define(path, depth):
+        xform = UsdGeom.Xform.Define(stage, path)
+        xform.AddTranslateOp().Set(Gf.Vec3d(1, 0, 0))
+        count[0] += 1
+        if depth < options.depth:
+            for i in range(options.breadth):
+                define(path.AppendChild("Node_{0}".format(i)), depth + 1)
+
+    define(Sdf.Path("/Hierarchy"), 1)
+    return {"rootPath": "/Hierarchy", "prims": count[0], "depth": options.depth}
+
+
+def write_crowd(stage, options):
+    """Skinned characters, each a skeleton animated over the frame range bound to a grid mesh."""
+    from pxr import Gf, Sdf, UsdGeom, UsdSkel, Vt
+
+    # A binary tree of joints, each one unit above its parent.
+    joints = []
+    depths = []
+    for i in range(options.joints):
+        if i == 0:
+            joints.append("j0")
+            depths.append(0)
+        else:
+            parent = (i - 1) // 2
+            joints.append("{0}/j{1}".format(joints[parent], i))
+            depths.append(depths[parent] + 1)
+    joint_tokens = Vt.TokenArray(joints)
+    local = Vt.Matrix4dArray([Gf.Matrix4d(1).SetTranslate(Gf.Vec3d(0, 0 if i == 0 else 1, 0))
+                              for i in range(options.joints)])
+    world = Vt.Matrix4dArray([Gf.Matrix4d(1).SetTranslate(Gf.Vec3d(0, d, 0)) for d in depths])
+    translations = Vt.Vec3fArray([Gf.Vec3f(0, 0 if i == 0 else 1, 0) for i in range(options.joints)])
+    scales = Vt.Vec3hArray([Gf.Vec3h(1, 1, 1)] * options.joints)
+    rotations = []
+    for frame in range(options.frames):
+        angle = 30.0 * math.sin(2.0 * math.pi * frame / max(1, options.frames))
+        rotations.append(Vt.QuatfArray([Gf.Quatf(Gf.Rotation(Gf.Vec3d(0, 0, 1), angle + i).GetQuat())
+                                        for i in range(options.joints)]))
+
+    side, counts, indices = grid_topology(options.crowd_points)
+    points = Vt.Vec3fArray([Gf.Vec3f(*p) for p in grid_points(side, size=2.0)])
+    joint_indices = Vt.IntArray([i % options.joints for i in range(len(points))])
+    joint_weights = Vt.FloatArray([1.0] * len(points))
+    counts = Vt.IntArray(counts)
+    indices = Vt.IntArray(indices)
+
+    UsdGeom.Scope.Define(stage, "/Crowd")
+    for k in range(options.crowd):
+        agent = Sdf.Path("/Crowd/Agent_{0}".format(k))
+        root = UsdSkel.Root.Define(stage, agent)
+        root.AddTranslateOp().Set(Gf.Vec3d(k * 3.0, 0, 0))
+
+        skel = UsdSkel.Skeleton.Define(stage, agent.AppendChild("Skel"))
+        skel.CreateJointsAttr(joint_tokens)
+        skel.CreateBindTransformsAttr(world)
+        skel.CreateRestTransformsAttr(local)
+
+        anim = UsdSkel.Animation.Define(stage, agent.AppendChild("Anim"))
+        anim.CreateJointsAttr(joint_tokens)
+        anim.CreateTranslationsAttr(translations)
+        anim.CreateScalesAttr(scales)
+        rotations_attr = anim.CreateRotationsAttr()
+        for frame in range(options.frames):
+            rotations_attr.Set(rotations[frame], frame)
+
+        UsdSkel.BindingAPI.Apply(root.GetPrim()).CreateSkeletonRel().SetTargets([skel.GetPath()])
+        UsdSkel.BindingAPI.Apply(skel.GetPrim()).CreateAnimationSourceRel().SetTargets([anim.GetPath()])
+
+        mesh = UsdGeom.Mesh.Define(stage, agent.AppendChild("Body"))
+        mesh.CreatePointsAttr(points)
+        mesh.CreateFaceVertexCountsAttr(counts)
+        mesh.CreateFaceVertexIndicesAttr(indices)
+        binding = UsdSkel.BindingAPI.Apply(mesh.GetPrim())
+        binding.CreateJointIndicesPrimvar(False, 1).Set(joint_indices)
+        binding.CreateJointWeightsPrimvar(False, 1).Set(joint_weights)
+        binding.CreateGeomBindTransformAttr(Gf.Matrix4d(1))
+
+    return {"rootPath": "/Crowd", "prims": options.crowd * 4 + 1, "meshes": options.crowd,
+            "points": len(points), "joints": options.joints, "frames": options.frames,
+            "attribute": "rotations"}
+
+
+def write_time_samples(stage, options):
+    """Transforms with a sample on every frame."""
+    from pxr import Gf, UsdGeom
+
+    root = UsdGeom.Xform.Define(stage, "/Animated")
+    for i in range(options.xforms):
+        xform = UsdGeom.Xform.Define(stage, root.GetPath().AppendChild("Xform_{0}".format(i)))
+        op = xform.AddTransformOp()
+        for frame in range(options.frames):
+            angle = 360.0 * frame / max(1, options.frames) + i
+            m = Gf.Matrix4d(1).SetRotate(Gf.Rotation(Gf.Vec3d(0, 1, 0), angle))
+            m.SetTranslateOnly(Gf.Vec3d(i, frame * 0.1, 0))
+            op.Set(m, frame)
+
+    return {"rootPath": "/Animated", "prims": options.xforms + 1, "frames": options.frames,
+            "attribute": "xformOp:transform"}
+
+
+SCENARIOS = [
+    ("meshes", write_meshes),
+    ("hierarchy", write_hierarchy),
+    ("crowd", write_crowd),
+    ("timesamples", write_time_samples),
+]
+
+
+def generate(options):
+    """Writes every scenario in every format to the output directory and returns the manifest."""
+    from pxr import Usd, UsdGeom
+
+    os.makedirs(options.output, exist_ok=True)
+    stages = []
+    for kind, writer in SCENARIOS:
+        if options.scenarios and kind not in options.scenarios:
+            continue
+        for fmt in options.formats:
+            name = "{0}_{1}".format(kind, fmt)
+            filename = "{0}.{1}".format(name, fmt)
+            logging.info("Generating {0} ...".format(filename))
+
+            stage = Usd.Stage.CreateNew(os.path.join(options.output, filename))
+            UsdGeom.SetStageUpAxis(stage, UsdGeom.Tokens.y)
+            UsdGeom.SetStageMetersPerUnit(stage, 1.0)
+            stage.SetTimeCodesPerSecond(24)
+            stage.SetStartTimeCode(0)
+            stage.SetEndTimeCode(max(0, options.frames - 1))
+
+            entry = {"name": name, "file": filename, "kind": kind, "format": fmt, "rootPath": "/",
+                     "attribute": "", "prims": 0, "meshes": 0, "points": 0, "depth": 0, "joints": 0,
+                     "frames": 0}
+            entry.update(writer(stage, options))
+            stage.GetRootLayer().Save()
+            entry["bytes"] = os.path.getsize(os.path.join(options.output, filename))
+            stages.append(entry)
+
+    manifest = {
+        "usdVersion": ".".join(str(v) for v in Usd.GetVersion()),
+        "preset": options.preset,
+        "parameters": {k: getattr(options, k) for k in sorted(PRESETS["small"])},
+        "stages": stages,
+    }
+    with open(os.path.join(options.output, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def run(options):
+    """Runs the Benchmark tests in Unity batchmode and returns the path to the results."""
+    manifest = os.path.abspath(options.stages)
+    if os.path.isdir(manifest):
+        manifest = os.path.join(manifest, MANIFEST_NAME)
+    if not os.path.exists(manifest):
+        raise RuntimeError("No manifest at '{0}', run 'generate' first.".format(manifest))
+
+    results = os.path.abspath(options.results)
+    if os.path.exists(results):
+        os.remove(results)
+
+    env = os.environ.copy()
+    env[STAGES_ENV] = manifest
+    env[RESULTS_ENV] = results
+    env[ITERATIONS_ENV] = str(options.iterations)
+
+    output_dir = os.path.dirname(results)
+    cmd = [options.unity,
+           "-batchmode", "-nographics",
+           "-projectPath", os.path.abspath(options.project),
+           "-runTests", "-testPlatform", "EditMode",
+           "-testCategory", "Benchmark",
+           "-testResults", os.path.join(output_dir, "benchmark_tests.xml"),
+           "-logFile", os.path.join(output_dir, "benchmark_editor.log")]
+    logging.info("Running {0}".format(" ".join(cmd)))
+    p = subprocess.Popen(cmd, env=env)
+    p.wait()
+    if p.returncode != 0:
+        raise RuntimeError("Unity exited with code {0}, see {1}.".format(
+            p.returncode, os.path.join(output_dir, "benchmark_editor.log")))
+    if not os.path.exists(results):
+        raise RuntimeError("The benchmarks did not write '{0}'.".format(results))
+    return results
+
+
+def load_results(path):
+    with open(path) as f:
+        report = json.load(f)
+    return {(r["stage"], r["benchmark"]): r for r in report["results"]}
+
+
+def compare(results_path, baseline_path, metric, threshold, min_ms):
+    """Prints the change of each benchmark relative to the baseline and returns the failures.
+
+    A benchmark regresses when it is slower than the baseline by more than threshold percent and by
+    more than min_ms, so that noise on very short benchmarks is not reported. The failures are the
+    regressions and the benchmarks of the baseline missing from the results, e.g. because they threw.
+    """
+    current = load_results(results_path)
+    baseline = load_results(baseline_path)
+
+    regressions = []
+    missing = []
+    rows = []
+    for key in sorted(set(current) | set(baseline)):
+        if key not in baseline:
+            rows.append((key, None, current[key][metric], "new"))
+            continue
+        if key not in current:
+            rows.append((key, baseline[key][metric], None, "MISSING"))
+            missing.append(key)
+            continue
+
+        base = baseline[key][metric]
+        value = current[key][metric]
+        status = "ok"
+        if value > base * (1.0 + threshold / 100.0) and value - base > min_ms:
+            status = "REGRESSION"
+            regressions.append(key)
+        elif value < base * (1.0 - threshold / 100.0) and base - value > min_ms:
+            status = "improved"
+        rows.append((key, base, value, status))
+
+    def fmt(v):
+        return "-" if v is None else "{0:.3f}".format(v)
+
+    print("{0:<24} {1:<32} {2:>12} {3:>12} {4:>8}  {5}".format("Stage", "Benchmark", "Baseline", "Current",
+                                                              "Change", "Status"))
+    for (stage, benchmark), base, value, status in rows:
+        change = "-" if base is None or value is None or base == 0 else "{0:+.1f}%".format(
+            (value - base) * 100.0 / base)
+        print("{0:<24} {1:<32} {2:>12} {3:>12} {4:>8}  {5}".format(stage, benchmark, fmt(base), fmt(value),
+                                                                  change, status))
+    print("\n{0} of {1} benchmarks regressed by more than {2}% ({3}, ms).".format(
+        len(regressions), len(rows), threshold, metric))
+    if missing:
+        print("{0} benchmarks of the baseline are missing from the results.".format(len(missing)))
+    return regressions + missing
+
+
+def add_compare_arguments(parser):
+    parser.add_argument("--metric", default="medianMs", choices=["minMs", "medianMs", "meanMs", "maxMs"],
+                        help="The timing compared to the baseline.")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Relative slowdown, in percent, above which a benchmark regressed.")
+    parser.add_argument("--min_ms", type=float, default=1.0,
+                        help="Absolute slowdown, in milliseconds, below which a benchmark never regressed.")
+    parser.add_argument("--update_baseline", action="store_true", default=False,
+                        help="Replace the baseline with the results when nothing regressed or is missing.")
+
+
+def compare_and_update(results, options):
+    failures = compare(results, options.baseline, options.metric, options.threshold, options.min_ms)
+    if options.update_baseline:
+        if failures:
+            logging.warning("Not updating baseline {0}: {1} benchmarks regressed or are missing".format(
+                options.baseline, len(failures)))
+        else:
+            with open(results) as f:
+                report = f.read()
+            with open(options.baseline, "w") as f:
+                f.write(report)
+            logging.info("Updated baseline {0}".format(options.baseline))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    logging.getLogger().setLevel(logging.INFO)
+
+    parser = argparse.ArgumentParser(description="Performance benchmarks of USD.NET.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    gen_parser = subparsers.add_parser("generate", help="Generate the synthetic stages (requires USD python).")
+    gen_parser.add_argument("output", help="Directory the stages and their manifest are written to.")
+    gen_parser.add_argument("--preset", choices=sorted(PRESETS), default="small",
+                            help="The default size of every scenario.")
+    gen_parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    gen_parser.add_argument("--scenarios", nargs="+", choices=[s[0] for s in SCENARIOS], default=None,
+                            help="The scenarios generated. Defaults to all of them.")
+    gen_parser.add_argument("--meshes", type=int, help="Number of meshes of the meshes scenario.")
+    gen_parser.add_argument("--points", type=int, help="Number of points of each mesh of the meshes scenario.")
+    gen_parser.add_argument("--depth", type=int, help="Depth of the hierarchy scenario.")
+    gen_parser.add_argument("--breadth", type=int, help="Children of each node of the hierarchy scenario.")
+    gen_parser.add_argument("--crowd", type=int, help="Number of skinned characters of the crowd scenario.")
+    gen_parser.add_argument("--joints", type=int, help="Joints of each skeleton of the crowd scenario.")
+    gen_parser.add_argument("--crowd_points", type=int, help="Points of each mesh of the crowd scenario.")
+    gen_parser.add_argument("--xforms", type=int, help="Animated transforms of the timesamples scenario.")
+    gen_parser.add_argument("--frames", type=int, help="Frames sampled by the crowd and timesamples scenarios.")
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks in Unity batchmode.")
+    run_parser.add_argument("stages", help="A manifest written by 'generate', or its directory.")
+    run_parser.add_argument("--unity", required=True, help="Path to the Unity editor executable.")
+    run_parser.add_argument("--project", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                                                              "TestProject", "Usd-Development"),
+                            help="Unity project referencing the package. Defaults to TestProject/Usd-Development.")
+    run_parser.add_argument("--results", default=RESULTS_NAME, help="Path the results are written to.")
+    run_parser.add_argument("--iterations", type=int, default=5, help="Timed iterations of each benchmark.")
+    run_parser.add_argument("--baseline", help="Results to compare to after running.")
+    add_compare_arguments(run_parser)
+
+    compare_parser = subparsers.add_parser("compare", help="Compare results to a baseline.")
+    compare_parser.add_argument("results", help="Results written by 'run'.")
+    compare_parser.add_argument("baseline", help="Results to compare to.")
+    add_compare_arguments(compare_parser)
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        for key, value in PRESETS[args.preset].items():
+            if getattr(args, key) is None:
+                setattr(args, key, value)
+        manifest = generate(args)
+        logging.info("Wrote {0} stages to {1} ({2} {3}, USD {4})".format(
+            len(manifest["stages"]), args.output, platform.system(), platform.machine(), manifest["usdVersion"]))
+    elif args.command == "run":
+        results_path = run(args)
+        logging.info("Wrote {0}".format(results_path))
+        if args.baseline:
+            sys.exit(compare_and_update(results_path, args))
+    elif args.command == "compare":
+        sys.exit(compare_and_update(args.results, args))
@@ -1,12 +1,20 @@
 ﻿#!/usr/bin/env python3 -B
 from builtins import FileNotFoundError
 
+import concurrent.futures
+import hashlib
 import logging
 import os
 import platform
+import re
 import shlex
+import shutil
+import ssl
 import subprocess
 import argparse
+import urllib.error
+import urllib.parse
+import urllib.request
 import zipfile
 
 STEVEDORE_REPO = "https://artifactory.internal.unity3d.com/stevedore-testing"
@@ -15,6 +23,11 @@ USD_BINARIES = {"20.08": {"Windows": "usd-win-python36-x86_64/v20.08_1df762cff26
                           "Darwin": "usd-mac-python36-x86_64/v20.08_8b0dfc648fb4dcd06938901690e9201835cb79ad51ad9eee90e7b3cfc6b3bf2c.zip"}}
 PYTHON_VERSION = "36"
 
+# Archives are cached by the sha256 in their filename, so every checkout on a machine shares them.
+USD_CACHE_DIR = os.environ.get("USD_BINARIES_CACHE",
+                               os.path.join(os.path.expanduser("~"), ".cache", "usd-unity-sdk"))
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 def usd_python_dirname(usd_version, python_version):
     return "usd-v{0}".format(usd_version)
@@ -28,7 +41,157 @@ def usd_binaries_dirname(usd_version, python_version):
     return "usd-v{0}-python{1}".format(usd_version, python_version)
 
 
-def download_usd_binaries(usd_version, python_version=PYTHON_VERSION, output_dir=""):
+def usd_archive_sha(usd_archive):
+    """Returns the sha256 embedded in a USD_BINARIES archive name, e.g. v20.08_<sha>.zip."""
+    match = re.search(r"_([0-9a-f]{64})\.zip$", usd_archive)
+    if not match:
+        raise ValueError("No sha256 in USD archive name: {0}".format(usd_archive))
+    return match.group(1)
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def open_usd_archive(source, usd_archive, offset=0):
+    """Opens the archive from source for reading, starting at offset when the source supports it.
+
+    source is either a local directory, holding the archives with or without their Stevedore
+    sub-directory, or a URL (http, https or file) under which the archive path is appended.
+    Returns (stream, offset) where offset is where the stream actually starts.
+    """
+    if "://" not in source:
+        path = os.path.join(source, usd_archive)
+        if not os.path.exists(path):
+            path = os.path.join(source, os.path.basename(usd_archive))
+        f = open(path, "rb")
+        f.seek(offset)
+        return f, offset
+
+    url = "{0}/{1}".format(source.rstrip("/"), usd_archive)
+    request = urllib.request.Request(url)
+    if offset and urllib.parse.urlparse(url).scheme in ["http", "https"]:
+        request.add_header("Range", "bytes={0}-".format(offset))
+    # Like the previous wget --no-check-certificate: the content is verified against its sha256.
+    response = urllib.request.urlopen(request, context=ssl._create_unverified_context())
+    if getattr(response, "status", None) != 206:
+        offset = 0
+    return response, offset
+
+
+def fetch_usd_archive(source, usd_archive, cache_dir):
+    """Returns the path of the archive in the cache, downloading it first if needed.
+
+    The download is streamed to a .part file, which is resumed if a previous download was
+    interrupted, and is only moved into the cache once its sha256 matches the archive name.
+    """
+    sha = usd_archive_sha(usd_archive)
+    archives_dir = os.path.join(cache_dir, "archives")
+    archive_path = os.path.join(archives_dir, sha + ".zip")
+    if os.path.exists(archive_path):
+        # Guard against an archive which was corrupted after it was added to the cache.
+        if sha256_file(archive_path) == sha:
+            return archive_path
+        logging.warning("Removing corrupted archive from the cache: {0}".format(archive_path))
+        os.remove(archive_path)
+
+    os.makedirs(archives_dir, exist_ok=True)
+    part_path = archive_path + ".part"
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+
+    logging.info("Downloading {0} from {1} ...".format(os.path.basename(usd_archive), source))
+    stream, offset = open_usd_archive(source, usd_archive, offset)
+    h = hashlib.sha256()
+    with stream, open(part_path, "r+b" if offset else "wb") as f:
+        if offset:
+            logging.info("Resuming download at {0} MB".format(offset // (1024 * 1024)))
+            # Hash the bytes already downloaded, then append the remainder.
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                h.update(chunk)
+            f.seek(offset)
+            f.truncate()
+        size = offset
+        for chunk in iter(lambda: stream.read(DOWNLOAD_CHUNK_SIZE), b""):
+            f.write(chunk)
+            h.update(chunk)
+            size += len(chunk)
+            if size % (64 * DOWNLOAD_CHUNK_SIZE) < len(chunk):
+                logging.info("  {0} MB".format(size // (1024 * 1024)))
+
+    if h.hexdigest() != sha:
+        os.remove(part_path)
+        raise RuntimeError("Checksum mismatch for {0}: expected {1}, got {2}".format(usd_archive, sha,
+                                                                                     h.hexdigest()))
+    os.replace(part_path, archive_path)
+    return archive_path
+
+
+def _extract_members(archive_path, members, output_path):
+    # Each worker opens its own handle, ZipFile objects can't be shared between threads.
+    with zipfile.ZipFile(archive_path, "r") as usd_zip:
+        for member in members:
+            path = usd_zip.extract(member, output_path)
+            # Keep the unix permissions, extract() drops them.
+            mode = (member.external_attr >> 16) & 0o777
+            if mode and not member.is_dir():
+                os.chmod(path, mode)
+
+
+def extract_usd_archive(archive_path, output_path, jobs=None):
+    """Extracts the archive to output_path in parallel, splitting the members across jobs workers.
+
+    The archive is extracted next to output_path and renamed once complete, so an interrupted
+    extraction is never mistaken for a complete one.
+    """
+    tmp_path = "{0}.{1}.tmp".format(output_path, os.getpid())
+    if os.path.exists(tmp_path):
+        shutil.rmtree(tmp_path)
+    with zipfile.ZipFile(archive_path, "r") as usd_zip:
+        members = usd_zip.infolist()
+
+    try:
+        # Create every directory up front: extract() creates missing parents without exist_ok, so workers
+        # extracting files of the same directory would race on it.
+        for member in members:
+            parts = [p for p in member.filename.split("/") if p not in ("", ".", "..")]
+            if not member.is_dir():
+                parts = parts[:-1]
+            os.makedirs(os.path.join(tmp_path, *parts), exist_ok=True)
+
+        jobs = jobs or os.cpu_count() or 1
+        # Deal the files out by size, so each worker gets a similar amount of data to inflate.
+        files = sorted((m for m in members if not m.is_dir()), key=lambda m: m.file_size, reverse=True)
+        batches = [files[i::jobs] for i in range(jobs)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_extract_members, archive_path, batch, tmp_path) for batch in batches if batch]
+            for future in futures:
+                future.result()
+    except BaseException:
+        # The temporary folder is named after this process, nothing else would ever clean it up.
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    try:
+        os.rename(tmp_path, output_path)
+    except OSError:
+        # Another process finished extracting the same archive first.
+        shutil.rmtree(tmp_path)
+        if not os.path.exists(output_path):
+            raise
+
+
+def download_usd_binaries(usd_version, python_version=PYTHON_VERSION, output_dir="", source=STEVEDORE_REPO,
+                          cache_dir=USD_CACHE_DIR, jobs=None):
+    """Returns the paths of the USD builds with and without python, downloading them if needed.
+
+    Binaries already extracted to output_dir, e.g. by a previous version of this script, are used
+    as is. Otherwise the archive is fetched from source into the cache and extracted there once,
+    keyed by its sha256, and the returned paths point into the cache.
+    """
     output_dir = os.path.abspath(output_dir)
     if not os.path.exists(output_dir):
         logging.error("Target path doesn't exist: {0}".format(output_dir))
@@ -42,20 +205,16 @@ def download_usd_binaries(usd_version, python_version=PYTHON_VERSION, output_dir
                                                                                                             ",".join(USD_BINARIES.keys())))
         raise ex
 
-    usd_archive_path = os.path.join(output_dir, artifactory_usd_archive.split('/')[-1])
-
     if not os.path.exists(output_path):
-        # Download usd archive from artifactory/stevedore
-        if not os.path.exists(usd_archive_path):
-            logging.info("Downloading USD v{0} for python {1} to {2} ...".format(usd_version, python_version, output_dir))
-            p = subprocess.Popen(shlex.split('wget --no-check-certificate -P "{0}" {1}/{2}'.format(output_dir, STEVEDORE_REPO,
-                                                                            artifactory_usd_archive)))
-            p.wait()
-
-        # Extract archive
-        logging.info("Extracting to {} ...\n".format(output_path))
-        with zipfile.ZipFile(usd_archive_path, 'r') as usd_zip:
-            usd_zip.extractall(output_path)
+        sha = usd_archive_sha(artifactory_usd_archive)
+        output_path = os.path.join(cache_dir, "extracted", sha)
+        if os.path.exists(output_path):
+            logging.info("Using cached USD v{0} binaries from {1}".format(usd_version, output_path))
+        else:
+            archive_path = fetch_usd_archive(source, artifactory_usd_archive, cache_dir)
+            logging.info("Extracting to {} ...\n".format(output_path))
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            extract_usd_archive(archive_path, output_path, jobs)
 
     usd_python_path = os.path.join(output_path, usd_python_dirname(usd_version, python_version))
     usd_no_python_path = os.path.join(output_path, usd_no_python_dirname(usd_version))
@@ -78,6 +237,14 @@ if __name__ == "__main__":
     parser.add_argument("--download", dest="download_usd_binaries", action="store_true", default=False,
                         help="Download USD binaries from Unity's Stevedore internal repository. "
                         "Refer to BUILDING.md for command used to build the libraries")
+    parser.add_argument("--usd_source", dest="usd_source", default=os.environ.get("USD_BINARIES_SOURCE", STEVEDORE_REPO),
+                        help="Where --download fetches the USD archives from: a URL (http, https or file://) or a "
+                             "local directory mirroring Stevedore. Defaults to $USD_BINARIES_SOURCE or Stevedore.")
+    parser.add_argument("--usd_cache", dest="usd_cache", default=USD_CACHE_DIR,
+                        help="Directory where downloaded USD archives are cached and extracted, shared between "
+                             "checkouts. Defaults to $USD_BINARIES_CACHE or ~/.cache/usd-unity-sdk.")
+    parser.add_argument("--jobs", dest="jobs", type=int, default=None,
+                        help="Number of threads used to extract the USD archive. Defaults to the number of CPUs.")
     parser.add_argument("--clean", dest="cmake_target", action="store_const", const="clean", default="install",
                         help="Call cmake with the clean target.")
     parser.add_argument("--component", dest="component", choices=["usdcs", "usdnet", "tests"], default="usdcs")
@@ -101,7 +268,8 @@ if __name__ == "__main__":
     if args.download_usd_binaries:
         try:
             (usd_python_dir_path, usd_no_python_dir_path) = download_usd_binaries(args.usd_version, PYTHON_VERSION,
-                                                                                  library_path)
+                                                                                  library_path, args.usd_source,
+                                                                                  args.usd_cache, args.jobs)
         except KeyError:
             exit()
     else:
@@ -21,8 +21,14 @@ if __name__ == "__main__":
     usd_python_path = os.path.join(usd_location, "lib", "python")
     new_env["PYTHONPATH"] = os.pathsep.join([usd_python_path, new_env.get("PYTHONPATH", "")])
 
-    # Spawn a python process with the new environment
-    cmd = ["python3", "src/Swig/scripts/gen.py", out_path]
+    # Spawn a python process with the new environment. Any extra arguments are forwarded to gen.py.
+    cmd = ["python3", "src/Swig/scripts/gen.py", out_path] + sys.argv[3:]
+
+    # Without USD python, reuse the schema snapshot captured by a previous run, if there is one.
+    snapshot_path = os.path.join(out_path, "schema_snapshot.json")
+    if not os.path.exists(usd_python_path) and "--snapshot" not in cmd and os.path.exists(snapshot_path):
+        logging.info("USD python not found, generating from {0}".format(snapshot_path))
+        cmd += ["--snapshot", snapshot_path]
     p = subprocess.Popen(cmd, env=new_env, cwd=os.path.join(os.getcwd(), '..'))
     p.wait()
     if p.returncode != 0:
@@ -28,6 +28,43 @@ namespace USD.NET.Unity
 
         private static bool isInitialized = false;
 
+        // Scalar Gf values are read by value, rather than through a proxy object (and its finalizer)
+        // per value. A VtValue holding another type reads as zeros, as with the proxy accessors.
+        private static pxr.GfVec2fValue GetVec2f(pxr.VtValue value)
+        {
+            pxr.GfVec2fValue ret;
+            pxr.UsdCs.VtValueToGfVec2fValue(value, out ret);
+            return ret;
+        }
+
+        private static pxr.GfVec3fValue GetVec3f(pxr.VtValue value)
+        {
+            pxr.GfVec3fValue ret;
+            pxr.UsdCs.VtValueToGfVec3fValue(value, out ret);
+            return ret;
+        }
+
+        private static pxr.GfVec4fValue GetVec4f(pxr.VtValue value)
+        {
+            pxr.GfVec4fValue ret;
+            pxr.UsdCs.VtValueToGfVec4fValue(value, out ret);
+            return ret;
+        }
+
+        private static pxr.GfQuatfValue GetQuatf(pxr.VtValue value)
+        {
+            pxr.GfQuatfValue ret;
+            pxr.UsdCs.VtValueToGfQuatfValue(value, out ret);
+            return ret;
+        }
+
+        private static pxr.GfMatrix4dValue GetMatrix4d(pxr.VtValue value)
+        {
+            pxr.GfMatrix4dValue ret;
+            pxr.UsdCs.VtValueToGfMatrix4dValue(value, out ret);
+            return ret;
+        }
+
         /// <summary>
         /// Registers Unity-specifc data type conversions in the global type binder (UsdIo.Bindings).
         /// </summary>
@@ -42,8 +79,8 @@ namespace USD.NET.Unity
             // Quaternion
             //
             binder.BindType(typeof(Quaternion), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.QuaternionToQuatf((Quaternion)obj),
-                (pxr.VtValue value) => UnityTypeConverter.QuatfToQuaternion(value),
+                (object obj) => UnityTypeConverter.QuaternionToQuatfValue((Quaternion)obj),
+                (pxr.VtValue value) => UnityTypeConverter.QuatfToQuaternion(GetQuatf(value)),
                 SdfValueTypeNames.Quatf));
             binder.BindArrayType<UnityTypeConverter>(typeof(Quaternion[]), typeof(pxr.VtQuatfArray), SdfValueTypeNames.QuatfArray);
             binder.BindArrayType<UnityTypeConverter>(typeof(List<Quaternion>), typeof(pxr.VtQuatfArray), SdfValueTypeNames.QuatfArray, "List");
@@ -52,26 +89,26 @@ namespace USD.NET.Unity
             // Scalar Vector{2,3,4}
             //
             binder.BindType(typeof(Vector2), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.Vector2ToVec2f((Vector2)obj),
-                (pxr.VtValue value) => UnityTypeConverter.Vec2fToVector2(value),
+                (object obj) => UnityTypeConverter.Vector2ToVec2fValue((Vector2)obj),
+                (pxr.VtValue value) => UnityTypeConverter.Vec2fToVector2(GetVec2f(value)),
                 SdfValueTypeNames.Float2));
             binder.AddTypeAlias(SdfValueTypeNames.TexCoord2f, SdfValueTypeNames.Float2);
             binder.BindType(typeof(Vector3), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.Vector3ToVec3f((Vector3)obj),
-                (pxr.VtValue value) => UnityTypeConverter.Vec3fToVector3(value),
+                (object obj) => UnityTypeConverter.Vector3ToVec3fValue((Vector3)obj),
+                (pxr.VtValue value) => UnityTypeConverter.Vec3fToVector3(GetVec3f(value)),
                 SdfValueTypeNames.Float3));
             binder.AddTypeAlias(SdfValueTypeNames.TexCoord3f, SdfValueTypeNames.Float3);
             binder.BindType(typeof(Vector4), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.Vector4ToVec4f((Vector4)obj),
-                (pxr.VtValue value) => UnityTypeConverter.Vec4fToVector4(value),
+                (object obj) => UnityTypeConverter.Vector4ToVec4fValue((Vector4)obj),
+                (pxr.VtValue value) => UnityTypeConverter.Vec4fToVector4(GetVec4f(value)),
                 SdfValueTypeNames.Float4));
 
             //
             // Scaler Rect <-> GfVec4f
             //
             binder.BindType(typeof(Rect), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.RectToVtVec4((Rect)obj),
-                (pxr.VtValue value) => UnityTypeConverter.Vec4fToRect(value),
+                (object obj) => UnityTypeConverter.RectToVec4fValue((Rect)obj),
+                (pxr.VtValue value) => UnityTypeConverter.Vec4fToRect(GetVec4f(value)),
                 SdfValueTypeNames.Float4));
 
             //
@@ -97,13 +134,13 @@ namespace USD.NET.Unity
                 SdfValueTypeNames.Color4fArray));
 
             binder.BindType(typeof(Color), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.ColorToVec4f(((Color)obj)),
-                (pxr.VtValue vtVal) => UnityTypeConverter.Vec4fToColor(vtVal),
+                (object obj) => UnityTypeConverter.ColorToVec4fValue(((Color)obj)),
+                (pxr.VtValue vtVal) => UnityTypeConverter.Vec4fToColor(GetVec4f(vtVal)),
                 SdfValueTypeNames.Color4f));
 
             binder.BindType(typeof(Color32), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.Color32ToVec4f(((Color32)obj)),
-                (pxr.VtValue vtVal) => UnityTypeConverter.Vec4fToColor32(vtVal),
+                (object obj) => UnityTypeConverter.Color32ToVec4fValue(((Color32)obj)),
+                (pxr.VtValue vtVal) => UnityTypeConverter.Vec4fToColor32(GetVec4f(vtVal)),
                 SdfValueTypeNames.Color4f));
 
             binder.BindType(typeof(Bounds), new UsdTypeBinding(
@@ -114,6 +151,20 @@ namespace USD.NET.Unity
             binder.BindArrayType<UnityTypeConverter>(typeof(List<Color>), typeof(pxr.VtVec4fArray), SdfValueTypeNames.Color4fArray);
             binder.BindArrayType<UnityTypeConverter>(typeof(Color32[]), typeof(pxr.VtVec4fArray), SdfValueTypeNames.Color4fArray);
 
+            //
+            // Types sharing the memory layout of the USD float vectors are written straight from
+            // managed memory, without a VtValue. Color32, Quaternion and Matrix4x4 must be converted.
+            //
+            binder.BindAttributeWriter(typeof(Vector2), typeof(pxr.GfVec2f));
+            binder.BindAttributeWriter(typeof(Vector3), typeof(pxr.GfVec3f));
+            binder.BindAttributeWriter(typeof(Vector4), typeof(pxr.GfVec4f));
+            binder.BindAttributeWriter(typeof(Rect), typeof(pxr.GfVec4f));
+            binder.BindAttributeWriter(typeof(Color), typeof(pxr.GfVec4f));
+            binder.BindAttributeWriter(typeof(Vector2[]), typeof(pxr.VtVec2fArray));
+            binder.BindAttributeWriter(typeof(Vector3[]), typeof(pxr.VtVec3fArray));
+            binder.BindAttributeWriter(typeof(Vector4[]), typeof(pxr.VtVec4fArray));
+            binder.BindAttributeWriter(typeof(Color[]), typeof(pxr.VtVec4fArray));
+
             //
             // Matrix4x4
             //
@@ -122,8 +173,8 @@ namespace USD.NET.Unity
             // In the future, it may be nice to support single-precision for clients who aren't targeting
             // UsdGeom.
             binder.BindType(typeof(Matrix4x4), new UsdTypeBinding(
-                (object obj) => UnityTypeConverter.ToGfMatrix(((Matrix4x4)obj)),
-                (pxr.VtValue vtVal) => UnityTypeConverter.FromMatrix((pxr.GfMatrix4d)vtVal),
+                (object obj) => UnityTypeConverter.ToGfMatrix4dValue(((Matrix4x4)obj)),
+                (pxr.VtValue vtVal) => UnityTypeConverter.FromMatrix(GetMatrix4d(vtVal)),
                 SdfValueTypeNames.Matrix4d));
 
             binder.BindArrayType<UnityTypeConverter>(typeof(Matrix4x4[]), typeof(pxr.VtMatrix4dArray), SdfValueTypeNames.Matrix4dArray);
@@ -17,6 +17,8 @@ using System;
 using System.Collections.Generic;
 using System.Linq;
 using pxr;
+using Unity.Collections;
+using Unity.Collections.LowLevel.Unsafe;
 using UnityEngine;
 
 namespace USD.NET.Unity
@@ -419,16 +421,65 @@ namespace USD.NET.Unity
             return ret;
         }
 
+        /// <summary>
+        /// Converts a matrix passed by value, without allocating a GfMatrix4d. As with the
+        /// GfMatrix4d overloads, the USD rows become the Unity columns.
+        /// </summary>
+        [Preserve]
+        static public GfMatrix4dValue ToGfMatrix4dValue(UnityEngine.Matrix4x4 m)
+        {
+            var ret = new GfMatrix4dValue();
+            ret.m00 = m.m00; ret.m01 = m.m10; ret.m02 = m.m20; ret.m03 = m.m30;
+            ret.m10 = m.m01; ret.m11 = m.m11; ret.m12 = m.m21; ret.m13 = m.m31;
+            ret.m20 = m.m02; ret.m21 = m.m12; ret.m22 = m.m22; ret.m23 = m.m32;
+            ret.m30 = m.m03; ret.m31 = m.m13; ret.m32 = m.m23; ret.m33 = m.m33;
+            return ret;
+        }
+
+        [Preserve]
+        static public UnityEngine.Matrix4x4 FromMatrix(GfMatrix4dValue m)
+        {
+            var ret = new UnityEngine.Matrix4x4();
+            ret.m00 = (float)m.m00; ret.m01 = (float)m.m10; ret.m02 = (float)m.m20; ret.m03 = (float)m.m30;
+            ret.m10 = (float)m.m01; ret.m11 = (float)m.m11; ret.m12 = (float)m.m21; ret.m13 = (float)m.m31;
+            ret.m20 = (float)m.m02; ret.m21 = (float)m.m12; ret.m22 = (float)m.m22; ret.m23 = (float)m.m32;
+            ret.m30 = (float)m.m03; ret.m31 = (float)m.m13; ret.m32 = (float)m.m23; ret.m33 = (float)m.m33;
+            return ret;
+        }
+
+        /// <summary>
+        /// Converts the 16 values of a row-major USD matrix starting at offset, such as those
+        /// computed by Scene.ComputeTransforms(). As with the GfMatrix4d overloads, the USD rows
+        /// become the Unity columns.
+        /// </summary>
+        [Preserve]
+        static public UnityEngine.Matrix4x4 FromMatrix(double[] values, int offset)
+        {
+            var ret = new UnityEngine.Matrix4x4();
+            ret.m00 = (float)values[offset + 0]; ret.m10 = (float)values[offset + 1]; ret.m20 = (float)values[offset + 2]; ret.m30 = (float)values[offset + 3];
+            ret.m01 = (float)values[offset + 4]; ret.m11 = (float)values[offset + 5]; ret.m21 = (float)values[offset + 6]; ret.m31 = (float)values[offset + 7];
+            ret.m02 = (float)values[offset + 8]; ret.m12 = (float)values[offset + 9]; ret.m22 = (float)values[offset + 10]; ret.m32 = (float)values[offset + 11];
+            ret.m03 = (float)values[offset + 12]; ret.m13 = (float)values[offset + 13]; ret.m23 = (float)values[offset + 14]; ret.m33 = (float)values[offset + 15];
+            return ret;
+        }
+
         // ----------------------------------------------------------------------------------------- //
         // Matrix4x4[] / VtArray<GfMatrix4d>
         // ----------------------------------------------------------------------------------------- //
+        //
+        // Unity matrices are stored column-major, which is the row-major layout of the transposed
+        // USD matrix (see ToGfMatrix), so only the components are converted between float and double.
+
         [Preserve]
         static public VtMatrix4dArray ToVtArray(UnityEngine.Matrix4x4[] input)
         {
             var output = new VtMatrix4dArray((uint)input.Length);
-            for (int i = 0; i < input.Length; i++)
+            unsafe
             {
-                output[i] = ToGfMatrix(input[i]);
+                fixed (UnityEngine.Matrix4x4* p = input)
+                {
+                    output.CopyFromFloatArray((IntPtr)p);
+                }
             }
             return output;
         }
@@ -437,37 +488,29 @@ namespace USD.NET.Unity
         static public UnityEngine.Matrix4x4[] FromVtArray(VtMatrix4dArray input)
         {
             var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Matrix4x4>(input.size());
-            for (int i = 0; i < output.Length; i++)
-            {
-                output[i] = FromMatrix(input[i]);
-            }
-            /* This doesn't work because we're converting double/float.
-             * Should add a specialized C++ function to do this conversion.
             unsafe
             {
-              fixed (UnityEngine.Matrix4x4* p = output) {
-                input.CopyToArray((IntPtr)p);
-              }
+                fixed (UnityEngine.Matrix4x4* p = output)
+                {
+                    input.CopyToFloatArray((IntPtr)p);
+                }
             }
-            */
             return output;
         }
 
         [Preserve]
         static public VtMatrix4dArray ListToVtArray(List<UnityEngine.Matrix4x4> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<UnityEngine.Matrix4x4> ListFromVtArray(VtMatrix4dArray input)
         {
-            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Matrix4x4>(input.size());
-            for (int i = 0; i < output.Length; i++)
-            {
-                output[i] = FromMatrix(input[i]);
-            }
-            return output.ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -485,10 +528,25 @@ namespace USD.NET.Unity
             return Vec4fToColor(v);
         }
 
+        [Preserve]
+        static public GfVec4fValue Color32ToVec4fValue(UnityEngine.Color32 c)
+        {
+            return ColorToVec4fValue(c);
+        }
+
+        [Preserve]
+        static public UnityEngine.Color32 Vec4fToColor32(GfVec4fValue v)
+        {
+            return Vec4fToColor(v);
+        }
+
         [Preserve]
         static public VtVec4fArray ToVtArray(List<UnityEngine.Color32> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
@@ -496,33 +554,37 @@ namespace USD.NET.Unity
             out VtVec3fArray rgb,
             out VtFloatArray alpha)
         {
-            ToVtArray(input.ToArray(), out rgb, out alpha);
+            var tmp = ListToTempArray(input);
+            ToVtArray(tmp, out rgb, out alpha);
+            FreeTempArray(tmp);
         }
 
         [Preserve]
         static public VtVec4fArray ToVtArray(UnityEngine.Color32[] input)
         {
-            var color = UsdIo.ArrayAllocator.Malloc<UnityEngine.Color>((uint)input.Length);
-            // PERFORMANCE: this sucks, should implement conversion in C++.
-            for (int i = 0; i < input.Length; i++)
+            var output = new VtVec4fArray((uint)input.Length);
+            unsafe
             {
-                color[i] = input[i];
+                fixed (UnityEngine.Color32* p = input)
+                {
+                    output.CopyFromUnorm8Array((IntPtr)p);
+                }
             }
-            return ToVtArray(color);
+            return output;
         }
 
         [Preserve]
         static public UnityEngine.Color32[] Color32FromVtArray(VtVec4fArray input)
         {
-            UnityEngine.Color32[] ret = UsdIo.ArrayAllocator.Malloc<UnityEngine.Color32>(input.size());
-            UnityEngine.Vector4[] rgb = FromVtArray(input);
-
-            for (int i = 0; i < ret.Length; i++)
+            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Color32>(input.size());
+            unsafe
             {
-                ret[i] = new UnityEngine.Color(rgb[i][0], rgb[i][1], rgb[i][2], rgb[i][3]);
+                fixed (UnityEngine.Color32* p = output)
+                {
+                    input.CopyToUnorm8Array((IntPtr)p);
+                }
             }
-
-            return ret;
+            return output;
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -540,10 +602,25 @@ namespace USD.NET.Unity
             return new UnityEngine.Color(v[0], v[1], v[2], v[3]);
         }
 
+        [Preserve]
+        static public GfVec4fValue ColorToVec4fValue(UnityEngine.Color c)
+        {
+            return new GfVec4fValue(c.r, c.g, c.b, c.a);
+        }
+
+        [Preserve]
+        static public UnityEngine.Color Vec4fToColor(GfVec4fValue v)
+        {
+            return new UnityEngine.Color(v.x, v.y, v.z, v.w);
+        }
+
         [Preserve]
         static public VtVec4fArray ToVtArray(List<UnityEngine.Color> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
@@ -551,7 +628,9 @@ namespace USD.NET.Unity
             out VtVec3fArray rgb,
             out VtFloatArray alpha)
         {
-            ToVtArray(input.ToArray(), out rgb, out alpha);
+            var tmp = ListToTempArray(input);
+            ToVtArray(tmp, out rgb, out alpha);
+            FreeTempArray(tmp);
         }
 
         [Preserve]
@@ -709,21 +788,9 @@ namespace USD.NET.Unity
         // Quaternion
         // ----------------------------------------------------------------------------------------- //
         //
-        // USD GfQuaternion is layed out in memory as [real] [i0, i1, i2]
+        // USD GfQuaternion is constructed as [real] [i0, i1, i2]
         // Unity Quaternion is [i0, i1, i2] [real]
-        // Swapping seems preferable to making a temp array copy.
-
-        [Preserve]
-        static private void SwapQuaternionReal(ref UnityEngine.Quaternion[] input)
-        {
-            float tmp;
-            for (int i = 0; i < input.Length; i++)
-            {
-                tmp = input[i][0];
-                input[i][0] = input[i][3];
-                input[i][3] = tmp;
-            }
-        }
+        // The bulk array conversions reorder the components in C++.
 
         [Preserve]
         static public GfQuatf QuaternionToQuatf(UnityEngine.Quaternion quaternion)
@@ -741,23 +808,29 @@ namespace USD.NET.Unity
         }
 
         [Preserve]
-        static public VtQuatfArray ToVtArray(UnityEngine.Quaternion[] input)
+        static public GfQuatfValue QuaternionToQuatfValue(UnityEngine.Quaternion quaternion)
+        {
+            // GfQuatfValue shares the Unity layout, the real component is reordered in C++.
+            return new GfQuatfValue(quaternion.x, quaternion.y, quaternion.z, quaternion.w);
+        }
+
+        [Preserve]
+        static public UnityEngine.Quaternion QuatfToQuaternion(GfQuatfValue quat)
         {
-            SwapQuaternionReal(ref input);
+            return new UnityEngine.Quaternion(quat.x, quat.y, quat.z, quat.w);
+        }
 
+        [Preserve]
+        static public VtQuatfArray ToVtArray(UnityEngine.Quaternion[] input)
+        {
             var output = new VtQuatfArray((uint)input.Length);
             unsafe
             {
-                // Copy to USD/C++
                 fixed (UnityEngine.Quaternion* p = input)
                 {
-                    output.CopyFromArray((IntPtr)p);
+                    output.CopyFromFloatArray((IntPtr)p);
                 }
             }
-
-            // Swap back
-            SwapQuaternionReal(ref input);
-
             return output;
         }
 
@@ -769,34 +842,25 @@ namespace USD.NET.Unity
             {
                 fixed (UnityEngine.Quaternion* p = output)
                 {
-                    input.CopyToArray((IntPtr)p);
+                    input.CopyToFloatArray((IntPtr)p);
                 }
             }
-            // Swap real component for USD/Unity mis-match.
-            SwapQuaternionReal(ref output);
             return output;
         }
 
         [Preserve]
         static public VtQuatfArray ListToVtArray(List<UnityEngine.Quaternion> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<UnityEngine.Quaternion> ListFromVtArray(VtQuatfArray input)
         {
-            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Quaternion>(input.size());
-            unsafe
-            {
-                fixed (UnityEngine.Quaternion* p = output)
-                {
-                    input.CopyToArray((IntPtr)p);
-                }
-            }
-            // Swap real component for USD/Unity mis-match.
-            SwapQuaternionReal(ref output);
-            return output.ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -833,21 +897,16 @@ namespace USD.NET.Unity
         [Preserve]
         static public VtVec4fArray ListToVtArray(List<UnityEngine.Vector4> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<UnityEngine.Vector4> ListFromVtArray(VtVec4fArray input)
         {
-            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Vector4>(input.size());
-            unsafe
-            {
-                fixed (UnityEngine.Vector4* p = output)
-                {
-                    input.CopyToArray((IntPtr)p);
-                }
-            }
-            return output.ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -935,21 +994,16 @@ namespace USD.NET.Unity
         [Preserve]
         static public VtVec3fArray ListToVtArray(List<UnityEngine.Vector3> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<UnityEngine.Vector3> ListFromVtArray(VtVec3fArray input)
         {
-            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Vector3>(input.size());
-            unsafe
-            {
-                fixed (UnityEngine.Vector3* p = output)
-                {
-                    input.CopyToArray((IntPtr)p);
-                }
-            }
-            return output.ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -986,21 +1040,16 @@ namespace USD.NET.Unity
         [Preserve]
         static public VtVec2fArray ListToVtArray(List<UnityEngine.Vector2> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<UnityEngine.Vector2> ListFromVtArray(VtVec2fArray input)
         {
-            var output = UsdIo.ArrayAllocator.Malloc<UnityEngine.Vector2>(input.size());
-            unsafe
-            {
-                fixed (UnityEngine.Vector2* p = output)
-                {
-                    input.CopyToArray((IntPtr)p);
-                }
-            }
-            return output.ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -1019,6 +1068,18 @@ namespace USD.NET.Unity
             return new UnityEngine.Vector2(obj[0], obj[1]);
         }
 
+        [Preserve]
+        static public GfVec2fValue Vector2ToVec2fValue(UnityEngine.Vector2 v)
+        {
+            return new GfVec2fValue(v.x, v.y);
+        }
+
+        [Preserve]
+        static public UnityEngine.Vector2 Vec2fToVector2(GfVec2fValue v)
+        {
+            return new UnityEngine.Vector2(v.x, v.y);
+        }
+
         // ----------------------------------------------------------------------------------------- //
         // Vector3/Vec3
         // ----------------------------------------------------------------------------------------- //
@@ -1034,6 +1095,18 @@ namespace USD.NET.Unity
             return new UnityEngine.Vector3(v3[0], v3[1], v3[2]);
         }
 
+        [Preserve]
+        static public GfVec3fValue Vector3ToVec3fValue(UnityEngine.Vector3 v)
+        {
+            return new GfVec3fValue(v.x, v.y, v.z);
+        }
+
+        [Preserve]
+        static public UnityEngine.Vector3 Vec3fToVector3(GfVec3fValue v)
+        {
+            return new UnityEngine.Vector3(v.x, v.y, v.z);
+        }
+
         // ----------------------------------------------------------------------------------------- //
         // Vector4/Vec4
         // ----------------------------------------------------------------------------------------- //
@@ -1049,6 +1122,18 @@ namespace USD.NET.Unity
             return new UnityEngine.Vector4(v4[0], v4[1], v4[2], v4[3]);
         }
 
+        [Preserve]
+        static public GfVec4fValue Vector4ToVec4fValue(UnityEngine.Vector4 v)
+        {
+            return new GfVec4fValue(v.x, v.y, v.z, v.w);
+        }
+
+        [Preserve]
+        static public UnityEngine.Vector4 Vec4fToVector4(GfVec4fValue v)
+        {
+            return new UnityEngine.Vector4(v.x, v.y, v.z, v.w);
+        }
+
         // ----------------------------------------------------------------------------------------- //
         // Rect
         // ----------------------------------------------------------------------------------------- //
@@ -1063,5 +1148,76 @@ namespace USD.NET.Unity
         {
             return new UnityEngine.Rect(v4[0], v4[1], v4[2], v4[3]);
         }
+
+        [Preserve]
+        static public GfVec4fValue RectToVec4fValue(UnityEngine.Rect rect)
+        {
+            return new GfVec4fValue(rect.x, rect.y, rect.width, rect.height);
+        }
+
+        [Preserve]
+        static public UnityEngine.Rect Vec4fToRect(GfVec4fValue v)
+        {
+            return new UnityEngine.Rect(v.x, v.y, v.z, v.w);
+        }
+
+        // ----------------------------------------------------------------------------------------- //
+        // Zero-copy views
+        // ----------------------------------------------------------------------------------------- //
+
+        /// <summary>
+        /// Wraps the storage of a POD VtArray in a NativeArray without copying it, e.g. to pass points
+        /// straight to Mesh.SetVertices. The NativeArray does not own the memory: it is only valid while
+        /// the VtArray is alive and unmodified, it must not be written to and need not be disposed.
+        /// </summary>
+        /// <param name="data">The VtArray storage, as returned by GetConstDataPointer()</param>
+        /// <param name="count">The number of elements in the VtArray, as returned by size()</param>
+        /// <param name="elementSize">The size of one VtArray element, as returned by GetElementSize()</param>
+        static public NativeArray<T> AsNativeArray<T>(IntPtr data, uint count, uint elementSize) where T : struct
+        {
+            long byteLength = (long)count * elementSize;
+            int viewElementSize = UnsafeUtility.SizeOf<T>();
+            if (byteLength % viewElementSize != 0)
+            {
+                throw new ArgumentException(string.Format("Array of {0} bytes cannot be viewed as {1}",
+                    byteLength, typeof(T).Name));
+            }
+
+            NativeArray<T> output;
+            unsafe
+            {
+                output = NativeArrayUnsafeUtility.ConvertExistingDataToNativeArray<T>(
+                    data.ToPointer(), (int)(byteLength / viewElementSize), Allocator.None);
+            }
+#if ENABLE_UNITY_COLLECTIONS_CHECKS
+            NativeArrayUnsafeUtility.SetAtomicSafetyHandle(ref output, AtomicSafetyHandle.GetTempUnsafePtrSliceHandle());
+#endif
+            return output;
+        }
+
+        static public NativeArray<UnityEngine.Vector2> AsNativeArray(VtVec2fArray input)
+        {
+            return AsNativeArray<UnityEngine.Vector2>(input.GetConstDataPointer(), input.size(), VtVec2fArray.GetElementSize());
+        }
+
+        static public NativeArray<UnityEngine.Vector3> AsNativeArray(VtVec3fArray input)
+        {
+            return AsNativeArray<UnityEngine.Vector3>(input.GetConstDataPointer(), input.size(), VtVec3fArray.GetElementSize());
+        }
+
+        static public NativeArray<UnityEngine.Vector4> AsNativeArray(VtVec4fArray input)
+        {
+            return AsNativeArray<UnityEngine.Vector4>(input.GetConstDataPointer(), input.size(), VtVec4fArray.GetElementSize());
+        }
+
+        static public NativeArray<int> AsNativeArray(VtIntArray input)
+        {
+            return AsNativeArray<int>(input.GetConstDataPointer(), input.size(), VtIntArray.GetElementSize());
+        }
+
+        static public NativeArray<float> AsNativeArray(VtFloatArray input)
+        {
+            return AsNativeArray<float>(input.GetConstDataPointer(), input.size(), VtFloatArray.GetElementSize());
+        }
     }
 }
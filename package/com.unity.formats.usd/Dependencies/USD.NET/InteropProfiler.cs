@@ -0,0 +1,333 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Text;
+using System.Threading;
+
+namespace USD.NET
+{
+    /// <summary>
+    /// Counts the calls made to each native entry point of the bindings and the time spent in them,
+    /// attributed to the phase running on the calling thread.
+    /// </summary>
+    /// <remarks>
+    /// Calls are only recorded when the bindings are generated with profiling, by passing --profile
+    /// to bin/add_MonoPInvokeCallback_attribute.py, and USD_INTEROP_PROFILING is defined. Otherwise
+    /// the instrumentation and the calls to BeginPhase() and EndPhase() compile to nothing.
+    ///
+    /// Phases are tracked per thread. Calls made by worker threads, e.g. the jobs reading meshes
+    /// during an import, are not nested in the phase of the thread which scheduled them: they are
+    /// attributed to the phases begun on the worker thread, such as "Read MeshSample" by
+    /// Scene.Read(), and to kNoPhase outside of those.
+    /// </remarks>
+    public static class InteropProfiler
+    {
+        /// <summary>
+        /// The phase of calls made outside of any phase.
+        /// </summary>
+        public const string kNoPhase = "(none)";
+
+        // The number of entry points counted by each block of counters.
+        const int kBlockSize = 1024;
+
+        // The counters of a block of entry points. Blocks are never copied or replaced, so calls
+        // recorded while another thread grows the phase are not lost.
+        class CounterBlock
+        {
+            public readonly long[] Calls = new long[kBlockSize];
+            public readonly long[] Ticks = new long[kBlockSize];
+        }
+
+        // The call counters of one phase, indexed by entry point.
+        class PhaseCounters
+        {
+            public readonly string Name;
+
+            // Replaced by Grow() under sm_lock, read without it by End().
+            public volatile CounterBlock[] Blocks = new CounterBlock[0];
+
+            public PhaseCounters(string name)
+            {
+                Name = name;
+            }
+        }
+
+        static readonly object sm_lock = new object();
+        static readonly List<string> sm_entryPoints = new List<string>();
+        static readonly Dictionary<string, PhaseCounters> sm_phases = new Dictionary<string, PhaseCounters>();
+        static readonly PhaseCounters sm_noPhase = GetPhase(kNoPhase);
+
+        [ThreadStatic] static List<PhaseCounters> t_phaseStack;
+
+        /// <summary>
+        /// True when the bindings were built with profiling and USD_INTEROP_PROFILING is defined.
+        /// </summary>
+        public static bool IsAvailable
+        {
+            get
+            {
+                lock (sm_lock) { return sm_entryPoints.Count > 0; }
+            }
+        }
+
+        /// <summary>
+        /// Attributes the native calls made by the current thread to the given phase, nested in the
+        /// current phase, until the matching call to EndPhase().
+        /// </summary>
+        [Conditional("USD_INTEROP_PROFILING")]
+        public static void BeginPhase(string name)
+        {
+            if (t_phaseStack == null)
+            {
+                t_phaseStack = new List<PhaseCounters>();
+            }
+
+            var count = t_phaseStack.Count;
+            var path = count == 0 ? name : t_phaseStack[count - 1].Name + "/" + name;
+            t_phaseStack.Add(GetPhase(path));
+        }
+
+        /// <summary>
+        /// Ends the phase begun by the last call to BeginPhase() on the current thread.
+        /// </summary>
+        [Conditional("USD_INTEROP_PROFILING")]
+        public static void EndPhase()
+        {
+            if (t_phaseStack != null && t_phaseStack.Count > 0)
+            {
+                t_phaseStack.RemoveAt(t_phaseStack.Count - 1);
+            }
+        }
+
+        /// <summary>
+        /// Registers the names of generated entry points, returning the id of the first one.
+        /// </summary>
+        public static int RegisterEntryPoints(string[] names)
+        {
+            lock (sm_lock)
+            {
+                var first = sm_entryPoints.Count;
+                sm_entryPoints.AddRange(names);
+                return first;
+            }
+        }
+
+        /// <summary>
+        /// Returns the timestamp at which a native call starts. Called by generated code.
+        /// </summary>
+        public static long Begin()
+        {
+            return Stopwatch.GetTimestamp();
+        }
+
+        /// <summary>
+        /// Records a native call to the given entry point, started at the given timestamp. Called by
+        /// generated code.
+        /// </summary>
+        public static void End(int entryPoint, long start)
+        {
+            var ticks = Stopwatch.GetTimestamp() - start;
+            var stack = t_phaseStack;
+            var phase = stack != null && stack.Count > 0 ? stack[stack.Count - 1] : sm_noPhase;
+
+            var blocks = phase.Blocks;
+            var blockIndex = entryPoint / kBlockSize;
+            if (blockIndex >= blocks.Length)
+            {
+                lock (sm_lock)
+                {
+                    Grow(phase);
+                    blocks = phase.Blocks;
+                }
+            }
+
+            var block = blocks[blockIndex];
+            var index = entryPoint % kBlockSize;
+            Interlocked.Increment(ref block.Calls[index]);
+            Interlocked.Add(ref block.Ticks[index], ticks);
+        }
+
+        /// <summary>
+        /// Returns the calls recorded since the last reset, sorted by decreasing total time.
+        /// </summary>
+        public static List<InteropProfileEntry> Snapshot()
+        {
+            var entries = new List<InteropProfileEntry>();
+            lock (sm_lock)
+            {
+                foreach (var phase in sm_phases.Values)
+                {
+                    var blocks = phase.Blocks;
+                    var count = Math.Min(sm_entryPoints.Count, blocks.Length * kBlockSize);
+                    for (int i = 0; i < count; i++)
+                    {
+                        var block = blocks[i / kBlockSize];
+                        var calls = Interlocked.Read(ref block.Calls[i % kBlockSize]);
+                        if (calls == 0)
+                        {
+                            continue;
+                        }
+
+                        entries.Add(new InteropProfileEntry(phase.Name, sm_entryPoints[i], calls,
+                            Interlocked.Read(ref block.Ticks[i % kBlockSize]) * 1000.0 / Stopwatch.Frequency));
+                    }
+                }
+            }
+
+            entries.Sort((a, b) => b.Milliseconds.CompareTo(a.Milliseconds));
+            return entries;
+        }
+
+        /// <summary>
+        /// Clears all recorded calls.
+        /// </summary>
+        public static void Reset()
+        {
+            lock (sm_lock)
+            {
+                foreach (var phase in sm_phases.Values)
+                {
+                    foreach (var block in phase.Blocks)
+                    {
+                        Array.Clear(block.Calls, 0, kBlockSize);
+                        Array.Clear(block.Ticks, 0, kBlockSize);
+                    }
+                }
+            }
+        }
+
+        /// <summary>
+        /// Returns a report of the calls recorded since the last reset: the total of each phase,
+        /// followed by the entry points taking the most time.
+        /// </summary>
+        /// <param name="maxEntries">The maximum number of entry points listed.</param>
+        public static string Report(int maxEntries = 50)
+        {
+            if (!IsAvailable)
+            {
+                return "Interop profiling is not available: the bindings were generated without profiling or USD_INTEROP_PROFILING is not defined.\n";
+            }
+
+            var entries = Snapshot();
+            var phases = new Dictionary<string, InteropProfileEntry>();
+            foreach (var entry in entries)
+            {
+                InteropProfileEntry total;
+                phases.TryGetValue(entry.Phase, out total);
+                phases[entry.Phase] = new InteropProfileEntry(entry.Phase, null,
+                    total.Calls + entry.Calls, total.Milliseconds + entry.Milliseconds);
+            }
+
+            var phaseTotals = new List<InteropProfileEntry>(phases.Values);
+            phaseTotals.Sort((a, b) => b.Milliseconds.CompareTo(a.Milliseconds));
+
+            var sb = new StringBuilder();
+            sb.AppendLine("Native calls by phase:");
+            sb.AppendLine(string.Format("  {0,12} {1,12}  {2}", "Calls", "Total (ms)", "Phase"));
+            foreach (var phase in phaseTotals)
+            {
+                sb.AppendLine(string.Format("  {0,12} {1,12:F3}  {2}", phase.Calls, phase.Milliseconds, phase.Phase));
+            }
+
+            sb.AppendLine();
+            sb.AppendLine("Native calls by entry point:");
+            sb.AppendLine(string.Format("  {0,12} {1,12} {2,12}  {3}", "Calls", "Total (ms)", "Mean (us)", "Entry point [phase]"));
+            for (int i = 0; i < entries.Count && i < maxEntries; i++)
+            {
+                var entry = entries[i];
+                sb.AppendLine(string.Format("  {0,12} {1,12:F3} {2,12:F3}  {3} [{4}]", entry.Calls, entry.Milliseconds,
+                    entry.Milliseconds * 1000.0 / entry.Calls, entry.EntryPoint, entry.Phase));
+            }
+
+            if (entries.Count > maxEntries)
+            {
+                sb.AppendLine(string.Format("  ... {0} more", entries.Count - maxEntries));
+            }
+
+            return sb.ToString();
+        }
+
+        static PhaseCounters GetPhase(string name)
+        {
+            lock (sm_lock)
+            {
+                PhaseCounters phase;
+                if (!sm_phases.TryGetValue(name, out phase))
+                {
+                    phase = new PhaseCounters(name);
+                    sm_phases.Add(name, phase);
+                }
+
+                return phase;
+            }
+        }
+
+        static void Grow(PhaseCounters phase)
+        {
+            var blockCount = (sm_entryPoints.Count + kBlockSize - 1) / kBlockSize;
+            if (phase.Blocks.Length >= blockCount)
+            {
+                return;
+            }
+
+            // Only the array of blocks is copied, the blocks themselves are shared with the
+            // threads still counting in them.
+            var blocks = new CounterBlock[blockCount];
+            Array.Copy(phase.Blocks, blocks, phase.Blocks.Length);
+            for (int i = phase.Blocks.Length; i < blockCount; i++)
+            {
+                blocks[i] = new CounterBlock();
+            }
+
+            phase.Blocks = blocks;
+        }
+    }
+
+    /// <summary>
+    /// The calls recorded by the InteropProfiler for one entry point in one phase.
+    /// </summary>
+    public struct InteropProfileEntry
+    {
+        /// <summary>
+        /// The phase, as the names of the nested phases separated by '/'.
+        /// </summary>
+        public string Phase;
+
+        /// <summary>
+        /// The name of the native entry point.
+        /// </summary>
+        public string EntryPoint;
+
+        /// <summary>
+        /// The number of calls.
+        /// </summary>
+        public long Calls;
+
+        /// <summary>
+        /// The total time spent in the calls, in milliseconds.
+        /// </summary>
+        public double Milliseconds;
+
+        public InteropProfileEntry(string phase, string entryPoint, long calls, double milliseconds)
+        {
+            Phase = phase;
+            EntryPoint = entryPoint;
+            Calls = calls;
+            Milliseconds = milliseconds;
+        }
+    }
+}
@@ -36,8 +36,7 @@ namespace USD.NET
 
         public SampleCollection(Scene scene, SdfPathVector paths)
         {
-            m_paths = new SdfPath[paths.Count];
-            paths.CopyTo(m_paths);
+            m_paths = IntrinsicTypeConverter.FromVector(paths);
             m_scene = scene;
         }
 
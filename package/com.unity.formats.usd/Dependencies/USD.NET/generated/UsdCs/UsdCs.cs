@@ -5130,6 +5130,1598 @@ namespace pxr
             return ret;
         }
 
+        public static uint UsdAttributeBatchGetSdfTimeCodeArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetSdfTimeCodeArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtBoolArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtBoolArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtDoubleArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtDoubleArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtFloatArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtFloatArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtHalfArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtHalfArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtInt64Array(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtInt64Array(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtIntArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtIntArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtMatrix2dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtMatrix2dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtMatrix3dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtMatrix3dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtMatrix4dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtMatrix4dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtQuatdArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtQuatdArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtQuatfArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtQuatfArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtQuathArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtQuathArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtUCharArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtUCharArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtUInt64Array(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtUInt64Array(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtUIntArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtUIntArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec2dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec2dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec2fArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec2fArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec2hArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec2hArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec2iArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec2iArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec3dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec3dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec3fArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec3fArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec3hArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec3hArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec3iArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec3iArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec4dArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec4dArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec4fArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec4fArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec4hArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec4hArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static uint UsdAttributeBatchGetVtVec4iArray(UsdAttributeVector attrs, UsdTimeCodeVector times, global::System.IntPtr buffer, uint capacity, long[] offsets, int[] lengths, uint entryCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdAttributeBatchGetVtVec4iArray(UsdAttributeVector.getCPtr(attrs), UsdTimeCodeVector.getCPtr(times), buffer, capacity, offsets, lengths, entryCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static pxr.GfMatrix2dValue GfMatrix2dToValue(GfMatrix2d value)
+        {
+            pxr.GfMatrix2dValue ret = UsdCsPINVOKE.GfMatrix2dToValue(GfMatrix2d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfMatrix2d GfMatrix2dFromValue(pxr.GfMatrix2dValue value)
+        {
+            GfMatrix2d ret = new GfMatrix2d(UsdCsPINVOKE.GfMatrix2dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfMatrix3dValue GfMatrix3dToValue(GfMatrix3d value)
+        {
+            pxr.GfMatrix3dValue ret = UsdCsPINVOKE.GfMatrix3dToValue(GfMatrix3d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfMatrix3d GfMatrix3dFromValue(pxr.GfMatrix3dValue value)
+        {
+            GfMatrix3d ret = new GfMatrix3d(UsdCsPINVOKE.GfMatrix3dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfMatrix4dValue GfMatrix4dToValue(GfMatrix4d value)
+        {
+            pxr.GfMatrix4dValue ret = UsdCsPINVOKE.GfMatrix4dToValue(GfMatrix4d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfMatrix4d GfMatrix4dFromValue(pxr.GfMatrix4dValue value)
+        {
+            GfMatrix4d ret = new GfMatrix4d(UsdCsPINVOKE.GfMatrix4dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfQuatdValue GfQuatdToValue(GfQuatd value)
+        {
+            pxr.GfQuatdValue ret = UsdCsPINVOKE.GfQuatdToValue(GfQuatd.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfQuatd GfQuatdFromValue(pxr.GfQuatdValue value)
+        {
+            GfQuatd ret = new GfQuatd(UsdCsPINVOKE.GfQuatdFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfQuatfValue GfQuatfToValue(GfQuatf value)
+        {
+            pxr.GfQuatfValue ret = UsdCsPINVOKE.GfQuatfToValue(GfQuatf.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfQuatf GfQuatfFromValue(pxr.GfQuatfValue value)
+        {
+            GfQuatf ret = new GfQuatf(UsdCsPINVOKE.GfQuatfFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfRange1dValue GfRange1dToValue(GfRange1d value)
+        {
+            pxr.GfRange1dValue ret = UsdCsPINVOKE.GfRange1dToValue(GfRange1d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfRange1d GfRange1dFromValue(pxr.GfRange1dValue value)
+        {
+            GfRange1d ret = new GfRange1d(UsdCsPINVOKE.GfRange1dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfRange1fValue GfRange1fToValue(GfRange1f value)
+        {
+            pxr.GfRange1fValue ret = UsdCsPINVOKE.GfRange1fToValue(GfRange1f.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfRange1f GfRange1fFromValue(pxr.GfRange1fValue value)
+        {
+            GfRange1f ret = new GfRange1f(UsdCsPINVOKE.GfRange1fFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfRange2dValue GfRange2dToValue(GfRange2d value)
+        {
+            pxr.GfRange2dValue ret = UsdCsPINVOKE.GfRange2dToValue(GfRange2d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfRange2d GfRange2dFromValue(pxr.GfRange2dValue value)
+        {
+            GfRange2d ret = new GfRange2d(UsdCsPINVOKE.GfRange2dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfRange3dValue GfRange3dToValue(GfRange3d value)
+        {
+            pxr.GfRange3dValue ret = UsdCsPINVOKE.GfRange3dToValue(GfRange3d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfRange3d GfRange3dFromValue(pxr.GfRange3dValue value)
+        {
+            GfRange3d ret = new GfRange3d(UsdCsPINVOKE.GfRange3dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec2dValue GfVec2dToValue(GfVec2d value)
+        {
+            pxr.GfVec2dValue ret = UsdCsPINVOKE.GfVec2dToValue(GfVec2d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec2d GfVec2dFromValue(pxr.GfVec2dValue value)
+        {
+            GfVec2d ret = new GfVec2d(UsdCsPINVOKE.GfVec2dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec2fValue GfVec2fToValue(GfVec2f value)
+        {
+            pxr.GfVec2fValue ret = UsdCsPINVOKE.GfVec2fToValue(GfVec2f.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec2f GfVec2fFromValue(pxr.GfVec2fValue value)
+        {
+            GfVec2f ret = new GfVec2f(UsdCsPINVOKE.GfVec2fFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec2iValue GfVec2iToValue(GfVec2i value)
+        {
+            pxr.GfVec2iValue ret = UsdCsPINVOKE.GfVec2iToValue(GfVec2i.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec2i GfVec2iFromValue(pxr.GfVec2iValue value)
+        {
+            GfVec2i ret = new GfVec2i(UsdCsPINVOKE.GfVec2iFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec3dValue GfVec3dToValue(GfVec3d value)
+        {
+            pxr.GfVec3dValue ret = UsdCsPINVOKE.GfVec3dToValue(GfVec3d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec3d GfVec3dFromValue(pxr.GfVec3dValue value)
+        {
+            GfVec3d ret = new GfVec3d(UsdCsPINVOKE.GfVec3dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec3fValue GfVec3fToValue(GfVec3f value)
+        {
+            pxr.GfVec3fValue ret = UsdCsPINVOKE.GfVec3fToValue(GfVec3f.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec3f GfVec3fFromValue(pxr.GfVec3fValue value)
+        {
+            GfVec3f ret = new GfVec3f(UsdCsPINVOKE.GfVec3fFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec3iValue GfVec3iToValue(GfVec3i value)
+        {
+            pxr.GfVec3iValue ret = UsdCsPINVOKE.GfVec3iToValue(GfVec3i.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec3i GfVec3iFromValue(pxr.GfVec3iValue value)
+        {
+            GfVec3i ret = new GfVec3i(UsdCsPINVOKE.GfVec3iFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec4dValue GfVec4dToValue(GfVec4d value)
+        {
+            pxr.GfVec4dValue ret = UsdCsPINVOKE.GfVec4dToValue(GfVec4d.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec4d GfVec4dFromValue(pxr.GfVec4dValue value)
+        {
+            GfVec4d ret = new GfVec4d(UsdCsPINVOKE.GfVec4dFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec4fValue GfVec4fToValue(GfVec4f value)
+        {
+            pxr.GfVec4fValue ret = UsdCsPINVOKE.GfVec4fToValue(GfVec4f.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec4f GfVec4fFromValue(pxr.GfVec4fValue value)
+        {
+            GfVec4f ret = new GfVec4f(UsdCsPINVOKE.GfVec4fFromValue(ref value), true);
+            return ret;
+        }
+
+        public static pxr.GfVec4iValue GfVec4iToValue(GfVec4i value)
+        {
+            pxr.GfVec4iValue ret = UsdCsPINVOKE.GfVec4iToValue(GfVec4i.getCPtr(value));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static GfVec4i GfVec4iFromValue(pxr.GfVec4iValue value)
+        {
+            GfVec4i ret = new GfVec4i(UsdCsPINVOKE.GfVec4iFromValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfMatrix2dValue(VtValue value, out pxr.GfMatrix2dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfMatrix2dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfMatrix2dValue(pxr.GfMatrix2dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfMatrix2dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfMatrix3dValue(VtValue value, out pxr.GfMatrix3dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfMatrix3dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfMatrix3dValue(pxr.GfMatrix3dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfMatrix3dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfMatrix4dValue(VtValue value, out pxr.GfMatrix4dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfMatrix4dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfMatrix4dValue(pxr.GfMatrix4dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfMatrix4dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfQuatdValue(VtValue value, out pxr.GfQuatdValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfQuatdValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfQuatdValue(pxr.GfQuatdValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfQuatdValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfQuatfValue(VtValue value, out pxr.GfQuatfValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfQuatfValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfQuatfValue(pxr.GfQuatfValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfQuatfValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec2dValue(VtValue value, out pxr.GfVec2dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec2dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec2dValue(pxr.GfVec2dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec2dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec2fValue(VtValue value, out pxr.GfVec2fValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec2fValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec2fValue(pxr.GfVec2fValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec2fValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec2iValue(VtValue value, out pxr.GfVec2iValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec2iValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec2iValue(pxr.GfVec2iValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec2iValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec3dValue(VtValue value, out pxr.GfVec3dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec3dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec3dValue(pxr.GfVec3dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec3dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec3fValue(VtValue value, out pxr.GfVec3fValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec3fValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec3fValue(pxr.GfVec3fValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec3fValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec3iValue(VtValue value, out pxr.GfVec3iValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec3iValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec3iValue(pxr.GfVec3iValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec3iValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec4dValue(VtValue value, out pxr.GfVec4dValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec4dValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec4dValue(pxr.GfVec4dValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec4dValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec4fValue(VtValue value, out pxr.GfVec4fValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec4fValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec4fValue(pxr.GfVec4fValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec4fValue(ref value), true);
+            return ret;
+        }
+
+        public static bool VtValueToGfVec4iValue(VtValue value, out pxr.GfVec4iValue output)
+        {
+            bool ret = UsdCsPINVOKE.VtValueToGfVec4iValue(VtValue.getCPtr(value), out output);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static VtValue VtValueFromGfVec4iValue(pxr.GfVec4iValue value)
+        {
+            VtValue ret = new VtValue(UsdCsPINVOKE.VtValueFromGfVec4iValue(ref value), true);
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfMatrix2dValue(UsdAttribute attr, out pxr.GfMatrix2dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfMatrix2dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix2dValue(UsdAttribute attr, pxr.GfMatrix2dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix2dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfMatrix3dValue(UsdAttribute attr, out pxr.GfMatrix3dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfMatrix3dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix3dValue(UsdAttribute attr, pxr.GfMatrix3dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix3dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfMatrix4dValue(UsdAttribute attr, out pxr.GfMatrix4dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfMatrix4dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix4dValue(UsdAttribute attr, pxr.GfMatrix4dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix4dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfQuatdValue(UsdAttribute attr, out pxr.GfQuatdValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfQuatdValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfQuatdValue(UsdAttribute attr, pxr.GfQuatdValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfQuatdValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfQuatfValue(UsdAttribute attr, out pxr.GfQuatfValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfQuatfValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfQuatfValue(UsdAttribute attr, pxr.GfQuatfValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfQuatfValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec2dValue(UsdAttribute attr, out pxr.GfVec2dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec2dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2dValue(UsdAttribute attr, pxr.GfVec2dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec2fValue(UsdAttribute attr, out pxr.GfVec2fValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec2fValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2fValue(UsdAttribute attr, pxr.GfVec2fValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2fValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec2iValue(UsdAttribute attr, out pxr.GfVec2iValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec2iValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2iValue(UsdAttribute attr, pxr.GfVec2iValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2iValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec3dValue(UsdAttribute attr, out pxr.GfVec3dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec3dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3dValue(UsdAttribute attr, pxr.GfVec3dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec3fValue(UsdAttribute attr, out pxr.GfVec3fValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec3fValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3fValue(UsdAttribute attr, pxr.GfVec3fValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3fValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec3iValue(UsdAttribute attr, out pxr.GfVec3iValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec3iValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3iValue(UsdAttribute attr, pxr.GfVec3iValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3iValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec4dValue(UsdAttribute attr, out pxr.GfVec4dValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec4dValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4dValue(UsdAttribute attr, pxr.GfVec4dValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4dValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec4fValue(UsdAttribute attr, out pxr.GfVec4fValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec4fValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4fValue(UsdAttribute attr, pxr.GfVec4fValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4fValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeGetGfVec4iValue(UsdAttribute attr, out pxr.GfVec4iValue output, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeGetGfVec4iValue(UsdAttribute.getCPtr(attr), out output, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4iValue(UsdAttribute attr, pxr.GfVec4iValue value, UsdTimeCode time)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4iValue(UsdAttribute.getCPtr(attr), ref value, UsdTimeCode.getCPtr(time));
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfHalf(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfHalf(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfHalf(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfHalf(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix2d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix2d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfMatrix2d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfMatrix2d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix3d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix3d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfMatrix3d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfMatrix3d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfMatrix4d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfMatrix4d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfMatrix4d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfMatrix4d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfQuatd(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfQuatd(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfQuatd(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfQuatd(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfQuatf(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfQuatf(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfQuatf(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfQuatf(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfQuath(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfQuath(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfQuath(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfQuath(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec2d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec2d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2f(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2f(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec2f(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec2f(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2h(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2h(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec2h(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec2h(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec2i(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec2i(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec2i(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec2i(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec3d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec3d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3f(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3f(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec3f(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec3f(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3h(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3h(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec3h(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec3h(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec3i(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec3i(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec3i(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec3i(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4d(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4d(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec4d(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec4d(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4f(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4f(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec4f(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec4f(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4h(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4h(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec4h(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec4h(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetGfVec4i(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetGfVec4i(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetGfVec4i(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetGfVec4i(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetSdfTimeCode(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetSdfTimeCode(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetSdfTimeCode(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetSdfTimeCode(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetSdfTimeCodeArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetSdfTimeCodeArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetSdfTimeCodeArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetSdfTimeCodeArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtBoolArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtBoolArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtBoolArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtBoolArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtDoubleArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtDoubleArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtDoubleArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtDoubleArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtFloatArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtFloatArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtFloatArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtFloatArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtHalfArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtHalfArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtHalfArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtHalfArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtInt64Array(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtInt64Array(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtInt64Array(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtInt64Array(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtIntArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtIntArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtIntArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtIntArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtMatrix2dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtMatrix2dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtMatrix2dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtMatrix2dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtMatrix3dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtMatrix3dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtMatrix3dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtMatrix3dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtMatrix4dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtMatrix4dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtMatrix4dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtMatrix4dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtQuatdArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtQuatdArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtQuatdArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtQuatdArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtQuatfArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtQuatfArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtQuatfArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtQuatfArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtQuathArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtQuathArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtQuathArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtQuathArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtUCharArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtUCharArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtUCharArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtUCharArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtUInt64Array(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtUInt64Array(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtUInt64Array(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtUInt64Array(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtUIntArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtUIntArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtUIntArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtUIntArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec2dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec2dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec2dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec2dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec2fArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec2fArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec2fArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec2fArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec2hArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec2hArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec2hArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec2hArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec2iArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec2iArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec2iArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec2iArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec3dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec3dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec3dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec3dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec3fArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec3fArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec3fArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec3fArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec3hArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec3hArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec3hArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec3hArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec3iArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec3iArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec3iArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec3iArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec4dArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec4dArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec4dArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec4dArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec4fArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec4fArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec4fArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec4fArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec4hArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec4hArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec4hArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec4hArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetVtVec4iArray(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetVtVec4iArray(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetVtVec4iArray(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetVtVec4iArray(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetbool(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetbool(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetbool(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetbool(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetdouble(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetdouble(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetdouble(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetdouble(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetfloat(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetfloat(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetfloat(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetfloat(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetint(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetint(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetint(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetint(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetlong(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetlong(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetlong(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetlong(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetulong(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetulong(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetulong(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetulong(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetbyte(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetbyte(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetbyte(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetbyte(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdAttributeSetuint(UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdAttributeSetuint(UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public static bool UsdUtilsSparseValueWriterSetuint(UsdUtilsSparseValueWriter writer, UsdAttribute attr, UsdTimeCode time, global::System.IntPtr data, uint count)
+        {
+            bool ret = UsdCsPINVOKE.UsdUtilsSparseValueWriterSetuint(UsdUtilsSparseValueWriter.getCPtr(writer), UsdAttribute.getCPtr(attr), UsdTimeCode.getCPtr(time), data, count);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
         public static void SetEnv(string name, string value)
         {
             UsdCsPINVOKE.SetEnv(name, value);
@@ -0,0 +1,623 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System.Runtime.InteropServices;
+
+namespace pxr
+{
+    /// <summary>
+    /// A GfMatrix2d passed by value, laid out as rows of components (row-major).
+    /// Reading one does not allocate, unlike the GfMatrix2d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfMatrix2dValue
+    {
+        public double m00;
+        public double m01;
+        public double m10;
+        public double m11;
+
+        public static explicit operator GfMatrix2d(GfMatrix2dValue value)
+        {
+            return UsdCs.GfMatrix2dFromValue(value);
+        }
+
+        public static explicit operator GfMatrix2dValue(GfMatrix2d value)
+        {
+            return UsdCs.GfMatrix2dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfMatrix2dValue value)
+        {
+            return UsdCs.VtValueFromGfMatrix2dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfMatrix3d passed by value, laid out as rows of components (row-major).
+    /// Reading one does not allocate, unlike the GfMatrix3d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfMatrix3dValue
+    {
+        public double m00;
+        public double m01;
+        public double m02;
+        public double m10;
+        public double m11;
+        public double m12;
+        public double m20;
+        public double m21;
+        public double m22;
+
+        public static explicit operator GfMatrix3d(GfMatrix3dValue value)
+        {
+            return UsdCs.GfMatrix3dFromValue(value);
+        }
+
+        public static explicit operator GfMatrix3dValue(GfMatrix3d value)
+        {
+            return UsdCs.GfMatrix3dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfMatrix3dValue value)
+        {
+            return UsdCs.VtValueFromGfMatrix3dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfMatrix4d passed by value, laid out as rows of components (row-major).
+    /// Reading one does not allocate, unlike the GfMatrix4d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfMatrix4dValue
+    {
+        public double m00;
+        public double m01;
+        public double m02;
+        public double m03;
+        public double m10;
+        public double m11;
+        public double m12;
+        public double m13;
+        public double m20;
+        public double m21;
+        public double m22;
+        public double m23;
+        public double m30;
+        public double m31;
+        public double m32;
+        public double m33;
+
+        public static explicit operator GfMatrix4d(GfMatrix4dValue value)
+        {
+            return UsdCs.GfMatrix4dFromValue(value);
+        }
+
+        public static explicit operator GfMatrix4dValue(GfMatrix4d value)
+        {
+            return UsdCs.GfMatrix4dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfMatrix4dValue value)
+        {
+            return UsdCs.VtValueFromGfMatrix4dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfQuatd passed by value, laid out as the imaginary components followed by the real component, like UnityEngine.Quaternion.
+    /// Reading one does not allocate, unlike the GfQuatd proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfQuatdValue
+    {
+        public double x;
+        public double y;
+        public double z;
+        public double w;
+
+        public GfQuatdValue(double x, double y, double z, double w)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+            this.w = w;
+        }
+
+        public static explicit operator GfQuatd(GfQuatdValue value)
+        {
+            return UsdCs.GfQuatdFromValue(value);
+        }
+
+        public static explicit operator GfQuatdValue(GfQuatd value)
+        {
+            return UsdCs.GfQuatdToValue(value);
+        }
+
+        public static implicit operator VtValue(GfQuatdValue value)
+        {
+            return UsdCs.VtValueFromGfQuatdValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfQuatf passed by value, laid out as the imaginary components followed by the real component, like UnityEngine.Quaternion.
+    /// Reading one does not allocate, unlike the GfQuatf proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfQuatfValue
+    {
+        public float x;
+        public float y;
+        public float z;
+        public float w;
+
+        public GfQuatfValue(float x, float y, float z, float w)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+            this.w = w;
+        }
+
+        public static explicit operator GfQuatf(GfQuatfValue value)
+        {
+            return UsdCs.GfQuatfFromValue(value);
+        }
+
+        public static explicit operator GfQuatfValue(GfQuatf value)
+        {
+            return UsdCs.GfQuatfToValue(value);
+        }
+
+        public static implicit operator VtValue(GfQuatfValue value)
+        {
+            return UsdCs.VtValueFromGfQuatfValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfRange1d passed by value, laid out as the minimum followed by the maximum.
+    /// Reading one does not allocate, unlike the GfRange1d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfRange1dValue
+    {
+        public double min;
+        public double max;
+
+        public GfRange1dValue(double min, double max)
+        {
+            this.min = min;
+            this.max = max;
+        }
+
+        public static explicit operator GfRange1d(GfRange1dValue value)
+        {
+            return UsdCs.GfRange1dFromValue(value);
+        }
+
+        public static explicit operator GfRange1dValue(GfRange1d value)
+        {
+            return UsdCs.GfRange1dToValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfRange1f passed by value, laid out as the minimum followed by the maximum.
+    /// Reading one does not allocate, unlike the GfRange1f proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfRange1fValue
+    {
+        public float min;
+        public float max;
+
+        public GfRange1fValue(float min, float max)
+        {
+            this.min = min;
+            this.max = max;
+        }
+
+        public static explicit operator GfRange1f(GfRange1fValue value)
+        {
+            return UsdCs.GfRange1fFromValue(value);
+        }
+
+        public static explicit operator GfRange1fValue(GfRange1f value)
+        {
+            return UsdCs.GfRange1fToValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfRange2d passed by value, laid out as the minimum followed by the maximum.
+    /// Reading one does not allocate, unlike the GfRange2d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfRange2dValue
+    {
+        public GfVec2dValue min;
+        public GfVec2dValue max;
+
+        public GfRange2dValue(GfVec2dValue min, GfVec2dValue max)
+        {
+            this.min = min;
+            this.max = max;
+        }
+
+        public static explicit operator GfRange2d(GfRange2dValue value)
+        {
+            return UsdCs.GfRange2dFromValue(value);
+        }
+
+        public static explicit operator GfRange2dValue(GfRange2d value)
+        {
+            return UsdCs.GfRange2dToValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfRange3d passed by value, laid out as the minimum followed by the maximum.
+    /// Reading one does not allocate, unlike the GfRange3d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfRange3dValue
+    {
+        public GfVec3dValue min;
+        public GfVec3dValue max;
+
+        public GfRange3dValue(GfVec3dValue min, GfVec3dValue max)
+        {
+            this.min = min;
+            this.max = max;
+        }
+
+        public static explicit operator GfRange3d(GfRange3dValue value)
+        {
+            return UsdCs.GfRange3dFromValue(value);
+        }
+
+        public static explicit operator GfRange3dValue(GfRange3d value)
+        {
+            return UsdCs.GfRange3dToValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec2d passed by value, laid out as 2 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec2d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec2dValue
+    {
+        public double x;
+        public double y;
+
+        public GfVec2dValue(double x, double y)
+        {
+            this.x = x;
+            this.y = y;
+        }
+
+        public static explicit operator GfVec2d(GfVec2dValue value)
+        {
+            return UsdCs.GfVec2dFromValue(value);
+        }
+
+        public static explicit operator GfVec2dValue(GfVec2d value)
+        {
+            return UsdCs.GfVec2dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec2dValue value)
+        {
+            return UsdCs.VtValueFromGfVec2dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec2f passed by value, laid out as 2 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec2f proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec2fValue
+    {
+        public float x;
+        public float y;
+
+        public GfVec2fValue(float x, float y)
+        {
+            this.x = x;
+            this.y = y;
+        }
+
+        public static explicit operator GfVec2f(GfVec2fValue value)
+        {
+            return UsdCs.GfVec2fFromValue(value);
+        }
+
+        public static explicit operator GfVec2fValue(GfVec2f value)
+        {
+            return UsdCs.GfVec2fToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec2fValue value)
+        {
+            return UsdCs.VtValueFromGfVec2fValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec2i passed by value, laid out as 2 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec2i proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec2iValue
+    {
+        public int x;
+        public int y;
+
+        public GfVec2iValue(int x, int y)
+        {
+            this.x = x;
+            this.y = y;
+        }
+
+        public static explicit operator GfVec2i(GfVec2iValue value)
+        {
+            return UsdCs.GfVec2iFromValue(value);
+        }
+
+        public static explicit operator GfVec2iValue(GfVec2i value)
+        {
+            return UsdCs.GfVec2iToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec2iValue value)
+        {
+            return UsdCs.VtValueFromGfVec2iValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec3d passed by value, laid out as 3 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec3d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec3dValue
+    {
+        public double x;
+        public double y;
+        public double z;
+
+        public GfVec3dValue(double x, double y, double z)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+        }
+
+        public static explicit operator GfVec3d(GfVec3dValue value)
+        {
+            return UsdCs.GfVec3dFromValue(value);
+        }
+
+        public static explicit operator GfVec3dValue(GfVec3d value)
+        {
+            return UsdCs.GfVec3dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec3dValue value)
+        {
+            return UsdCs.VtValueFromGfVec3dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec3f passed by value, laid out as 3 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec3f proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec3fValue
+    {
+        public float x;
+        public float y;
+        public float z;
+
+        public GfVec3fValue(float x, float y, float z)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+        }
+
+        public static explicit operator GfVec3f(GfVec3fValue value)
+        {
+            return UsdCs.GfVec3fFromValue(value);
+        }
+
+        public static explicit operator GfVec3fValue(GfVec3f value)
+        {
+            return UsdCs.GfVec3fToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec3fValue value)
+        {
+            return UsdCs.VtValueFromGfVec3fValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec3i passed by value, laid out as 3 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec3i proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec3iValue
+    {
+        public int x;
+        public int y;
+        public int z;
+
+        public GfVec3iValue(int x, int y, int z)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+        }
+
+        public static explicit operator GfVec3i(GfVec3iValue value)
+        {
+            return UsdCs.GfVec3iFromValue(value);
+        }
+
+        public static explicit operator GfVec3iValue(GfVec3i value)
+        {
+            return UsdCs.GfVec3iToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec3iValue value)
+        {
+            return UsdCs.VtValueFromGfVec3iValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec4d passed by value, laid out as 4 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec4d proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec4dValue
+    {
+        public double x;
+        public double y;
+        public double z;
+        public double w;
+
+        public GfVec4dValue(double x, double y, double z, double w)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+            this.w = w;
+        }
+
+        public static explicit operator GfVec4d(GfVec4dValue value)
+        {
+            return UsdCs.GfVec4dFromValue(value);
+        }
+
+        public static explicit operator GfVec4dValue(GfVec4d value)
+        {
+            return UsdCs.GfVec4dToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec4dValue value)
+        {
+            return UsdCs.VtValueFromGfVec4dValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec4f passed by value, laid out as 4 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec4f proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec4fValue
+    {
+        public float x;
+        public float y;
+        public float z;
+        public float w;
+
+        public GfVec4fValue(float x, float y, float z, float w)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+            this.w = w;
+        }
+
+        public static explicit operator GfVec4f(GfVec4fValue value)
+        {
+            return UsdCs.GfVec4fFromValue(value);
+        }
+
+        public static explicit operator GfVec4fValue(GfVec4f value)
+        {
+            return UsdCs.GfVec4fToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec4fValue value)
+        {
+            return UsdCs.VtValueFromGfVec4fValue(value);
+        }
+    }
+
+    /// <summary>
+    /// A GfVec4i passed by value, laid out as 4 consecutive components.
+    /// Reading one does not allocate, unlike the GfVec4i proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct GfVec4iValue
+    {
+        public int x;
+        public int y;
+        public int z;
+        public int w;
+
+        public GfVec4iValue(int x, int y, int z, int w)
+        {
+            this.x = x;
+            this.y = y;
+            this.z = z;
+            this.w = w;
+        }
+
+        public static explicit operator GfVec4i(GfVec4iValue value)
+        {
+            return UsdCs.GfVec4iFromValue(value);
+        }
+
+        public static explicit operator GfVec4iValue(GfVec4i value)
+        {
+            return UsdCs.GfVec4iToValue(value);
+        }
+
+        public static implicit operator VtValue(GfVec4iValue value)
+        {
+            return UsdCs.VtValueFromGfVec4iValue(value);
+        }
+    }
+}
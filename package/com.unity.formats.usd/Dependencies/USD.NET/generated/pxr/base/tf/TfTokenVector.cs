@@ -361,5 +361,17 @@ namespace pxr
             UsdCsPINVOKE.TfTokenVector_SetRange(swigCPtr, index, TfTokenVector.getCPtr(values));
             if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
         }
+
+        public void CopyToHandles(int index, int count, long[] tokenHandles)
+        {
+            UsdCsPINVOKE.TfTokenVector_CopyToHandles(swigCPtr, index, count, tokenHandles);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
+
+        public void CopyToTextPointers(int index, int count, long[] tokenTexts, int[] tokenLengths)
+        {
+            UsdCsPINVOKE.TfTokenVector_CopyToTextPointers(swigCPtr, index, count, tokenTexts, tokenLengths);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
     }
 }
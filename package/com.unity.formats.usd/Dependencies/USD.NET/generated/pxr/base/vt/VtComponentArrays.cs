@@ -0,0 +1,161 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+using System;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+using pxr;
+
+/// <summary>
+/// Bulk conversions between VtArrays of vector, matrix and quaternion elements and managed arrays
+/// of structs made of float components, e.g. VtVec3fArray and UnityEngine.Vector3[].
+/// </summary>
+public static class VtComponentArrays
+{
+    class Converter
+    {
+        public uint ComponentCount;
+        public Func<Vt_ArrayBase, uint> Size;
+        public Action<Vt_ArrayBase, uint> Resize;
+        public Action<Vt_ArrayBase, IntPtr> CopyTo;
+        public Action<Vt_ArrayBase, IntPtr> CopyFrom;
+    }
+
+    static Dictionary<Type, Converter> sm_converters = new Dictionary<Type, Converter>();
+
+    /// <summary>
+    /// Returns the number of float components of each element of the given VtArray type, or zero
+    /// if the type has no bulk conversion.
+    /// </summary>
+    public static uint GetComponentCount(Type vtArrayType)
+    {
+        Converter converter;
+        return sm_converters.TryGetValue(vtArrayType, out converter) ? converter.ComponentCount : 0;
+    }
+
+    /// <summary>
+    /// Copies the elements of the array into output, converting each component to float. T must be
+    /// a struct of GetComponentCount() floats, the output array is reallocated if its length does
+    /// not match the size of the input.
+    /// </summary>
+    public static void CopyToArray<T>(Vt_ArrayBase input, ref T[] output) where T : struct
+    {
+        Converter converter = GetConverter(input, typeof(T));
+        uint size = converter.Size(input);
+        if (output == null || output.Length != size)
+        {
+            output = new T[size];
+        }
+        var handle = GCHandle.Alloc(output, GCHandleType.Pinned);
+        try
+        {
+            converter.CopyTo(input, handle.AddrOfPinnedObject());
+        }
+        finally
+        {
+            handle.Free();
+        }
+    }
+
+    /// <summary>
+    /// Copies the elements of input into the array, converting each component from float. T must
+    /// be a struct of GetComponentCount() floats, the array is resized to the length of the input.
+    /// </summary>
+    public static void CopyFromArray<T>(Vt_ArrayBase output, T[] input) where T : struct
+    {
+        Converter converter = GetConverter(output, typeof(T));
+        converter.Resize(output, (uint)input.Length);
+        var handle = GCHandle.Alloc(input, GCHandleType.Pinned);
+        try
+        {
+            converter.CopyFrom(output, handle.AddrOfPinnedObject());
+        }
+        finally
+        {
+            handle.Free();
+        }
+    }
+
+    static Converter GetConverter(Vt_ArrayBase array, Type elementType)
+    {
+        Converter converter;
+        if (!sm_converters.TryGetValue(array.GetType(), out converter))
+        {
+            throw new ArgumentException("No bulk conversion for " + array.GetType().Name);
+        }
+        if (Marshal.SizeOf(elementType) != converter.ComponentCount * sizeof(float))
+        {
+            throw new ArgumentException(elementType.Name + " does not have the layout of "
+                + converter.ComponentCount + " floats required by " + array.GetType().Name);
+        }
+        return converter;
+    }
+
+    static void Register<T>(uint componentCount,
+        Func<T, uint> size,
+        Action<T, uint> resize,
+        Action<T, IntPtr> copyTo,
+        Action<T, IntPtr> copyFrom) where T : Vt_ArrayBase
+    {
+        sm_converters[typeof(T)] = new Converter
+        {
+            ComponentCount = componentCount,
+            Size = (array) => size((T)array),
+            Resize = (array, n) => resize((T)array, n),
+            CopyTo = (array, dest) => copyTo((T)array, dest),
+            CopyFrom = (array, src) => copyFrom((T)array, src),
+        };
+    }
+
+    static VtComponentArrays()
+    {
+        Register<VtMatrix2dArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtMatrix3dArray>(9, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtMatrix4dArray>(16, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtQuatdArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtQuatfArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtQuathArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec2dArray>(2, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec2fArray>(2, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec2hArray>(2, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec2iArray>(2, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec3dArray>(3, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec3fArray>(3, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec3hArray>(3, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec3iArray>(3, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec4dArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec4fArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec4hArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+        Register<VtVec4iArray>(4, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));
+    }
+}
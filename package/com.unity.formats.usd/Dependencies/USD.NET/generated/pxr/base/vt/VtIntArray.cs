@@ -164,6 +164,57 @@ namespace pxr
             UsdCsPINVOKE.VtIntArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetElementSize()
+        {
+            uint ret = UsdCsPINVOKE.VtIntArray_GetElementSize();
+            return ret;
+        }
+
+        public System.IntPtr GetDataPointer()
+        {
+            System.IntPtr ret = UsdCsPINVOKE.VtIntArray_GetDataPointer(swigCPtr);
+            return ret;
+        }
+
+        public System.IntPtr GetConstDataPointer()
+        {
+            System.IntPtr ret = UsdCsPINVOKE.VtIntArray_GetConstDataPointer(swigCPtr);
+            return ret;
+        }
+
+#if UNITY_2021_2_OR_NEWER
+        /// <summary>
+        /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+        /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+        /// valid while this array is alive and is not resized.
+        /// </summary>
+        public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged
+        {
+            return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+        }
+
+        /// <summary>
+        /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+        /// with another array, it is detached (copied) first, as with any other write.
+        /// </summary>
+        public unsafe System.Span<T> AsSpan<T>() where T : unmanaged
+        {
+            return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+        }
+
+        int GetViewLength(int viewElementSize)
+        {
+            long byteLength = (long)size() * GetElementSize();
+            if (byteLength % viewElementSize != 0)
+            {
+                throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                    + viewElementSize + " bytes");
+            }
+            return (int)(byteLength / viewElementSize);
+        }
+
+#endif
+
         protected int GetValue(int index)
         {
             int ret = UsdCsPINVOKE.VtIntArray_GetValue(swigCPtr, index);
@@ -167,6 +167,22 @@ namespace pxr
             UsdCsPINVOKE.VtQuatdArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtQuatdArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtQuatdArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtQuatdArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
         protected GfQuatd GetValue(int index)
         {
             GfQuatd ret = new GfQuatd(UsdCsPINVOKE.VtQuatdArray_GetValue(swigCPtr, index), false);
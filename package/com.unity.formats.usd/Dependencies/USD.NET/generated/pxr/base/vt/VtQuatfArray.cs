@@ -167,6 +167,22 @@ namespace pxr
             UsdCsPINVOKE.VtQuatfArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtQuatfArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtQuatfArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtQuatfArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
         protected GfQuatf GetValue(int index)
         {
             GfQuatf ret = new GfQuatf(UsdCsPINVOKE.VtQuatfArray_GetValue(swigCPtr, index), false);
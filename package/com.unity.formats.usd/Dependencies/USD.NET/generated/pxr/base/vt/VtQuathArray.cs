@@ -167,6 +167,22 @@ namespace pxr
             UsdCsPINVOKE.VtQuathArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtQuathArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtQuathArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtQuathArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
         protected GfQuath GetValue(int index)
         {
             GfQuath ret = new GfQuath(UsdCsPINVOKE.VtQuathArray_GetValue(swigCPtr, index), false);
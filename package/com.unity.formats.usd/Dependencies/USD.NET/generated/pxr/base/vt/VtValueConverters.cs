@@ -0,0 +1,283 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+using System;
+using System.Collections.Generic;
+using pxr;
+
+/// <summary>
+/// Strongly typed VtValueTo* accessors, indexed by C# type and by SdfValueTypeName.
+/// </summary>
+public static class VtValueConverters
+{
+    static Dictionary<Type, Delegate> sm_toCs = new Dictionary<Type, Delegate>();
+    static Dictionary<Type, Delegate> sm_copyToCs = new Dictionary<Type, Delegate>();
+    static Dictionary<Type, Func<VtValue, object>> sm_toObject = new Dictionary<Type, Func<VtValue, object>>();
+    static Dictionary<Type, Action<VtValue, object>> sm_copyToObject = new Dictionary<Type, Action<VtValue, object>>();
+
+    // Built on first use, since it touches every member of SdfValueTypeNames.
+    static Dictionary<string, Type> sm_sdfTypes;
+
+    /// <summary>
+    /// Returns the VtValueTo{T} accessor, or null if T is not held by any Sdf value type.
+    /// </summary>
+    public static Func<VtValue, T> GetConverter<T>()
+    {
+        Delegate converter;
+        return sm_toCs.TryGetValue(typeof(T), out converter) ? (Func<VtValue, T>)converter : null;
+    }
+
+    /// <summary>
+    /// Returns the VtValueTo{T} accessor which copies into an existing object, or null if T is
+    /// a value type, string or is not held by any Sdf value type.
+    /// </summary>
+    public static Action<VtValue, T> GetCopyConverter<T>()
+    {
+        Delegate converter;
+        return sm_copyToCs.TryGetValue(typeof(T), out converter) ? (Action<VtValue, T>)converter : null;
+    }
+
+    /// <summary>
+    /// Returns the strongly typed copy accessor for the given type as an untyped delegate, which
+    /// is useful when the underlying method is required, or null if no accessor exists.
+    /// </summary>
+    public static Delegate GetCopyConverter(Type csType)
+    {
+        Delegate converter;
+        return sm_copyToCs.TryGetValue(csType, out converter) ? converter : null;
+    }
+
+    /// <summary>
+    /// Finds the accessor returning the given type, boxed as an object.
+    /// </summary>
+    public static bool TryGetConverter(Type csType, out Func<VtValue, object> converter)
+    {
+        return sm_toObject.TryGetValue(csType, out converter);
+    }
+
+    /// <summary>
+    /// Finds the accessor copying into an existing object of the given type.
+    /// </summary>
+    public static bool TryGetCopyConverter(Type csType, out Action<VtValue, object> converter)
+    {
+        return sm_copyToObject.TryGetValue(csType, out converter);
+    }
+
+    /// <summary>
+    /// Finds the C# type used to hold values of the given Sdf type, e.g. Point3f is held by GfVec3f.
+    /// </summary>
+    public static bool TryGetCsType(SdfValueTypeName sdfTypeName, out Type csType)
+    {
+        if (sm_sdfTypes == null)
+        {
+            var sdfTypes = new Dictionary<string, Type>();
+            RegisterSdfTypes(sdfTypes);
+            sm_sdfTypes = sdfTypes;
+        }
+        return sm_sdfTypes.TryGetValue(sdfTypeName.GetAsToken().ToString(), out csType);
+    }
+
+    static void Register<T>(Func<VtValue, T> toCs, Action<VtValue, T> copyToCs)
+    {
+        sm_toCs[typeof(T)] = toCs;
+        sm_toObject[typeof(T)] = (value) => toCs(value);
+        if (copyToCs != null)
+        {
+            sm_copyToCs[typeof(T)] = copyToCs;
+            sm_copyToObject[typeof(T)] = (value, output) => copyToCs(value, (T)output);
+        }
+    }
+
+    static void RegisterSdfType(Dictionary<string, Type> sdfTypes, SdfValueTypeName sdfTypeName, Type csType)
+    {
+        sdfTypes[sdfTypeName.GetAsToken().ToString()] = csType;
+    }
+
+    static VtValueConverters()
+    {
+        Register<GfHalf>(UsdCs.VtValueToGfHalf, UsdCs.VtValueToGfHalf);
+        Register<GfMatrix2d>(UsdCs.VtValueToGfMatrix2d, UsdCs.VtValueToGfMatrix2d);
+        Register<GfMatrix3d>(UsdCs.VtValueToGfMatrix3d, UsdCs.VtValueToGfMatrix3d);
+        Register<GfMatrix4d>(UsdCs.VtValueToGfMatrix4d, UsdCs.VtValueToGfMatrix4d);
+        Register<GfQuatd>(UsdCs.VtValueToGfQuatd, UsdCs.VtValueToGfQuatd);
+        Register<GfQuatf>(UsdCs.VtValueToGfQuatf, UsdCs.VtValueToGfQuatf);
+        Register<GfQuath>(UsdCs.VtValueToGfQuath, UsdCs.VtValueToGfQuath);
+        Register<GfVec2d>(UsdCs.VtValueToGfVec2d, UsdCs.VtValueToGfVec2d);
+        Register<GfVec2f>(UsdCs.VtValueToGfVec2f, UsdCs.VtValueToGfVec2f);
+        Register<GfVec2h>(UsdCs.VtValueToGfVec2h, UsdCs.VtValueToGfVec2h);
+        Register<GfVec2i>(UsdCs.VtValueToGfVec2i, UsdCs.VtValueToGfVec2i);
+        Register<GfVec3d>(UsdCs.VtValueToGfVec3d, UsdCs.VtValueToGfVec3d);
+        Register<GfVec3f>(UsdCs.VtValueToGfVec3f, UsdCs.VtValueToGfVec3f);
+        Register<GfVec3h>(UsdCs.VtValueToGfVec3h, UsdCs.VtValueToGfVec3h);
+        Register<GfVec3i>(UsdCs.VtValueToGfVec3i, UsdCs.VtValueToGfVec3i);
+        Register<GfVec4d>(UsdCs.VtValueToGfVec4d, UsdCs.VtValueToGfVec4d);
+        Register<GfVec4f>(UsdCs.VtValueToGfVec4f, UsdCs.VtValueToGfVec4f);
+        Register<GfVec4h>(UsdCs.VtValueToGfVec4h, UsdCs.VtValueToGfVec4h);
+        Register<GfVec4i>(UsdCs.VtValueToGfVec4i, UsdCs.VtValueToGfVec4i);
+        Register<SdfAssetPath>(UsdCs.VtValueToSdfAssetPath, UsdCs.VtValueToSdfAssetPath);
+        Register<SdfAssetPathArray>(UsdCs.VtValueToSdfAssetPathArray, UsdCs.VtValueToSdfAssetPathArray);
+        Register<SdfTimeCode>(UsdCs.VtValueToSdfTimeCode, UsdCs.VtValueToSdfTimeCode);
+        Register<SdfTimeCodeArray>(UsdCs.VtValueToSdfTimeCodeArray, UsdCs.VtValueToSdfTimeCodeArray);
+        Register<TfToken>(UsdCs.VtValueToTfToken, UsdCs.VtValueToTfToken);
+        Register<VtBoolArray>(UsdCs.VtValueToVtBoolArray, UsdCs.VtValueToVtBoolArray);
+        Register<VtDoubleArray>(UsdCs.VtValueToVtDoubleArray, UsdCs.VtValueToVtDoubleArray);
+        Register<VtFloatArray>(UsdCs.VtValueToVtFloatArray, UsdCs.VtValueToVtFloatArray);
+        Register<VtHalfArray>(UsdCs.VtValueToVtHalfArray, UsdCs.VtValueToVtHalfArray);
+        Register<VtInt64Array>(UsdCs.VtValueToVtInt64Array, UsdCs.VtValueToVtInt64Array);
+        Register<VtIntArray>(UsdCs.VtValueToVtIntArray, UsdCs.VtValueToVtIntArray);
+        Register<VtMatrix2dArray>(UsdCs.VtValueToVtMatrix2dArray, UsdCs.VtValueToVtMatrix2dArray);
+        Register<VtMatrix3dArray>(UsdCs.VtValueToVtMatrix3dArray, UsdCs.VtValueToVtMatrix3dArray);
+        Register<VtMatrix4dArray>(UsdCs.VtValueToVtMatrix4dArray, UsdCs.VtValueToVtMatrix4dArray);
+        Register<VtQuatdArray>(UsdCs.VtValueToVtQuatdArray, UsdCs.VtValueToVtQuatdArray);
+        Register<VtQuatfArray>(UsdCs.VtValueToVtQuatfArray, UsdCs.VtValueToVtQuatfArray);
+        Register<VtQuathArray>(UsdCs.VtValueToVtQuathArray, UsdCs.VtValueToVtQuathArray);
+        Register<VtStringArray>(UsdCs.VtValueToVtStringArray, UsdCs.VtValueToVtStringArray);
+        Register<VtTokenArray>(UsdCs.VtValueToVtTokenArray, UsdCs.VtValueToVtTokenArray);
+        Register<VtUCharArray>(UsdCs.VtValueToVtUCharArray, UsdCs.VtValueToVtUCharArray);
+        Register<VtUInt64Array>(UsdCs.VtValueToVtUInt64Array, UsdCs.VtValueToVtUInt64Array);
+        Register<VtUIntArray>(UsdCs.VtValueToVtUIntArray, UsdCs.VtValueToVtUIntArray);
+        Register<VtVec2dArray>(UsdCs.VtValueToVtVec2dArray, UsdCs.VtValueToVtVec2dArray);
+        Register<VtVec2fArray>(UsdCs.VtValueToVtVec2fArray, UsdCs.VtValueToVtVec2fArray);
+        Register<VtVec2hArray>(UsdCs.VtValueToVtVec2hArray, UsdCs.VtValueToVtVec2hArray);
+        Register<VtVec2iArray>(UsdCs.VtValueToVtVec2iArray, UsdCs.VtValueToVtVec2iArray);
+        Register<VtVec3dArray>(UsdCs.VtValueToVtVec3dArray, UsdCs.VtValueToVtVec3dArray);
+        Register<VtVec3fArray>(UsdCs.VtValueToVtVec3fArray, UsdCs.VtValueToVtVec3fArray);
+        Register<VtVec3hArray>(UsdCs.VtValueToVtVec3hArray, UsdCs.VtValueToVtVec3hArray);
+        Register<VtVec3iArray>(UsdCs.VtValueToVtVec3iArray, UsdCs.VtValueToVtVec3iArray);
+        Register<VtVec4dArray>(UsdCs.VtValueToVtVec4dArray, UsdCs.VtValueToVtVec4dArray);
+        Register<VtVec4fArray>(UsdCs.VtValueToVtVec4fArray, UsdCs.VtValueToVtVec4fArray);
+        Register<VtVec4hArray>(UsdCs.VtValueToVtVec4hArray, UsdCs.VtValueToVtVec4hArray);
+        Register<VtVec4iArray>(UsdCs.VtValueToVtVec4iArray, UsdCs.VtValueToVtVec4iArray);
+        Register<bool>(UsdCs.VtValueTobool, null);
+        Register<double>(UsdCs.VtValueTodouble, null);
+        Register<float>(UsdCs.VtValueTofloat, null);
+        Register<int>(UsdCs.VtValueToint, null);
+        Register<long>(UsdCs.VtValueTolong, null);
+        Register<string>(UsdCs.VtValueTostring, null);
+        Register<ulong>(UsdCs.VtValueToulong, null);
+        Register<byte>(UsdCs.VtValueTobyte, null);
+        Register<uint>(UsdCs.VtValueTouint, null);
+    }
+
+    static void RegisterSdfTypes(Dictionary<string, Type> sdfTypes)
+    {
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Bool, typeof(bool));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UChar, typeof(byte));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int, typeof(int));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UInt, typeof(uint));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int64, typeof(long));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UInt64, typeof(ulong));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half, typeof(GfHalf));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float, typeof(float));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double, typeof(double));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TimeCode, typeof(SdfTimeCode));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.String, typeof(string));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Token, typeof(TfToken));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Asset, typeof(SdfAssetPath));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int2, typeof(GfVec2i));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int3, typeof(GfVec3i));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int4, typeof(GfVec4i));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half2, typeof(GfVec2h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half3, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half4, typeof(GfVec4h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float2, typeof(GfVec2f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float3, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float4, typeof(GfVec4f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double2, typeof(GfVec2d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double3, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double4, typeof(GfVec4d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3h, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3f, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3d, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3h, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3f, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3d, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3h, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3f, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3d, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3h, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3f, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3d, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4h, typeof(GfVec4h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4f, typeof(GfVec4f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4d, typeof(GfVec4d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Quath, typeof(GfQuath));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Quatf, typeof(GfQuatf));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Quatd, typeof(GfQuatd));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix2d, typeof(GfMatrix2d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix3d, typeof(GfMatrix3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix4d, typeof(GfMatrix4d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Frame4d, typeof(GfMatrix4d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2h, typeof(GfVec2h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2f, typeof(GfVec2f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2d, typeof(GfVec2d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3h, typeof(GfVec3h));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3f, typeof(GfVec3f));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3d, typeof(GfVec3d));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.BoolArray, typeof(VtBoolArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UCharArray, typeof(VtUCharArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.IntArray, typeof(VtIntArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UIntArray, typeof(VtUIntArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int64Array, typeof(VtInt64Array));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.UInt64Array, typeof(VtUInt64Array));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.HalfArray, typeof(VtHalfArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.FloatArray, typeof(VtFloatArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.DoubleArray, typeof(VtDoubleArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TimeCodeArray, typeof(SdfTimeCodeArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.StringArray, typeof(VtStringArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TokenArray, typeof(VtTokenArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.AssetArray, typeof(SdfAssetPathArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int2Array, typeof(VtVec2iArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int3Array, typeof(VtVec3iArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Int4Array, typeof(VtVec4iArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half2Array, typeof(VtVec2hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half3Array, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Half4Array, typeof(VtVec4hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float2Array, typeof(VtVec2fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float3Array, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Float4Array, typeof(VtVec4fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double2Array, typeof(VtVec2dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double3Array, typeof(VtVec3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Double4Array, typeof(VtVec4dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3hArray, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3fArray, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Point3dArray, typeof(VtVec3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3hArray, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3fArray, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Vector3dArray, typeof(VtVec3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3hArray, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3fArray, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Normal3dArray, typeof(VtVec3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3hArray, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3fArray, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color3dArray, typeof(VtVec3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4hArray, typeof(VtVec4hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4fArray, typeof(VtVec4fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Color4dArray, typeof(VtVec4dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.QuathArray, typeof(VtQuathArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.QuatfArray, typeof(VtQuatfArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.QuatdArray, typeof(VtQuatdArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix2dArray, typeof(VtMatrix2dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix3dArray, typeof(VtMatrix3dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Matrix4dArray, typeof(VtMatrix4dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.Frame4dArray, typeof(VtMatrix4dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2hArray, typeof(VtVec2hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2fArray, typeof(VtVec2fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord2dArray, typeof(VtVec2dArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3hArray, typeof(VtVec3hArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3fArray, typeof(VtVec3fArray));
+        RegisterSdfType(sdfTypes, SdfValueTypeNames.TexCoord3dArray, typeof(VtVec3dArray));
+    }
+}
@@ -167,6 +167,22 @@ namespace pxr
             UsdCsPINVOKE.VtVec2hArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtVec2hArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtVec2hArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtVec2hArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
         protected GfVec2h GetValue(int index)
         {
             GfVec2h ret = new GfVec2h(UsdCsPINVOKE.VtVec2hArray_GetValue(swigCPtr, index), false);
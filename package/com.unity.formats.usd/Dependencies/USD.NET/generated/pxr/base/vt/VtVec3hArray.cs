@@ -167,6 +167,22 @@ namespace pxr
             UsdCsPINVOKE.VtVec3hArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtVec3hArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtVec3hArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtVec3hArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
         protected GfVec3h GetValue(int index)
         {
             GfVec3h ret = new GfVec3h(UsdCsPINVOKE.VtVec3hArray_GetValue(swigCPtr, index), false);
@@ -167,6 +167,32 @@ namespace pxr
             UsdCsPINVOKE.VtVec4hArray_CopyFromArray__SWIG_1(swigCPtr, src);
         }
 
+        public static uint GetComponentCount()
+        {
+            uint ret = UsdCsPINVOKE.VtVec4hArray_GetComponentCount();
+            return ret;
+        }
+
+        public void CopyToFloatArray(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtVec4hArray_CopyToFloatArray(swigCPtr, dest);
+        }
+
+        public void CopyFromFloatArray(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtVec4hArray_CopyFromFloatArray(swigCPtr, src);
+        }
+
+        public void CopyToUnorm8Array(System.IntPtr dest)
+        {
+            UsdCsPINVOKE.VtVec4hArray_CopyToUnorm8Array(swigCPtr, dest);
+        }
+
+        public void CopyFromUnorm8Array(System.IntPtr src)
+        {
+            UsdCsPINVOKE.VtVec4hArray_CopyFromUnorm8Array(swigCPtr, src);
+        }
+
         protected GfVec4h GetValue(int index)
         {
             GfVec4h ret = new GfVec4h(UsdCsPINVOKE.VtVec4hArray_GetValue(swigCPtr, index), false);
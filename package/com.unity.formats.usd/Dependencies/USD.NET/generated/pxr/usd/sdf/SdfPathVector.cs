@@ -361,5 +361,17 @@ namespace pxr
             UsdCsPINVOKE.SdfPathVector_SetRange(swigCPtr, index, SdfPathVector.getCPtr(values));
             if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
         }
+
+        public void CopyToHandles(int index, int count, long[] pathHandles)
+        {
+            UsdCsPINVOKE.SdfPathVector_CopyToHandles(swigCPtr, index, count, pathHandles);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
+
+        public void CopyToTextPointers(int index, int count, long[] pathTexts, int[] pathLengths)
+        {
+            UsdCsPINVOKE.SdfPathVector_CopyToTextPointers(swigCPtr, index, count, pathTexts, pathLengths);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
     }
 }
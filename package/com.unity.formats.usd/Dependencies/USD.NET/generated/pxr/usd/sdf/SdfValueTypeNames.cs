@@ -14,113 +14,247 @@
 
 
 using System;
+using System.Threading;
 using pxr;
+
+/// <summary>
+/// The Sdf value type names, each of which is fetched from native code the first time it is used.
+/// </summary>
 public static class SdfValueTypeNames
 {
-    static public SdfValueTypeName Bool = UsdCs.SdfGetValueTypeBool();
-    static public SdfValueTypeName UChar = UsdCs.SdfGetValueTypeUChar();
-    static public SdfValueTypeName Int = UsdCs.SdfGetValueTypeInt();
-    static public SdfValueTypeName UInt = UsdCs.SdfGetValueTypeUInt();
-    static public SdfValueTypeName Int64 = UsdCs.SdfGetValueTypeInt64();
-    static public SdfValueTypeName UInt64 = UsdCs.SdfGetValueTypeUInt64();
-    static public SdfValueTypeName Half = UsdCs.SdfGetValueTypeHalf();
-    static public SdfValueTypeName Float = UsdCs.SdfGetValueTypeFloat();
-    static public SdfValueTypeName Double = UsdCs.SdfGetValueTypeDouble();
-    static public SdfValueTypeName TimeCode = UsdCs.SdfGetValueTypeTimeCode();
-    static public SdfValueTypeName String = UsdCs.SdfGetValueTypeString();
-    static public SdfValueTypeName Token = UsdCs.SdfGetValueTypeToken();
-    static public SdfValueTypeName Asset = UsdCs.SdfGetValueTypeAsset();
-    static public SdfValueTypeName Int2 = UsdCs.SdfGetValueTypeInt2();
-    static public SdfValueTypeName Int3 = UsdCs.SdfGetValueTypeInt3();
-    static public SdfValueTypeName Int4 = UsdCs.SdfGetValueTypeInt4();
-    static public SdfValueTypeName Half2 = UsdCs.SdfGetValueTypeHalf2();
-    static public SdfValueTypeName Half3 = UsdCs.SdfGetValueTypeHalf3();
-    static public SdfValueTypeName Half4 = UsdCs.SdfGetValueTypeHalf4();
-    static public SdfValueTypeName Float2 = UsdCs.SdfGetValueTypeFloat2();
-    static public SdfValueTypeName Float3 = UsdCs.SdfGetValueTypeFloat3();
-    static public SdfValueTypeName Float4 = UsdCs.SdfGetValueTypeFloat4();
-    static public SdfValueTypeName Double2 = UsdCs.SdfGetValueTypeDouble2();
-    static public SdfValueTypeName Double3 = UsdCs.SdfGetValueTypeDouble3();
-    static public SdfValueTypeName Double4 = UsdCs.SdfGetValueTypeDouble4();
-    static public SdfValueTypeName Point3h = UsdCs.SdfGetValueTypePoint3h();
-    static public SdfValueTypeName Point3f = UsdCs.SdfGetValueTypePoint3f();
-    static public SdfValueTypeName Point3d = UsdCs.SdfGetValueTypePoint3d();
-    static public SdfValueTypeName Vector3h = UsdCs.SdfGetValueTypeVector3h();
-    static public SdfValueTypeName Vector3f = UsdCs.SdfGetValueTypeVector3f();
-    static public SdfValueTypeName Vector3d = UsdCs.SdfGetValueTypeVector3d();
-    static public SdfValueTypeName Normal3h = UsdCs.SdfGetValueTypeNormal3h();
-    static public SdfValueTypeName Normal3f = UsdCs.SdfGetValueTypeNormal3f();
-    static public SdfValueTypeName Normal3d = UsdCs.SdfGetValueTypeNormal3d();
-    static public SdfValueTypeName Color3h = UsdCs.SdfGetValueTypeColor3h();
-    static public SdfValueTypeName Color3f = UsdCs.SdfGetValueTypeColor3f();
-    static public SdfValueTypeName Color3d = UsdCs.SdfGetValueTypeColor3d();
-    static public SdfValueTypeName Color4h = UsdCs.SdfGetValueTypeColor4h();
-    static public SdfValueTypeName Color4f = UsdCs.SdfGetValueTypeColor4f();
-    static public SdfValueTypeName Color4d = UsdCs.SdfGetValueTypeColor4d();
-    static public SdfValueTypeName Quath = UsdCs.SdfGetValueTypeQuath();
-    static public SdfValueTypeName Quatf = UsdCs.SdfGetValueTypeQuatf();
-    static public SdfValueTypeName Quatd = UsdCs.SdfGetValueTypeQuatd();
-    static public SdfValueTypeName Matrix2d = UsdCs.SdfGetValueTypeMatrix2d();
-    static public SdfValueTypeName Matrix3d = UsdCs.SdfGetValueTypeMatrix3d();
-    static public SdfValueTypeName Matrix4d = UsdCs.SdfGetValueTypeMatrix4d();
-    static public SdfValueTypeName Frame4d = UsdCs.SdfGetValueTypeFrame4d();
-    static public SdfValueTypeName TexCoord2h = UsdCs.SdfGetValueTypeTexCoord2h();
-    static public SdfValueTypeName TexCoord2f = UsdCs.SdfGetValueTypeTexCoord2f();
-    static public SdfValueTypeName TexCoord2d = UsdCs.SdfGetValueTypeTexCoord2d();
-    static public SdfValueTypeName TexCoord3h = UsdCs.SdfGetValueTypeTexCoord3h();
-    static public SdfValueTypeName TexCoord3f = UsdCs.SdfGetValueTypeTexCoord3f();
-    static public SdfValueTypeName TexCoord3d = UsdCs.SdfGetValueTypeTexCoord3d();
-    static public SdfValueTypeName BoolArray = UsdCs.SdfGetValueTypeBoolArray();
-    static public SdfValueTypeName UCharArray = UsdCs.SdfGetValueTypeUCharArray();
-    static public SdfValueTypeName IntArray = UsdCs.SdfGetValueTypeIntArray();
-    static public SdfValueTypeName UIntArray = UsdCs.SdfGetValueTypeUIntArray();
-    static public SdfValueTypeName Int64Array = UsdCs.SdfGetValueTypeInt64Array();
-    static public SdfValueTypeName UInt64Array = UsdCs.SdfGetValueTypeUInt64Array();
-    static public SdfValueTypeName HalfArray = UsdCs.SdfGetValueTypeHalfArray();
-    static public SdfValueTypeName FloatArray = UsdCs.SdfGetValueTypeFloatArray();
-    static public SdfValueTypeName DoubleArray = UsdCs.SdfGetValueTypeDoubleArray();
-    static public SdfValueTypeName TimeCodeArray = UsdCs.SdfGetValueTypeTimeCodeArray();
-    static public SdfValueTypeName StringArray = UsdCs.SdfGetValueTypeStringArray();
-    static public SdfValueTypeName TokenArray = UsdCs.SdfGetValueTypeTokenArray();
-    static public SdfValueTypeName AssetArray = UsdCs.SdfGetValueTypeAssetArray();
-    static public SdfValueTypeName Int2Array = UsdCs.SdfGetValueTypeInt2Array();
-    static public SdfValueTypeName Int3Array = UsdCs.SdfGetValueTypeInt3Array();
-    static public SdfValueTypeName Int4Array = UsdCs.SdfGetValueTypeInt4Array();
-    static public SdfValueTypeName Half2Array = UsdCs.SdfGetValueTypeHalf2Array();
-    static public SdfValueTypeName Half3Array = UsdCs.SdfGetValueTypeHalf3Array();
-    static public SdfValueTypeName Half4Array = UsdCs.SdfGetValueTypeHalf4Array();
-    static public SdfValueTypeName Float2Array = UsdCs.SdfGetValueTypeFloat2Array();
-    static public SdfValueTypeName Float3Array = UsdCs.SdfGetValueTypeFloat3Array();
-    static public SdfValueTypeName Float4Array = UsdCs.SdfGetValueTypeFloat4Array();
-    static public SdfValueTypeName Double2Array = UsdCs.SdfGetValueTypeDouble2Array();
-    static public SdfValueTypeName Double3Array = UsdCs.SdfGetValueTypeDouble3Array();
-    static public SdfValueTypeName Double4Array = UsdCs.SdfGetValueTypeDouble4Array();
-    static public SdfValueTypeName Point3hArray = UsdCs.SdfGetValueTypePoint3hArray();
-    static public SdfValueTypeName Point3fArray = UsdCs.SdfGetValueTypePoint3fArray();
-    static public SdfValueTypeName Point3dArray = UsdCs.SdfGetValueTypePoint3dArray();
-    static public SdfValueTypeName Vector3hArray = UsdCs.SdfGetValueTypeVector3hArray();
-    static public SdfValueTypeName Vector3fArray = UsdCs.SdfGetValueTypeVector3fArray();
-    static public SdfValueTypeName Vector3dArray = UsdCs.SdfGetValueTypeVector3dArray();
-    static public SdfValueTypeName Normal3hArray = UsdCs.SdfGetValueTypeNormal3hArray();
-    static public SdfValueTypeName Normal3fArray = UsdCs.SdfGetValueTypeNormal3fArray();
-    static public SdfValueTypeName Normal3dArray = UsdCs.SdfGetValueTypeNormal3dArray();
-    static public SdfValueTypeName Color3hArray = UsdCs.SdfGetValueTypeColor3hArray();
-    static public SdfValueTypeName Color3fArray = UsdCs.SdfGetValueTypeColor3fArray();
-    static public SdfValueTypeName Color3dArray = UsdCs.SdfGetValueTypeColor3dArray();
-    static public SdfValueTypeName Color4hArray = UsdCs.SdfGetValueTypeColor4hArray();
-    static public SdfValueTypeName Color4fArray = UsdCs.SdfGetValueTypeColor4fArray();
-    static public SdfValueTypeName Color4dArray = UsdCs.SdfGetValueTypeColor4dArray();
-    static public SdfValueTypeName QuathArray = UsdCs.SdfGetValueTypeQuathArray();
-    static public SdfValueTypeName QuatfArray = UsdCs.SdfGetValueTypeQuatfArray();
-    static public SdfValueTypeName QuatdArray = UsdCs.SdfGetValueTypeQuatdArray();
-    static public SdfValueTypeName Matrix2dArray = UsdCs.SdfGetValueTypeMatrix2dArray();
-    static public SdfValueTypeName Matrix3dArray = UsdCs.SdfGetValueTypeMatrix3dArray();
-    static public SdfValueTypeName Matrix4dArray = UsdCs.SdfGetValueTypeMatrix4dArray();
-    static public SdfValueTypeName Frame4dArray = UsdCs.SdfGetValueTypeFrame4dArray();
-    static public SdfValueTypeName TexCoord2hArray = UsdCs.SdfGetValueTypeTexCoord2hArray();
-    static public SdfValueTypeName TexCoord2fArray = UsdCs.SdfGetValueTypeTexCoord2fArray();
-    static public SdfValueTypeName TexCoord2dArray = UsdCs.SdfGetValueTypeTexCoord2dArray();
-    static public SdfValueTypeName TexCoord3hArray = UsdCs.SdfGetValueTypeTexCoord3hArray();
-    static public SdfValueTypeName TexCoord3fArray = UsdCs.SdfGetValueTypeTexCoord3fArray();
-    static public SdfValueTypeName TexCoord3dArray = UsdCs.SdfGetValueTypeTexCoord3dArray();
+    static int sm_materializedCount;
+
+    /// <summary>
+    /// The number of value type names which have been fetched so far.
+    /// </summary>
+    public static int MaterializedCount { get { return sm_materializedCount; } }
+
+    /// <summary>
+    /// The total number of value type names.
+    /// </summary>
+    public const int Count = 106;
+
+    static SdfValueTypeName Materialize(ref SdfValueTypeName field, SdfValueTypeName value)
+    {
+        if (Interlocked.CompareExchange(ref field, value, null) == null)
+        {
+            Interlocked.Increment(ref sm_materializedCount);
+            return value;
+        }
+        value.Dispose();
+        return field;
+    }
+
+    static SdfValueTypeName sm_Bool;
+    static public SdfValueTypeName Bool { get { return sm_Bool ?? Materialize(ref sm_Bool, UsdCs.SdfGetValueTypeBool()); } }
+    static SdfValueTypeName sm_UChar;
+    static public SdfValueTypeName UChar { get { return sm_UChar ?? Materialize(ref sm_UChar, UsdCs.SdfGetValueTypeUChar()); } }
+    static SdfValueTypeName sm_Int;
+    static public SdfValueTypeName Int { get { return sm_Int ?? Materialize(ref sm_Int, UsdCs.SdfGetValueTypeInt()); } }
+    static SdfValueTypeName sm_UInt;
+    static public SdfValueTypeName UInt { get { return sm_UInt ?? Materialize(ref sm_UInt, UsdCs.SdfGetValueTypeUInt()); } }
+    static SdfValueTypeName sm_Int64;
+    static public SdfValueTypeName Int64 { get { return sm_Int64 ?? Materialize(ref sm_Int64, UsdCs.SdfGetValueTypeInt64()); } }
+    static SdfValueTypeName sm_UInt64;
+    static public SdfValueTypeName UInt64 { get { return sm_UInt64 ?? Materialize(ref sm_UInt64, UsdCs.SdfGetValueTypeUInt64()); } }
+    static SdfValueTypeName sm_Half;
+    static public SdfValueTypeName Half { get { return sm_Half ?? Materialize(ref sm_Half, UsdCs.SdfGetValueTypeHalf()); } }
+    static SdfValueTypeName sm_Float;
+    static public SdfValueTypeName Float { get { return sm_Float ?? Materialize(ref sm_Float, UsdCs.SdfGetValueTypeFloat()); } }
+    static SdfValueTypeName sm_Double;
+    static public SdfValueTypeName Double { get { return sm_Double ?? Materialize(ref sm_Double, UsdCs.SdfGetValueTypeDouble()); } }
+    static SdfValueTypeName sm_TimeCode;
+    static public SdfValueTypeName TimeCode { get { return sm_TimeCode ?? Materialize(ref sm_TimeCode, UsdCs.SdfGetValueTypeTimeCode()); } }
+    static SdfValueTypeName sm_String;
+    static public SdfValueTypeName String { get { return sm_String ?? Materialize(ref sm_String, UsdCs.SdfGetValueTypeString()); } }
+    static SdfValueTypeName sm_Token;
+    static public SdfValueTypeName Token { get { return sm_Token ?? Materialize(ref sm_Token, UsdCs.SdfGetValueTypeToken()); } }
+    static SdfValueTypeName sm_Asset;
+    static public SdfValueTypeName Asset { get { return sm_Asset ?? Materialize(ref sm_Asset, UsdCs.SdfGetValueTypeAsset()); } }
+    static SdfValueTypeName sm_Int2;
+    static public SdfValueTypeName Int2 { get { return sm_Int2 ?? Materialize(ref sm_Int2, UsdCs.SdfGetValueTypeInt2()); } }
+    static SdfValueTypeName sm_Int3;
+    static public SdfValueTypeName Int3 { get { return sm_Int3 ?? Materialize(ref sm_Int3, UsdCs.SdfGetValueTypeInt3()); } }
+    static SdfValueTypeName sm_Int4;
+    static public SdfValueTypeName Int4 { get { return sm_Int4 ?? Materialize(ref sm_Int4, UsdCs.SdfGetValueTypeInt4()); } }
+    static SdfValueTypeName sm_Half2;
+    static public SdfValueTypeName Half2 { get { return sm_Half2 ?? Materialize(ref sm_Half2, UsdCs.SdfGetValueTypeHalf2()); } }
+    static SdfValueTypeName sm_Half3;
+    static public SdfValueTypeName Half3 { get { return sm_Half3 ?? Materialize(ref sm_Half3, UsdCs.SdfGetValueTypeHalf3()); } }
+    static SdfValueTypeName sm_Half4;
+    static public SdfValueTypeName Half4 { get { return sm_Half4 ?? Materialize(ref sm_Half4, UsdCs.SdfGetValueTypeHalf4()); } }
+    static SdfValueTypeName sm_Float2;
+    static public SdfValueTypeName Float2 { get { return sm_Float2 ?? Materialize(ref sm_Float2, UsdCs.SdfGetValueTypeFloat2()); } }
+    static SdfValueTypeName sm_Float3;
+    static public SdfValueTypeName Float3 { get { return sm_Float3 ?? Materialize(ref sm_Float3, UsdCs.SdfGetValueTypeFloat3()); } }
+    static SdfValueTypeName sm_Float4;
+    static public SdfValueTypeName Float4 { get { return sm_Float4 ?? Materialize(ref sm_Float4, UsdCs.SdfGetValueTypeFloat4()); } }
+    static SdfValueTypeName sm_Double2;
+    static public SdfValueTypeName Double2 { get { return sm_Double2 ?? Materialize(ref sm_Double2, UsdCs.SdfGetValueTypeDouble2()); } }
+    static SdfValueTypeName sm_Double3;
+    static public SdfValueTypeName Double3 { get { return sm_Double3 ?? Materialize(ref sm_Double3, UsdCs.SdfGetValueTypeDouble3()); } }
+    static SdfValueTypeName sm_Double4;
+    static public SdfValueTypeName Double4 { get { return sm_Double4 ?? Materialize(ref sm_Double4, UsdCs.SdfGetValueTypeDouble4()); } }
+    static SdfValueTypeName sm_Point3h;
+    static public SdfValueTypeName Point3h { get { return sm_Point3h ?? Materialize(ref sm_Point3h, UsdCs.SdfGetValueTypePoint3h()); } }
+    static SdfValueTypeName sm_Point3f;
+    static public SdfValueTypeName Point3f { get { return sm_Point3f ?? Materialize(ref sm_Point3f, UsdCs.SdfGetValueTypePoint3f()); } }
+    static SdfValueTypeName sm_Point3d;
+    static public SdfValueTypeName Point3d { get { return sm_Point3d ?? Materialize(ref sm_Point3d, UsdCs.SdfGetValueTypePoint3d()); } }
+    static SdfValueTypeName sm_Vector3h;
+    static public SdfValueTypeName Vector3h { get { return sm_Vector3h ?? Materialize(ref sm_Vector3h, UsdCs.SdfGetValueTypeVector3h()); } }
+    static SdfValueTypeName sm_Vector3f;
+    static public SdfValueTypeName Vector3f { get { return sm_Vector3f ?? Materialize(ref sm_Vector3f, UsdCs.SdfGetValueTypeVector3f()); } }
+    static SdfValueTypeName sm_Vector3d;
+    static public SdfValueTypeName Vector3d { get { return sm_Vector3d ?? Materialize(ref sm_Vector3d, UsdCs.SdfGetValueTypeVector3d()); } }
+    static SdfValueTypeName sm_Normal3h;
+    static public SdfValueTypeName Normal3h { get { return sm_Normal3h ?? Materialize(ref sm_Normal3h, UsdCs.SdfGetValueTypeNormal3h()); } }
+    static SdfValueTypeName sm_Normal3f;
+    static public SdfValueTypeName Normal3f { get { return sm_Normal3f ?? Materialize(ref sm_Normal3f, UsdCs.SdfGetValueTypeNormal3f()); } }
+    static SdfValueTypeName sm_Normal3d;
+    static public SdfValueTypeName Normal3d { get { return sm_Normal3d ?? Materialize(ref sm_Normal3d, UsdCs.SdfGetValueTypeNormal3d()); } }
+    static SdfValueTypeName sm_Color3h;
+    static public SdfValueTypeName Color3h { get { return sm_Color3h ?? Materialize(ref sm_Color3h, UsdCs.SdfGetValueTypeColor3h()); } }
+    static SdfValueTypeName sm_Color3f;
+    static public SdfValueTypeName Color3f { get { return sm_Color3f ?? Materialize(ref sm_Color3f, UsdCs.SdfGetValueTypeColor3f()); } }
+    static SdfValueTypeName sm_Color3d;
+    static public SdfValueTypeName Color3d { get { return sm_Color3d ?? Materialize(ref sm_Color3d, UsdCs.SdfGetValueTypeColor3d()); } }
+    static SdfValueTypeName sm_Color4h;
+    static public SdfValueTypeName Color4h { get { return sm_Color4h ?? Materialize(ref sm_Color4h, UsdCs.SdfGetValueTypeColor4h()); } }
+    static SdfValueTypeName sm_Color4f;
+    static public SdfValueTypeName Color4f { get { return sm_Color4f ?? Materialize(ref sm_Color4f, UsdCs.SdfGetValueTypeColor4f()); } }
+    static SdfValueTypeName sm_Color4d;
+    static public SdfValueTypeName Color4d { get { return sm_Color4d ?? Materialize(ref sm_Color4d, UsdCs.SdfGetValueTypeColor4d()); } }
+    static SdfValueTypeName sm_Quath;
+    static public SdfValueTypeName Quath { get { return sm_Quath ?? Materialize(ref sm_Quath, UsdCs.SdfGetValueTypeQuath()); } }
+    static SdfValueTypeName sm_Quatf;
+    static public SdfValueTypeName Quatf { get { return sm_Quatf ?? Materialize(ref sm_Quatf, UsdCs.SdfGetValueTypeQuatf()); } }
+    static SdfValueTypeName sm_Quatd;
+    static public SdfValueTypeName Quatd { get { return sm_Quatd ?? Materialize(ref sm_Quatd, UsdCs.SdfGetValueTypeQuatd()); } }
+    static SdfValueTypeName sm_Matrix2d;
+    static public SdfValueTypeName Matrix2d { get { return sm_Matrix2d ?? Materialize(ref sm_Matrix2d, UsdCs.SdfGetValueTypeMatrix2d()); } }
+    static SdfValueTypeName sm_Matrix3d;
+    static public SdfValueTypeName Matrix3d { get { return sm_Matrix3d ?? Materialize(ref sm_Matrix3d, UsdCs.SdfGetValueTypeMatrix3d()); } }
+    static SdfValueTypeName sm_Matrix4d;
+    static public SdfValueTypeName Matrix4d { get { return sm_Matrix4d ?? Materialize(ref sm_Matrix4d, UsdCs.SdfGetValueTypeMatrix4d()); } }
+    static SdfValueTypeName sm_Frame4d;
+    static public SdfValueTypeName Frame4d { get { return sm_Frame4d ?? Materialize(ref sm_Frame4d, UsdCs.SdfGetValueTypeFrame4d()); } }
+    static SdfValueTypeName sm_TexCoord2h;
+    static public SdfValueTypeName TexCoord2h { get { return sm_TexCoord2h ?? Materialize(ref sm_TexCoord2h, UsdCs.SdfGetValueTypeTexCoord2h()); } }
+    static SdfValueTypeName sm_TexCoord2f;
+    static public SdfValueTypeName TexCoord2f { get { return sm_TexCoord2f ?? Materialize(ref sm_TexCoord2f, UsdCs.SdfGetValueTypeTexCoord2f()); } }
+    static SdfValueTypeName sm_TexCoord2d;
+    static public SdfValueTypeName TexCoord2d { get { return sm_TexCoord2d ?? Materialize(ref sm_TexCoord2d, UsdCs.SdfGetValueTypeTexCoord2d()); } }
+    static SdfValueTypeName sm_TexCoord3h;
+    static public SdfValueTypeName TexCoord3h { get { return sm_TexCoord3h ?? Materialize(ref sm_TexCoord3h, UsdCs.SdfGetValueTypeTexCoord3h()); } }
+    static SdfValueTypeName sm_TexCoord3f;
+    static public SdfValueTypeName TexCoord3f { get { return sm_TexCoord3f ?? Materialize(ref sm_TexCoord3f, UsdCs.SdfGetValueTypeTexCoord3f()); } }
+    static SdfValueTypeName sm_TexCoord3d;
+    static public SdfValueTypeName TexCoord3d { get { return sm_TexCoord3d ?? Materialize(ref sm_TexCoord3d, UsdCs.SdfGetValueTypeTexCoord3d()); } }
+    static SdfValueTypeName sm_BoolArray;
+    static public SdfValueTypeName BoolArray { get { return sm_BoolArray ?? Materialize(ref sm_BoolArray, UsdCs.SdfGetValueTypeBoolArray()); } }
+    static SdfValueTypeName sm_UCharArray;
+    static public SdfValueTypeName UCharArray { get { return sm_UCharArray ?? Materialize(ref sm_UCharArray, UsdCs.SdfGetValueTypeUCharArray()); } }
+    static SdfValueTypeName sm_IntArray;
+    static public SdfValueTypeName IntArray { get { return sm_IntArray ?? Materialize(ref sm_IntArray, UsdCs.SdfGetValueTypeIntArray()); } }
+    static SdfValueTypeName sm_UIntArray;
+    static public SdfValueTypeName UIntArray { get { return sm_UIntArray ?? Materialize(ref sm_UIntArray, UsdCs.SdfGetValueTypeUIntArray()); } }
+    static SdfValueTypeName sm_Int64Array;
+    static public SdfValueTypeName Int64Array { get { return sm_Int64Array ?? Materialize(ref sm_Int64Array, UsdCs.SdfGetValueTypeInt64Array()); } }
+    static SdfValueTypeName sm_UInt64Array;
+    static public SdfValueTypeName UInt64Array { get { return sm_UInt64Array ?? Materialize(ref sm_UInt64Array, UsdCs.SdfGetValueTypeUInt64Array()); } }
+    static SdfValueTypeName sm_HalfArray;
+    static public SdfValueTypeName HalfArray { get { return sm_HalfArray ?? Materialize(ref sm_HalfArray, UsdCs.SdfGetValueTypeHalfArray()); } }
+    static SdfValueTypeName sm_FloatArray;
+    static public SdfValueTypeName FloatArray { get { return sm_FloatArray ?? Materialize(ref sm_FloatArray, UsdCs.SdfGetValueTypeFloatArray()); } }
+    static SdfValueTypeName sm_DoubleArray;
+    static public SdfValueTypeName DoubleArray { get { return sm_DoubleArray ?? Materialize(ref sm_DoubleArray, UsdCs.SdfGetValueTypeDoubleArray()); } }
+    static SdfValueTypeName sm_TimeCodeArray;
+    static public SdfValueTypeName TimeCodeArray { get { return sm_TimeCodeArray ?? Materialize(ref sm_TimeCodeArray, UsdCs.SdfGetValueTypeTimeCodeArray()); } }
+    static SdfValueTypeName sm_StringArray;
+    static public SdfValueTypeName StringArray { get { return sm_StringArray ?? Materialize(ref sm_StringArray, UsdCs.SdfGetValueTypeStringArray()); } }
+    static SdfValueTypeName sm_TokenArray;
+    static public SdfValueTypeName TokenArray { get { return sm_TokenArray ?? Materialize(ref sm_TokenArray, UsdCs.SdfGetValueTypeTokenArray()); } }
+    static SdfValueTypeName sm_AssetArray;
+    static public SdfValueTypeName AssetArray { get { return sm_AssetArray ?? Materialize(ref sm_AssetArray, UsdCs.SdfGetValueTypeAssetArray()); } }
+    static SdfValueTypeName sm_Int2Array;
+    static public SdfValueTypeName Int2Array { get { return sm_Int2Array ?? Materialize(ref sm_Int2Array, UsdCs.SdfGetValueTypeInt2Array()); } }
+    static SdfValueTypeName sm_Int3Array;
+    static public SdfValueTypeName Int3Array { get { return sm_Int3Array ?? Materialize(ref sm_Int3Array, UsdCs.SdfGetValueTypeInt3Array()); } }
+    static SdfValueTypeName sm_Int4Array;
+    static public SdfValueTypeName Int4Array { get { return sm_Int4Array ?? Materialize(ref sm_Int4Array, UsdCs.SdfGetValueTypeInt4Array()); } }
+    static SdfValueTypeName sm_Half2Array;
+    static public SdfValueTypeName Half2Array { get { return sm_Half2Array ?? Materialize(ref sm_Half2Array, UsdCs.SdfGetValueTypeHalf2Array()); } }
+    static SdfValueTypeName sm_Half3Array;
+    static public SdfValueTypeName Half3Array { get { return sm_Half3Array ?? Materialize(ref sm_Half3Array, UsdCs.SdfGetValueTypeHalf3Array()); } }
+    static SdfValueTypeName sm_Half4Array;
+    static public SdfValueTypeName Half4Array { get { return sm_Half4Array ?? Materialize(ref sm_Half4Array, UsdCs.SdfGetValueTypeHalf4Array()); } }
+    static SdfValueTypeName sm_Float2Array;
+    static public SdfValueTypeName Float2Array { get { return sm_Float2Array ?? Materialize(ref sm_Float2Array, UsdCs.SdfGetValueTypeFloat2Array()); } }
+    static SdfValueTypeName sm_Float3Array;
+    static public SdfValueTypeName Float3Array { get { return sm_Float3Array ?? Materialize(ref sm_Float3Array, UsdCs.SdfGetValueTypeFloat3Array()); } }
+    static SdfValueTypeName sm_Float4Array;
+    static public SdfValueTypeName Float4Array { get { return sm_Float4Array ?? Materialize(ref sm_Float4Array, UsdCs.SdfGetValueTypeFloat4Array()); } }
+    static SdfValueTypeName sm_Double2Array;
+    static public SdfValueTypeName Double2Array { get { return sm_Double2Array ?? Materialize(ref sm_Double2Array, UsdCs.SdfGetValueTypeDouble2Array()); } }
+    static SdfValueTypeName sm_Double3Array;
+    static public SdfValueTypeName Double3Array { get { return sm_Double3Array ?? Materialize(ref sm_Double3Array, UsdCs.SdfGetValueTypeDouble3Array()); } }
+    static SdfValueTypeName sm_Double4Array;
+    static public SdfValueTypeName Double4Array { get { return sm_Double4Array ?? Materialize(ref sm_Double4Array, UsdCs.SdfGetValueTypeDouble4Array()); } }
+    static SdfValueTypeName sm_Point3hArray;
+    static public SdfValueTypeName Point3hArray { get { return sm_Point3hArray ?? Materialize(ref sm_Point3hArray, UsdCs.SdfGetValueTypePoint3hArray()); } }
+    static SdfValueTypeName sm_Point3fArray;
+    static public SdfValueTypeName Point3fArray { get { return sm_Point3fArray ?? Materialize(ref sm_Point3fArray, UsdCs.SdfGetValueTypePoint3fArray()); } }
+    static SdfValueTypeName sm_Point3dArray;
+    static public SdfValueTypeName Point3dArray { get { return sm_Point3dArray ?? Materialize(ref sm_Point3dArray, UsdCs.SdfGetValueTypePoint3dArray()); } }
+    static SdfValueTypeName sm_Vector3hArray;
+    static public SdfValueTypeName Vector3hArray { get { return sm_Vector3hArray ?? Materialize(ref sm_Vector3hArray, UsdCs.SdfGetValueTypeVector3hArray()); } }
+    static SdfValueTypeName sm_Vector3fArray;
+    static public SdfValueTypeName Vector3fArray { get { return sm_Vector3fArray ?? Materialize(ref sm_Vector3fArray, UsdCs.SdfGetValueTypeVector3fArray()); } }
+    static SdfValueTypeName sm_Vector3dArray;
+    static public SdfValueTypeName Vector3dArray { get { return sm_Vector3dArray ?? Materialize(ref sm_Vector3dArray, UsdCs.SdfGetValueTypeVector3dArray()); } }
+    static SdfValueTypeName sm_Normal3hArray;
+    static public SdfValueTypeName Normal3hArray { get { return sm_Normal3hArray ?? Materialize(ref sm_Normal3hArray, UsdCs.SdfGetValueTypeNormal3hArray()); } }
+    static SdfValueTypeName sm_Normal3fArray;
+    static public SdfValueTypeName Normal3fArray { get { return sm_Normal3fArray ?? Materialize(ref sm_Normal3fArray, UsdCs.SdfGetValueTypeNormal3fArray()); } }
+    static SdfValueTypeName sm_Normal3dArray;
+    static public SdfValueTypeName Normal3dArray { get { return sm_Normal3dArray ?? Materialize(ref sm_Normal3dArray, UsdCs.SdfGetValueTypeNormal3dArray()); } }
+    static SdfValueTypeName sm_Color3hArray;
+    static public SdfValueTypeName Color3hArray { get { return sm_Color3hArray ?? Materialize(ref sm_Color3hArray, UsdCs.SdfGetValueTypeColor3hArray()); } }
+    static SdfValueTypeName sm_Color3fArray;
+    static public SdfValueTypeName Color3fArray { get { return sm_Color3fArray ?? Materialize(ref sm_Color3fArray, UsdCs.SdfGetValueTypeColor3fArray()); } }
+    static SdfValueTypeName sm_Color3dArray;
+    static public SdfValueTypeName Color3dArray { get { return sm_Color3dArray ?? Materialize(ref sm_Color3dArray, UsdCs.SdfGetValueTypeColor3dArray()); } }
+    static SdfValueTypeName sm_Color4hArray;
+    static public SdfValueTypeName Color4hArray { get { return sm_Color4hArray ?? Materialize(ref sm_Color4hArray, UsdCs.SdfGetValueTypeColor4hArray()); } }
+    static SdfValueTypeName sm_Color4fArray;
+    static public SdfValueTypeName Color4fArray { get { return sm_Color4fArray ?? Materialize(ref sm_Color4fArray, UsdCs.SdfGetValueTypeColor4fArray()); } }
+    static SdfValueTypeName sm_Color4dArray;
+    static public SdfValueTypeName Color4dArray { get { return sm_Color4dArray ?? Materialize(ref sm_Color4dArray, UsdCs.SdfGetValueTypeColor4dArray()); } }
+    static SdfValueTypeName sm_QuathArray;
+    static public SdfValueTypeName QuathArray { get { return sm_QuathArray ?? Materialize(ref sm_QuathArray, UsdCs.SdfGetValueTypeQuathArray()); } }
+    static SdfValueTypeName sm_QuatfArray;
+    static public SdfValueTypeName QuatfArray { get { return sm_QuatfArray ?? Materialize(ref sm_QuatfArray, UsdCs.SdfGetValueTypeQuatfArray()); } }
+    static SdfValueTypeName sm_QuatdArray;
+    static public SdfValueTypeName QuatdArray { get { return sm_QuatdArray ?? Materialize(ref sm_QuatdArray, UsdCs.SdfGetValueTypeQuatdArray()); } }
+    static SdfValueTypeName sm_Matrix2dArray;
+    static public SdfValueTypeName Matrix2dArray { get { return sm_Matrix2dArray ?? Materialize(ref sm_Matrix2dArray, UsdCs.SdfGetValueTypeMatrix2dArray()); } }
+    static SdfValueTypeName sm_Matrix3dArray;
+    static public SdfValueTypeName Matrix3dArray { get { return sm_Matrix3dArray ?? Materialize(ref sm_Matrix3dArray, UsdCs.SdfGetValueTypeMatrix3dArray()); } }
+    static SdfValueTypeName sm_Matrix4dArray;
+    static public SdfValueTypeName Matrix4dArray { get { return sm_Matrix4dArray ?? Materialize(ref sm_Matrix4dArray, UsdCs.SdfGetValueTypeMatrix4dArray()); } }
+    static SdfValueTypeName sm_Frame4dArray;
+    static public SdfValueTypeName Frame4dArray { get { return sm_Frame4dArray ?? Materialize(ref sm_Frame4dArray, UsdCs.SdfGetValueTypeFrame4dArray()); } }
+    static SdfValueTypeName sm_TexCoord2hArray;
+    static public SdfValueTypeName TexCoord2hArray { get { return sm_TexCoord2hArray ?? Materialize(ref sm_TexCoord2hArray, UsdCs.SdfGetValueTypeTexCoord2hArray()); } }
+    static SdfValueTypeName sm_TexCoord2fArray;
+    static public SdfValueTypeName TexCoord2fArray { get { return sm_TexCoord2fArray ?? Materialize(ref sm_TexCoord2fArray, UsdCs.SdfGetValueTypeTexCoord2fArray()); } }
+    static SdfValueTypeName sm_TexCoord2dArray;
+    static public SdfValueTypeName TexCoord2dArray { get { return sm_TexCoord2dArray ?? Materialize(ref sm_TexCoord2dArray, UsdCs.SdfGetValueTypeTexCoord2dArray()); } }
+    static SdfValueTypeName sm_TexCoord3hArray;
+    static public SdfValueTypeName TexCoord3hArray { get { return sm_TexCoord3hArray ?? Materialize(ref sm_TexCoord3hArray, UsdCs.SdfGetValueTypeTexCoord3hArray()); } }
+    static SdfValueTypeName sm_TexCoord3fArray;
+    static public SdfValueTypeName TexCoord3fArray { get { return sm_TexCoord3fArray ?? Materialize(ref sm_TexCoord3fArray, UsdCs.SdfGetValueTypeTexCoord3fArray()); } }
+    static SdfValueTypeName sm_TexCoord3dArray;
+    static public SdfValueTypeName TexCoord3dArray { get { return sm_TexCoord3dArray ?? Materialize(ref sm_TexCoord3dArray, UsdCs.SdfGetValueTypeTexCoord3dArray()); } }
 }
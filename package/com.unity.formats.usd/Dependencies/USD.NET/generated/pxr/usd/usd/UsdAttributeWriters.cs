@@ -0,0 +1,128 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using pxr;
+
+/// <summary>
+/// Typed attribute setters, indexed by the C# type holding the USD value, e.g. VtVec3fArray. They
+/// write values straight from (pinned) memory with the layout of the C++ elements, rather than
+/// through a VtValue.
+/// </summary>
+public static class UsdAttributeWriters
+{
+    /// <summary>
+    /// Writes count elements read from data to the attribute at the given time. When sparseWriter
+    /// is not null, values equal to the previous time sample are skipped.
+    /// </summary>
+    public delegate bool Writer(UsdAttribute attr, UsdTimeCode time, IntPtr data, uint count,
+        UsdUtilsSparseValueWriter sparseWriter);
+
+    struct Entry
+    {
+        public Writer writer;
+        public uint elementSize;
+        public bool isArray;
+    }
+
+    static Dictionary<Type, Entry> sm_writers = new Dictionary<Type, Entry>();
+
+    /// <summary>
+    /// Finds the writer for the given type, along with the size in bytes of its elements and
+    /// whether it is an array type.
+    /// </summary>
+    public static bool TryGetWriter(Type vtType, out Writer writer, out uint elementSize, out bool isArray)
+    {
+        Entry entry;
+        bool found = sm_writers.TryGetValue(vtType, out entry);
+        writer = entry.writer;
+        elementSize = entry.elementSize;
+        isArray = entry.isArray;
+        return found;
+    }
+
+    static void Register<T>(Func<UsdAttribute, UsdTimeCode, IntPtr, uint, bool> set,
+        Func<UsdUtilsSparseValueWriter, UsdAttribute, UsdTimeCode, IntPtr, uint, bool> sparseSet,
+        uint elementSize, bool isArray)
+    {
+        var entry = new Entry();
+        entry.writer = (attr, time, data, count, sparseWriter) => sparseWriter == null
+            ? set(attr, time, data, count)
+            : sparseSet(sparseWriter, attr, time, data, count);
+        entry.elementSize = elementSize;
+        entry.isArray = isArray;
+        sm_writers[typeof(T)] = entry;
+    }
+
+    static UsdAttributeWriters()
+    {
+        Register<GfHalf>(UsdCs.UsdAttributeSetGfHalf, UsdCs.UsdUtilsSparseValueWriterSetGfHalf, 2, false);
+        Register<GfMatrix2d>(UsdCs.UsdAttributeSetGfMatrix2d, UsdCs.UsdUtilsSparseValueWriterSetGfMatrix2d, 32, false);
+        Register<GfMatrix3d>(UsdCs.UsdAttributeSetGfMatrix3d, UsdCs.UsdUtilsSparseValueWriterSetGfMatrix3d, 72, false);
+        Register<GfMatrix4d>(UsdCs.UsdAttributeSetGfMatrix4d, UsdCs.UsdUtilsSparseValueWriterSetGfMatrix4d, 128, false);
+        Register<GfQuatd>(UsdCs.UsdAttributeSetGfQuatd, UsdCs.UsdUtilsSparseValueWriterSetGfQuatd, 32, false);
+        Register<GfQuatf>(UsdCs.UsdAttributeSetGfQuatf, UsdCs.UsdUtilsSparseValueWriterSetGfQuatf, 16, false);
+        Register<GfQuath>(UsdCs.UsdAttributeSetGfQuath, UsdCs.UsdUtilsSparseValueWriterSetGfQuath, 8, false);
+        Register<GfVec2d>(UsdCs.UsdAttributeSetGfVec2d, UsdCs.UsdUtilsSparseValueWriterSetGfVec2d, 16, false);
+        Register<GfVec2f>(UsdCs.UsdAttributeSetGfVec2f, UsdCs.UsdUtilsSparseValueWriterSetGfVec2f, 8, false);
+        Register<GfVec2h>(UsdCs.UsdAttributeSetGfVec2h, UsdCs.UsdUtilsSparseValueWriterSetGfVec2h, 4, false);
+        Register<GfVec2i>(UsdCs.UsdAttributeSetGfVec2i, UsdCs.UsdUtilsSparseValueWriterSetGfVec2i, 8, false);
+        Register<GfVec3d>(UsdCs.UsdAttributeSetGfVec3d, UsdCs.UsdUtilsSparseValueWriterSetGfVec3d, 24, false);
+        Register<GfVec3f>(UsdCs.UsdAttributeSetGfVec3f, UsdCs.UsdUtilsSparseValueWriterSetGfVec3f, 12, false);
+        Register<GfVec3h>(UsdCs.UsdAttributeSetGfVec3h, UsdCs.UsdUtilsSparseValueWriterSetGfVec3h, 6, false);
+        Register<GfVec3i>(UsdCs.UsdAttributeSetGfVec3i, UsdCs.UsdUtilsSparseValueWriterSetGfVec3i, 12, false);
+        Register<GfVec4d>(UsdCs.UsdAttributeSetGfVec4d, UsdCs.UsdUtilsSparseValueWriterSetGfVec4d, 32, false);
+        Register<GfVec4f>(UsdCs.UsdAttributeSetGfVec4f, UsdCs.UsdUtilsSparseValueWriterSetGfVec4f, 16, false);
+        Register<GfVec4h>(UsdCs.UsdAttributeSetGfVec4h, UsdCs.UsdUtilsSparseValueWriterSetGfVec4h, 8, false);
+        Register<GfVec4i>(UsdCs.UsdAttributeSetGfVec4i, UsdCs.UsdUtilsSparseValueWriterSetGfVec4i, 16, false);
+        Register<SdfTimeCode>(UsdCs.UsdAttributeSetSdfTimeCode, UsdCs.UsdUtilsSparseValueWriterSetSdfTimeCode, 8, false);
+        Register<SdfTimeCodeArray>(UsdCs.UsdAttributeSetSdfTimeCodeArray, UsdCs.UsdUtilsSparseValueWriterSetSdfTimeCodeArray, 8, true);
+        Register<VtBoolArray>(UsdCs.UsdAttributeSetVtBoolArray, UsdCs.UsdUtilsSparseValueWriterSetVtBoolArray, 1, true);
+        Register<VtDoubleArray>(UsdCs.UsdAttributeSetVtDoubleArray, UsdCs.UsdUtilsSparseValueWriterSetVtDoubleArray, 8, true);
+        Register<VtFloatArray>(UsdCs.UsdAttributeSetVtFloatArray, UsdCs.UsdUtilsSparseValueWriterSetVtFloatArray, 4, true);
+        Register<VtHalfArray>(UsdCs.UsdAttributeSetVtHalfArray, UsdCs.UsdUtilsSparseValueWriterSetVtHalfArray, 2, true);
+        Register<VtInt64Array>(UsdCs.UsdAttributeSetVtInt64Array, UsdCs.UsdUtilsSparseValueWriterSetVtInt64Array, 8, true);
+        Register<VtIntArray>(UsdCs.UsdAttributeSetVtIntArray, UsdCs.UsdUtilsSparseValueWriterSetVtIntArray, 4, true);
+        Register<VtMatrix2dArray>(UsdCs.UsdAttributeSetVtMatrix2dArray, UsdCs.UsdUtilsSparseValueWriterSetVtMatrix2dArray, 32, true);
+        Register<VtMatrix3dArray>(UsdCs.UsdAttributeSetVtMatrix3dArray, UsdCs.UsdUtilsSparseValueWriterSetVtMatrix3dArray, 72, true);
+        Register<VtMatrix4dArray>(UsdCs.UsdAttributeSetVtMatrix4dArray, UsdCs.UsdUtilsSparseValueWriterSetVtMatrix4dArray, 128, true);
+        Register<VtQuatdArray>(UsdCs.UsdAttributeSetVtQuatdArray, UsdCs.UsdUtilsSparseValueWriterSetVtQuatdArray, 32, true);
+        Register<VtQuatfArray>(UsdCs.UsdAttributeSetVtQuatfArray, UsdCs.UsdUtilsSparseValueWriterSetVtQuatfArray, 16, true);
+        Register<VtQuathArray>(UsdCs.UsdAttributeSetVtQuathArray, UsdCs.UsdUtilsSparseValueWriterSetVtQuathArray, 8, true);
+        Register<VtUCharArray>(UsdCs.UsdAttributeSetVtUCharArray, UsdCs.UsdUtilsSparseValueWriterSetVtUCharArray, 1, true);
+        Register<VtUInt64Array>(UsdCs.UsdAttributeSetVtUInt64Array, UsdCs.UsdUtilsSparseValueWriterSetVtUInt64Array, 8, true);
+        Register<VtUIntArray>(UsdCs.UsdAttributeSetVtUIntArray, UsdCs.UsdUtilsSparseValueWriterSetVtUIntArray, 4, true);
+        Register<VtVec2dArray>(UsdCs.UsdAttributeSetVtVec2dArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec2dArray, 16, true);
+        Register<VtVec2fArray>(UsdCs.UsdAttributeSetVtVec2fArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec2fArray, 8, true);
+        Register<VtVec2hArray>(UsdCs.UsdAttributeSetVtVec2hArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec2hArray, 4, true);
+        Register<VtVec2iArray>(UsdCs.UsdAttributeSetVtVec2iArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec2iArray, 8, true);
+        Register<VtVec3dArray>(UsdCs.UsdAttributeSetVtVec3dArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec3dArray, 24, true);
+        Register<VtVec3fArray>(UsdCs.UsdAttributeSetVtVec3fArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec3fArray, 12, true);
+        Register<VtVec3hArray>(UsdCs.UsdAttributeSetVtVec3hArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec3hArray, 6, true);
+        Register<VtVec3iArray>(UsdCs.UsdAttributeSetVtVec3iArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec3iArray, 12, true);
+        Register<VtVec4dArray>(UsdCs.UsdAttributeSetVtVec4dArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec4dArray, 32, true);
+        Register<VtVec4fArray>(UsdCs.UsdAttributeSetVtVec4fArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec4fArray, 16, true);
+        Register<VtVec4hArray>(UsdCs.UsdAttributeSetVtVec4hArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec4hArray, 8, true);
+        Register<VtVec4iArray>(UsdCs.UsdAttributeSetVtVec4iArray, UsdCs.UsdUtilsSparseValueWriterSetVtVec4iArray, 16, true);
+        Register<bool>(UsdCs.UsdAttributeSetbool, UsdCs.UsdUtilsSparseValueWriterSetbool, 1, false);
+        Register<double>(UsdCs.UsdAttributeSetdouble, UsdCs.UsdUtilsSparseValueWriterSetdouble, 8, false);
+        Register<float>(UsdCs.UsdAttributeSetfloat, UsdCs.UsdUtilsSparseValueWriterSetfloat, 4, false);
+        Register<int>(UsdCs.UsdAttributeSetint, UsdCs.UsdUtilsSparseValueWriterSetint, 4, false);
+        Register<long>(UsdCs.UsdAttributeSetlong, UsdCs.UsdUtilsSparseValueWriterSetlong, 8, false);
+        Register<ulong>(UsdCs.UsdAttributeSetulong, UsdCs.UsdUtilsSparseValueWriterSetulong, 8, false);
+        Register<byte>(UsdCs.UsdAttributeSetbyte, UsdCs.UsdUtilsSparseValueWriterSetbyte, 1, false);
+        Register<uint>(UsdCs.UsdAttributeSetuint, UsdCs.UsdUtilsSparseValueWriterSetuint, 4, false);
+    }
+}
@@ -787,5 +787,11 @@ namespace pxr
             if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
             return ret;
         }
+
+        public SdfPathVector GetChildrenPaths()
+        {
+            SdfPathVector ret = new SdfPathVector(UsdCsPINVOKE.UsdPrim_GetChildrenPaths(swigCPtr), true);
+            return ret;
+        }
     }
 }
@@ -0,0 +1,513 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+using System.Threading;
+using pxr;
+
+/// <summary>
+/// All tokens declared by the generated schema token classes, interned by id. Looking up a token
+/// string is lock free and allocation free, and each TfToken is created once, on first use.
+/// </summary>
+public static class UsdSchemaTokens
+{
+    /// <summary>
+    /// The number of interned tokens. Ids range from 0 to Count - 1.
+    /// </summary>
+    public const int Count = 385;
+
+    static readonly TfToken[] sm_tokens = new TfToken[Count];
+
+    /// <summary>
+    /// Returns the id of the given token string, or -1 if it is not a schema token.
+    /// </summary>
+    public static int GetId(string value)
+    {
+        if (value == null)
+        {
+            return -1;
+        }
+        int displacement = sm_displacements[Hash(0, value) % Count];
+        int id = displacement < 0 ? -displacement - 1 : (int)(Hash((uint)displacement, value) % Count);
+        return sm_strings[id] == value ? id : -1;
+    }
+
+    /// <summary>
+    /// Returns the token string with the given id.
+    /// </summary>
+    public static string GetString(int id)
+    {
+        return sm_strings[id];
+    }
+
+    /// <summary>
+    /// Returns the TfToken with the given id, creating it the first time it is requested.
+    /// </summary>
+    public static TfToken GetToken(int id)
+    {
+        var token = sm_tokens[id];
+        if (token == null)
+        {
+            token = new TfToken(sm_strings[id]);
+            var existing = Interlocked.CompareExchange(ref sm_tokens[id], token, null);
+            if (existing != null)
+            {
+                token.Dispose();
+                token = existing;
+            }
+        }
+        return token;
+    }
+
+    /// <summary>
+    /// Finds the interned TfToken for the given string, returns false if it is not a schema token.
+    /// </summary>
+    public static bool TryGetToken(string value, out TfToken token)
+    {
+        int id = GetId(value);
+        token = id < 0 ? null : GetToken(id);
+        return token != null;
+    }
+
+    // FNV-1 order (multiply, then xor), starting from the FNV prime rather than the offset basis
+    // and seeded by the displacement. Must match hashToken in tokens.py.
+    static uint Hash(uint seed, string value)
+    {
+        uint hash = seed == 0 ? 0x01000193u : seed;
+        for (int i = 0; i < value.Length; i++)
+        {
+            hash = unchecked((hash * 0x01000193u) ^ value[i]);
+        }
+        return hash;
+    }
+
+
+    static readonly string[] sm_strings =
+    {
+        "creaseIndices",
+        "edgeScale:front",
+        "edgeScale:back",
+        "color",
+        "refine:left",
+        "colorRamp:interpolation",
+        "type",
+        "edgeScale:left",
+        "model",
+        "edgeAndCorner",
+        "primvars:skel:geomBindTransform",
+        "refine:front",
+        "inactiveIds",
+        "filters",
+        "stereoRole",
+        "blendShapeWeights",
+        "analytic:blur:amount",
+        "min",
+        "all",
+        "inherited",
+        "color:saturation",
+        "texture:map",
+        "intensity",
+        "height",
+        "unauthoredValuesIndex",
+        "cookieMode",
+        "trimCurve:knots",
+        "surface",
+        "interfaceOnly",
+        "spherical",
+        "ignore",
+        "lightList",
+        "ri:sampling:fixedSampleCount",
+        "offsets",
+        "length",
+        "cornersPlus1",
+        "beginDistance",
+        "automatic",
+        "model:cardTextureXNeg",
+        "uForm",
+        "ri:combineMode",
+        "refine:right",
+        "materialBind",
+        "orientation",
+        "trimCurve:vertexCounts",
+        "falloff:interpolation",
+        "weight",
+        "enableColorTemperature",
+        "shaping:ies:file",
+        "analytic:density:midpoint",
+        "clippingRange",
+        "displacement",
+        "catmullRom",
+        "skel:animationSource",
+        "skel:skeleton",
+        "right",
+        "shadow:color",
+        "fallbackStrength",
+        "verticalAperture",
+        "cornerIndices",
+        "interpolation",
+        "linear",
+        "analytic:density:exponent",
+        "analytic:shearY",
+        "cornersPlus2",
+        "doubleSided",
+        "creaseSharpnesses",
+        "analytic:blur:nearValue",
+        "outputs:volume",
+        "lightList:cacheBehavior",
+        "model:cardGeometry",
+        "repeat",
+        "catmullClark",
+        "orthographic",
+        "texture:scaleV",
+        "scale:height",
+        "spline",
+        "width",
+        "primvars:displayColor",
+        "angularVelocities",
+        "analytic:blur:farValue",
+        "coordSys:",
+        "creaseLengths",
+        "physical",
+        "holeIndices",
+        "constant",
+        "off",
+        "horizontalAperture",
+        "ri:shadow:thinShadow",
+        "face",
+        "analytic",
+        "sdrMetadata",
+        "none",
+        "pivot",
+        "trimCurve:counts",
+        "day",
+        "texture:fillColor",
+        "texture:wrapMode",
+        "ri:specular",
+        "vForm",
+        "analytic:blur:exponent",
+        "ri:invert",
+        "uRange",
+        "analytic:blur:sMult",
+        "collection:filterLink:includeRoot",
+        "cubic",
+        "points",
+        "upAxis",
+        "faceVertexCounts",
+        "values",
+        "focalLength",
+        "bindTransforms",
+        "color:tint",
+        "smooth",
+        "color:whitepoint",
+        "info:implementationSource",
+        "clamp",
+        "bindMaterialAs",
+        "radial",
+        "haziness",
+        "skel:blendShapes",
+        "subcomponent",
+        "interpolateBoundary",
+        "ri:lightGroup",
+        "accelerations",
+        "barnMode",
+        "open",
+        "noLight",
+        "render",
+        "scales",
+        "protoIndices",
+        "color:midpoint",
+        "trimCurve:points",
+        "shutter:open",
+        "faceVaryingLinearInterpolation",
+        "texture:offsetV",
+        "distanceToLight",
+        "perspective",
+        "texture:scaleU",
+        "longitude",
+        "invisibleIds",
+        "falloff",
+        "latlong",
+        "Z",
+        "Y",
+        "shadow:falloff",
+        "xformOpOrder",
+        "blendShapes",
+        "analytic:density:farValue",
+        "orientToStageUpAxis",
+        "colorRamp:knots",
+        "nonperiodic",
+        "fStop",
+        "useColor",
+        "specular",
+        "texture:invertU",
+        "default",
+        "pinned",
+        "shadowLink",
+        "max",
+        "scale:depth",
+        "colorRamp:colors",
+        "primvars:displayOpacity",
+        "analytic:density:nearDistance",
+        "info:filePath",
+        "shutter:close",
+        "strongerThanDescendants",
+        "proxy",
+        "bspline",
+        "orientations",
+        "proxyPrim",
+        "screen",
+        "analytic:blur:farDistance",
+        "info:sloPath",
+        "velocities",
+        "triangleSubdivisionRule",
+        "restTransforms",
+        "bilinear",
+        "analytic:apex",
+        "unrestricted",
+        "cone",
+        "shaping:ies:normalize",
+        "model:cardTextureZNeg",
+        "skel:joints",
+        "faceVarying",
+        "shaping:cone:softness",
+        "edgeScale:right",
+        "info:oslPath",
+        "edgeThickness",
+        "knots",
+        "rightHanded",
+        "indices",
+        "aovName",
+        "volume",
+        "year",
+        "invert",
+        "closed",
+        "skyTint",
+        "normalize",
+        "analytic:density:nearValue",
+        "pointWeights",
+        "zone",
+        "full",
+        "model:cardTextureXPos",
+        "cornersOnly",
+        "depth",
+        "basis",
+        "edgeScale:top",
+        "refine:bottom",
+        "color:contrast",
+        "focusDistance",
+        "weakerThanDescendants",
+        "angle",
+        "ri:intensity",
+        "horizontalApertureOffset",
+        "ri:density",
+        "material:binding:collection",
+        "hour",
+        "rampMode",
+        "analytic:directional",
+        "shaping:cone:angle",
+        "guide",
+        "sourceAsset",
+        "clippingPlanes",
+        "inReflection",
+        "analytic:shearX",
+        "outputs:displacement",
+        "month",
+        "latitude",
+        "leftHanded",
+        "argsPath",
+        "analytic:density:midValue",
+        "jointNames",
+        "lightLink",
+        "model:cardTextureYNeg",
+        "size",
+        "collection:shadowLink:includeRoot",
+        "uKnots",
+        "texture:file",
+        "shadow:falloffGamma",
+        "outputs:ri:displacement",
+        "cubeMapVerticalCross",
+        "vVertexCount",
+        "fromTexture",
+        "elementType",
+        "extentsHint",
+        "cornerSharpnesses",
+        "ri:exposure",
+        "trimCurve:orders",
+        "info:id",
+        "ri:portal:tint",
+        "geometry",
+        "sunTint",
+        "sunDirection",
+        "analytic:blur:nearDistance",
+        "ids",
+        "mono",
+        "axis",
+        "subdivisionScheme",
+        "texture:offsetU",
+        "vOrder",
+        "noEffect",
+        "edgeOnly",
+        "uVertexCount",
+        "filterLink",
+        "shaping:ies:angleScale",
+        "consumeAndHalt",
+        "texture:invertV",
+        "catmull-rom",
+        "normalOffsets",
+        "group",
+        "preBarnEffect",
+        "material:binding",
+        "analytic:useLightDirection",
+        "widths",
+        "positions",
+        "endDistance",
+        "bounds",
+        "left",
+        "edgeScale:bottom",
+        "extent",
+        "filePath",
+        "partition",
+        "vertex",
+        "cards",
+        "useThroughput",
+        "outputs:",
+        "nonOverlapping",
+        "ri:trace:lightPaths",
+        "collection:lightLink:includeRoot",
+        "shaping:focus",
+        "vRange",
+        "multiply",
+        "sourceCode",
+        "refine:top",
+        "analytic:density:farDistance",
+        "purpose",
+        "radius",
+        "visibility",
+        "falloff:floats",
+        "colorTemperature",
+        "invisible",
+        "angular",
+        "portals",
+        "analytic:blur:midpoint",
+        "outputs:ri:surface",
+        "refine:back",
+        "pointIndices",
+        "primvars:skel:jointWeights",
+        "shaping:focusTint",
+        "faceVertexIndices",
+        "",
+        "texture:premultipliedAlpha",
+        "scale:width",
+        "id",
+        "bezier",
+        "component",
+        "assembly",
+        "hermite",
+        "ri:texture:gamma",
+        "elementSize",
+        "box",
+        "analytic:blur:tMult",
+        "uniform",
+        "joints",
+        "boundaries",
+        "inputs:",
+        "metersPerUnit",
+        "shadow:distance",
+        "colorRamp",
+        "prototypes",
+        "trimCurve:ranges",
+        "ri:sampling:importanceMultiplier",
+        "diffuse",
+        "outputs:surface",
+        "vKnots",
+        "model:cardTextureZPos",
+        "projection",
+        "translations",
+        "model:drawModeColor",
+        "ri:texture:saturation",
+        "familyName",
+        "uOrder",
+        "normals",
+        "outputs:ri:volume",
+        "ranges",
+        "info:argsPath",
+        "ri:portal:intensity",
+        "subIdentifier",
+        "preview",
+        "texture:format",
+        "skel:blendShapeTargets",
+        "sunSize",
+        "shadow:enable",
+        "wrap",
+        "varying",
+        "onVolumeBoundaries",
+        "X",
+        "periodic",
+        "cross",
+        "loop",
+        "analytic:blur:midValue",
+        "materialVariant",
+        "model:applyDrawMode",
+        "ri:diffuse",
+        "treatAsPoint",
+        "inRefraction",
+        "curveVertexCounts",
+        "model:cardTextureYPos",
+        "rotations",
+        "origin",
+        "falloff:knots",
+        "primvars:skel:jointIndices",
+        "model:drawMode",
+        "order",
+        "inPrimaryHit",
+        "treatAsLine",
+        "motion:velocityScale",
+        "tangents",
+        "mirroredBall",
+        "power",
+        "consumeAndContinue",
+        "exposure",
+        "verticalApertureOffset",
+        "ri:intensityNearDist",
+    };
+
+    static readonly int[] sm_displacements =
+    {
+        0, 1, 1, 0, -385, 0, 2, -382, 1, 1, -381, 2, 0, 0, 0, 0,
+        0, -380, 1, 2, 1, -379, 0, 0, 5, 0, 1, 2, 0, 0, -378, 0,
+        0, -376, -368, 2, -367, 0, -363, 0, 2, 3, 0, 1, 1, -362, 1, 0,
+        0, -361, -355, -354, 0, -352, -350, 0, 3, -345, -339, 0, -334, -333, -331, 0,
+        0, 1, 1, 0, -330, -327, -326, 0, 1, -325, -324, -323, 0, 1, 2, 2,
+        0, 0, -320, -318, 0, 0, -317, -315, -313, -312, 0, -309, 2, 0, 4, 0,
+        0, 3, 1, 0, 1, -307, -300, 0, 0, -299, 1, -298, -297, 1, 0, 0,
+        2, 4, 1, -294, 3, -290, 1, 1, 0, -289, 0, -283, 1, 0, -278, 0,
+        1, -276, 0, 0, 3, -275, 0, 0, -272, 3, -266, -264, -261, 2, 0, -260,
+        0, 1, 2, 0, 0, 0, 0, 1, 0, -259, 0, -257, 0, -256, 0, 0,
+        2, 1, 5, 0, -255, 0, -254, -253, 1, 0, -250, -249, 0, -248, 0, 7,
+        0, -246, 0, 2, -242, -237, 2, -235, 0, 3, 1, -226, -221, 0, 0, 1,
+        -220, 0, -217, -214, 6, -212, 4, 0, -211, 0, 0, -206, 8, 5, 0, 0,
+        -201, 1, -197, -195, -169, 1, -168, 3, 7, 7, -167, 0, 3, -166, 3, 0,
+        5, 0, 1, -162, 0, 0, 0, -161, 1, 1, 0, 1, 4, 0, -160, -158,
+        0, 0, 0, -154, -152, 4, 15, 2, 0, 4, 0, -148, 6, -147, -142, -141,
+        -138, -137, -134, 0, 0, 1, -133, 0, -132, 1, 1, -129, -128, -124, 1, 5,
+        -123, 1, 1, 0, 0, -122, -121, -117, -116, -113, -112, 10, 0, -110, 0, 0,
+        -103, -101, -95, 0, 0, 0, -91, -89, -85, 3, 0, -84, 0, 0, 0, 0,
+        3, -83, -79, 0, -76, 0, 3, -72, -71, 0, 0, -67, -62, -57, -54, 0,
+        2, -50, -49, 0, 8, -45, -44, -42, -41, 0, -40, -34, -32, 0, 1, 0,
+        0, 0, -28, 0, 0, -27, 0, -26, 2, 0, 5, 0, -24, 0, 0, 0,
+        -21, -20, -18, -17, 0, 0, 0, -13, 1, 0, -11, 0, 1, 0, 0, 2,
+        0, -8, 0, 0, 0, 2, -7, 0, 0, 0, -6, 3, 0, 1, -3, 0,
+        3,
+    };
+}
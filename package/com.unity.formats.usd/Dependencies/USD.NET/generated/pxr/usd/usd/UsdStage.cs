@@ -1027,6 +1027,38 @@ namespace pxr
             return ret;
         }
 
+        public uint ComputeKeyFrames(SdfPath rootPath, TfTokenVector attrNames, SdfPathVector paths, int[] attrIndices, int[] offsets, uint entryCapacity, double[] times, uint timesCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdStage_ComputeKeyFrames(swigCPtr, SdfPath.getCPtr(rootPath), TfTokenVector.getCPtr(attrNames), SdfPathVector.getCPtr(paths), attrIndices, offsets, entryCapacity, times, timesCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public uint ComputePrimHierarchy(SdfPath rootPath, StdStringVector typeNames, SdfPathVector paths, StdStringVector strings, int[] records, uint primCapacity, int[] variants, uint variantCapacity)
+        {
+            uint ret = UsdCsPINVOKE.UsdStage_ComputePrimHierarchy(swigCPtr, SdfPath.getCPtr(rootPath), StdStringVector.getCPtr(typeNames), SdfPathVector.getCPtr(paths), StdStringVector.getCPtr(strings), records, primCapacity, variants, variantCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+            return ret;
+        }
+
+        public void ComputeTransforms(SdfPathVector paths, UsdTimeCode time, double[] localXforms, double[] worldXforms, int[] flags)
+        {
+            UsdCsPINVOKE.UsdStage_ComputeTransforms(swigCPtr, SdfPathVector.getCPtr(paths), UsdTimeCode.getCPtr(time), localXforms, worldXforms, flags);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
+
+        public void ComputeBounds(SdfPathVector paths, UsdTimeCode time, TfTokenVector purposes, double[] worldBounds, double[] localBounds)
+        {
+            UsdCsPINVOKE.UsdStage_ComputeBounds(swigCPtr, SdfPathVector.getCPtr(paths), UsdTimeCode.getCPtr(time), TfTokenVector.getCPtr(purposes), worldBounds, localBounds);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
+
+        public void ComputeSkeletonPoses(UsdSkelCache cache, SdfPathVector skeletonPaths, UsdTimeCode time, StdStringVector joints, StdStringVector blendShapes, int[] jointOffsets, int[] blendShapeOffsets, int[] flags, double[] localXforms, double[] skinningXforms, uint jointCapacity, float[] blendShapeWeights, uint blendShapeCapacity)
+        {
+            UsdCsPINVOKE.UsdStage_ComputeSkeletonPoses(swigCPtr, UsdSkelCache.getCPtr(cache), SdfPathVector.getCPtr(skeletonPaths), UsdTimeCode.getCPtr(time), StdStringVector.getCPtr(joints), StdStringVector.getCPtr(blendShapes), jointOffsets, blendShapeOffsets, flags, localXforms, skinningXforms, jointCapacity, blendShapeWeights, blendShapeCapacity);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
+
         public enum InitialLoadSet
         {
             LoadAll,
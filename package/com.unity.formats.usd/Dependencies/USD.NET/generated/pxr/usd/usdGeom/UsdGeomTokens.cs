@@ -42,158 +42,335 @@ namespace pxr
             }
         }
 
-        public static TfToken accelerations = new TfToken("accelerations");
-        public static TfToken all = new TfToken("all");
-        public static TfToken angularVelocities = new TfToken("angularVelocities");
-        public static TfToken axis = new TfToken("axis");
-        public static TfToken basis = new TfToken("basis");
-        public static TfToken bezier = new TfToken("bezier");
-        public static TfToken bilinear = new TfToken("bilinear");
-        public static TfToken boundaries = new TfToken("boundaries");
-        public static TfToken bounds = new TfToken("bounds");
-        public static TfToken box = new TfToken("box");
-        public static TfToken bspline = new TfToken("bspline");
-        public static TfToken cards = new TfToken("cards");
-        public static TfToken catmullClark = new TfToken("catmullClark");
-        public static TfToken catmullRom = new TfToken("catmullRom");
-        public static TfToken clippingPlanes = new TfToken("clippingPlanes");
-        public static TfToken clippingRange = new TfToken("clippingRange");
-        public static TfToken closed = new TfToken("closed");
-        public static TfToken constant = new TfToken("constant");
-        public static TfToken cornerIndices = new TfToken("cornerIndices");
-        public static TfToken cornerSharpnesses = new TfToken("cornerSharpnesses");
-        public static TfToken cornersOnly = new TfToken("cornersOnly");
-        public static TfToken cornersPlus1 = new TfToken("cornersPlus1");
-        public static TfToken cornersPlus2 = new TfToken("cornersPlus2");
-        public static TfToken creaseIndices = new TfToken("creaseIndices");
-        public static TfToken creaseLengths = new TfToken("creaseLengths");
-        public static TfToken creaseSharpnesses = new TfToken("creaseSharpnesses");
-        public static TfToken cross = new TfToken("cross");
-        public static TfToken cubic = new TfToken("cubic");
-        public static TfToken curveVertexCounts = new TfToken("curveVertexCounts");
-        public static TfToken default_ = new TfToken("default");
-        public static TfToken doubleSided = new TfToken("doubleSided");
-        public static TfToken edgeAndCorner = new TfToken("edgeAndCorner");
-        public static TfToken edgeOnly = new TfToken("edgeOnly");
-        public static TfToken elementSize = new TfToken("elementSize");
-        public static TfToken elementType = new TfToken("elementType");
-        public static TfToken extent = new TfToken("extent");
-        public static TfToken extentsHint = new TfToken("extentsHint");
-        public static TfToken fStop = new TfToken("fStop");
-        public static TfToken face = new TfToken("face");
-        public static TfToken faceVarying = new TfToken("faceVarying");
-        public static TfToken faceVaryingLinearInterpolation = new TfToken("faceVaryingLinearInterpolation");
-        public static TfToken faceVertexCounts = new TfToken("faceVertexCounts");
-        public static TfToken faceVertexIndices = new TfToken("faceVertexIndices");
-        public static TfToken familyName = new TfToken("familyName");
-        public static TfToken focalLength = new TfToken("focalLength");
-        public static TfToken focusDistance = new TfToken("focusDistance");
-        public static TfToken fromTexture = new TfToken("fromTexture");
-        public static TfToken guide = new TfToken("guide");
-        public static TfToken height = new TfToken("height");
-        public static TfToken hermite = new TfToken("hermite");
-        public static TfToken holeIndices = new TfToken("holeIndices");
-        public static TfToken horizontalAperture = new TfToken("horizontalAperture");
-        public static TfToken horizontalApertureOffset = new TfToken("horizontalApertureOffset");
-        public static TfToken ids = new TfToken("ids");
-        public static TfToken inactiveIds = new TfToken("inactiveIds");
-        public static TfToken indices = new TfToken("indices");
-        public static TfToken inherited = new TfToken("inherited");
-        public static TfToken interpolateBoundary = new TfToken("interpolateBoundary");
-        public static TfToken interpolation = new TfToken("interpolation");
-        public static TfToken invisible = new TfToken("invisible");
-        public static TfToken invisibleIds = new TfToken("invisibleIds");
-        public static TfToken knots = new TfToken("knots");
-        public static TfToken left = new TfToken("left");
-        public static TfToken leftHanded = new TfToken("leftHanded");
-        public static TfToken linear = new TfToken("linear");
-        public static TfToken loop = new TfToken("loop");
-        public static TfToken metersPerUnit = new TfToken("metersPerUnit");
-        public static TfToken modelApplyDrawMode = new TfToken("model:applyDrawMode");
-        public static TfToken modelCardGeometry = new TfToken("model:cardGeometry");
-        public static TfToken modelCardTextureXNeg = new TfToken("model:cardTextureXNeg");
-        public static TfToken modelCardTextureXPos = new TfToken("model:cardTextureXPos");
-        public static TfToken modelCardTextureYNeg = new TfToken("model:cardTextureYNeg");
-        public static TfToken modelCardTextureYPos = new TfToken("model:cardTextureYPos");
-        public static TfToken modelCardTextureZNeg = new TfToken("model:cardTextureZNeg");
-        public static TfToken modelCardTextureZPos = new TfToken("model:cardTextureZPos");
-        public static TfToken modelDrawMode = new TfToken("model:drawMode");
-        public static TfToken modelDrawModeColor = new TfToken("model:drawModeColor");
-        public static TfToken mono = new TfToken("mono");
-        public static TfToken motionVelocityScale = new TfToken("motion:velocityScale");
-        public static TfToken nonOverlapping = new TfToken("nonOverlapping");
-        public static TfToken none = new TfToken("none");
-        public static TfToken nonperiodic = new TfToken("nonperiodic");
-        public static TfToken normals = new TfToken("normals");
-        public static TfToken open = new TfToken("open");
-        public static TfToken order = new TfToken("order");
-        public static TfToken orientation = new TfToken("orientation");
-        public static TfToken orientations = new TfToken("orientations");
-        public static TfToken origin = new TfToken("origin");
-        public static TfToken orthographic = new TfToken("orthographic");
-        public static TfToken partition = new TfToken("partition");
-        public static TfToken periodic = new TfToken("periodic");
-        public static TfToken perspective = new TfToken("perspective");
-        public static TfToken pinned = new TfToken("pinned");
-        public static TfToken pivot = new TfToken("pivot");
-        public static TfToken pointWeights = new TfToken("pointWeights");
-        public static TfToken points = new TfToken("points");
-        public static TfToken positions = new TfToken("positions");
-        public static TfToken power = new TfToken("power");
-        public static TfToken primvarsDisplayColor = new TfToken("primvars:displayColor");
-        public static TfToken primvarsDisplayOpacity = new TfToken("primvars:displayOpacity");
-        public static TfToken projection = new TfToken("projection");
-        public static TfToken protoIndices = new TfToken("protoIndices");
-        public static TfToken prototypes = new TfToken("prototypes");
-        public static TfToken proxy = new TfToken("proxy");
-        public static TfToken proxyPrim = new TfToken("proxyPrim");
-        public static TfToken purpose = new TfToken("purpose");
-        public static TfToken radius = new TfToken("radius");
-        public static TfToken ranges = new TfToken("ranges");
-        public static TfToken render = new TfToken("render");
-        public static TfToken right = new TfToken("right");
-        public static TfToken rightHanded = new TfToken("rightHanded");
-        public static TfToken scales = new TfToken("scales");
-        public static TfToken shutterClose = new TfToken("shutter:close");
-        public static TfToken shutterOpen = new TfToken("shutter:open");
-        public static TfToken size = new TfToken("size");
-        public static TfToken smooth = new TfToken("smooth");
-        public static TfToken stereoRole = new TfToken("stereoRole");
-        public static TfToken subdivisionScheme = new TfToken("subdivisionScheme");
-        public static TfToken tangents = new TfToken("tangents");
-        public static TfToken triangleSubdivisionRule = new TfToken("triangleSubdivisionRule");
-        public static TfToken trimCurveCounts = new TfToken("trimCurve:counts");
-        public static TfToken trimCurveKnots = new TfToken("trimCurve:knots");
-        public static TfToken trimCurveOrders = new TfToken("trimCurve:orders");
-        public static TfToken trimCurvePoints = new TfToken("trimCurve:points");
-        public static TfToken trimCurveRanges = new TfToken("trimCurve:ranges");
-        public static TfToken trimCurveVertexCounts = new TfToken("trimCurve:vertexCounts");
-        public static TfToken type = new TfToken("type");
-        public static TfToken uForm = new TfToken("uForm");
-        public static TfToken uKnots = new TfToken("uKnots");
-        public static TfToken uOrder = new TfToken("uOrder");
-        public static TfToken uRange = new TfToken("uRange");
-        public static TfToken uVertexCount = new TfToken("uVertexCount");
-        public static TfToken unauthoredValuesIndex = new TfToken("unauthoredValuesIndex");
-        public static TfToken uniform = new TfToken("uniform");
-        public static TfToken unrestricted = new TfToken("unrestricted");
-        public static TfToken upAxis = new TfToken("upAxis");
-        public static TfToken vForm = new TfToken("vForm");
-        public static TfToken vKnots = new TfToken("vKnots");
-        public static TfToken vOrder = new TfToken("vOrder");
-        public static TfToken vRange = new TfToken("vRange");
-        public static TfToken vVertexCount = new TfToken("vVertexCount");
-        public static TfToken varying = new TfToken("varying");
-        public static TfToken velocities = new TfToken("velocities");
-        public static TfToken vertex = new TfToken("vertex");
-        public static TfToken verticalAperture = new TfToken("verticalAperture");
-        public static TfToken verticalApertureOffset = new TfToken("verticalApertureOffset");
-        public static TfToken visibility = new TfToken("visibility");
-        public static TfToken widths = new TfToken("widths");
-        public static TfToken wrap = new TfToken("wrap");
-        public static TfToken x = new TfToken("X");
-        public static TfToken xformOpOrder = new TfToken("xformOpOrder");
-        public static TfToken y = new TfToken("Y");
-        public static TfToken z = new TfToken("Z");
+        static int sm_materializedCount;
+
+        /// <summary>
+        /// The number of tokens in this class which have been created so far.
+        /// </summary>
+        public static int MaterializedCount { get { return sm_materializedCount; } }
+
+        /// <summary>
+        /// The total number of tokens in this class.
+        /// </summary>
+        public const int Count = 153;
+
+        static TfToken Materialize(ref TfToken field, string value)
+        {
+            var token = new TfToken(value);
+            if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null)
+            {
+                global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+                return token;
+            }
+            token.Dispose();
+            return field;
+        }
+
+        static TfToken sm_accelerations;
+        public static TfToken accelerations { get { return sm_accelerations ?? Materialize(ref sm_accelerations, "accelerations"); } }
+        static TfToken sm_all;
+        public static TfToken all { get { return sm_all ?? Materialize(ref sm_all, "all"); } }
+        static TfToken sm_angularVelocities;
+        public static TfToken angularVelocities { get { return sm_angularVelocities ?? Materialize(ref sm_angularVelocities, "angularVelocities"); } }
+        static TfToken sm_axis;
+        public static TfToken axis { get { return sm_axis ?? Materialize(ref sm_axis, "axis"); } }
+        static TfToken sm_basis;
+        public static TfToken basis { get { return sm_basis ?? Materialize(ref sm_basis, "basis"); } }
+        static TfToken sm_bezier;
+        public static TfToken bezier { get { return sm_bezier ?? Materialize(ref sm_bezier, "bezier"); } }
+        static TfToken sm_bilinear;
+        public static TfToken bilinear { get { return sm_bilinear ?? Materialize(ref sm_bilinear, "bilinear"); } }
+        static TfToken sm_boundaries;
+        public static TfToken boundaries { get { return sm_boundaries ?? Materialize(ref sm_boundaries, "boundaries"); } }
+        static TfToken sm_bounds;
+        public static TfToken bounds { get { return sm_bounds ?? Materialize(ref sm_bounds, "bounds"); } }
+        static TfToken sm_box;
+        public static TfToken box { get { return sm_box ?? Materialize(ref sm_box, "box"); } }
+        static TfToken sm_bspline;
+        public static TfToken bspline { get { return sm_bspline ?? Materialize(ref sm_bspline, "bspline"); } }
+        static TfToken sm_cards;
+        public static TfToken cards { get { return sm_cards ?? Materialize(ref sm_cards, "cards"); } }
+        static TfToken sm_catmullClark;
+        public static TfToken catmullClark { get { return sm_catmullClark ?? Materialize(ref sm_catmullClark, "catmullClark"); } }
+        static TfToken sm_catmullRom;
+        public static TfToken catmullRom { get { return sm_catmullRom ?? Materialize(ref sm_catmullRom, "catmullRom"); } }
+        static TfToken sm_clippingPlanes;
+        public static TfToken clippingPlanes { get { return sm_clippingPlanes ?? Materialize(ref sm_clippingPlanes, "clippingPlanes"); } }
+        static TfToken sm_clippingRange;
+        public static TfToken clippingRange { get { return sm_clippingRange ?? Materialize(ref sm_clippingRange, "clippingRange"); } }
+        static TfToken sm_closed;
+        public static TfToken closed { get { return sm_closed ?? Materialize(ref sm_closed, "closed"); } }
+        static TfToken sm_constant;
+        public static TfToken constant { get { return sm_constant ?? Materialize(ref sm_constant, "constant"); } }
+        static TfToken sm_cornerIndices;
+        public static TfToken cornerIndices { get { return sm_cornerIndices ?? Materialize(ref sm_cornerIndices, "cornerIndices"); } }
+        static TfToken sm_cornerSharpnesses;
+        public static TfToken cornerSharpnesses { get { return sm_cornerSharpnesses ?? Materialize(ref sm_cornerSharpnesses, "cornerSharpnesses"); } }
+        static TfToken sm_cornersOnly;
+        public static TfToken cornersOnly { get { return sm_cornersOnly ?? Materialize(ref sm_cornersOnly, "cornersOnly"); } }
+        static TfToken sm_cornersPlus1;
+        public static TfToken cornersPlus1 { get { return sm_cornersPlus1 ?? Materialize(ref sm_cornersPlus1, "cornersPlus1"); } }
+        static TfToken sm_cornersPlus2;
+        public static TfToken cornersPlus2 { get { return sm_cornersPlus2 ?? Materialize(ref sm_cornersPlus2, "cornersPlus2"); } }
+        static TfToken sm_creaseIndices;
+        public static TfToken creaseIndices { get { return sm_creaseIndices ?? Materialize(ref sm_creaseIndices, "creaseIndices"); } }
+        static TfToken sm_creaseLengths;
+        public static TfToken creaseLengths { get { return sm_creaseLengths ?? Materialize(ref sm_creaseLengths, "creaseLengths"); } }
+        static TfToken sm_creaseSharpnesses;
+        public static TfToken creaseSharpnesses { get { return sm_creaseSharpnesses ?? Materialize(ref sm_creaseSharpnesses, "creaseSharpnesses"); } }
+        static TfToken sm_cross;
+        public static TfToken cross { get { return sm_cross ?? Materialize(ref sm_cross, "cross"); } }
+        static TfToken sm_cubic;
+        public static TfToken cubic { get { return sm_cubic ?? Materialize(ref sm_cubic, "cubic"); } }
+        static TfToken sm_curveVertexCounts;
+        public static TfToken curveVertexCounts { get { return sm_curveVertexCounts ?? Materialize(ref sm_curveVertexCounts, "curveVertexCounts"); } }
+        static TfToken sm_default_;
+        public static TfToken default_ { get { return sm_default_ ?? Materialize(ref sm_default_, "default"); } }
+        static TfToken sm_doubleSided;
+        public static TfToken doubleSided { get { return sm_doubleSided ?? Materialize(ref sm_doubleSided, "doubleSided"); } }
+        static TfToken sm_edgeAndCorner;
+        public static TfToken edgeAndCorner { get { return sm_edgeAndCorner ?? Materialize(ref sm_edgeAndCorner, "edgeAndCorner"); } }
+        static TfToken sm_edgeOnly;
+        public static TfToken edgeOnly { get { return sm_edgeOnly ?? Materialize(ref sm_edgeOnly, "edgeOnly"); } }
+        static TfToken sm_elementSize;
+        public static TfToken elementSize { get { return sm_elementSize ?? Materialize(ref sm_elementSize, "elementSize"); } }
+        static TfToken sm_elementType;
+        public static TfToken elementType { get { return sm_elementType ?? Materialize(ref sm_elementType, "elementType"); } }
+        static TfToken sm_extent;
+        public static TfToken extent { get { return sm_extent ?? Materialize(ref sm_extent, "extent"); } }
+        static TfToken sm_extentsHint;
+        public static TfToken extentsHint { get { return sm_extentsHint ?? Materialize(ref sm_extentsHint, "extentsHint"); } }
+        static TfToken sm_fStop;
+        public static TfToken fStop { get { return sm_fStop ?? Materialize(ref sm_fStop, "fStop"); } }
+        static TfToken sm_face;
+        public static TfToken face { get { return sm_face ?? Materialize(ref sm_face, "face"); } }
+        static TfToken sm_faceVarying;
+        public static TfToken faceVarying { get { return sm_faceVarying ?? Materialize(ref sm_faceVarying, "faceVarying"); } }
+        static TfToken sm_faceVaryingLinearInterpolation;
+        public static TfToken faceVaryingLinearInterpolation { get { return sm_faceVaryingLinearInterpolation ?? Materialize(ref sm_faceVaryingLinearInterpolation, "faceVaryingLinearInterpolation"); } }
+        static TfToken sm_faceVertexCounts;
+        public static TfToken faceVertexCounts { get { return sm_faceVertexCounts ?? Materialize(ref sm_faceVertexCounts, "faceVertexCounts"); } }
+        static TfToken sm_faceVertexIndices;
+        public static TfToken faceVertexIndices { get { return sm_faceVertexIndices ?? Materialize(ref sm_faceVertexIndices, "faceVertexIndices"); } }
+        static TfToken sm_familyName;
+        public static TfToken familyName { get { return sm_familyName ?? Materialize(ref sm_familyName, "familyName"); } }
+        static TfToken sm_focalLength;
+        public static TfToken focalLength { get { return sm_focalLength ?? Materialize(ref sm_focalLength, "focalLength"); } }
+        static TfToken sm_focusDistance;
+        public static TfToken focusDistance { get { return sm_focusDistance ?? Materialize(ref sm_focusDistance, "focusDistance"); } }
+        static TfToken sm_fromTexture;
+        public static TfToken fromTexture { get { return sm_fromTexture ?? Materialize(ref sm_fromTexture, "fromTexture"); } }
+        static TfToken sm_guide;
+        public static TfToken guide { get { return sm_guide ?? Materialize(ref sm_guide, "guide"); } }
+        static TfToken sm_height;
+        public static TfToken height { get { return sm_height ?? Materialize(ref sm_height, "height"); } }
+        static TfToken sm_hermite;
+        public static TfToken hermite { get { return sm_hermite ?? Materialize(ref sm_hermite, "hermite"); } }
+        static TfToken sm_holeIndices;
+        public static TfToken holeIndices { get { return sm_holeIndices ?? Materialize(ref sm_holeIndices, "holeIndices"); } }
+        static TfToken sm_horizontalAperture;
+        public static TfToken horizontalAperture { get { return sm_horizontalAperture ?? Materialize(ref sm_horizontalAperture, "horizontalAperture"); } }
+        static TfToken sm_horizontalApertureOffset;
+        public static TfToken horizontalApertureOffset { get { return sm_horizontalApertureOffset ?? Materialize(ref sm_horizontalApertureOffset, "horizontalApertureOffset"); } }
+        static TfToken sm_ids;
+        public static TfToken ids { get { return sm_ids ?? Materialize(ref sm_ids, "ids"); } }
+        static TfToken sm_inactiveIds;
+        public static TfToken inactiveIds { get { return sm_inactiveIds ?? Materialize(ref sm_inactiveIds, "inactiveIds"); } }
+        static TfToken sm_indices;
+        public static TfToken indices { get { return sm_indices ?? Materialize(ref sm_indices, "indices"); } }
+        static TfToken sm_inherited;
+        public static TfToken inherited { get { return sm_inherited ?? Materialize(ref sm_inherited, "inherited"); } }
+        static TfToken sm_interpolateBoundary;
+        public static TfToken interpolateBoundary { get { return sm_interpolateBoundary ?? Materialize(ref sm_interpolateBoundary, "interpolateBoundary"); } }
+        static TfToken sm_interpolation;
+        public static TfToken interpolation { get { return sm_interpolation ?? Materialize(ref sm_interpolation, "interpolation"); } }
+        static TfToken sm_invisible;
+        public static TfToken invisible { get { return sm_invisible ?? Materialize(ref sm_invisible, "invisible"); } }
+        static TfToken sm_invisibleIds;
+        public static TfToken invisibleIds { get { return sm_invisibleIds ?? Materialize(ref sm_invisibleIds, "invisibleIds"); } }
+        static TfToken sm_knots;
+        public static TfToken knots { get { return sm_knots ?? Materialize(ref sm_knots, "knots"); } }
+        static TfToken sm_left;
+        public static TfToken left { get { return sm_left ?? Materialize(ref sm_left, "left"); } }
+        static TfToken sm_leftHanded;
+        public static TfToken leftHanded { get { return sm_leftHanded ?? Materialize(ref sm_leftHanded, "leftHanded"); } }
+        static TfToken sm_linear;
+        public static TfToken linear { get { return sm_linear ?? Materialize(ref sm_linear, "linear"); } }
+        static TfToken sm_loop;
+        public static TfToken loop { get { return sm_loop ?? Materialize(ref sm_loop, "loop"); } }
+        static TfToken sm_metersPerUnit;
+        public static TfToken metersPerUnit { get { return sm_metersPerUnit ?? Materialize(ref sm_metersPerUnit, "metersPerUnit"); } }
+        static TfToken sm_modelApplyDrawMode;
+        public static TfToken modelApplyDrawMode { get { return sm_modelApplyDrawMode ?? Materialize(ref sm_modelApplyDrawMode, "model:applyDrawMode"); } }
+        static TfToken sm_modelCardGeometry;
+        public static TfToken modelCardGeometry { get { return sm_modelCardGeometry ?? Materialize(ref sm_modelCardGeometry, "model:cardGeometry"); } }
+        static TfToken sm_modelCardTextureXNeg;
+        public static TfToken modelCardTextureXNeg { get { return sm_modelCardTextureXNeg ?? Materialize(ref sm_modelCardTextureXNeg, "model:cardTextureXNeg"); } }
+        static TfToken sm_modelCardTextureXPos;
+        public static TfToken modelCardTextureXPos { get { return sm_modelCardTextureXPos ?? Materialize(ref sm_modelCardTextureXPos, "model:cardTextureXPos"); } }
+        static TfToken sm_modelCardTextureYNeg;
+        public static TfToken modelCardTextureYNeg { get { return sm_modelCardTextureYNeg ?? Materialize(ref sm_modelCardTextureYNeg, "model:cardTextureYNeg"); } }
+        static TfToken sm_modelCardTextureYPos;
+        public static TfToken modelCardTextureYPos { get { return sm_modelCardTextureYPos ?? Materialize(ref sm_modelCardTextureYPos, "model:cardTextureYPos"); } }
+        static TfToken sm_modelCardTextureZNeg;
+        public static TfToken modelCardTextureZNeg { get { return sm_modelCardTextureZNeg ?? Materialize(ref sm_modelCardTextureZNeg, "model:cardTextureZNeg"); } }
+        static TfToken sm_modelCardTextureZPos;
+        public static TfToken modelCardTextureZPos { get { return sm_modelCardTextureZPos ?? Materialize(ref sm_modelCardTextureZPos, "model:cardTextureZPos"); } }
+        static TfToken sm_modelDrawMode;
+        public static TfToken modelDrawMode { get { return sm_modelDrawMode ?? Materialize(ref sm_modelDrawMode, "model:drawMode"); } }
+        static TfToken sm_modelDrawModeColor;
+        public static TfToken modelDrawModeColor { get { return sm_modelDrawModeColor ?? Materialize(ref sm_modelDrawModeColor, "model:drawModeColor"); } }
+        static TfToken sm_mono;
+        public static TfToken mono { get { return sm_mono ?? Materialize(ref sm_mono, "mono"); } }
+        static TfToken sm_motionVelocityScale;
+        public static TfToken motionVelocityScale { get { return sm_motionVelocityScale ?? Materialize(ref sm_motionVelocityScale, "motion:velocityScale"); } }
+        static TfToken sm_nonOverlapping;
+        public static TfToken nonOverlapping { get { return sm_nonOverlapping ?? Materialize(ref sm_nonOverlapping, "nonOverlapping"); } }
+        static TfToken sm_none;
+        public static TfToken none { get { return sm_none ?? Materialize(ref sm_none, "none"); } }
+        static TfToken sm_nonperiodic;
+        public static TfToken nonperiodic { get { return sm_nonperiodic ?? Materialize(ref sm_nonperiodic, "nonperiodic"); } }
+        static TfToken sm_normals;
+        public static TfToken normals { get { return sm_normals ?? Materialize(ref sm_normals, "normals"); } }
+        static TfToken sm_open;
+        public static TfToken open { get { return sm_open ?? Materialize(ref sm_open, "open"); } }
+        static TfToken sm_order;
+        public static TfToken order { get { return sm_order ?? Materialize(ref sm_order, "order"); } }
+        static TfToken sm_orientation;
+        public static TfToken orientation { get { return sm_orientation ?? Materialize(ref sm_orientation, "orientation"); } }
+        static TfToken sm_orientations;
+        public static TfToken orientations { get { return sm_orientations ?? Materialize(ref sm_orientations, "orientations"); } }
+        static TfToken sm_origin;
+        public static TfToken origin { get { return sm_origin ?? Materialize(ref sm_origin, "origin"); } }
+        static TfToken sm_orthographic;
+        public static TfToken orthographic { get { return sm_orthographic ?? Materialize(ref sm_orthographic, "orthographic"); } }
+        static TfToken sm_partition;
+        public static TfToken partition { get { return sm_partition ?? Materialize(ref sm_partition, "partition"); } }
+        static TfToken sm_periodic;
+        public static TfToken periodic { get { return sm_periodic ?? Materialize(ref sm_periodic, "periodic"); } }
+        static TfToken sm_perspective;
+        public static TfToken perspective { get { return sm_perspective ?? Materialize(ref sm_perspective, "perspective"); } }
+        static TfToken sm_pinned;
+        public static TfToken pinned { get { return sm_pinned ?? Materialize(ref sm_pinned, "pinned"); } }
+        static TfToken sm_pivot;
+        public static TfToken pivot { get { return sm_pivot ?? Materialize(ref sm_pivot, "pivot"); } }
+        static TfToken sm_pointWeights;
+        public static TfToken pointWeights { get { return sm_pointWeights ?? Materialize(ref sm_pointWeights, "pointWeights"); } }
+        static TfToken sm_points;
+        public static TfToken points { get { return sm_points ?? Materialize(ref sm_points, "points"); } }
+        static TfToken sm_positions;
+        public static TfToken positions { get { return sm_positions ?? Materialize(ref sm_positions, "positions"); } }
+        static TfToken sm_power;
+        public static TfToken power { get { return sm_power ?? Materialize(ref sm_power, "power"); } }
+        static TfToken sm_primvarsDisplayColor;
+        public static TfToken primvarsDisplayColor { get { return sm_primvarsDisplayColor ?? Materialize(ref sm_primvarsDisplayColor, "primvars:displayColor"); } }
+        static TfToken sm_primvarsDisplayOpacity;
+        public static TfToken primvarsDisplayOpacity { get { return sm_primvarsDisplayOpacity ?? Materialize(ref sm_primvarsDisplayOpacity, "primvars:displayOpacity"); } }
+        static TfToken sm_projection;
+        public static TfToken projection { get { return sm_projection ?? Materialize(ref sm_projection, "projection"); } }
+        static TfToken sm_protoIndices;
+        public static TfToken protoIndices { get { return sm_protoIndices ?? Materialize(ref sm_protoIndices, "protoIndices"); } }
+        static TfToken sm_prototypes;
+        public static TfToken prototypes { get { return sm_prototypes ?? Materialize(ref sm_prototypes, "prototypes"); } }
+        static TfToken sm_proxy;
+        public static TfToken proxy { get { return sm_proxy ?? Materialize(ref sm_proxy, "proxy"); } }
+        static TfToken sm_proxyPrim;
+        public static TfToken proxyPrim { get { return sm_proxyPrim ?? Materialize(ref sm_proxyPrim, "proxyPrim"); } }
+        static TfToken sm_purpose;
+        public static TfToken purpose { get { return sm_purpose ?? Materialize(ref sm_purpose, "purpose"); } }
+        static TfToken sm_radius;
+        public static TfToken radius { get { return sm_radius ?? Materialize(ref sm_radius, "radius"); } }
+        static TfToken sm_ranges;
+        public static TfToken ranges { get { return sm_ranges ?? Materialize(ref sm_ranges, "ranges"); } }
+        static TfToken sm_render;
+        public static TfToken render { get { return sm_render ?? Materialize(ref sm_render, "render"); } }
+        static TfToken sm_right;
+        public static TfToken right { get { return sm_right ?? Materialize(ref sm_right, "right"); } }
+        static TfToken sm_rightHanded;
+        public static TfToken rightHanded { get { return sm_rightHanded ?? Materialize(ref sm_rightHanded, "rightHanded"); } }
+        static TfToken sm_scales;
+        public static TfToken scales { get { return sm_scales ?? Materialize(ref sm_scales, "scales"); } }
+        static TfToken sm_shutterClose;
+        public static TfToken shutterClose { get { return sm_shutterClose ?? Materialize(ref sm_shutterClose, "shutter:close"); } }
+        static TfToken sm_shutterOpen;
+        public static TfToken shutterOpen { get { return sm_shutterOpen ?? Materialize(ref sm_shutterOpen, "shutter:open"); } }
+        static TfToken sm_size;
+        public static TfToken size { get { return sm_size ?? Materialize(ref sm_size, "size"); } }
+        static TfToken sm_smooth;
+        public static TfToken smooth { get { return sm_smooth ?? Materialize(ref sm_smooth, "smooth"); } }
+        static TfToken sm_stereoRole;
+        public static TfToken stereoRole { get { return sm_stereoRole ?? Materialize(ref sm_stereoRole, "stereoRole"); } }
+        static TfToken sm_subdivisionScheme;
+        public static TfToken subdivisionScheme { get { return sm_subdivisionScheme ?? Materialize(ref sm_subdivisionScheme, "subdivisionScheme"); } }
+        static TfToken sm_tangents;
+        public static TfToken tangents { get { return sm_tangents ?? Materialize(ref sm_tangents, "tangents"); } }
+        static TfToken sm_triangleSubdivisionRule;
+        public static TfToken triangleSubdivisionRule { get { return sm_triangleSubdivisionRule ?? Materialize(ref sm_triangleSubdivisionRule, "triangleSubdivisionRule"); } }
+        static TfToken sm_trimCurveCounts;
+        public static TfToken trimCurveCounts { get { return sm_trimCurveCounts ?? Materialize(ref sm_trimCurveCounts, "trimCurve:counts"); } }
+        static TfToken sm_trimCurveKnots;
+        public static TfToken trimCurveKnots { get { return sm_trimCurveKnots ?? Materialize(ref sm_trimCurveKnots, "trimCurve:knots"); } }
+        static TfToken sm_trimCurveOrders;
+        public static TfToken trimCurveOrders { get { return sm_trimCurveOrders ?? Materialize(ref sm_trimCurveOrders, "trimCurve:orders"); } }
+        static TfToken sm_trimCurvePoints;
+        public static TfToken trimCurvePoints { get { return sm_trimCurvePoints ?? Materialize(ref sm_trimCurvePoints, "trimCurve:points"); } }
+        static TfToken sm_trimCurveRanges;
+        public static TfToken trimCurveRanges { get { return sm_trimCurveRanges ?? Materialize(ref sm_trimCurveRanges, "trimCurve:ranges"); } }
+        static TfToken sm_trimCurveVertexCounts;
+        public static TfToken trimCurveVertexCounts { get { return sm_trimCurveVertexCounts ?? Materialize(ref sm_trimCurveVertexCounts, "trimCurve:vertexCounts"); } }
+        static TfToken sm_type;
+        public static TfToken type { get { return sm_type ?? Materialize(ref sm_type, "type"); } }
+        static TfToken sm_uForm;
+        public static TfToken uForm { get { return sm_uForm ?? Materialize(ref sm_uForm, "uForm"); } }
+        static TfToken sm_uKnots;
+        public static TfToken uKnots { get { return sm_uKnots ?? Materialize(ref sm_uKnots, "uKnots"); } }
+        static TfToken sm_uOrder;
+        public static TfToken uOrder { get { return sm_uOrder ?? Materialize(ref sm_uOrder, "uOrder"); } }
+        static TfToken sm_uRange;
+        public static TfToken uRange { get { return sm_uRange ?? Materialize(ref sm_uRange, "uRange"); } }
+        static TfToken sm_uVertexCount;
+        public static TfToken uVertexCount { get { return sm_uVertexCount ?? Materialize(ref sm_uVertexCount, "uVertexCount"); } }
+        static TfToken sm_unauthoredValuesIndex;
+        public static TfToken unauthoredValuesIndex { get { return sm_unauthoredValuesIndex ?? Materialize(ref sm_unauthoredValuesIndex, "unauthoredValuesIndex"); } }
+        static TfToken sm_uniform;
+        public static TfToken uniform { get { return sm_uniform ?? Materialize(ref sm_uniform, "uniform"); } }
+        static TfToken sm_unrestricted;
+        public static TfToken unrestricted { get { return sm_unrestricted ?? Materialize(ref sm_unrestricted, "unrestricted"); } }
+        static TfToken sm_upAxis;
+        public static TfToken upAxis { get { return sm_upAxis ?? Materialize(ref sm_upAxis, "upAxis"); } }
+        static TfToken sm_vForm;
+        public static TfToken vForm { get { return sm_vForm ?? Materialize(ref sm_vForm, "vForm"); } }
+        static TfToken sm_vKnots;
+        public static TfToken vKnots { get { return sm_vKnots ?? Materialize(ref sm_vKnots, "vKnots"); } }
+        static TfToken sm_vOrder;
+        public static TfToken vOrder { get { return sm_vOrder ?? Materialize(ref sm_vOrder, "vOrder"); } }
+        static TfToken sm_vRange;
+        public static TfToken vRange { get { return sm_vRange ?? Materialize(ref sm_vRange, "vRange"); } }
+        static TfToken sm_vVertexCount;
+        public static TfToken vVertexCount { get { return sm_vVertexCount ?? Materialize(ref sm_vVertexCount, "vVertexCount"); } }
+        static TfToken sm_varying;
+        public static TfToken varying { get { return sm_varying ?? Materialize(ref sm_varying, "varying"); } }
+        static TfToken sm_velocities;
+        public static TfToken velocities { get { return sm_velocities ?? Materialize(ref sm_velocities, "velocities"); } }
+        static TfToken sm_vertex;
+        public static TfToken vertex { get { return sm_vertex ?? Materialize(ref sm_vertex, "vertex"); } }
+        static TfToken sm_verticalAperture;
+        public static TfToken verticalAperture { get { return sm_verticalAperture ?? Materialize(ref sm_verticalAperture, "verticalAperture"); } }
+        static TfToken sm_verticalApertureOffset;
+        public static TfToken verticalApertureOffset { get { return sm_verticalApertureOffset ?? Materialize(ref sm_verticalApertureOffset, "verticalApertureOffset"); } }
+        static TfToken sm_visibility;
+        public static TfToken visibility { get { return sm_visibility ?? Materialize(ref sm_visibility, "visibility"); } }
+        static TfToken sm_widths;
+        public static TfToken widths { get { return sm_widths ?? Materialize(ref sm_widths, "widths"); } }
+        static TfToken sm_wrap;
+        public static TfToken wrap { get { return sm_wrap ?? Materialize(ref sm_wrap, "wrap"); } }
+        static TfToken sm_x;
+        public static TfToken x { get { return sm_x ?? Materialize(ref sm_x, "X"); } }
+        static TfToken sm_xformOpOrder;
+        public static TfToken xformOpOrder { get { return sm_xformOpOrder ?? Materialize(ref sm_xformOpOrder, "xformOpOrder"); } }
+        static TfToken sm_y;
+        public static TfToken y { get { return sm_y ?? Materialize(ref sm_y, "Y"); } }
+        static TfToken sm_z;
+        public static TfToken z { get { return sm_z ?? Materialize(ref sm_z, "Z"); } }
     }
 }
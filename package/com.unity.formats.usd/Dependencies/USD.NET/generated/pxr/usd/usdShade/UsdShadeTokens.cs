@@ -42,35 +42,89 @@ namespace pxr
             }
         }
 
-        public static TfToken allPurpose = new TfToken("");
-        public static TfToken bindMaterialAs = new TfToken("bindMaterialAs");
-        public static TfToken coordSys = new TfToken("coordSys:");
-        public static TfToken displacement = new TfToken("displacement");
-        public static TfToken fallbackStrength = new TfToken("fallbackStrength");
-        public static TfToken full = new TfToken("full");
-        public static TfToken id = new TfToken("id");
-        public static TfToken infoId = new TfToken("info:id");
-        public static TfToken infoImplementationSource = new TfToken("info:implementationSource");
-        public static TfToken inputs = new TfToken("inputs:");
-        public static TfToken interfaceOnly = new TfToken("interfaceOnly");
-        public static TfToken materialBind = new TfToken("materialBind");
-        public static TfToken materialBinding = new TfToken("material:binding");
-        public static TfToken materialBindingCollection = new TfToken("material:binding:collection");
-        public static TfToken materialVariant = new TfToken("materialVariant");
-        public static TfToken outputs = new TfToken("outputs:");
-        public static TfToken outputsDisplacement = new TfToken("outputs:displacement");
-        public static TfToken outputsSurface = new TfToken("outputs:surface");
-        public static TfToken outputsVolume = new TfToken("outputs:volume");
-        public static TfToken preview = new TfToken("preview");
-        public static TfToken sdrMetadata = new TfToken("sdrMetadata");
-        public static TfToken sourceAsset = new TfToken("sourceAsset");
-        public static TfToken sourceCode = new TfToken("sourceCode");
-        public static TfToken strongerThanDescendants = new TfToken("strongerThanDescendants");
-        public static TfToken subIdentifier = new TfToken("subIdentifier");
-        public static TfToken surface = new TfToken("surface");
-        public static TfToken universalRenderContext = new TfToken("");
-        public static TfToken universalSourceType = new TfToken("");
-        public static TfToken volume = new TfToken("volume");
-        public static TfToken weakerThanDescendants = new TfToken("weakerThanDescendants");
+        static int sm_materializedCount;
+
+        /// <summary>
+        /// The number of tokens in this class which have been created so far.
+        /// </summary>
+        public static int MaterializedCount { get { return sm_materializedCount; } }
+
+        /// <summary>
+        /// The total number of tokens in this class.
+        /// </summary>
+        public const int Count = 30;
+
+        static TfToken Materialize(ref TfToken field, string value)
+        {
+            var token = new TfToken(value);
+            if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null)
+            {
+                global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+                return token;
+            }
+            token.Dispose();
+            return field;
+        }
+
+        static TfToken sm_allPurpose;
+        public static TfToken allPurpose { get { return sm_allPurpose ?? Materialize(ref sm_allPurpose, ""); } }
+        static TfToken sm_bindMaterialAs;
+        public static TfToken bindMaterialAs { get { return sm_bindMaterialAs ?? Materialize(ref sm_bindMaterialAs, "bindMaterialAs"); } }
+        static TfToken sm_coordSys;
+        public static TfToken coordSys { get { return sm_coordSys ?? Materialize(ref sm_coordSys, "coordSys:"); } }
+        static TfToken sm_displacement;
+        public static TfToken displacement { get { return sm_displacement ?? Materialize(ref sm_displacement, "displacement"); } }
+        static TfToken sm_fallbackStrength;
+        public static TfToken fallbackStrength { get { return sm_fallbackStrength ?? Materialize(ref sm_fallbackStrength, "fallbackStrength"); } }
+        static TfToken sm_full;
+        public static TfToken full { get { return sm_full ?? Materialize(ref sm_full, "full"); } }
+        static TfToken sm_id;
+        public static TfToken id { get { return sm_id ?? Materialize(ref sm_id, "id"); } }
+        static TfToken sm_infoId;
+        public static TfToken infoId { get { return sm_infoId ?? Materialize(ref sm_infoId, "info:id"); } }
+        static TfToken sm_infoImplementationSource;
+        public static TfToken infoImplementationSource { get { return sm_infoImplementationSource ?? Materialize(ref sm_infoImplementationSource, "info:implementationSource"); } }
+        static TfToken sm_inputs;
+        public static TfToken inputs { get { return sm_inputs ?? Materialize(ref sm_inputs, "inputs:"); } }
+        static TfToken sm_interfaceOnly;
+        public static TfToken interfaceOnly { get { return sm_interfaceOnly ?? Materialize(ref sm_interfaceOnly, "interfaceOnly"); } }
+        static TfToken sm_materialBind;
+        public static TfToken materialBind { get { return sm_materialBind ?? Materialize(ref sm_materialBind, "materialBind"); } }
+        static TfToken sm_materialBinding;
+        public static TfToken materialBinding { get { return sm_materialBinding ?? Materialize(ref sm_materialBinding, "material:binding"); } }
+        static TfToken sm_materialBindingCollection;
+        public static TfToken materialBindingCollection { get { return sm_materialBindingCollection ?? Materialize(ref sm_materialBindingCollection, "material:binding:collection"); } }
+        static TfToken sm_materialVariant;
+        public static TfToken materialVariant { get { return sm_materialVariant ?? Materialize(ref sm_materialVariant, "materialVariant"); } }
+        static TfToken sm_outputs;
+        public static TfToken outputs { get { return sm_outputs ?? Materialize(ref sm_outputs, "outputs:"); } }
+        static TfToken sm_outputsDisplacement;
+        public static TfToken outputsDisplacement { get { return sm_outputsDisplacement ?? Materialize(ref sm_outputsDisplacement, "outputs:displacement"); } }
+        static TfToken sm_outputsSurface;
+        public static TfToken outputsSurface { get { return sm_outputsSurface ?? Materialize(ref sm_outputsSurface, "outputs:surface"); } }
+        static TfToken sm_outputsVolume;
+        public static TfToken outputsVolume { get { return sm_outputsVolume ?? Materialize(ref sm_outputsVolume, "outputs:volume"); } }
+        static TfToken sm_preview;
+        public static TfToken preview { get { return sm_preview ?? Materialize(ref sm_preview, "preview"); } }
+        static TfToken sm_sdrMetadata;
+        public static TfToken sdrMetadata { get { return sm_sdrMetadata ?? Materialize(ref sm_sdrMetadata, "sdrMetadata"); } }
+        static TfToken sm_sourceAsset;
+        public static TfToken sourceAsset { get { return sm_sourceAsset ?? Materialize(ref sm_sourceAsset, "sourceAsset"); } }
+        static TfToken sm_sourceCode;
+        public static TfToken sourceCode { get { return sm_sourceCode ?? Materialize(ref sm_sourceCode, "sourceCode"); } }
+        static TfToken sm_strongerThanDescendants;
+        public static TfToken strongerThanDescendants { get { return sm_strongerThanDescendants ?? Materialize(ref sm_strongerThanDescendants, "strongerThanDescendants"); } }
+        static TfToken sm_subIdentifier;
+        public static TfToken subIdentifier { get { return sm_subIdentifier ?? Materialize(ref sm_subIdentifier, "subIdentifier"); } }
+        static TfToken sm_surface;
+        public static TfToken surface { get { return sm_surface ?? Materialize(ref sm_surface, "surface"); } }
+        static TfToken sm_universalRenderContext;
+        public static TfToken universalRenderContext { get { return sm_universalRenderContext ?? Materialize(ref sm_universalRenderContext, ""); } }
+        static TfToken sm_universalSourceType;
+        public static TfToken universalSourceType { get { return sm_universalSourceType ?? Materialize(ref sm_universalSourceType, ""); } }
+        static TfToken sm_volume;
+        public static TfToken volume { get { return sm_volume ?? Materialize(ref sm_volume, "volume"); } }
+        static TfToken sm_weakerThanDescendants;
+        public static TfToken weakerThanDescendants { get { return sm_weakerThanDescendants ?? Materialize(ref sm_weakerThanDescendants, "weakerThanDescendants"); } }
     }
 }
@@ -42,26 +42,71 @@ namespace pxr
             }
         }
 
-        public static TfToken bindTransforms = new TfToken("bindTransforms");
-        public static TfToken blendShapeWeights = new TfToken("blendShapeWeights");
-        public static TfToken blendShapes = new TfToken("blendShapes");
-        public static TfToken jointNames = new TfToken("jointNames");
-        public static TfToken joints = new TfToken("joints");
-        public static TfToken normalOffsets = new TfToken("normalOffsets");
-        public static TfToken offsets = new TfToken("offsets");
-        public static TfToken pointIndices = new TfToken("pointIndices");
-        public static TfToken primvarsSkelGeomBindTransform = new TfToken("primvars:skel:geomBindTransform");
-        public static TfToken primvarsSkelJointIndices = new TfToken("primvars:skel:jointIndices");
-        public static TfToken primvarsSkelJointWeights = new TfToken("primvars:skel:jointWeights");
-        public static TfToken restTransforms = new TfToken("restTransforms");
-        public static TfToken rotations = new TfToken("rotations");
-        public static TfToken scales = new TfToken("scales");
-        public static TfToken skelAnimationSource = new TfToken("skel:animationSource");
-        public static TfToken skelBlendShapeTargets = new TfToken("skel:blendShapeTargets");
-        public static TfToken skelBlendShapes = new TfToken("skel:blendShapes");
-        public static TfToken skelJoints = new TfToken("skel:joints");
-        public static TfToken skelSkeleton = new TfToken("skel:skeleton");
-        public static TfToken translations = new TfToken("translations");
-        public static TfToken weight = new TfToken("weight");
+        static int sm_materializedCount;
+
+        /// <summary>
+        /// The number of tokens in this class which have been created so far.
+        /// </summary>
+        public static int MaterializedCount { get { return sm_materializedCount; } }
+
+        /// <summary>
+        /// The total number of tokens in this class.
+        /// </summary>
+        public const int Count = 21;
+
+        static TfToken Materialize(ref TfToken field, string value)
+        {
+            var token = new TfToken(value);
+            if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null)
+            {
+                global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+                return token;
+            }
+            token.Dispose();
+            return field;
+        }
+
+        static TfToken sm_bindTransforms;
+        public static TfToken bindTransforms { get { return sm_bindTransforms ?? Materialize(ref sm_bindTransforms, "bindTransforms"); } }
+        static TfToken sm_blendShapeWeights;
+        public static TfToken blendShapeWeights { get { return sm_blendShapeWeights ?? Materialize(ref sm_blendShapeWeights, "blendShapeWeights"); } }
+        static TfToken sm_blendShapes;
+        public static TfToken blendShapes { get { return sm_blendShapes ?? Materialize(ref sm_blendShapes, "blendShapes"); } }
+        static TfToken sm_jointNames;
+        public static TfToken jointNames { get { return sm_jointNames ?? Materialize(ref sm_jointNames, "jointNames"); } }
+        static TfToken sm_joints;
+        public static TfToken joints { get { return sm_joints ?? Materialize(ref sm_joints, "joints"); } }
+        static TfToken sm_normalOffsets;
+        public static TfToken normalOffsets { get { return sm_normalOffsets ?? Materialize(ref sm_normalOffsets, "normalOffsets"); } }
+        static TfToken sm_offsets;
+        public static TfToken offsets { get { return sm_offsets ?? Materialize(ref sm_offsets, "offsets"); } }
+        static TfToken sm_pointIndices;
+        public static TfToken pointIndices { get { return sm_pointIndices ?? Materialize(ref sm_pointIndices, "pointIndices"); } }
+        static TfToken sm_primvarsSkelGeomBindTransform;
+        public static TfToken primvarsSkelGeomBindTransform { get { return sm_primvarsSkelGeomBindTransform ?? Materialize(ref sm_primvarsSkelGeomBindTransform, "primvars:skel:geomBindTransform"); } }
+        static TfToken sm_primvarsSkelJointIndices;
+        public static TfToken primvarsSkelJointIndices { get { return sm_primvarsSkelJointIndices ?? Materialize(ref sm_primvarsSkelJointIndices, "primvars:skel:jointIndices"); } }
+        static TfToken sm_primvarsSkelJointWeights;
+        public static TfToken primvarsSkelJointWeights { get { return sm_primvarsSkelJointWeights ?? Materialize(ref sm_primvarsSkelJointWeights, "primvars:skel:jointWeights"); } }
+        static TfToken sm_restTransforms;
+        public static TfToken restTransforms { get { return sm_restTransforms ?? Materialize(ref sm_restTransforms, "restTransforms"); } }
+        static TfToken sm_rotations;
+        public static TfToken rotations { get { return sm_rotations ?? Materialize(ref sm_rotations, "rotations"); } }
+        static TfToken sm_scales;
+        public static TfToken scales { get { return sm_scales ?? Materialize(ref sm_scales, "scales"); } }
+        static TfToken sm_skelAnimationSource;
+        public static TfToken skelAnimationSource { get { return sm_skelAnimationSource ?? Materialize(ref sm_skelAnimationSource, "skel:animationSource"); } }
+        static TfToken sm_skelBlendShapeTargets;
+        public static TfToken skelBlendShapeTargets { get { return sm_skelBlendShapeTargets ?? Materialize(ref sm_skelBlendShapeTargets, "skel:blendShapeTargets"); } }
+        static TfToken sm_skelBlendShapes;
+        public static TfToken skelBlendShapes { get { return sm_skelBlendShapes ?? Materialize(ref sm_skelBlendShapes, "skel:blendShapes"); } }
+        static TfToken sm_skelJoints;
+        public static TfToken skelJoints { get { return sm_skelJoints ?? Materialize(ref sm_skelJoints, "skel:joints"); } }
+        static TfToken sm_skelSkeleton;
+        public static TfToken skelSkeleton { get { return sm_skelSkeleton ?? Materialize(ref sm_skelSkeleton, "skel:skeleton"); } }
+        static TfToken sm_translations;
+        public static TfToken translations { get { return sm_translations ?? Materialize(ref sm_translations, "translations"); } }
+        static TfToken sm_weight;
+        public static TfToken weight { get { return sm_weight ?? Materialize(ref sm_weight, "weight"); } }
     }
 }
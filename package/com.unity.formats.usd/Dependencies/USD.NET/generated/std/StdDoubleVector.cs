@@ -384,5 +384,11 @@ namespace pxr
             bool ret = UsdCsPINVOKE.StdDoubleVector_Remove(swigCPtr, value);
             return ret;
         }
+
+        public void CopyToArray(int index, int count, double[] doubleBuffer)
+        {
+            UsdCsPINVOKE.StdDoubleVector_CopyToArray(swigCPtr, index, count, doubleBuffer);
+            if (UsdCsPINVOKE.SWIGPendingException.Pending) throw UsdCsPINVOKE.SWIGPendingException.Retrieve();
+        }
     }
 }
@@ -13,7 +13,10 @@
 // limitations under the License.
 
 using System;
+using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Runtime.InteropServices;
+using System.Threading;
 
 namespace USD.NET
 {
@@ -21,17 +24,164 @@ namespace USD.NET
     /// A pooled memory allocator. May be used optionally during serializaiton to avoid generation of
     /// garbage.
     /// </summary>
+    /// <remarks>
+    /// Free arrays are held in stripes, each with its own lock, chosen by array type and
+    /// power-of-two size class so that threads working on different data rarely contend. Arrays are
+    /// still only reused for requests of the exact same length, since callers rely on the length of
+    /// the array as the element count.
+    ///
+    /// The pool retains at most MaxRetainedBytes of free arrays. When freeing an array exceeds the
+    /// budget, the least recently freed arrays are evicted and left to the garbage collector.
+    /// </remarks>
     public class ArrayPool
     {
         protected static readonly Type[] sm_defaultCtor = new Type[0];
         protected static readonly object[] sm_noParameters = new object[0];
 
-        private Dictionary<Type, Dictionary<uint, List<Array>>> m_data =
-            new Dictionary<Type, Dictionary<uint, List<Array>>>();
+        /// <summary>
+        /// The default byte budget of a pool, 256 MB.
+        /// </summary>
+        public const long kDefaultMaxRetainedBytes = 256L * 1024 * 1024;
+
+        // Must be a power of two.
+        private const int kStripeCount = 16;
+
+        private struct Key : IEquatable<Key>
+        {
+            public readonly Type ArrayType;
+            public readonly uint Size;
+
+            public Key(Type arrayType, uint size)
+            {
+                ArrayType = arrayType;
+                Size = size;
+            }
+
+            public bool Equals(Key other)
+            {
+                return ArrayType == other.ArrayType && Size == other.Size;
+            }
+
+            public override bool Equals(object obj)
+            {
+                return obj is Key && Equals((Key)obj);
+            }
+
+            public override int GetHashCode()
+            {
+                return unchecked(ArrayType.GetHashCode() * 31 + (int)Size);
+            }
+        }
+
+        private class Entry
+        {
+            public Key key;
+            public Array array;
+            public long bytes;
+            public long lastFreed;
+        }
+
+        private class Stripe
+        {
+            // Free arrays of each type and length, most recently freed last.
+            public Dictionary<Key, List<LinkedListNode<Entry>>> free = new Dictionary<Key, List<LinkedListNode<Entry>>>();
+
+            // All free arrays of the stripe, least recently freed first.
+            public LinkedList<Entry> lru = new LinkedList<Entry>();
+        }
+
+        private static readonly ConcurrentDictionary<Type, int> sm_elementSizes = new ConcurrentDictionary<Type, int>();
+
+        private readonly Stripe[] m_stripes = new Stripe[kStripeCount];
 
         private Dictionary<Type, List<object>> m_hndData =
             new Dictionary<Type, List<object>>();
 
+        private long m_maxRetainedBytes;
+        private long m_retainedBytes;
+        private long m_clock;
+        private long m_hits;
+        private long m_misses;
+        private long m_evictions;
+
+        /// <summary>
+        /// The maximum number of bytes of free arrays the pool holds on to. Lowering it evicts the
+        /// least recently freed arrays immediately.
+        /// </summary>
+        public long MaxRetainedBytes
+        {
+            get { return Interlocked.Read(ref m_maxRetainedBytes); }
+            set
+            {
+                Interlocked.Exchange(ref m_maxRetainedBytes, value);
+                Evict();
+            }
+        }
+
+        /// <summary>
+        /// The number of bytes of free arrays currently held by the pool.
+        /// </summary>
+        public long RetainedBytes { get { return Interlocked.Read(ref m_retainedBytes); } }
+
+        /// <summary>
+        /// The number of array allocations served from the pool.
+        /// </summary>
+        public long Hits { get { return Interlocked.Read(ref m_hits); } }
+
+        /// <summary>
+        /// The number of array allocations which had to create a new array.
+        /// </summary>
+        public long Misses { get { return Interlocked.Read(ref m_misses); } }
+
+        /// <summary>
+        /// The number of free arrays dropped to stay within MaxRetainedBytes.
+        /// </summary>
+        public long Evictions { get { return Interlocked.Read(ref m_evictions); } }
+
+        public ArrayPool() : this(kDefaultMaxRetainedBytes)
+        {
+        }
+
+        /// <param name="maxRetainedBytes">The maximum number of bytes of free arrays to hold on to</param>
+        public ArrayPool(long maxRetainedBytes)
+        {
+            m_maxRetainedBytes = maxRetainedBytes;
+            for (int i = 0; i < kStripeCount; i++)
+            {
+                m_stripes[i] = new Stripe();
+            }
+        }
+
+        /// <summary>
+        /// Resets the hit, miss and eviction counters to zero, the pooled arrays are kept.
+        /// </summary>
+        public void ResetCounters()
+        {
+            Interlocked.Exchange(ref m_hits, 0);
+            Interlocked.Exchange(ref m_misses, 0);
+            Interlocked.Exchange(ref m_evictions, 0);
+        }
+
+        /// <summary>
+        /// Drops every free array held by the pool.
+        /// </summary>
+        public void Clear()
+        {
+            foreach (var stripe in m_stripes)
+            {
+                lock (stripe)
+                {
+                    foreach (var entry in stripe.lru)
+                    {
+                        Interlocked.Add(ref m_retainedBytes, -entry.bytes);
+                    }
+
+                    stripe.free.Clear();
+                    stripe.lru.Clear();
+                }
+            }
+        }
+
         /// <summary>
         /// Allocates a new array of type T, returning ownership to the caller. Uses an existing array
         /// from the pool if available.
@@ -45,34 +195,147 @@ namespace USD.NET
             {
                 return new T[size];
             }
-            lock (this) {
-                Dictionary<uint, List<Array>> pool;
-                List<Array> vec;
-                Type arrayType = typeof(T[]);
+            return (T[])TakeFromPool(typeof(T[]), size) ?? new T[size];
+        }
+
+        /// <summary>
+        /// Allocates a new array of the given array type, returning ownership to the caller. Uses an
+        /// existing array from the pool if available.
+        /// </summary>
+        /// <param name="arrayType">The type of the array, e.g. typeof(float[])</param>
+        /// <param name="size">The number of elements to allocate in the array</param>
+        /// <returns></returns>
+        virtual public Array Malloc(Type arrayType, uint size)
+        {
+            if (arrayType == typeof(string[]))
+            {
+                return new string[size];
+            }
+            return TakeFromPool(arrayType, size) ?? Array.CreateInstance(arrayType.GetElementType(), size);
+        }
+
+        /// <summary>
+        /// Removes an array of the given type and size from the pool, returns null if there is none.
+        /// </summary>
+        private Array TakeFromPool(Type arrayType, uint size)
+        {
+            var key = new Key(arrayType, size);
+            var stripe = GetStripe(key);
+
+            lock (stripe)
+            {
+                List<LinkedListNode<Entry>> vec;
+                if (stripe.free.TryGetValue(key, out vec) && vec.Count > 0)
+                {
+                    var node = vec[vec.Count - 1];
+                    vec.RemoveAt(vec.Count - 1);
+                    if (vec.Count == 0)
+                    {
+                        stripe.free.Remove(key);
+                    }
+
+                    stripe.lru.Remove(node);
+                    Interlocked.Add(ref m_retainedBytes, -node.Value.bytes);
+                    Interlocked.Increment(ref m_hits);
+                    return node.Value.array;
+                }
+            }
+
+            Interlocked.Increment(ref m_misses);
+            return null;
+        }
+
+        private Stripe GetStripe(Key key)
+        {
+            int sizeClass = 0;
+            for (uint size = key.Size; size > 1; size = (size + 1) >> 1)
+            {
+                sizeClass++;
+            }
+
+            int hash = unchecked(key.ArrayType.GetHashCode() * 31 + sizeClass);
+            return m_stripes[hash & (kStripeCount - 1)];
+        }
 
-                if (!m_data.TryGetValue(arrayType, out pool))
+        /// <summary>
+        /// Evicts the least recently freed arrays until the pool is within its byte budget.
+        /// </summary>
+        private void Evict()
+        {
+            while (Interlocked.Read(ref m_retainedBytes) > Interlocked.Read(ref m_maxRetainedBytes))
+            {
+                Stripe oldest = null;
+                long oldestFreed = long.MaxValue;
+                foreach (var stripe in m_stripes)
                 {
-                    pool = new Dictionary<uint, List<Array>>();
-                    m_data.Add(arrayType, pool);
+                    lock (stripe)
+                    {
+                        var first = stripe.lru.First;
+                        if (first != null && first.Value.lastFreed < oldestFreed)
+                        {
+                            oldest = stripe;
+                            oldestFreed = first.Value.lastFreed;
+                        }
+                    }
                 }
 
-                if (!pool.TryGetValue(size, out vec))
+                if (oldest == null)
                 {
-                    vec = new List<Array>();
-                    pool.Add(size, vec);
+                    return;
                 }
 
-                if (vec.Count == 0)
+                lock (oldest)
                 {
-                    return new T[size];
+                    var node = oldest.lru.First;
+                    if (node == null)
+                    {
+                        continue;
+                    }
+
+                    // Arrays of one type and length are freed in order, so the least recently freed
+                    // array of the stripe is also the first in its list.
+                    oldest.lru.RemoveFirst();
+                    var vec = oldest.free[node.Value.key];
+                    vec.RemoveAt(0);
+                    if (vec.Count == 0)
+                    {
+                        oldest.free.Remove(node.Value.key);
+                    }
+
+                    Interlocked.Add(ref m_retainedBytes, -node.Value.bytes);
+                    Interlocked.Increment(ref m_evictions);
                 }
-                else
+            }
+        }
+
+        private static long GetByteSize(Array array)
+        {
+            var elementType = array.GetType().GetElementType();
+            if (elementType.IsPrimitive)
+            {
+                return Buffer.ByteLength(array);
+            }
+
+            int elementSize;
+            if (!sm_elementSizes.TryGetValue(elementType, out elementSize))
+            {
+                elementSize = IntPtr.Size;
+                if (elementType.IsValueType)
                 {
-                    Array array = vec[vec.Count - 1];
-                    vec.RemoveAt(vec.Count - 1);
-                    return (T[])array;
+                    try
+                    {
+                        elementSize = Marshal.SizeOf(elementType);
+                    }
+                    catch (ArgumentException)
+                    {
+                        // Not marshalable, a pointer per element is a lower bound.
+                    }
                 }
+
+                sm_elementSizes[elementType] = elementSize;
             }
+
+            return (long)elementSize * array.Length;
         }
 
         /// <summary>
@@ -148,31 +411,46 @@ namespace USD.NET
         /// </summary>
         /// <remarks>
         /// Note that objects returned to the allocator pool will not be garbage collected and will not
-        /// be disposed.
+        /// be disposed, unless they are evicted to stay within MaxRetainedBytes. The array is pooled
+        /// by its own type and length.
         /// </remarks>
         virtual public void Free(Type arrayType, uint size, Array array)
         {
-            if (arrayType == typeof(string[]))
+            if (array == null || array is string[])
             {
                 return;
             }
-            Dictionary<uint, List<Array>> pool;
-            List<Array> vec;
 
-            lock (this) {
-                if (!m_data.TryGetValue(arrayType, out pool))
-                {
-                    pool = new Dictionary<uint, List<Array>>();
-                    m_data.Add(arrayType, pool);
-                }
+            var entry = new Entry
+            {
+                key = new Key(array.GetType(), (uint)array.Length),
+                array = array,
+                bytes = GetByteSize(array),
+                lastFreed = Interlocked.Increment(ref m_clock),
+            };
 
-                if (!pool.TryGetValue(size, out vec))
+            if (entry.bytes > MaxRetainedBytes)
+            {
+                Interlocked.Increment(ref m_evictions);
+                return;
+            }
+
+            var stripe = GetStripe(entry.key);
+            lock (stripe)
+            {
+                List<LinkedListNode<Entry>> vec;
+                if (!stripe.free.TryGetValue(entry.key, out vec))
                 {
-                    vec = new List<Array>();
-                    pool.Add(size, vec);
+                    vec = new List<LinkedListNode<Entry>>();
+                    stripe.free.Add(entry.key, vec);
                 }
 
-                vec.Add(array);
+                vec.Add(stripe.lru.AddLast(entry));
+            }
+
+            if (Interlocked.Add(ref m_retainedBytes, entry.bytes) > MaxRetainedBytes)
+            {
+                Evict();
             }
         }
     }
@@ -26,6 +26,11 @@ namespace USD.NET
             return new T[size];
         }
 
+        override public Array Malloc(Type arrayType, uint size)
+        {
+            return Array.CreateInstance(arrayType.GetElementType(), size);
+        }
+
         override public void Free(Type type, uint size, Array array)
         {
         }
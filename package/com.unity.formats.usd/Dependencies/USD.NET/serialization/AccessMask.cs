@@ -56,5 +56,17 @@ namespace USD.NET
     public class AccessMask
     {
         public Dictionary<SdfPath, DeserializationContext> Included = new Dictionary<SdfPath, DeserializationContext>();
+
+        /// <summary>
+        /// When non-null, the prims which might vary over time. Prims missing from the index are read
+        /// without checking their members for variability while populating and are never included.
+        /// </summary>
+        public TimeVaryingIndex TimeVarying;
+
+        /// <summary>
+        /// The prims whose transform might vary over time, recorded by Scene.ComputeTransforms()
+        /// while populating.
+        /// </summary>
+        public HashSet<SdfPath> TimeVaryingTransforms = new HashSet<SdfPath>();
     }
 }
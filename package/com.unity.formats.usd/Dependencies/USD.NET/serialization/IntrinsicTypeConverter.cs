@@ -58,6 +58,36 @@ namespace USD.NET
             }
         }
 
+        /// <summary>
+        /// Copies the list into an array from the ArrayAllocator, avoiding the garbage generated by
+        /// List.ToArray(). The array should be returned with FreeTempArray once it has been consumed.
+        /// </summary>
+        static protected T[] ListToTempArray<T>(List<T> input)
+        {
+            var tmp = UsdIo.ArrayAllocator.Malloc<T>((uint)input.Count);
+            input.CopyTo(tmp);
+            return tmp;
+        }
+
+        /// <summary>
+        /// Returns an array obtained from the ArrayAllocator to the pool.
+        /// </summary>
+        static protected void FreeTempArray<T>(T[] tmp)
+        {
+            UsdIo.ArrayAllocator.Free(tmp.GetType(), (uint)tmp.Length, tmp);
+        }
+
+        /// <summary>
+        /// Copies an array obtained from the ArrayAllocator into a new list and returns the array to
+        /// the pool.
+        /// </summary>
+        static protected List<T> TempArrayToList<T>(T[] tmp)
+        {
+            var output = new List<T>(tmp);
+            FreeTempArray(tmp);
+            return output;
+        }
+
         // ----------------------------------------------------------------------------------------- //
         // string[], List<string> <--> TokenArray
         // ----------------------------------------------------------------------------------------- //
@@ -76,13 +106,16 @@ namespace USD.NET
         [Preserve]
         static public VtTokenArray ListToVtArray(List<string> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<string> ListFromVtArray(VtTokenArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // Convenience API: generates garbage, do not use when performance matters.
@@ -126,13 +159,16 @@ namespace USD.NET
         [Preserve]
         static public SdfAssetPathArray ListToVtArray(List<SdfAssetPath> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<SdfAssetPath> ListFromVtArray(SdfAssetPathArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // Convenience API: generates garbage, do not use when performance matters.
@@ -203,7 +239,10 @@ namespace USD.NET
         [Preserve]
         static public VtBoolArray ListToVtArray(List<bool> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
@@ -217,7 +256,7 @@ namespace USD.NET
                     input.CopyToArray(new IntPtr(p));
                 }
             }
-            return tmp.ToList();
+            return TempArrayToList(tmp);
         }
 
         // ----------------------------------------------------------------------------------------- //
@@ -240,13 +279,16 @@ namespace USD.NET
         [Preserve]
         static public VtUCharArray ListToVtArray(List<byte> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<byte> ListFromVtArray(VtUCharArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         // Convenience API: generates garbage, do not use when performance matters.
@@ -281,13 +323,16 @@ namespace USD.NET
         [Preserve]
         static public VtIntArray ListToVtArray(List<int> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<int> ListFromVtArray(VtIntArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -335,13 +380,16 @@ namespace USD.NET
         [Preserve]
         static public VtUIntArray ListToVtArray(List<uint> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<uint> ListFromVtArray(VtUIntArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -389,13 +437,16 @@ namespace USD.NET
         [Preserve]
         static public VtInt64Array ListToVtArray(List<long> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<long> ListFromVtArray(VtInt64Array input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -443,13 +494,16 @@ namespace USD.NET
         [Preserve]
         static public VtUInt64Array ListToVtArray(List<ulong> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<ulong> ListFromVtArray(VtUInt64Array input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -497,13 +551,16 @@ namespace USD.NET
         [Preserve]
         static public VtFloatArray ListToVtArray(List<float> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<float> ListFromVtArray(VtFloatArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -540,13 +597,16 @@ namespace USD.NET
         [Preserve]
         static public VtDoubleArray ListToVtArray(List<double> input)
         {
-            return ToVtArray(input.ToArray());
+            var tmp = ListToTempArray(input);
+            var output = ToVtArray(tmp);
+            FreeTempArray(tmp);
+            return output;
         }
 
         [Preserve]
         static public List<double> ListFromVtArray(VtDoubleArray input)
         {
-            return FromVtArray(input).ToList();
+            return TempArrayToList(FromVtArray(input));
         }
 
         [Preserve]
@@ -576,5 +636,118 @@ namespace USD.NET
             }
             return output;
         }
+
+        // ----------------------------------------------------------------------------------------- //
+        // SdfPath[], TfToken[], string[], double[] <-- SdfPathVector, TfTokenVector, StdDoubleVector
+        // ----------------------------------------------------------------------------------------- //
+
+        // The vectors are copied with a single native call, rather than the call per element (and
+        // the proxy holding a reference into the vector) of the vector indexers and CopyTo().
+
+        [Preserve]
+        static public SdfPath[] FromVector(SdfPathVector input)
+        {
+            var count = input.Count;
+            var output = new SdfPath[count];
+            if (count == 0)
+            {
+                return output;
+            }
+
+            var handles = new long[count];
+            input.CopyToHandles(0, count, handles);
+            for (int i = 0; i < count; i++)
+            {
+                output[i] = new SdfPath(new IntPtr(handles[i]), true);
+            }
+            return output;
+        }
+
+        [Preserve]
+        static public TfToken[] FromVector(TfTokenVector input)
+        {
+            var count = input.Count;
+            var output = new TfToken[count];
+            if (count == 0)
+            {
+                return output;
+            }
+
+            var handles = new long[count];
+            input.CopyToHandles(0, count, handles);
+            for (int i = 0; i < count; i++)
+            {
+                output[i] = new TfToken(new IntPtr(handles[i]), true);
+            }
+            return output;
+        }
+
+        [Preserve]
+        static public double[] FromVector(StdDoubleVector input)
+        {
+            var output = new double[input.Count];
+            if (output.Length > 0)
+            {
+                input.CopyToArray(0, output.Length, output);
+            }
+            return output;
+        }
+
+        /// <summary>
+        /// Returns the paths of the vector as strings, without creating SdfPath objects.
+        /// </summary>
+        [Preserve]
+        static public string[] ToStrings(SdfPathVector input)
+        {
+            var count = input.Count;
+            var output = new string[count];
+            if (count == 0)
+            {
+                return output;
+            }
+
+            var texts = new long[count];
+            var lengths = new int[count];
+            input.CopyToTextPointers(0, count, texts, lengths);
+            DecodeUtf8(texts, lengths, output);
+
+            // The text is owned by the paths held in the vector.
+            GC.KeepAlive(input);
+            return output;
+        }
+
+        /// <summary>
+        /// Returns the tokens of the vector as strings, without creating TfToken objects.
+        /// </summary>
+        [Preserve]
+        static public string[] ToStrings(TfTokenVector input)
+        {
+            var count = input.Count;
+            var output = new string[count];
+            if (count == 0)
+            {
+                return output;
+            }
+
+            var texts = new long[count];
+            var lengths = new int[count];
+            input.CopyToTextPointers(0, count, texts, lengths);
+            DecodeUtf8(texts, lengths, output);
+
+            // The text is owned by the tokens held in the vector.
+            GC.KeepAlive(input);
+            return output;
+        }
+
+        static void DecodeUtf8(long[] texts, int[] lengths, string[] output)
+        {
+            unsafe
+            {
+                for (int i = 0; i < output.Length; i++)
+                {
+                    output[i] = System.Text.Encoding.UTF8.GetString((byte*)texts[i], lengths[i]);
+                }
+            }
+        }
     }
 }
@@ -0,0 +1,68 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using pxr;
+
+namespace USD.NET
+{
+    /// <summary>
+    /// The times at which the prims under a root path have keyframes, for one or more attributes,
+    /// as returned by Scene.ComputeKeyFrameTable().
+    /// </summary>
+    /// <remarks>
+    /// Each entry is a prim and attribute with time samples. The times of all entries are held in a
+    /// single flat buffer, entry i spanning Times[Offsets[i]] to Times[Offsets[i + 1]].
+    /// </remarks>
+    public class KeyFrameTable
+    {
+        /// <summary>
+        /// The attribute names the table was computed for.
+        /// </summary>
+        public string[] Attributes;
+
+        /// <summary>
+        /// The prim of each entry.
+        /// </summary>
+        public SdfPath[] Paths;
+
+        /// <summary>
+        /// The index in Attributes of the attribute of each entry.
+        /// </summary>
+        public int[] AttributeIndices;
+
+        /// <summary>
+        /// Where the times of each entry start in Times, followed by the total number of times.
+        /// </summary>
+        public int[] Offsets;
+
+        /// <summary>
+        /// The times of every entry, in entry order.
+        /// </summary>
+        public double[] Times;
+
+        /// <summary>
+        /// The number of entries.
+        /// </summary>
+        public int Count { get { return Paths.Length; } }
+
+        /// <summary>
+        /// Returns the times of the given entry.
+        /// </summary>
+        public ArraySegment<double> GetTimes(int entry)
+        {
+            return new ArraySegment<double>(Times, Offsets[entry], Offsets[entry + 1] - Offsets[entry]);
+        }
+    }
+}
@@ -0,0 +1,292 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using pxr;
+
+namespace USD.NET
+{
+    /// <summary>
+    /// The state of a prim recorded in a PrimHierarchy.
+    /// </summary>
+    [Flags]
+    public enum PrimHierarchyFlags
+    {
+        None = 0,
+        Active = 1 << 0,
+        Loaded = 1 << 1,
+        Abstract = 1 << 2,
+        Instance = 1 << 3,
+        HasPayload = 1 << 4,
+
+        /// <summary>
+        /// The prim is imageable and its own visibility is invisible at time 0.
+        /// </summary>
+        Invisible = 1 << 5,
+        Model = 1 << 6,
+        Group = 1 << 7,
+        Assembly = 1 << 8,
+
+        /// <summary>
+        /// The prim is an assembly, or a model which is not a group, with asset info authored.
+        /// </summary>
+        HasAssetInfo = 1 << 9,
+    }
+
+    /// <summary>
+    /// A snapshot of the prims under a root path, as returned by Scene.ComputePrimHierarchy().
+    /// </summary>
+    /// <remarks>
+    /// The prims are gathered natively in a single traversal and returned as flat arrays, so reading
+    /// the hierarchy does not require a UsdPrim, or any call into USD, per prim. Prims are indexed in
+    /// depth-first order, the root being prim 0, so a parent always comes before its children.
+    /// </remarks>
+    public class PrimHierarchy
+    {
+        // The layout of the records of ComputePrimHierarchy, see usdStage.i.
+        private const int kStride = 10;
+        private const int kParent = 0;
+        private const int kTypeMask = 1;
+        private const int kFlags = 2;
+        private const int kTypeName = 3;
+        private const int kKind = 4;
+        private const int kMaster = 5;
+        private const int kAssetIdentifier = 6;
+        private const int kAssetName = 7;
+        private const int kAssetVersion = 8;
+        private const int kVariants = 9;
+
+        private readonly SdfPathVector m_paths;
+        private readonly SdfPath[] m_pathCache;
+        private readonly string[] m_strings;
+        private readonly int[] m_records;
+        private readonly int[] m_variants;
+
+        /// <summary>
+        /// The schema type names the prims were matched against.
+        /// </summary>
+        public string[] SchemaTypeNames { get; private set; }
+
+        /// <summary>
+        /// The number of prims.
+        /// </summary>
+        public int Count { get { return m_pathCache.Length; } }
+
+        internal PrimHierarchy(string[] schemaTypeNames,
+                               SdfPathVector paths,
+                               string[] strings,
+                               int[] records,
+                               int[] variants)
+        {
+            SchemaTypeNames = schemaTypeNames;
+            m_paths = paths;
+            m_pathCache = new SdfPath[paths.Count];
+            m_strings = strings;
+            m_records = records;
+            m_variants = variants;
+        }
+
+        /// <summary>
+        /// Returns the path of the prim.
+        /// </summary>
+        /// <remarks>
+        /// Paths are copied out of USD on first access only. This method is not thread safe.
+        /// </remarks>
+        public SdfPath GetPath(int prim)
+        {
+            var path = m_pathCache[prim];
+            if (path == null)
+            {
+                m_paths.CopyTo(prim, m_pathCache, prim, 1);
+                path = m_pathCache[prim];
+            }
+
+            return path;
+        }
+
+        /// <summary>
+        /// Returns the index of the parent of the prim, or -1 for the root.
+        /// </summary>
+        public int GetParent(int prim)
+        {
+            return m_records[prim * kStride + kParent];
+        }
+
+        /// <summary>
+        /// Returns true if the prim is not abstract and is, or derives from, the schema type
+        /// SchemaTypeNames[schemaIndex].
+        /// </summary>
+        public bool IsA(int prim, int schemaIndex)
+        {
+            return (m_records[prim * kStride + kTypeMask] & (1 << schemaIndex)) != 0;
+        }
+
+        /// <summary>
+        /// Returns a mask with bit i set when IsA(prim, i) is true.
+        /// </summary>
+        public int GetTypeMask(int prim)
+        {
+            return m_records[prim * kStride + kTypeMask];
+        }
+
+        /// <summary>
+        /// Returns the indices of the prims of the schema type SchemaTypeNames[schemaIndex], in
+        /// depth-first order.
+        /// </summary>
+        public int[] FindAll(int schemaIndex)
+        {
+            var found = new List<int>();
+            for (int i = 0; i < Count; i++)
+            {
+                if (IsA(i, schemaIndex))
+                {
+                    found.Add(i);
+                }
+            }
+
+            return found.ToArray();
+        }
+
+        /// <summary>
+        /// Returns the state of the prim.
+        /// </summary>
+        public PrimHierarchyFlags GetFlags(int prim)
+        {
+            return (PrimHierarchyFlags)m_records[prim * kStride + kFlags];
+        }
+
+        /// <summary>
+        /// Returns true if all the given flags are set on the prim.
+        /// </summary>
+        public bool HasFlags(int prim, PrimHierarchyFlags flags)
+        {
+            return (GetFlags(prim) & flags) == flags;
+        }
+
+        /// <summary>
+        /// Returns the type name of the prim, which is empty for typeless prims.
+        /// </summary>
+        public string GetTypeName(int prim)
+        {
+            return GetString(prim, kTypeName);
+        }
+
+        /// <summary>
+        /// Returns the authored kind of the prim, or null.
+        /// </summary>
+        public string GetKind(int prim)
+        {
+            return GetString(prim, kKind);
+        }
+
+        /// <summary>
+        /// Returns the path of the master of an instance, or null.
+        /// </summary>
+        public string GetMasterPath(int prim)
+        {
+            return GetString(prim, kMaster);
+        }
+
+        /// <summary>
+        /// Returns the asset path of the "identifier" asset info, or null.
+        /// </summary>
+        public string GetAssetIdentifier(int prim)
+        {
+            return GetString(prim, kAssetIdentifier);
+        }
+
+        /// <summary>
+        /// Returns the "name" asset info, or null.
+        /// </summary>
+        public string GetAssetName(int prim)
+        {
+            return GetString(prim, kAssetName);
+        }
+
+        /// <summary>
+        /// Returns the "version" asset info, or null.
+        /// </summary>
+        public string GetAssetVersion(int prim)
+        {
+            return GetString(prim, kAssetVersion);
+        }
+
+        /// <summary>
+        /// Returns the number of variant sets on the prim.
+        /// </summary>
+        public int GetVariantSetCount(int prim)
+        {
+            var offset = m_records[prim * kStride + kVariants];
+            return offset < 0 ? 0 : m_variants[offset];
+        }
+
+        /// <summary>
+        /// Returns the variant sets of the prim: the name and selection of each set, and the names
+        /// of the variants of all sets, variantCounts[i] of them for set i.
+        /// </summary>
+        public void GetVariantSets(int prim,
+                                   out string[] setNames,
+                                   out string[] selections,
+                                   out string[] variants,
+                                   out int[] variantCounts)
+        {
+            var setCount = GetVariantSetCount(prim);
+            setNames = new string[setCount];
+            selections = new string[setCount];
+            variantCounts = new int[setCount];
+            var variantNames = new List<string>();
+
+            var offset = m_records[prim * kStride + kVariants] + 1;
+            for (int i = 0; i < setCount; i++)
+            {
+                setNames[i] = m_strings[m_variants[offset++]];
+                selections[i] = m_strings[m_variants[offset++]];
+                variantCounts[i] = m_variants[offset++];
+                for (int j = 0; j < variantCounts[i]; j++)
+                {
+                    variantNames.Add(m_strings[m_variants[offset++]]);
+                }
+            }
+
+            variants = variantNames.ToArray();
+        }
+
+        /// <summary>
+        /// Returns the variant selection of each variant set of the prim, by set name.
+        /// </summary>
+        public Dictionary<string, string> GetVariantSelections(int prim)
+        {
+            string[] setNames;
+            string[] selections;
+            string[] variants;
+            int[] variantCounts;
+            GetVariantSets(prim, out setNames, out selections, out variants, out variantCounts);
+
+            var result = new Dictionary<string, string>(setNames.Length);
+            for (int i = 0; i < setNames.Length; i++)
+            {
+                result.Add(setNames[i], selections[i]);
+            }
+
+            return result;
+        }
+
+        private string GetString(int prim, int field)
+        {
+            var index = m_records[prim * kStride + field];
+            return index < 0 ? null : m_strings[index];
+        }
+    }
+}
@@ -0,0 +1,223 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using System.Reflection;
+
+namespace USD.NET
+{
+    public delegate object SampleMemberGetter(object sample);
+    public delegate void SampleMemberSetter(object sample, object value);
+
+    /// <summary>
+    /// Strongly typed getters and setters for the serialized members of one sample type, used by
+    /// UsdIo instead of reading and writing members via reflection.
+    /// </summary>
+    /// <remarks>
+    /// Accessors are typically generated at build time, as reflection is much slower in AOT
+    /// compiled players. Members without an accessor are read and written via reflection.
+    /// </remarks>
+    public class SampleAccessor
+    {
+        Dictionary<string, SampleMemberGetter> m_propertyGetters = new Dictionary<string, SampleMemberGetter>();
+        Dictionary<string, SampleMemberSetter> m_propertySetters = new Dictionary<string, SampleMemberSetter>();
+        Dictionary<string, SampleMemberGetter> m_fieldGetters = new Dictionary<string, SampleMemberGetter>();
+        Dictionary<string, SampleMemberSetter> m_fieldSetters = new Dictionary<string, SampleMemberSetter>();
+
+        /// <summary>
+        /// The sample type whose members are accessed.
+        /// </summary>
+        public Type SampleType { get; private set; }
+
+        public SampleAccessor(Type sampleType)
+        {
+            SampleType = sampleType;
+        }
+
+        /// <summary>
+        /// Adds the accessors of a public instance property, either of which may be null.
+        /// </summary>
+        public void AddProperty(string name, SampleMemberGetter getter, SampleMemberSetter setter)
+        {
+            m_propertyGetters[name] = getter;
+            m_propertySetters[name] = setter;
+        }
+
+        /// <summary>
+        /// Adds the accessors of a public instance field, either of which may be null.
+        /// </summary>
+        public void AddField(string name, SampleMemberGetter getter, SampleMemberSetter setter)
+        {
+            m_fieldGetters[name] = getter;
+            m_fieldSetters[name] = setter;
+        }
+
+        /// <summary>
+        /// Aligns the accessors with the members returned by Reflect for the sample type.
+        /// </summary>
+        internal SampleMemberTable CreateTable(PropertyInfo[] properties, FieldInfo[] fields)
+        {
+            var table = new SampleMemberTable(properties.Length, fields.Length);
+            for (int i = 0; i < properties.Length; i++)
+            {
+                m_propertyGetters.TryGetValue(properties[i].Name, out table.PropertyGetters[i]);
+                m_propertySetters.TryGetValue(properties[i].Name, out table.PropertySetters[i]);
+            }
+
+            for (int i = 0; i < fields.Length; i++)
+            {
+                m_fieldGetters.TryGetValue(fields[i].Name, out table.FieldGetters[i]);
+                m_fieldSetters.TryGetValue(fields[i].Name, out table.FieldSetters[i]);
+            }
+
+            return table;
+        }
+    }
+
+    /// <summary>
+    /// The registry of sample accessors.
+    /// </summary>
+    public static class SampleAccessors
+    {
+        static Dictionary<Type, SampleAccessor> sm_accessors = new Dictionary<Type, SampleAccessor>();
+        static Dictionary<Type, SampleMemberTable> sm_tables = new Dictionary<Type, SampleMemberTable>();
+
+        /// <summary>
+        /// When false, all members are read and written via reflection.
+        /// </summary>
+        public static bool Enabled = true;
+
+        /// <summary>
+        /// The number of sample types with registered accessors.
+        /// </summary>
+        public static int Count
+        {
+            get { lock (sm_accessors) { return sm_accessors.Count; } }
+        }
+
+        /// <summary>
+        /// Registers the accessors of a sample type, replacing any previously registered.
+        /// </summary>
+        public static void Register(SampleAccessor accessor)
+        {
+            lock (sm_accessors)
+            {
+                sm_accessors[accessor.SampleType] = accessor;
+                sm_tables.Remove(accessor.SampleType);
+            }
+        }
+
+        /// <summary>
+        /// Returns true if accessors are registered for the given sample type.
+        /// </summary>
+        public static bool IsRegistered(Type sampleType)
+        {
+            lock (sm_accessors)
+            {
+                return sm_accessors.ContainsKey(sampleType);
+            }
+        }
+
+        /// <summary>
+        /// Returns the accessors of the members of the given type in the order of
+        /// Reflect.GetCachedProperties() and GetCachedFields(), or null if there are none.
+        /// </summary>
+        internal static SampleMemberTable GetTable(Type sampleType)
+        {
+            if (!Enabled)
+            {
+                return null;
+            }
+
+            SampleMemberTable table;
+            lock (sm_accessors)
+            {
+                if (sm_tables.TryGetValue(sampleType, out table))
+                {
+                    return table;
+                }
+
+                SampleAccessor accessor;
+                if (sm_accessors.TryGetValue(sampleType, out accessor))
+                {
+                    table = accessor.CreateTable(Reflect.GetCachedProperties(sampleType),
+                        Reflect.GetCachedFields(sampleType));
+                }
+
+                sm_tables[sampleType] = table;
+            }
+
+            return table;
+        }
+    }
+
+    /// <summary>
+    /// The accessors of a sample type, indexed like its cached PropertyInfo and FieldInfo arrays.
+    /// Null entries fall back to reflection.
+    /// </summary>
+    internal class SampleMemberTable
+    {
+        public SampleMemberGetter[] PropertyGetters;
+        public SampleMemberSetter[] PropertySetters;
+        public SampleMemberGetter[] FieldGetters;
+        public SampleMemberSetter[] FieldSetters;
+
+        public SampleMemberTable(int propertyCount, int fieldCount)
+        {
+            PropertyGetters = new SampleMemberGetter[propertyCount];
+            PropertySetters = new SampleMemberSetter[propertyCount];
+            FieldGetters = new SampleMemberGetter[fieldCount];
+            FieldSetters = new SampleMemberSetter[fieldCount];
+        }
+
+        public static object GetProperty(SampleMemberTable table, int index, PropertyInfo info, object sample)
+        {
+            var getter = table == null ? null : table.PropertyGetters[index];
+            return getter != null ? getter(sample) : info.GetValue(sample, index: null);
+        }
+
+        public static void SetProperty(SampleMemberTable table, int index, PropertyInfo info, object sample, object value)
+        {
+            var setter = table == null ? null : table.PropertySetters[index];
+            if (setter != null)
+            {
+                setter(sample, value);
+            }
+            else
+            {
+                info.SetValue(sample, value, index: null);
+            }
+        }
+
+        public static object GetField(SampleMemberTable table, int index, FieldInfo info, object sample)
+        {
+            var getter = table == null ? null : table.FieldGetters[index];
+            return getter != null ? getter(sample) : info.GetValue(sample);
+        }
+
+        public static void SetField(SampleMemberTable table, int index, FieldInfo info, object sample, object value)
+        {
+            var setter = table == null ? null : table.FieldSetters[index];
+            if (setter != null)
+            {
+                setter(sample, value);
+            }
+            else
+            {
+                info.SetValue(sample, value);
+            }
+        }
+    }
+}
@@ -18,6 +18,13 @@ using pxr;
 
 namespace USD.NET
 {
+    /// <summary>
+    /// Receives the samples passed to Scene.Write() while a Scene.WriteHandler is set, along with
+    /// the type, time and write mode they would have been written with.
+    /// </summary>
+    public delegate void SceneWriteHandler(SdfPath path, SampleBase sample, Type sampleType,
+        double? time, Scene.WriteModes writeMode);
+
     /// <summary>
     /// A Scene object represents a UsdStage and enables USD serialization and deserialization.
     /// </summary>
@@ -107,6 +114,12 @@ namespace USD.NET
         /// </summary>
         public WriteModes WriteMode { get; set; }
 
+        /// <summary>
+        /// When set, calls to Write() hand the sample to this handler instead of serializing it. The
+        /// handler may serialize it later, e.g. on another thread, with WriteSample().
+        /// </summary>
+        public SceneWriteHandler WriteHandler { get; set; }
+
         /// <summary>
         /// The time at which key frames should be read and written.
         /// </summary>
@@ -196,9 +209,12 @@ namespace USD.NET
             {
                 VtValue val = new VtValue();
                 string upAxis = null;
-                if (Stage.GetMetadata(kUpAxisToken, val))
+                lock (m_stageLock)
                 {
-                    upAxis = UsdCs.VtValueToTfToken(val).ToString();
+                    if (Stage.GetMetadata(kUpAxisToken, val))
+                    {
+                        upAxis = UsdCs.VtValueToTfToken(val).ToString();
+                    }
                 }
 
                 if (!string.IsNullOrEmpty(upAxis))
@@ -437,12 +453,7 @@ namespace USD.NET
         /// </returns>
         public SdfPath[] Find<T>(SdfPath rootPath) where T : SampleBase, new()
         {
-            var attrs = typeof(T).GetCustomAttributes(typeof(USD.NET.UsdSchemaAttribute), true);
-            if (attrs.Length == 0)
-            {
-                throw new ApplicationException("Invalid type T, does not have UsdSchema attribute");
-            }
-            var schemaTypeName = ((UsdSchemaAttribute)attrs[0]).Name;
+            var schemaTypeName = GetSchemaTypeName(typeof(T));
             return VectorToArray(Stage.GetAllPathsByType(schemaTypeName, rootPath));
         }
 
@@ -582,39 +593,436 @@ namespace USD.NET
         /// </summary>
         public Dictionary<string, double[]> ComputeKeyFrames(string rootPath, string attribute)
         {
-            var keys = new Dictionary<string, double[]>();
-            var prim = GetUsdPrim(GetSdfPath(rootPath));
+            var table = ComputeKeyFrameTable(rootPath, attribute);
+            var keys = new Dictionary<string, double[]>(table.Count);
+
+            for (int i = 0; i < table.Count; i++)
+            {
+                var times = table.GetTimes(i);
+                var copy = new double[times.Count];
+                Array.Copy(times.Array, times.Offset, copy, 0, times.Count);
+                keys.Add(table.Paths[i], copy);
+            }
+
+            return keys;
+        }
+
+        /// <summary>
+        /// Returns the times at which the prims under rootPath, inclusive, have keyframes for the
+        /// given attributes, in a single traversal of the subtree.
+        /// </summary>
+        /// <remarks>
+        /// The prims and times are gathered natively and returned in flat arrays, so the cost is
+        /// proportional to the size of the subtree and the number of keyframes found, rather than to
+        /// the size of the stage.
+        /// </remarks>
+        public KeyFrameTable ComputeKeyFrameTable(string rootPath, params string[] attributes)
+        {
+            var sdfRootPath = GetSdfPath(rootPath);
+            var prim = GetUsdPrim(sdfRootPath);
 
             if (!prim)
             {
                 throw new ArgumentException("rootPath does not exist");
             }
-            var sdfRootPath = GetSdfPath(rootPath);
-            var tfAttrName = new pxr.TfToken(attribute);
-            foreach (var child in Stage.GetAllPrims())
+
+            var attrNames = new TfTokenVector();
+            foreach (var attribute in attributes)
+            {
+                attrNames.Add(UsdIo.Tokens[attribute]);
+            }
+
+            var paths = new SdfPathVector();
+            var attrIndices = new int[m_keyFrameEntryCapacity];
+            var offsets = new int[m_keyFrameEntryCapacity + 1];
+            var times = new double[m_keyFrameTimesCapacity];
+            int timeCount;
+
+            lock (m_stageLock)
             {
-                if (child.GetPath() == SdfPath.AbsoluteRootPath())
+                timeCount = (int)Stage.ComputeKeyFrames(sdfRootPath, attrNames, paths, attrIndices, offsets,
+                    (uint)attrIndices.Length, times, (uint)times.Length);
+
+                // The buffers were too small, compute again with buffers of the exact size.
+                if (paths.Count > attrIndices.Length || timeCount > times.Length)
                 {
-                    continue;
+                    m_keyFrameEntryCapacity = Math.Max(m_keyFrameEntryCapacity, paths.Count);
+                    m_keyFrameTimesCapacity = Math.Max(m_keyFrameTimesCapacity, timeCount);
+                    attrIndices = new int[paths.Count];
+                    offsets = new int[paths.Count + 1];
+                    times = new double[timeCount];
+                    Stage.ComputeKeyFrames(sdfRootPath, attrNames, paths, attrIndices, offsets,
+                        (uint)attrIndices.Length, times, (uint)times.Length);
+                }
+            }
+
+            var entryCount = paths.Count;
+            if (attrIndices.Length != entryCount)
+            {
+                Array.Resize(ref attrIndices, entryCount);
+                Array.Resize(ref offsets, entryCount + 1);
+            }
+
+            if (times.Length != timeCount)
+            {
+                Array.Resize(ref times, timeCount);
+            }
+
+            return new KeyFrameTable
+            {
+                Attributes = attributes,
+                Paths = VectorToArray(paths),
+                AttributeIndices = attrIndices,
+                Offsets = offsets,
+                Times = times,
+            };
+        }
+
+        /// <summary>
+        /// Returns a snapshot of the prims under rootPath, inclusive, matched against the schema
+        /// types declared for the given sample types.
+        /// </summary>
+        /// <param name="rootPath">The root path at which to begin the traversal.</param>
+        /// <param name="sampleTypes">
+        /// Types which inherit from SampleBase, adorned with a UsdSchemaAttribute.
+        /// </param>
+        public PrimHierarchy ComputePrimHierarchy(SdfPath rootPath, Type[] sampleTypes)
+        {
+            var schemaTypeNames = new string[sampleTypes.Length];
+            for (int i = 0; i < sampleTypes.Length; i++)
+            {
+                schemaTypeNames[i] = GetSchemaTypeName(sampleTypes[i]);
+            }
+
+            return ComputePrimHierarchy(rootPath, schemaTypeNames);
+        }
+
+        /// <summary>
+        /// Returns a snapshot of the prims under rootPath, inclusive, in a single traversal of the
+        /// subtree.
+        /// </summary>
+        /// <remarks>
+        /// The hierarchy, type names, kinds, flags and variant selections of all prims are gathered
+        /// natively and returned in flat arrays, so reading them does not require a call into USD per
+        /// prim. As with Find(), a prim matches a schema type when it is not abstract and its type is,
+        /// or derives from, the schema type.
+        /// </remarks>
+        /// <param name="rootPath">The root path at which to begin the traversal.</param>
+        /// <param name="schemaTypeNames">
+        /// Up to 32 USD schema type names (e.g. UsdGeomMesh) or their aliases (e.g. Mesh).
+        /// </param>
+        public PrimHierarchy ComputePrimHierarchy(SdfPath rootPath, params string[] schemaTypeNames)
+        {
+            if (schemaTypeNames.Length > 32)
+            {
+                throw new ArgumentException("At most 32 schema type names are supported");
+            }
+
+            if (!GetUsdPrim(rootPath))
+            {
+                throw new ArgumentException("rootPath does not exist");
+            }
+
+            var typeNames = new StdStringVector(schemaTypeNames);
+            var paths = new SdfPathVector();
+            var strings = new StdStringVector();
+            var records = new int[m_hierarchyPrimCapacity * kPrimHierarchyStride];
+            var variants = new int[m_hierarchyVariantCapacity];
+            int variantCount;
+
+            lock (m_stageLock)
+            {
+                variantCount = (int)Stage.ComputePrimHierarchy(rootPath, typeNames, paths, strings, records,
+                    (uint)m_hierarchyPrimCapacity, variants, (uint)variants.Length);
+
+                // The buffers were too small, compute again with buffers of the exact size.
+                if (paths.Count > m_hierarchyPrimCapacity || variantCount > variants.Length)
+                {
+                    m_hierarchyPrimCapacity = Math.Max(m_hierarchyPrimCapacity, paths.Count);
+                    m_hierarchyVariantCapacity = Math.Max(m_hierarchyVariantCapacity, variantCount);
+                    records = new int[paths.Count * kPrimHierarchyStride];
+                    variants = new int[variantCount];
+                    Stage.ComputePrimHierarchy(rootPath, typeNames, paths, strings, records,
+                        (uint)paths.Count, variants, (uint)variants.Length);
+                }
+            }
+
+            var stringArray = new string[strings.Count];
+            strings.CopyTo(stringArray);
+
+            return new PrimHierarchy(schemaTypeNames, paths, stringArray, records, variants);
+        }
+
+        /// <summary>
+        /// Computes the transforms of the given prims at the current time in a single call.
+        /// </summary>
+        /// <remarks>
+        /// The 16 values of the local and local-to-world matrices of paths[i] are written in USD
+        /// row-major order from 16 * i in localTransforms and worldTransforms, either of which may
+        /// be null when not required, and flags[i] receives its TransformFlags. A single
+        /// UsdGeomXformCache is used for the whole call, so ancestors shared by several prims are
+        /// only computed once.
+        ///
+        /// When there is an AccessMask, the prims whose transform might vary over time are recorded
+        /// while populating it. Afterwards, only their transforms are computed, the other prims are
+        /// flagged as TransformFlags.Skipped and their matrices are not written.
+        /// </remarks>
+        public void ComputeTransforms(SdfPath[] paths,
+                                      double[] localTransforms,
+                                      double[] worldTransforms,
+                                      int[] flags)
+        {
+            if (flags == null || flags.Length < paths.Length)
+            {
+                throw new ArgumentException("flags must hold one value per path");
+            }
+
+            if (localTransforms != null && localTransforms.Length < paths.Length * 16)
+            {
+                throw new ArgumentException("localTransforms must hold 16 values per path");
+            }
+
+            if (worldTransforms != null && worldTransforms.Length < paths.Length * 16)
+            {
+                throw new ArgumentException("worldTransforms must hold 16 values per path");
+            }
+
+            var accessMask = AccessMask;
+            var populatingAccessMask = IsPopulatingAccessMask;
+
+            // When the access mask is populated already, only the time-varying transforms are computed.
+            List<int> computed = null;
+            if (accessMask != null && !populatingAccessMask)
+            {
+                computed = new List<int>();
+                lock (m_stageLock)
+                {
+                    for (int i = 0; i < paths.Length; i++)
+                    {
+                        if (accessMask.TimeVaryingTransforms.Contains(paths[i]))
+                        {
+                            computed.Add(i);
+                        }
+                        else
+                        {
+                            flags[i] = (int)TransformFlags.Skipped;
+                        }
+                    }
+                }
+            }
+
+            lock (m_stageLock)
+            {
+                if (computed == null)
+                {
+                    var sdfPaths = new SdfPathVector(paths);
+                    Stage.ComputeTransforms(sdfPaths, TimeCode, localTransforms, worldTransforms, flags);
+                }
+                else if (computed.Count > 0)
+                {
+                    var sdfPaths = new SdfPathVector(computed.Count);
+                    foreach (var i in computed)
+                    {
+                        sdfPaths.Add(paths[i]);
+                    }
+
+                    var local = localTransforms == null ? null : new double[computed.Count * 16];
+                    var world = worldTransforms == null ? null : new double[computed.Count * 16];
+                    var computedFlags = new int[computed.Count];
+                    Stage.ComputeTransforms(sdfPaths, TimeCode, local, world, computedFlags);
+
+                    for (int j = 0; j < computed.Count; j++)
+                    {
+                        var i = computed[j];
+                        flags[i] = computedFlags[j];
+                        if (local != null)
+                        {
+                            Array.Copy(local, j * 16, localTransforms, i * 16, 16);
+                        }
+
+                        if (world != null)
+                        {
+                            Array.Copy(world, j * 16, worldTransforms, i * 16, 16);
+                        }
+                    }
                 }
 
-                if (!child.GetPath().HasPrefix(sdfRootPath))
+                if (accessMask != null && populatingAccessMask)
                 {
-                    continue;
+                    for (int i = 0; i < paths.Length; i++)
+                    {
+                        if ((flags[i] & (int)TransformFlags.MightBeTimeVarying) != 0)
+                        {
+                            accessMask.TimeVaryingTransforms.Add(paths[i]);
+                        }
+                    }
                 }
+            }
+        }
+
+        /// <summary>
+        /// Computes the bounds of the given prims at the current time in a single call.
+        /// </summary>
+        /// <remarks>
+        /// The minimum then maximum corners of the bounds of paths[i] are written from 6 * i in
+        /// worldBounds, aligned to the world axes, and in localBounds, aligned to the axes of the
+        /// prim without its own transform. Either may be null when not required. Empty bounds have a
+        /// minimum greater than their maximum. A single UsdGeomBBoxCache is used for the whole call.
+        /// </remarks>
+        /// <param name="purposes">
+        /// The purposes of the prims included in the bounds, the default purpose when none are given.
+        /// </param>
+        public void ComputeBounds(SdfPath[] paths,
+                                  double[] worldBounds,
+                                  double[] localBounds,
+                                  params string[] purposes)
+        {
+            if (worldBounds != null && worldBounds.Length < paths.Length * 6)
+            {
+                throw new ArgumentException("worldBounds must hold 6 values per path");
+            }
+
+            if (localBounds != null && localBounds.Length < paths.Length * 6)
+            {
+                throw new ArgumentException("localBounds must hold 6 values per path");
+            }
+
+            var purposeTokens = new TfTokenVector();
+            foreach (var purpose in purposes)
+            {
+                purposeTokens.Add(UsdIo.Tokens[purpose]);
+            }
+
+            lock (m_stageLock)
+            {
+                Stage.ComputeBounds(new SdfPathVector(paths), TimeCode, purposeTokens, worldBounds, localBounds);
+            }
+        }
+
+        /// <summary>
+        /// Computes the poses of the given skeletons at the current time in a single call.
+        /// </summary>
+        /// <remarks>
+        /// The skeleton and animation queries are taken from the given cache, which keeps them across
+        /// calls, so posing the same skeletons at every frame only evaluates their joint transforms
+        /// and blend shape weights. The cache does not need to be populated, though the cache
+        /// populated when importing the skeletons is typically reused. The joint transforms and
+        /// blend shape weights of all skeletons are gathered natively into flat buffers, so the cost
+        /// of the call does not depend on the number of skeletons as much as on the number of joints.
+        /// </remarks>
+        /// <param name="cache">The cache holding the queries of the skeletons.</param>
+        /// <param name="skeletonPaths">The paths of UsdSkelSkeleton prims, one entry each.</param>
+        /// <param name="localTransforms">Whether to compute the joint local transforms.</param>
+        /// <param name="skinningTransforms">Whether to compute the joint skinning transforms.</param>
+        public SkeletonPoseTable ComputeSkeletonPoses(UsdSkelCache cache,
+                                                      SdfPath[] skeletonPaths,
+                                                      bool localTransforms,
+                                                      bool skinningTransforms)
+        {
+            if (cache == null)
+            {
+                throw new ArgumentNullException("cache");
+            }
+
+            var sdfSkeletonPaths = new SdfPathVector(skeletonPaths);
+            var joints = new StdStringVector();
+            var blendShapes = new StdStringVector();
+            var jointOffsets = new int[skeletonPaths.Length + 1];
+            var blendShapeOffsets = new int[skeletonPaths.Length + 1];
+            var flags = new int[skeletonPaths.Length];
+            var local = localTransforms ? new double[m_jointCapacity * 16] : null;
+            var skinning = skinningTransforms ? new double[m_jointCapacity * 16] : null;
+            var weights = new float[m_blendShapeCapacity];
+
+            lock (m_stageLock)
+            {
+                Stage.ComputeSkeletonPoses(cache, sdfSkeletonPaths, TimeCode, joints, blendShapes,
+                    jointOffsets, blendShapeOffsets, flags,
+                    local, skinning, (uint)m_jointCapacity, weights, (uint)weights.Length);
 
-                var stdDoubleVector = child.GetAttribute(tfAttrName).GetTimeSamples();
-                if (stdDoubleVector.Count == 0)
+                // The buffers were too small, compute again with buffers of the exact size.
+                if (joints.Count > m_jointCapacity || blendShapes.Count > weights.Length)
                 {
-                    continue;
+                    m_jointCapacity = Math.Max(m_jointCapacity, joints.Count);
+                    m_blendShapeCapacity = Math.Max(m_blendShapeCapacity, blendShapes.Count);
+                    local = localTransforms ? new double[joints.Count * 16] : null;
+                    skinning = skinningTransforms ? new double[joints.Count * 16] : null;
+                    weights = new float[blendShapes.Count];
+                    Stage.ComputeSkeletonPoses(cache, sdfSkeletonPaths, TimeCode, joints, blendShapes,
+                        jointOffsets, blendShapeOffsets, flags,
+                        local, skinning, (uint)joints.Count, weights, (uint)weights.Length);
                 }
+            }
 
-                double[] times = new double[stdDoubleVector.Count];
-                stdDoubleVector.CopyTo(times);
-                keys.Add(child.GetPath(), times);
+            var poseFlags = new SkeletonPoseFlags[skeletonPaths.Length];
+            for (int i = 0; i < poseFlags.Length; i++)
+            {
+                poseFlags[i] = (SkeletonPoseFlags)flags[i];
             }
 
-            return keys;
+            if (local != null && local.Length != joints.Count * 16)
+            {
+                Array.Resize(ref local, joints.Count * 16);
+            }
+
+            if (skinning != null && skinning.Length != joints.Count * 16)
+            {
+                Array.Resize(ref skinning, joints.Count * 16);
+            }
+
+            if (weights.Length != blendShapes.Count)
+            {
+                Array.Resize(ref weights, blendShapes.Count);
+            }
+
+            var jointArray = new string[joints.Count];
+            joints.CopyTo(jointArray);
+            var blendShapeArray = new string[blendShapes.Count];
+            blendShapes.CopyTo(blendShapeArray);
+
+            return new SkeletonPoseTable
+            {
+                Paths = (SdfPath[])skeletonPaths.Clone(),
+                Flags = poseFlags,
+                JointOffsets = jointOffsets,
+                Joints = jointArray,
+                LocalTransforms = local,
+                SkinningTransforms = skinning,
+                BlendShapeOffsets = blendShapeOffsets,
+                BlendShapes = blendShapeArray,
+                BlendShapeWeights = weights,
+            };
+        }
+
+        /// <summary>
+        /// Returns an index of the prims under rootPath with attributes which might vary over time,
+        /// including the prims of instance masters.
+        /// </summary>
+        /// <remarks>
+        /// This walks the stage once, querying UsdAttribute.ValueMightBeTimeVarying() for every
+        /// attribute, so the result should be kept for as long as the stage is not edited.
+        /// </remarks>
+        public TimeVaryingIndex ComputeTimeVaryingIndex(string rootPath)
+        {
+            var sdfRootPath = GetSdfPath(rootPath);
+            var prim = GetUsdPrim(sdfRootPath);
+
+            if (!prim)
+            {
+                throw new ArgumentException("rootPath does not exist");
+            }
+
+            var index = new TimeVaryingIndex(sdfRootPath);
+            lock (m_stageLock)
+            {
+                index.AddSubtree(prim);
+                foreach (var master in Stage.GetMasters())
+                {
+                    index.AddSubtree(master);
+                }
+            }
+
+            return index;
         }
 
         /// <summary>
@@ -677,12 +1085,42 @@ namespace USD.NET
         /// </remarks>
         public void Read<T>(string path, T sample) where T : SampleBase
         {
-            ReadInternal(GetSdfPath(path), sample, TimeCode);
+            Read(GetSdfPath(path), sample);
         }
 
         public void Read<T>(SdfPath path, T sample) where T : SampleBase
         {
-            ReadInternal(path, sample, TimeCode);
+            // The phase name is only built when interop profiling is compiled in.
+            InteropProfiler.BeginPhase("Read " + typeof(T).Name);
+            try
+            {
+                ReadInternal(path, sample, TimeCode);
+            }
+            finally
+            {
+                InteropProfiler.EndPhase();
+            }
+        }
+
+        /// <summary>
+        /// Reads a sample at the given time rather than the current one. Safe to call from another
+        /// thread than the one changing Time, e.g. from a stage edit applied by a background writer.
+        /// </summary>
+        /// <param name="path">The path of the prim to read</param>
+        /// <param name="sample">The sample to populate</param>
+        /// <param name="time">The time at which to read, or null for the default time</param>
+        public void ReadSample<T>(SdfPath path, T sample, double? time) where T : SampleBase
+        {
+            var timeCode = time.HasValue ? new UsdTimeCode(time.Value) : UsdTimeCode.Default();
+            InteropProfiler.BeginPhase("Read " + typeof(T).Name);
+            try
+            {
+                ReadInternal(path, sample, timeCode);
+            }
+            finally
+            {
+                InteropProfiler.EndPhase();
+            }
         }
 
         /// <summary>
@@ -751,6 +1189,19 @@ namespace USD.NET
             bool? mayVary = false;
 
             // When reading animation data, the access map optimizes which prim members need to be read
+            if (accessMap != null && accessMap.TimeVarying != null && !accessMap.TimeVarying.Contains(path))
+            {
+                // The prim holds the same values at every time: it is read in full while populating,
+                // skipping the variability checks, and never again.
+                if (IsPopulatingAccessMask)
+                {
+                    mayVary = null;
+                    m_usdIo.Deserialize(sample, prim, timeCode, null, ref mayVary);
+                }
+
+                return;
+            }
+
             if (accessMap != null)
             {
                 var populatingAccessMask = IsPopulatingAccessMask;
@@ -812,22 +1263,64 @@ namespace USD.NET
 
         public void Write<T>(SdfPath path, T sample) where T : SampleBase
         {
-            WriteInternal(path, sample, TimeCode);
+            var handler = WriteHandler;
+            if (handler != null)
+            {
+                handler(path, sample, typeof(T), Time, WriteMode);
+                return;
+            }
+
+            InteropProfiler.BeginPhase("Write " + typeof(T).Name);
+            try
+            {
+                WriteInternal(path, sample, typeof(T), TimeCode, WriteMode);
+            }
+            finally
+            {
+                InteropProfiler.EndPhase();
+            }
         }
 
-        private void WriteInternal<T>(SdfPath path,
-            T sample,
-            UsdTimeCode timeCode) where T : SampleBase
+        /// <summary>
+        /// Writes a sample received by a WriteHandler, at the given time and with the given write
+        /// mode rather than the current ones. Safe to call from another thread than the one
+        /// changing Time and WriteMode.
+        /// </summary>
+        /// <param name="path">The path of the prim to write</param>
+        /// <param name="sample">The sample to write</param>
+        /// <param name="sampleType">The type the sample was written as, which defines the prim schema</param>
+        /// <param name="time">The time at which to write, or null for the default time</param>
+        /// <param name="writeMode">Whether to define or override the prim</param>
+        public void WriteSample(SdfPath path, SampleBase sample, Type sampleType, double? time,
+            WriteModes writeMode)
+        {
+            var timeCode = time.HasValue ? new UsdTimeCode(time.Value) : UsdTimeCode.Default();
+            InteropProfiler.BeginPhase("Write " + sampleType.Name);
+            try
+            {
+                WriteInternal(path, sample, sampleType, timeCode, writeMode);
+            }
+            finally
+            {
+                InteropProfiler.EndPhase();
+            }
+        }
+
+        private void WriteInternal(SdfPath path,
+            SampleBase sample,
+            Type sampleType,
+            UsdTimeCode timeCode,
+            WriteModes writeMode)
         {
             pxr.UsdPrim prim;
             lock (m_stageLock)
             {
-                if (WriteMode == WriteModes.Define)
+                if (writeMode == WriteModes.Define)
                 {
                     // At the moment multiple ExportPlans end up having the same SdfPath which make Xform schema type override the actual schema type
                     // Also typeless Prims may be created when Child objects are created before Parents in the export plans and we need to make sure their type is updated
                     // The next code is a hacky way to maintain the desired schema type until we refactor the export code
-                    var primTypeName = Reflect.GetSchema(typeof(T));
+                    var primTypeName = Reflect.GetSchema(sampleType);
 
                     prim = m_stage.GetPrimAtPath(path);
                     if (prim == null || !prim.IsValid())
@@ -847,7 +1340,7 @@ namespace USD.NET
                 if (prim == null || !prim.IsValid())
                 {
                     throw new Exception("Failed to "
-                        + (WriteMode == WriteModes.Define ? "define" : "override") + " prim: " + path);
+                        + (writeMode == WriteModes.Define ? "define" : "override") + " prim: " + path);
                 }
             }
             m_usdIo.Serialize(sample, prim, timeCode);
@@ -876,9 +1369,21 @@ namespace USD.NET
         /// </remarks>
         private SdfPath[] VectorToArray(SdfPathVector vec)
         {
-            var ret = new SdfPath[vec.Count];
-            vec.CopyTo(ret);
-            return ret;
+            return IntrinsicTypeConverter.FromVector(vec);
+        }
+
+        /// <summary>
+        /// Returns the schema type name declared by the UsdSchemaAttribute of the given sample type.
+        /// </summary>
+        private static string GetSchemaTypeName(Type sampleType)
+        {
+            var attrs = sampleType.GetCustomAttributes(typeof(USD.NET.UsdSchemaAttribute), true);
+            if (attrs.Length == 0)
+            {
+                throw new ApplicationException("Invalid type " + sampleType.Name + ", does not have UsdSchema attribute");
+            }
+
+            return ((UsdSchemaAttribute)attrs[0]).Name;
         }
 
         private SdfPath GetSdfPath(pxr.SdfPath path)
@@ -937,6 +1442,19 @@ namespace USD.NET
         private UsdIo m_usdIo;
         private UsdStage m_stage;
 
+        // Buffer sizes for ComputeKeyFrameTable, grown to fit the largest result so far.
+        private int m_keyFrameEntryCapacity = 256;
+        private int m_keyFrameTimesCapacity = 4096;
+
+        // Buffer sizes for ComputePrimHierarchy, grown to fit the largest result so far.
+        private const int kPrimHierarchyStride = 10;
+        private int m_hierarchyPrimCapacity = 1024;
+        private int m_hierarchyVariantCapacity = 256;
+
+        // Buffer sizes for ComputeSkeletonPoses, grown to fit the largest result so far.
+        private int m_jointCapacity = 1024;
+        private int m_blendShapeCapacity = 256;
+
         // Cache TfTokens for reuse to avoid P/Invoke and token churn.
         private static readonly TfToken kUpAxisToken = new TfToken("upAxis");
         private static readonly TfToken kYUpToken = new TfToken("Y");
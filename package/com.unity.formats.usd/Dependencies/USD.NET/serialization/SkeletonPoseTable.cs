@@ -0,0 +1,122 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using pxr;
+
+namespace USD.NET
+{
+    /// <summary>
+    /// The poses of one or more skeletons at a single time, as returned by
+    /// Scene.ComputeSkeletonPoses().
+    /// </summary>
+    /// <remarks>
+    /// Each entry is a skeleton, in the order they were given, flagged Failed when the path is not
+    /// a valid skeleton. The joints, matrices and blend shape weights of all skeletons are
+    /// held in flat buffers: the joints of entry i are Joints[JointOffsets[i]] to
+    /// Joints[JointOffsets[i + 1]], the 16 values of the matrix of joint j start at 16 * j, in USD
+    /// row-major order, and the blend shapes of entry i are BlendShapes[BlendShapeOffsets[i]] to
+    /// BlendShapes[BlendShapeOffsets[i + 1]], with their weights at the same indices in
+    /// BlendShapeWeights.
+    /// </remarks>
+    public class SkeletonPoseTable
+    {
+        /// <summary>
+        /// The skeleton of each entry.
+        /// </summary>
+        public SdfPath[] Paths;
+
+        /// <summary>
+        /// The SkeletonPoseFlags of each entry.
+        /// </summary>
+        public SkeletonPoseFlags[] Flags;
+
+        /// <summary>
+        /// Where the joints of each entry start in Joints, followed by the total number of joints.
+        /// </summary>
+        public int[] JointOffsets;
+
+        /// <summary>
+        /// The joints of every entry, in the joint order of their skeleton.
+        /// </summary>
+        public string[] Joints;
+
+        /// <summary>
+        /// The joint local transforms of every joint, or null when not computed.
+        /// </summary>
+        public double[] LocalTransforms;
+
+        /// <summary>
+        /// The skinning transforms of every joint, that is the inverse of the world space bind
+        /// transform followed by the world space transform of the joint, or null when not computed.
+        /// </summary>
+        public double[] SkinningTransforms;
+
+        /// <summary>
+        /// Where the blend shapes of each entry start in BlendShapes, followed by the total number of
+        /// blend shapes.
+        /// </summary>
+        public int[] BlendShapeOffsets;
+
+        /// <summary>
+        /// The blend shapes of the animation of every entry, in the order of the animation.
+        /// </summary>
+        public string[] BlendShapes;
+
+        /// <summary>
+        /// The weight of every blend shape.
+        /// </summary>
+        public float[] BlendShapeWeights;
+
+        /// <summary>
+        /// The number of entries.
+        /// </summary>
+        public int Count { get { return Paths.Length; } }
+
+        /// <summary>
+        /// Returns the index of the entry of the given skeleton, or -1.
+        /// </summary>
+        public int IndexOf(SdfPath skeleton)
+        {
+            return Array.IndexOf(Paths, skeleton);
+        }
+
+        /// <summary>
+        /// Returns the joints of the given entry.
+        /// </summary>
+        public ArraySegment<string> GetJoints(int entry)
+        {
+            return new ArraySegment<string>(Joints, JointOffsets[entry],
+                JointOffsets[entry + 1] - JointOffsets[entry]);
+        }
+
+        /// <summary>
+        /// Returns the blend shapes of the given entry.
+        /// </summary>
+        public ArraySegment<string> GetBlendShapes(int entry)
+        {
+            return new ArraySegment<string>(BlendShapes, BlendShapeOffsets[entry],
+                BlendShapeOffsets[entry + 1] - BlendShapeOffsets[entry]);
+        }
+
+        /// <summary>
+        /// Returns the blend shape weights of the given entry.
+        /// </summary>
+        public ArraySegment<float> GetBlendShapeWeights(int entry)
+        {
+            return new ArraySegment<float>(BlendShapeWeights, BlendShapeOffsets[entry],
+                BlendShapeOffsets[entry + 1] - BlendShapeOffsets[entry]);
+        }
+    }
+}
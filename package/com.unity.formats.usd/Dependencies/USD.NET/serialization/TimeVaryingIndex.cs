@@ -0,0 +1,126 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System.Collections.Generic;
+using pxr;
+
+namespace USD.NET
+{
+    /// <summary>
+    /// The prims under a root path which have at least one attribute that might vary over time,
+    /// along with the names of those attributes.
+    /// </summary>
+    /// <remarks>
+    /// Computed once per stage with Scene.ComputeTimeVaryingIndex(), the index answers which prims
+    /// must be read again when the time changes without querying USD. Prims which are not in the
+    /// index hold the same values at every time.
+    /// </remarks>
+    public class TimeVaryingIndex
+    {
+        readonly Dictionary<SdfPath, HashSet<string>> m_attributes = new Dictionary<SdfPath, HashSet<string>>();
+        readonly Dictionary<SdfPath[], SdfPath[]> m_filtered = new Dictionary<SdfPath[], SdfPath[]>();
+
+        /// <summary>
+        /// The root path the index was computed for.
+        /// </summary>
+        public SdfPath RootPath { get; private set; }
+
+        /// <summary>
+        /// The number of time-varying prims.
+        /// </summary>
+        public int Count { get { return m_attributes.Count; } }
+
+        /// <summary>
+        /// The paths of the time-varying prims.
+        /// </summary>
+        public IEnumerable<SdfPath> Prims { get { return m_attributes.Keys; } }
+
+        internal TimeVaryingIndex(SdfPath rootPath)
+        {
+            RootPath = rootPath;
+        }
+
+        /// <summary>
+        /// Returns true if at least one attribute of the prim might vary over time.
+        /// </summary>
+        public bool Contains(SdfPath primPath)
+        {
+            return m_attributes.ContainsKey(primPath);
+        }
+
+        /// <summary>
+        /// Returns true if the named attribute of the prim might vary over time.
+        /// </summary>
+        public bool IsTimeVarying(SdfPath primPath, string attrName)
+        {
+            HashSet<string> names;
+            return m_attributes.TryGetValue(primPath, out names) && names.Contains(attrName);
+        }
+
+        /// <summary>
+        /// Returns the time-varying prims among the given paths, in the same order.
+        /// </summary>
+        /// <remarks>
+        /// The result is cached per array instance, so the arrays passed in must not be modified
+        /// afterwards. This method is not thread safe.
+        /// </remarks>
+        public SdfPath[] Filter(SdfPath[] paths)
+        {
+            SdfPath[] filtered;
+            if (m_filtered.TryGetValue(paths, out filtered))
+            {
+                return filtered;
+            }
+
+            var found = new List<SdfPath>();
+            foreach (var path in paths)
+            {
+                if (m_attributes.ContainsKey(path))
+                {
+                    found.Add(path);
+                }
+            }
+
+            filtered = found.ToArray();
+            m_filtered.Add(paths, filtered);
+            return filtered;
+        }
+
+        /// <summary>
+        /// Adds the time-varying attributes of the prims under the given prim, inclusive.
+        /// </summary>
+        internal void AddSubtree(UsdPrim root)
+        {
+            foreach (var prim in new UsdPrimRange(root))
+            {
+                HashSet<string> names = null;
+                foreach (var attr in prim.GetAttributes())
+                {
+                    if (!attr.ValueMightBeTimeVarying())
+                    {
+                        continue;
+                    }
+
+                    if (names == null)
+                    {
+                        names = new HashSet<string>();
+                        m_attributes[prim.GetPath()] = names;
+                    }
+
+                    names.Add(attr.GetName());
+                }
+            }
+        }
+    }
+}
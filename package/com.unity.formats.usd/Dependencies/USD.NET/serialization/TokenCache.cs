@@ -12,7 +12,9 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-using System.Collections.Generic;
+using System;
+using System.Collections.Concurrent;
+using System.Threading;
 
 namespace USD.NET
 {
@@ -20,10 +22,75 @@ namespace USD.NET
     /// USD TfTokens are expensive to create and destroy, both in C# and in C++. This class provides a
     /// thread safe caching mechanism to avoid TfToken churn.
     /// </summary>
-    internal class TokenCache
+    /// <remarks>
+    /// Lookups never take a lock: schema tokens known to the code generator are served from the
+    /// precomputed UsdSchemaTokens table and all other tokens from a concurrent dictionary, keyed by
+    /// namespace and name so the joined name is only built when a token is first created.
+    /// </remarks>
+    public class TokenCache
     {
-        private Dictionary<string, Dictionary<string, pxr.TfToken>> m_cache =
-            new Dictionary<string, Dictionary<string, pxr.TfToken>>();
+        private struct Key : IEquatable<Key>
+        {
+            public readonly string Namespace;
+            public readonly string Name;
+
+            public Key(string ns, string name)
+            {
+                Namespace = ns;
+                Name = name;
+            }
+
+            public bool Equals(Key other)
+            {
+                return string.Equals(Namespace, other.Namespace) && string.Equals(Name, other.Name);
+            }
+
+            public override bool Equals(object obj)
+            {
+                return obj is Key && Equals((Key)obj);
+            }
+
+            public override int GetHashCode()
+            {
+                return unchecked(Namespace.GetHashCode() * 31 + Name.GetHashCode());
+            }
+        }
+
+        private ConcurrentDictionary<Key, pxr.TfToken> m_cache = new ConcurrentDictionary<Key, pxr.TfToken>();
+
+        private long m_schemaHits;
+        private long m_hits;
+        private long m_misses;
+
+        /// <summary>
+        /// The number of lookups served from the precomputed schema token table.
+        /// </summary>
+        public long SchemaHits { get { return Interlocked.Read(ref m_schemaHits); } }
+
+        /// <summary>
+        /// The number of lookups served from tokens previously added to the cache.
+        /// </summary>
+        public long Hits { get { return Interlocked.Read(ref m_hits); } }
+
+        /// <summary>
+        /// The number of lookups which had to add a token to the cache.
+        /// </summary>
+        public long Misses { get { return Interlocked.Read(ref m_misses); } }
+
+        /// <summary>
+        /// The number of tokens added to the cache, excluding the precomputed schema tokens.
+        /// </summary>
+        public int Count { get { return m_cache.Count; } }
+
+        /// <summary>
+        /// Resets the hit and miss counters to zero, the cached tokens are kept.
+        /// </summary>
+        public void ResetCounters()
+        {
+            Interlocked.Exchange(ref m_schemaHits, 0);
+            Interlocked.Exchange(ref m_hits, 0);
+            Interlocked.Exchange(ref m_misses, 0);
+        }
 
         /// <summary>
         /// Internal helper function to access the token cache.
@@ -38,25 +105,36 @@ namespace USD.NET
             if (token == null) { token = string.Empty; }
 
             pxr.TfToken val;
-            lock (this) {
-                // TODO: the lock and nested lookup here could be more efficient.
-
-                // First lookup the namespace cache.
-                Dictionary<string, pxr.TfToken> nsCache;
-                if (!m_cache.TryGetValue(ns, out nsCache))
-                {
-                    nsCache = new Dictionary<string, pxr.TfToken>();
-                    m_cache[ns] = nsCache;
-                }
-
-                // Then lookup the token in the namespace.
-                if (!nsCache.TryGetValue(token, out val))
-                {
-                    val = new pxr.TfToken(IntrinsicTypeConverter.JoinNamespace(ns, token));
-                    nsCache[token] = val;
-                }
+            if (ns.Length == 0 && UsdSchemaTokens.TryGetToken(token, out val))
+            {
+                Interlocked.Increment(ref m_schemaHits);
+                return val;
+            }
+
+            var key = new Key(ns, token);
+            if (m_cache.TryGetValue(key, out val))
+            {
+                Interlocked.Increment(ref m_hits);
+                return val;
+            }
+
+            // Namespaced names such as "primvars:displayColor" may still be schema tokens, which are
+            // shared rather than duplicated.
+            Interlocked.Increment(ref m_misses);
+            string joined = IntrinsicTypeConverter.JoinNamespace(ns, token);
+            bool isSchemaToken = UsdSchemaTokens.TryGetToken(joined, out val);
+            if (!isSchemaToken)
+            {
+                val = new pxr.TfToken(joined);
+            }
+
+            // When two threads race to add the same token, the first one wins.
+            var cached = m_cache.GetOrAdd(key, val);
+            if (!ReferenceEquals(cached, val) && !isSchemaToken)
+            {
+                val.Dispose();
             }
-            return val;
+            return cached;
         }
 
         /// <summary>
@@ -15,6 +15,7 @@
 using System;
 using System.Collections.Generic;
 using System.Runtime.CompilerServices;
+using System.Runtime.InteropServices;
 using pxr;
 
 namespace USD.NET
@@ -22,6 +23,8 @@ namespace USD.NET
     public delegate pxr.VtValue ToVtConverter(object value);
     public delegate object ToCsConverter(pxr.VtValue value);
     internal delegate object ToCsCopyConverter(pxr.VtValue value, object vtArray);
+    public delegate bool AttributeWriter(object value, pxr.UsdAttribute attr, pxr.UsdTimeCode time,
+        pxr.UsdUtilsSparseValueWriter sparseWriter);
 
     /// Conversions discovered automatically via reflection on VtValue.
     public class DefaultConversions
@@ -46,6 +49,12 @@ namespace USD.NET
         public ToCsConverter toCsObject;
         public pxr.SdfValueTypeName sdfTypeName;
 
+        /// <summary>
+        /// Writes the C# value straight to an attribute, skipping the VtValue, or null when the value
+        /// must be converted with toVtValue. See TypeBinder.BindAttributeWriter.
+        /// </summary>
+        public AttributeWriter attributeWriter;
+
         public UsdTypeBinding(ToVtConverter toVtConverter,
                               ToCsConverter toCsConverter,
                               pxr.SdfValueTypeName sdfName)
@@ -53,6 +62,7 @@ namespace USD.NET
             toVtValue = toVtConverter;
             toCsObject = toCsConverter;
             sdfTypeName = sdfName;
+            attributeWriter = null;
         }
     }
 
@@ -66,8 +76,6 @@ namespace USD.NET
 
         static Dictionary<Type, UsdTypeBinding> bindings = new Dictionary<Type, UsdTypeBinding>();
 
-        // TODO: change these in Python generator to match .NET System types rather than C# types
-        Dictionary<string, string> typeNameMapping = new Dictionary<string, string>();
         Dictionary<Type, Dictionary<pxr.TfToken, Enum>> enumMaps = new Dictionary<Type, Dictionary<pxr.TfToken, Enum>>();
 
         /// <summary>
@@ -78,17 +86,6 @@ namespace USD.NET
 
         public TypeBinder()
         {
-            // TODO: kill this, see above.
-            typeNameMapping.Add("Boolean", "bool");
-            typeNameMapping.Add("Byte", "byte");
-            typeNameMapping.Add("Int32", "int");
-            typeNameMapping.Add("UInt32", "uint");
-            typeNameMapping.Add("Int64", "long");
-            typeNameMapping.Add("UInt64", "ulong");
-            typeNameMapping.Add("String", "string");
-            typeNameMapping.Add("Single", "float");
-            typeNameMapping.Add("Double", "double");
-
             RegisterIntrinsicTypes();
         }
 
@@ -236,10 +233,10 @@ namespace USD.NET
             //   class UsdCs {
             //     public static void VtValueToVtTokenArray(VtValue value, VtTokenArray output);
             //
-            var valToVtArray = typeof(pxr.UsdCs).GetMethod("VtValueTo" + vtArrayType.Name,
-                new Type[] { typeof(pxr.VtValue), vtArrayType });
-
-            if (valToVtArray == null)
+            // These are generated along with the bindings, so no reflection is required to find them.
+            //
+            Action<pxr.VtValue, object> valToVtArray;
+            if (!VtValueConverters.TryGetCopyConverter(vtArrayType, out valToVtArray))
             {
                 throw new ArgumentException(string.Format("No VtValueTo{...} converter found for type {0}",
                     vtArrayType.ToString()));
@@ -267,7 +264,8 @@ namespace USD.NET
             {
                 // EmitToCs and EmitToVt are not defined when not using NET_4_6
 #if NET_4_6
-                var copyConverter = (ToCsCopyConverter)CodeGen.EmitToCs<ToCsCopyConverter>(valToVtArray, vtToCsArray);
+                var valToVtArrayMethod = VtValueConverters.GetCopyConverter(vtArrayType).Method;
+                var copyConverter = (ToCsCopyConverter)CodeGen.EmitToCs<ToCsCopyConverter>(valToVtArrayMethod, vtToCsArray);
                 toCs = (vtValue) => ToCsConvertHelper(vtValue, vtArrayType, copyConverter);
                 toVt = (ToVtConverter)CodeGen.EmitToVt<ToVtConverter>(csToVtArray, csType, vtArrayType);
 #endif
@@ -305,7 +303,7 @@ namespace USD.NET
         /// <summary>
         /// Converts a VtValue holding a VtArray of T to a C#-native array type, using (slow) late binding.
         /// </summary>
-        object ToCsDynamicConvertHelper(pxr.VtValue vtValue, Type vtArrayType, System.Reflection.MethodInfo valToVtArray, System.Reflection.MethodInfo vtToCsArray)
+        object ToCsDynamicConvertHelper(pxr.VtValue vtValue, Type vtArrayType, Action<pxr.VtValue, object> valToVtArray, System.Reflection.MethodInfo vtToCsArray)
         {
             // Intentionally not tracking size here, since USD will resize the array for us.
             object vtArrayObject = UsdIo.ArrayAllocator.MallocHandle(vtArrayType);
@@ -315,7 +313,7 @@ namespace USD.NET
             // For example:
             //   class UsdCs {
             //     public static void VtValueToVtTokenArray(VtValue value, VtTokenArray output);
-            valToVtArray.Invoke(null, new object[] { vtValue, vtArrayObject });
+            valToVtArray(vtValue, vtArrayObject);
 
             // For example:
             //   class IntrinsicTypeConverter {
@@ -349,22 +347,73 @@ namespace USD.NET
 
         public void BindNativeType(Type csType, pxr.SdfValueTypeName sdfName)
         {
-            string name;
-            if (!typeNameMapping.TryGetValue(csType.Name, out name))
+            // The generated registry maps the C# type directly to its VtValueTo{...} accessor,
+            // e.g. typeof(float) -> UsdCs.VtValueTofloat.
+            Func<pxr.VtValue, object> converter;
+            if (!VtValueConverters.TryGetConverter(csType, out converter))
             {
-                name = csType.Name;
+                throw new ArgumentException(string.Format("No VtValueTo... converter found for type {0}",
+                    csType.ToString()));
             }
-            var converter = typeof(pxr.UsdCs).GetMethod("VtValueTo" + name,
-                new Type[] { typeof(pxr.VtValue) });
+            bindings[csType] = new UsdTypeBinding(DefaultConversions.ToVtValue,
+                (x) => converter(x),
+                sdfName);
+        }
 
-            if (converter == null)
+        /// <summary>
+        /// Writes values of an already bound C# type straight from managed memory, with the generated
+        /// UsdAttributeWriters, rather than converting them to a VtValue first. The C# type must be a
+        /// struct, or an array of structs, with the memory layout of the elements of the USD type,
+        /// e.g. float[] for float[] or a three float vector for float3, but not a quaternion whose
+        /// components are ordered differently. Bools are not supported, their marshaled size differs.
+        /// </summary>
+        /// <param name="csType">The bound C# type</param>
+        /// <param name="vtType">The C# type holding the USD value, e.g. VtVec3fArray</param>
+        public void BindAttributeWriter(Type csType, Type vtType)
+        {
+            UsdTypeBinding binding;
+            if (!bindings.TryGetValue(csType, out binding))
             {
-                throw new ArgumentException(string.Format("No VtValueTo... converter found for type {0}, VtValueTo{1}",
-                    csType.ToString(), name));
+                throw new ArgumentException(string.Format("No binding found for type {0}",
+                    csType.ToString()));
+            }
+
+            UsdAttributeWriters.Writer writer;
+            uint elementSize;
+            bool isArray;
+            if (!UsdAttributeWriters.TryGetWriter(vtType, out writer, out elementSize, out isArray))
+            {
+                throw new ArgumentException(string.Format("No UsdAttributeSet{{...}} writer found for type {0}",
+                    vtType.ToString()));
+            }
+
+            Type elementType = isArray ? csType.GetElementType() : csType;
+            if (isArray != csType.IsArray || !elementType.IsValueType
+                || Marshal.SizeOf(elementType) != elementSize)
+            {
+                throw new ArgumentException(string.Format("Type {0} does not match the layout of {1}",
+                    csType.ToString(), vtType.ToString()));
+            }
+
+            binding.attributeWriter = (value, attr, time, sparseWriter) =>
+                WritePinned(value, isArray, attr, time, sparseWriter, writer);
+            bindings[csType] = binding;
+        }
+
+        static bool WritePinned(object value, bool isArray, pxr.UsdAttribute attr, pxr.UsdTimeCode time,
+            pxr.UsdUtilsSparseValueWriter sparseWriter, UsdAttributeWriters.Writer writer)
+        {
+            // Boxed structs are pinned the same way as arrays, so scalars need no copy either.
+            uint count = isArray ? (uint)((Array)value).Length : 1;
+            GCHandle handle = GCHandle.Alloc(value, GCHandleType.Pinned);
+            try
+            {
+                return writer(attr, time, handle.AddrOfPinnedObject(), count, sparseWriter);
+            }
+            finally
+            {
+                handle.Free();
             }
-            bindings[csType] = new UsdTypeBinding(DefaultConversions.ToVtValue,
-                (x) => converter.Invoke(null, new object[] { x }),
-                sdfName);
         }
 
         private UsdTypeBinding BindEnum(Type enumType)
@@ -510,6 +559,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtUCharArray), SdfValueTypeNames.UCharArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(byte[]), typeof(pxr.VtUCharArray), SdfValueTypeNames.UCharArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<byte>), typeof(pxr.VtUCharArray), SdfValueTypeNames.UCharArray, "List");
+            BindAttributeWriter(typeof(byte), typeof(byte));
+            BindAttributeWriter(typeof(byte[]), typeof(pxr.VtUCharArray));
 
             //
             // String
@@ -536,6 +587,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtIntArray), SdfValueTypeNames.IntArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(int[]), typeof(pxr.VtIntArray), SdfValueTypeNames.IntArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<int>), typeof(pxr.VtIntArray), SdfValueTypeNames.IntArray, "List");
+            BindAttributeWriter(typeof(int), typeof(int));
+            BindAttributeWriter(typeof(int[]), typeof(pxr.VtIntArray));
 
             //
             // UInt
@@ -544,6 +597,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtUIntArray), SdfValueTypeNames.UIntArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(uint[]), typeof(pxr.VtUIntArray), SdfValueTypeNames.UIntArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<uint>), typeof(pxr.VtUIntArray), SdfValueTypeNames.UIntArray, "List");
+            BindAttributeWriter(typeof(uint), typeof(uint));
+            BindAttributeWriter(typeof(uint[]), typeof(pxr.VtUIntArray));
 
             //
             // Long
@@ -552,6 +607,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtInt64Array), SdfValueTypeNames.Int64Array);
             BindArrayType<IntrinsicTypeConverter>(typeof(long[]), typeof(pxr.VtInt64Array), SdfValueTypeNames.Int64Array);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<long>), typeof(pxr.VtInt64Array), SdfValueTypeNames.Int64Array, "List");
+            BindAttributeWriter(typeof(long), typeof(long));
+            BindAttributeWriter(typeof(long[]), typeof(pxr.VtInt64Array));
 
             //
             // ULong
@@ -560,6 +617,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtUInt64Array), SdfValueTypeNames.UInt64Array);
             BindArrayType<IntrinsicTypeConverter>(typeof(ulong[]), typeof(pxr.VtUInt64Array), SdfValueTypeNames.UInt64Array);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<ulong>), typeof(pxr.VtUInt64Array), SdfValueTypeNames.UInt64Array, "List");
+            BindAttributeWriter(typeof(ulong), typeof(ulong));
+            BindAttributeWriter(typeof(ulong[]), typeof(pxr.VtUInt64Array));
 
             //
             // Half
@@ -577,6 +636,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtFloatArray), SdfValueTypeNames.FloatArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(float[]), typeof(pxr.VtFloatArray), SdfValueTypeNames.FloatArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<float>), typeof(pxr.VtFloatArray), SdfValueTypeNames.FloatArray, "List");
+            BindAttributeWriter(typeof(float), typeof(float));
+            BindAttributeWriter(typeof(float[]), typeof(pxr.VtFloatArray));
 
             //
             // Double
@@ -585,6 +646,8 @@ namespace USD.NET
             BindNativeType(typeof(pxr.VtDoubleArray), SdfValueTypeNames.DoubleArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(double[]), typeof(pxr.VtDoubleArray), SdfValueTypeNames.DoubleArray);
             BindArrayType<IntrinsicTypeConverter>(typeof(List<double>), typeof(pxr.VtDoubleArray), SdfValueTypeNames.DoubleArray, "List");
+            BindAttributeWriter(typeof(double), typeof(double));
+            BindAttributeWriter(typeof(double[]), typeof(pxr.VtDoubleArray));
 
             //
             // Quaternion
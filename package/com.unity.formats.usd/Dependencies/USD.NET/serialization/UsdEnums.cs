@@ -56,4 +56,50 @@ namespace USD.NET
         Vertex,
         FaceVarying
     }
+
+    /// <summary>
+    /// Describes the transform of a prim computed by Scene.ComputeTransforms().
+    /// </summary>
+    [System.Flags]
+    public enum TransformFlags
+    {
+        None = 0,
+        ResetsXformStack = 1 << 0,
+        MightBeTimeVarying = 1 << 1,
+
+        /// <summary>
+        /// The prim is not xformable, its transforms are identity.
+        /// </summary>
+        NotXformable = 1 << 2,
+
+        /// <summary>
+        /// The transform does not vary over time according to the AccessMask and was not computed.
+        /// </summary>
+        Skipped = 1 << 3,
+    }
+
+    /// <summary>
+    /// Describes the pose of a skeleton computed by Scene.ComputeSkeletonPoses().
+    /// </summary>
+    [System.Flags]
+    public enum SkeletonPoseFlags
+    {
+        None = 0,
+
+        /// <summary>
+        /// The skeleton is bound to a UsdSkelAnimation.
+        /// </summary>
+        HasAnimation = 1 << 0,
+
+        /// <summary>
+        /// The joint transforms or blend shape weights of the animation might vary over time.
+        /// </summary>
+        MightBeTimeVarying = 1 << 1,
+
+        /// <summary>
+        /// The path is not a valid skeleton, or some transforms or weights could not be computed,
+        /// identity matrices and zero weights were returned in their place.
+        /// </summary>
+        Failed = 1 << 2,
+    }
 }
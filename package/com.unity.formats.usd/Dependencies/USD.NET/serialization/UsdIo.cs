@@ -36,8 +36,6 @@ namespace USD.NET
         public static ArrayPool ArrayAllocator = new ArrayUnpool();
 
         // Avoid churning through tokens to avoid the overhead of both p/invoke and garbage generation.
-        // TODO: This has detremental effect on multi-threaded performance, making it thread-specific
-        //       would make it more efficient.
         static TokenCache sm_tokenCache = new TokenCache();
 
         // Data driven type bindings allow clients to add bindings for new, custom data types.
@@ -54,6 +52,12 @@ namespace USD.NET
         /// </summary>
         public static TypeBinder Bindings { get { return sm_bindings; } }
 
+        /// <summary>
+        /// Provides access to the token cache shared by all reads and writes, e.g. to inspect its hit
+        /// and miss counters.
+        /// </summary>
+        public static TokenCache Tokens { get { return sm_tokenCache; } }
+
         // A lock used to protect the stage from multi-threaded writes.
         private object m_stageLock;
 
@@ -82,25 +86,26 @@ namespace USD.NET
         {
             PropertyInfo[] properties = Reflect.GetCachedProperties(t.GetType());
             FieldInfo[] fields = Reflect.GetCachedFields(t.GetType());
+            SampleMemberTable accessors = SampleAccessors.GetTable(t.GetType());
             var imgble = new pxr.UsdGeomImageable(prim);
 
             for (int i = 0; i < properties.Length; i++)
             {
                 PropertyInfo csProp = properties[i];
                 Type csType = csProp.PropertyType;
+                object csValue = SampleMemberTable.GetProperty(accessors, i, csProp, t);
                 if (csType == typeof(object))
                 {
                     if (Reflect.IsCustomData(csProp) || Reflect.IsMetadata(csProp))
                     {
                         throw new ArgumentException("Writing metadata/customdata with type of object is not currently allowed");
                     }
-                    object o = csProp.GetValue(t, index: null);
-                    if (o != null)
+                    if (csValue != null)
                     {
-                        csType = o.GetType();
+                        csType = csValue.GetType();
                     }
                 }
-                if (!WriteAttr(csProp.Name, csType, csProp.GetValue(t, index:null),
+                if (!WriteAttr(csProp.Name, csType, csValue,
                     usdTime, prim, imgble, csProp, usdNamespace))
                 {
                     // TODO: add options to dictate behavior here
@@ -111,19 +116,19 @@ namespace USD.NET
             {
                 FieldInfo csField = fields[i];
                 Type csType = csField.FieldType;
+                object csValue = SampleMemberTable.GetField(accessors, i, csField, t);
                 if (csType == typeof(object))
                 {
                     if (Reflect.IsCustomData(csField) || Reflect.IsMetadata(csField))
                     {
                         throw new ArgumentException("Writing metadata/customdata with type of object is not currently allowed");
                     }
-                    object o = csField.GetValue(t);
-                    if (o != null)
+                    if (csValue != null)
                     {
-                        csType = o.GetType();
+                        csType = csValue.GetType();
                     }
                 }
-                if (!WriteAttr(csField.Name, csType, csField.GetValue(t),
+                if (!WriteAttr(csField.Name, csType, csValue,
                     usdTime, prim, imgble, csField, usdNamespace))
                 {
                     // TODO: add options to dictate behavior here
@@ -229,6 +234,7 @@ namespace USD.NET
 
             PropertyInfo[] properties = Reflect.GetCachedProperties(t.GetType());
             FieldInfo[] fields = Reflect.GetCachedFields(t.GetType());
+            SampleMemberTable accessors = SampleAccessors.GetTable(t.GetType());
             var localVarMap = accessMap;
             bool mayVaryWasNull = mayVary == null;
             if (mayVary == null)
@@ -247,9 +253,9 @@ namespace USD.NET
                 {
                     continue;
                 }
-                object propValue = csProp.GetValue(t, null);
+                object propValue = SampleMemberTable.GetProperty(accessors, i, csProp, t);
                 Deserialize(ref propValue, prim, usdTime, csProp, localVarMap, ref mayVary, usdNamespace);
-                csProp.SetValue(t, propValue, index: null);
+                SampleMemberTable.SetProperty(accessors, i, csProp, t, propValue);
                 if ((mayVary == null) != mayVaryWasNull)
                 {
                     throw new ApplicationException("Deserialize modified mayVary to be non-null");
@@ -267,9 +273,9 @@ namespace USD.NET
                 {
                     continue;
                 }
-                object fieldValue = csField.GetValue(t);
+                object fieldValue = SampleMemberTable.GetField(accessors, i, csField, t);
                 Deserialize(ref fieldValue, prim, usdTime, csField, localVarMap, ref mayVary, usdNamespace);
-                csField.SetValue(t, fieldValue);
+                SampleMemberTable.SetField(accessors, i, csField, t, fieldValue);
                 if ((mayVary == null) != mayVaryWasNull)
                 {
                     throw new ApplicationException("Deserialize modified mayVary to be non-null");
@@ -535,25 +541,36 @@ namespace USD.NET
                 return true;
             }
 
-
-            pxr.VtValue vtValue = binding.toVtValue(csValue);
-            lock (m_stageLock) {
-                if (isMetaData)
-                {
-                    prim.SetMetadata(sdfAttrName, vtValue);
-                }
-                else if (isCustomData)
-                {
-                    prim.SetCustomDataByKey(sdfAttrName, vtValue);
-                }
-                else if (Reflect.IsFusedDisplayColor(memberInfo))
-                {
-                    pxr.UsdCs.SetFusedDisplayColor(prim, vtValue, time);
+            if (binding.attributeWriter != null && !isMetaData && !isCustomData
+                && !Reflect.IsFusedDisplayColor(memberInfo))
+            {
+                // Blittable values are written straight from managed memory, without creating a
+                // VtValue, still going through the sparse value writer.
+                lock (m_stageLock) {
+                    binding.attributeWriter(csValue, attr, time, m_sparseValueWriter);
                 }
-                else
-                {
-                    // use the sparse attribute value writer, to skip redundant time samples
-                    m_sparseValueWriter.SetAttribute(attr, vtValue, time);
+            }
+            else
+            {
+                pxr.VtValue vtValue = binding.toVtValue(csValue);
+                lock (m_stageLock) {
+                    if (isMetaData)
+                    {
+                        prim.SetMetadata(sdfAttrName, vtValue);
+                    }
+                    else if (isCustomData)
+                    {
+                        prim.SetCustomDataByKey(sdfAttrName, vtValue);
+                    }
+                    else if (Reflect.IsFusedDisplayColor(memberInfo))
+                    {
+                        pxr.UsdCs.SetFusedDisplayColor(prim, vtValue, time);
+                    }
+                    else
+                    {
+                        // use the sparse attribute value writer, to skip redundant time samples
+                        m_sparseValueWriter.SetAttribute(attr, vtValue, time);
+                    }
                 }
             }
 
@@ -693,14 +710,7 @@ namespace USD.NET
                     return true;
                 }
 
-                pxr.SdfPathVector paths = rel.GetTargets();
-                string[] result = new string[paths.Count];
-                for (int i = 0; i < paths.Count; i++)
-                {
-                    result[i] = paths[i].ToString();
-                }
-
-                relationship.targetPaths = result;
+                relationship.targetPaths = IntrinsicTypeConverter.ToStrings(rel.GetTargets());
                 return true;
             }
 
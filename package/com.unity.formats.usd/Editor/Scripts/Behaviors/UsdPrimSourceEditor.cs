@@ -144,7 +144,7 @@ namespace Unity.Formats.USD
 
             EditorGUILayout.LabelField("TimeSamples: ");
             GUILayout.TextArea(string.Join(",",
-                selectedAttribute.GetTimeSamples().Select(p => p.ToString()).ToArray()));
+                IntrinsicTypeConverter.FromVector(selectedAttribute.GetTimeSamples()).Select(p => p.ToString()).ToArray()));
 
             // Spec are the low level API  in Sdf, the enable one to read and write a layer without
             // going through the composition graph. This is the fastest way to write USD data, but
@@ -0,0 +1,267 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+using System.Text;
+using UnityEditor;
+using UnityEditor.Build;
+using UnityEditor.Build.Reporting;
+using UnityEditor.Compilation;
+using UnityEngine;
+using USD.NET;
+
+namespace Unity.Formats.USD
+{
+    /// <summary>
+    /// Generates strongly typed accessors for the serialized members of every SampleBase type
+    /// visible to the project scripts, so that player builds read and write samples without
+    /// reflection.
+    /// </summary>
+    /// <remarks>
+    /// The accessors are written to a script in the project, which registers them with
+    /// SampleAccessors on load. When building an IL2CPP player, or when the script already exists,
+    /// it is regenerated before the build. Members which cannot be accessed from generated code,
+    /// e.g. because their type is not public, are still read and written via reflection.
+    /// </remarks>
+    public class UsdSampleAccessorGenerator : IPreprocessBuildWithReport
+    {
+        /// <summary>
+        /// The project path of the generated script.
+        /// </summary>
+        public const string kDefaultPath = "Assets/UsdGenerated/UsdSampleAccessors.cs";
+
+        [Serializable]
+        class AssemblyDefinition
+        {
+            public bool autoReferenced = true;
+        }
+
+        public int callbackOrder { get { return 0; } }
+
+        public void OnPreprocessBuild(BuildReport report)
+        {
+            var target = report.summary.platform;
+            if (target != BuildTarget.StandaloneWindows64 && target != BuildTarget.StandaloneOSX)
+            {
+                return;
+            }
+
+            var backend = PlayerSettings.GetScriptingBackend(report.summary.platformGroup);
+            if (backend != ScriptingImplementation.IL2CPP && !File.Exists(kDefaultPath))
+            {
+                return;
+            }
+
+            if (Generate(kDefaultPath))
+            {
+                Debug.Log("USD: Generated sample accessors in " + kDefaultPath);
+            }
+        }
+
+        [MenuItem("USD/Generate Sample Accessors", priority = 180)]
+        static void MenuGenerateSampleAccessors()
+        {
+            Generate(kDefaultPath);
+            Debug.Log("USD: Generated sample accessors in " + kDefaultPath);
+        }
+
+        /// <summary>
+        /// Generates the accessors of all sample types into the script at the given project path.
+        /// Returns false if the script was already up to date.
+        /// </summary>
+        public static bool Generate(string path)
+        {
+            var source = GenerateSource(FindSampleTypes());
+            if (File.Exists(path) && File.ReadAllText(path) == source)
+            {
+                return false;
+            }
+
+            Directory.CreateDirectory(Path.GetDirectoryName(path));
+            File.WriteAllText(path, source);
+            AssetDatabase.ImportAsset(path);
+            return true;
+        }
+
+        /// <summary>
+        /// Returns the concrete, public SampleBase types of the player assemblies which project
+        /// scripts can reference, ordered by name.
+        /// </summary>
+        public static List<Type> FindSampleTypes()
+        {
+            var assemblies = new HashSet<string>();
+            foreach (var assembly in CompilationPipeline.GetAssemblies(AssembliesType.PlayerWithoutTestAssemblies))
+            {
+                var asmdefPath = CompilationPipeline.GetAssemblyDefinitionFilePathFromAssemblyName(assembly.name);
+                if (!string.IsNullOrEmpty(asmdefPath))
+                {
+                    var asmdef = new AssemblyDefinition();
+                    JsonUtility.FromJsonOverwrite(File.ReadAllText(asmdefPath), asmdef);
+                    if (!asmdef.autoReferenced)
+                    {
+                        continue;
+                    }
+                }
+
+                assemblies.Add(assembly.name);
+            }
+
+            return TypeCache.GetTypesDerivedFrom<SampleBase>()
+                .Where(type => !type.IsAbstract
+                    && !type.ContainsGenericParameters
+                    && type.IsVisible
+                    && assemblies.Contains(type.Assembly.GetName().Name))
+                .OrderBy(type => type.FullName, StringComparer.Ordinal)
+                .ToList();
+        }
+
+        /// <summary>
+        /// Returns the source of a script registering the accessors of the given sample types.
+        /// </summary>
+        public static string GenerateSource(IList<Type> sampleTypes)
+        {
+            var sb = new StringBuilder();
+            sb.AppendLine("// This file is generated by Unity.Formats.USD.UsdSampleAccessorGenerator. Do not modify by hand.");
+            sb.AppendLine("// Regenerate it with USD > Generate Sample Accessors after changing a SampleBase type.");
+            sb.AppendLine();
+            sb.AppendLine("#if UNITY_EDITOR || UNITY_STANDALONE_WIN || UNITY_STANDALONE_OSX");
+            sb.AppendLine("namespace Unity.Formats.USD.Generated");
+            sb.AppendLine("{");
+            sb.AppendLine("    [UnityEngine.Scripting.Preserve]");
+            sb.AppendLine("    static class UsdSampleAccessors");
+            sb.AppendLine("    {");
+            sb.AppendLine("#if UNITY_EDITOR");
+            sb.AppendLine("        [UnityEditor.InitializeOnLoadMethod]");
+            sb.AppendLine("#endif");
+            sb.AppendLine("        [UnityEngine.RuntimeInitializeOnLoadMethod(UnityEngine.RuntimeInitializeLoadType.BeforeSceneLoad)]");
+            sb.AppendLine("        [UnityEngine.Scripting.Preserve]");
+            sb.AppendLine("        static void Register()");
+            sb.AppendLine("        {");
+            for (int i = 0; i < sampleTypes.Count; i++)
+            {
+                sb.AppendLine("            Register" + i + "();");
+            }
+            sb.AppendLine("        }");
+
+            for (int i = 0; i < sampleTypes.Count; i++)
+            {
+                var type = sampleTypes[i];
+                var typeName = GetTypeName(type);
+                sb.AppendLine();
+                sb.AppendLine("        // " + type.FullName);
+                sb.AppendLine("        static void Register" + i + "()");
+                sb.AppendLine("        {");
+                sb.AppendLine("            var accessor = new global::USD.NET.SampleAccessor(typeof(" + typeName + "));");
+
+                var properties = type.GetProperties(BindingFlags.Public | BindingFlags.Instance);
+                foreach (var prop in properties)
+                {
+                    if (prop.GetIndexParameters().Length > 0
+                        || properties.Count(p => p.Name == prop.Name) > 1
+                        || !IsAccessible(prop.PropertyType))
+                    {
+                        continue;
+                    }
+
+                    var getter = prop.GetGetMethod() != null ? GetGetter(typeName, prop.Name) : "null";
+                    var setter = prop.GetSetMethod() != null ? GetSetter(typeName, prop.Name, prop.PropertyType) : "null";
+                    sb.AppendLine("            accessor.AddProperty(\"" + prop.Name + "\", " + getter + ", " + setter + ");");
+                }
+
+                var fields = type.GetFields(BindingFlags.Public | BindingFlags.Instance);
+                foreach (var field in fields)
+                {
+                    if (fields.Count(f => f.Name == field.Name) > 1 || !IsAccessible(field.FieldType))
+                    {
+                        continue;
+                    }
+
+                    var setter = field.IsInitOnly ? "null" : GetSetter(typeName, field.Name, field.FieldType);
+                    sb.AppendLine("            accessor.AddField(\"" + field.Name + "\", " + GetGetter(typeName, field.Name) + ", " + setter + ");");
+                }
+
+                sb.AppendLine("            global::USD.NET.SampleAccessors.Register(accessor);");
+                sb.AppendLine("        }");
+            }
+
+            sb.AppendLine("    }");
+            sb.AppendLine("}");
+            sb.AppendLine("#endif");
+            return sb.ToString();
+        }
+
+        static string GetGetter(string typeName, string memberName)
+        {
+            return "s => ((" + typeName + ")s).@" + memberName;
+        }
+
+        static string GetSetter(string typeName, string memberName, Type memberType)
+        {
+            var memberTypeName = GetTypeName(memberType);
+
+            // Like FieldInfo.SetValue, assign the default value of value types when given null.
+            var value = memberType.IsValueType && Nullable.GetUnderlyingType(memberType) == null
+                ? "v == null ? default(" + memberTypeName + ") : (" + memberTypeName + ")v"
+                : "(" + memberTypeName + ")v";
+            return "(s, v) => ((" + typeName + ")s).@" + memberName + " = " + value;
+        }
+
+        /// <summary>
+        /// Returns true if the type can be named from generated code.
+        /// </summary>
+        static bool IsAccessible(Type type)
+        {
+            if (type.IsPointer || type.IsByRef || type.ContainsGenericParameters || !type.IsVisible)
+            {
+                return false;
+            }
+
+            if (type.IsArray)
+            {
+                return IsAccessible(type.GetElementType());
+            }
+
+            return !type.IsNested || !type.DeclaringType.IsGenericType;
+        }
+
+        /// <summary>
+        /// Returns the fully qualified C# name of the given type.
+        /// </summary>
+        static string GetTypeName(Type type)
+        {
+            if (type.IsArray)
+            {
+                return GetTypeName(type.GetElementType()) + "[" + new string(',', type.GetArrayRank() - 1) + "]";
+            }
+
+            var name = type.Name;
+            if (type.IsGenericType)
+            {
+                name = name.Substring(0, name.IndexOf('`'))
+                    + "<" + string.Join(", ", type.GetGenericArguments().Select(GetTypeName).ToArray()) + ">";
+            }
+
+            if (type.IsNested)
+            {
+                return GetTypeName(type.DeclaringType) + "." + name;
+            }
+
+            return "global::" + (string.IsNullOrEmpty(type.Namespace) ? "" : type.Namespace + ".") + name;
+        }
+    }
+}
@@ -165,6 +165,9 @@ namespace Unity.Formats.USD
         public bool m_importPointInstances = true;
         public bool m_importMonoBehaviors = false;
 
+        [Tooltip("Stores imported meshes on disk and restores them when the layers and settings are unchanged")]
+        public bool m_useImportCache = false;
+
 #if false
         [Header("Export Settings")]
         public bool m_exportCameras = true;
@@ -198,6 +201,7 @@ namespace Unity.Formats.USD
         private Scene m_lastScene;
         private PrimMap m_lastPrimMap = null;
         private AccessMask m_lastAccessMask = null;
+        private TimeVaryingIndex m_lastTimeVaryingIndex = null;
 
 #if UNITY_EDITOR
         /// <summary>
@@ -274,6 +278,7 @@ namespace Unity.Formats.USD
             m_importSceneInstances = options.importSceneInstances;
             m_importPointInstances = options.importPointInstances;
             m_importMonoBehaviors = options.importMonoBehaviours;
+            m_useImportCache = options.useImportCache;
 
             // Mesh options.
             m_points = options.meshOptions.points;
@@ -323,6 +328,7 @@ namespace Unity.Formats.USD
             options.importSceneInstances = m_importSceneInstances;
             options.importPointInstances = m_importPointInstances;
             options.importMonoBehaviours = m_importMonoBehaviors;
+            options.useImportCache = m_useImportCache;
 
             // Mesh options.
             options.meshOptions.points = m_points;
@@ -391,6 +397,7 @@ namespace Unity.Formats.USD
                 m_lastScene = Scene.Open(stage);
                 m_lastPrimMap = null;
                 m_lastAccessMask = null;
+                m_lastTimeVaryingIndex = null;
 
                 // TODO: This is potentially horrible in terms of performance, LoadAndUnload should be used
                 // instead, but the binding is not complete.
@@ -438,6 +445,7 @@ namespace Unity.Formats.USD
         {
             m_lastPrimMap = null;
             m_lastAccessMask = null;
+            m_lastTimeVaryingIndex = null;
             if (m_lastScene != null)
             {
                 m_lastScene.Close();
@@ -467,6 +475,7 @@ namespace Unity.Formats.USD
             m_lastScene = null;
             m_lastPrimMap = null;
             m_lastAccessMask = null;
+            m_lastTimeVaryingIndex = null;
         }
 
         /// <summary>
@@ -726,6 +735,20 @@ namespace Unity.Formats.USD
                     m_lastAccessMask = new AccessMask();
                     scene.IsPopulatingAccessMask = true;
                 }
+
+                if (m_lastTimeVaryingIndex == null || m_lastTimeVaryingIndex.RootPath != options.usdRootPath)
+                {
+                    m_lastTimeVaryingIndex = scene.ComputeTimeVaryingIndex(options.usdRootPath);
+                }
+
+                m_lastAccessMask.TimeVarying = m_lastTimeVaryingIndex;
+
+                // Nothing under the root varies over time, so there is nothing to update once the
+                // initial values have been read.
+                if (!scene.IsPopulatingAccessMask && !options.importHierarchy && m_lastTimeVaryingIndex.Count == 0)
+                {
+                    return;
+                }
             }
             else
             {
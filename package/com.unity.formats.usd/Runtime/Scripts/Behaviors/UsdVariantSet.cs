@@ -57,6 +57,16 @@ namespace Unity.Formats.USD
             m_primPath = prim.GetPath();
         }
 
+        /// <summary>
+        /// Loads the variant sets and selection state of a prim from a hierarchy snapshot, without
+        /// querying USD.
+        /// </summary>
+        internal void LoadFromHierarchy(USD.NET.PrimHierarchy hierarchy, int prim)
+        {
+            hierarchy.GetVariantSets(prim, out m_variantSetNames, out m_selected, out m_variants, out m_variantCounts);
+            m_primPath = hierarchy.GetPath(prim);
+        }
+
         /// <summary>
         /// Syncs the current Unity state to USD and reimports any affected GameObjects. Note that this
         /// may result in the objects being destroyed and recreated.
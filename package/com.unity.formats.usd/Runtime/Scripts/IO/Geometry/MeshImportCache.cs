@@ -0,0 +1,595 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Security.Cryptography;
+using System.Text;
+using UnityEngine;
+using UnityEngine.Rendering;
+using USD.NET;
+
+namespace Unity.Formats.USD
+{
+    /// <summary>
+    /// A persistent cache of imported meshes on disk, so that importing unchanged USD layers again
+    /// with the same options does not require reading and converting the meshes again.
+    /// </summary>
+    /// <remarks>
+    /// Each entry holds the final Unity mesh data of one USD mesh, after triangulation, the
+    /// computation of normals and tangents, the import of UVs and the generation of lightmap UVs,
+    /// together with what is needed to bind its materials. Entries are keyed by a hash of the
+    /// identifiers and modification state of every layer used by the stage, the import options and
+    /// the time, plus the prim path, so editing any layer invalidates all entries of the stage.
+    ///
+    /// Entries are stored in a compact binary format, one file per mesh, and read through memory
+    /// mapped files. When the total size of the cache exceeds its limit, the least recently used
+    /// entries are evicted by Trim().
+    /// </remarks>
+    public class MeshImportCache
+    {
+        // Bump the version when the file format or the conversion of the meshes changes, it is part
+        // of the scene key so that older entries are never read.
+        private const int kMagic = 0x4D445355; // "USDM"
+        private const int kVersion = 1;
+        private const string kExtension = ".mesh";
+        private const int kUvChannelCount = 8;
+
+        private const int kHasNormals = 1 << 0;
+        private const int kHasTangents = 1 << 1;
+        private const int kHasColors = 1 << 2;
+        private const int kHasDisplayColor = 1 << 3;
+        private const int kInactive = 1 << 4;
+
+        /// <summary>
+        /// What is needed, besides the mesh data, to restore a cached mesh.
+        /// </summary>
+        public class Entry
+        {
+            /// <summary>
+            /// False when the GameObject of the mesh should be deactivated, e.g. for guides.
+            /// </summary>
+            public bool active = true;
+
+            /// <summary>
+            /// The constant display color of the mesh, if any.
+            /// </summary>
+            public Color? displayColor;
+
+            /// <summary>
+            /// The paths of the geometry subsets bound to each sub-mesh, empty when the mesh has a
+            /// single sub-mesh bound through the mesh itself.
+            /// </summary>
+            public string[] subsetPaths = new string[0];
+        }
+
+        /// <summary>
+        /// The directory used when none is given in the import options.
+        /// </summary>
+        public static string DefaultDirectory
+        {
+            get { return Path.Combine(Application.temporaryCachePath, "UsdImportCache"); }
+        }
+
+        /// <summary>
+        /// The directory holding the entries.
+        /// </summary>
+        public string Directory { get; private set; }
+
+        /// <summary>
+        /// The total size in bytes above which Trim() evicts entries.
+        /// </summary>
+        public long SizeLimit { get; private set; }
+
+        public MeshImportCache(string directory, long sizeLimit)
+        {
+            Directory = directory;
+            SizeLimit = sizeLimit;
+        }
+
+        /// <summary>
+        /// Returns the cache of the given import options, or null when it is disabled.
+        /// </summary>
+        public static MeshImportCache FromOptions(SceneImportOptions options)
+        {
+            if (!options.useImportCache)
+            {
+                return null;
+            }
+
+            var directory = string.IsNullOrEmpty(options.importCacheDirectory)
+                ? DefaultDirectory
+                : options.importCacheDirectory;
+            return new MeshImportCache(directory, options.importCacheSizeLimit);
+        }
+
+        /// <summary>
+        /// Returns a key identifying the current state of every layer used by the scene, the current
+        /// time and the import options, or null when the scene cannot be cached.
+        /// </summary>
+        /// <remarks>
+        /// Layers backed by a file are identified by the size and modification time of the file, or
+        /// of the package holding them, e.g. a .usdz, and anonymous layers and layers with unsaved
+        /// edits by a hash of their content. Scenes read through an AccessMask, i.e. during
+        /// playback, are not cached.
+        /// </remarks>
+        public static string ComputeSceneKey(Scene scene, SceneImportOptions options)
+        {
+            if (scene.AccessMask != null)
+            {
+                return null;
+            }
+
+            var layerKeys = new List<string>();
+            foreach (var layer in scene.Stage.GetUsedLayers())
+            {
+                var identifier = layer.GetIdentifier();
+                var realPath = layer.GetRealPath();
+                var filePath = GetLayerFilePath(realPath);
+                if (layer.IsAnonymous() || layer.IsDirty() || string.IsNullOrEmpty(filePath) || !File.Exists(filePath))
+                {
+                    layerKeys.Add(identifier + "|" + Hash(layer.ExportToString()));
+                }
+                else
+                {
+                    var info = new FileInfo(filePath);
+                    layerKeys.Add(identifier + "|" + realPath + "|" + info.Length + "|" + info.LastWriteTimeUtc.Ticks);
+                }
+            }
+
+            // The order of the used layers is not specified.
+            layerKeys.Sort(StringComparer.Ordinal);
+
+            var key = new StringBuilder();
+            key.Append(kVersion).Append('\n');
+            foreach (var layerKey in layerKeys)
+            {
+                key.Append(layerKey).Append('\n');
+            }
+
+            key.Append(scene.Time.HasValue ? scene.Time.Value.ToString("R") : "default").Append('\n');
+            AppendOptions(key, options);
+            return Hash(key.ToString());
+        }
+
+        /// <summary>
+        /// Returns the key of the entry of the given prim.
+        /// </summary>
+        public static string GetEntryKey(string sceneKey, string primPath)
+        {
+            return Hash(sceneKey + "|" + primPath);
+        }
+
+        /// <summary>
+        /// Returns true if there is an entry with the given key.
+        /// </summary>
+        public bool Contains(string entryKey)
+        {
+            return File.Exists(GetEntryPath(entryKey));
+        }
+
+        /// <summary>
+        /// Reads the entry with the given key into the given mesh, replacing its content.
+        /// </summary>
+        /// <remarks>
+        /// The entry is read through a memory mapped file and marked as recently used. Throws when
+        /// the entry is invalid, in which case it is removed from the cache and the mesh is left
+        /// unchanged, so the caller can build it from USD instead.
+        /// </remarks>
+        public Entry Load(string entryKey, Mesh mesh)
+        {
+            var path = GetEntryPath(entryKey);
+            Entry entry;
+            try
+            {
+                var length = new FileInfo(path).Length;
+                using (var file = MemoryMappedFile.CreateFromFile(path, FileMode.Open, null, 0, MemoryMappedFileAccess.Read))
+                using (var view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read))
+                {
+                    entry = Read(view, length, mesh);
+                }
+            }
+            catch (Exception)
+            {
+                try
+                {
+                    File.Delete(path);
+                }
+                catch (IOException)
+                {
+                    // The entry is in use, it is rejected again by the next load.
+                }
+                catch (UnauthorizedAccessException)
+                {
+                    // The entry is read-only or locked, it is rejected again by the next load.
+                }
+
+                throw;
+            }
+
+            File.SetLastAccessTimeUtc(path, DateTime.UtcNow);
+            return entry;
+        }
+
+        /// <summary>
+        /// Writes the given mesh as the entry with the given key, replacing any previous entry.
+        /// </summary>
+        public void Store(string entryKey, Mesh mesh, Entry entry)
+        {
+            System.IO.Directory.CreateDirectory(Directory);
+
+            // Write to a temporary file first, so a partially written entry is never read.
+            var path = GetEntryPath(entryKey);
+            var tempPath = path + "." + Guid.NewGuid().ToString("N");
+            using (var writer = new BinaryWriter(File.Create(tempPath)))
+            {
+                Write(writer, mesh, entry);
+            }
+
+            if (File.Exists(path))
+            {
+                File.Delete(path);
+            }
+
+            File.Move(tempPath, path);
+        }
+
+        /// <summary>
+        /// Evicts the least recently used entries until the total size of the cache is within
+        /// SizeLimit.
+        /// </summary>
+        public void Trim()
+        {
+            var directory = new DirectoryInfo(Directory);
+            if (!directory.Exists)
+            {
+                return;
+            }
+
+            var files = directory.GetFiles("*" + kExtension);
+            long totalSize = 0;
+            foreach (var file in files)
+            {
+                totalSize += file.Length;
+            }
+
+            if (totalSize <= SizeLimit)
+            {
+                return;
+            }
+
+            Array.Sort(files, (a, b) => a.LastAccessTimeUtc.CompareTo(b.LastAccessTimeUtc));
+            foreach (var file in files)
+            {
+                if (totalSize <= SizeLimit)
+                {
+                    break;
+                }
+
+                try
+                {
+                    var length = file.Length;
+                    file.Delete();
+                    totalSize -= length;
+                }
+                catch (IOException)
+                {
+                    // The entry is in use, leave it for the next trim.
+                }
+                catch (UnauthorizedAccessException)
+                {
+                    // The entry is read-only or locked, leave it for the next trim.
+                }
+            }
+        }
+
+        /// <summary>
+        /// Returns the path of the file holding a layer: the outermost package for layers inside a
+        /// package, whose real path is package relative, e.g. "a.usdz" for "a.usdz[b.usdc]".
+        /// </summary>
+        private static string GetLayerFilePath(string realPath)
+        {
+            if (string.IsNullOrEmpty(realPath) || !realPath.EndsWith("]"))
+            {
+                return realPath;
+            }
+
+            var bracket = realPath.IndexOf('[');
+            return bracket > 0 ? realPath.Substring(0, bracket) : realPath;
+        }
+
+        private string GetEntryPath(string entryKey)
+        {
+            return Path.Combine(Directory, entryKey + kExtension);
+        }
+
+        // The options which change the result of the conversion of meshes and the binding of
+        // their materials.
+        private static void AppendOptions(StringBuilder key, SceneImportOptions options)
+        {
+            key.Append(JsonUtility.ToJson(options.meshOptions)).Append('\n');
+            key.Append(options.changeHandedness).Append('|')
+                .Append(options.scale.ToString("R")).Append('|')
+                .Append(options.interpolate).Append('|')
+                .Append(options.payloadPolicy).Append('|')
+                .Append(options.importSkinning).Append('|')
+                .Append(options.importSkinWeights).Append('|')
+                .Append(options.materialImportMode).Append('|')
+                .Append(options.useDisplayColorAsFallbackMaterial).Append('\n');
+        }
+
+        private static string Hash(string value)
+        {
+            using (var md5 = MD5.Create())
+            {
+                var hash = md5.ComputeHash(Encoding.UTF8.GetBytes(value));
+                var hex = new StringBuilder(hash.Length * 2);
+                foreach (var b in hash)
+                {
+                    hex.Append(b.ToString("x2"));
+                }
+
+                return hex.ToString();
+            }
+        }
+
+        //
+        // File format, little-endian:
+        //   int magic, int version, int flags, int indexFormat, float[6] bounds center and extents,
+        //   float[4] display color, int vertexCount, int[8] uv dimensions (0 when absent),
+        //   int subMeshCount, int[subMeshCount] index counts, int subsetPathCount, then for each
+        //   subset path an int byte count and its UTF-8 bytes,
+        //   then the vertices, normals, tangents, colors, uvs and the indices of each sub-mesh.
+        //
+
+        private static void Write(BinaryWriter writer, Mesh mesh, Entry entry)
+        {
+            var vertices = mesh.vertices;
+            var normals = mesh.normals;
+            var tangents = mesh.tangents;
+            var colors = mesh.colors;
+
+            var flags = 0;
+            if (normals.Length == vertices.Length && vertices.Length > 0) flags |= kHasNormals;
+            if (tangents.Length == vertices.Length && vertices.Length > 0) flags |= kHasTangents;
+            if (colors.Length == vertices.Length && vertices.Length > 0) flags |= kHasColors;
+            if (entry.displayColor.HasValue) flags |= kHasDisplayColor;
+            if (!entry.active) flags |= kInactive;
+
+            writer.Write(kMagic);
+            writer.Write(kVersion);
+            writer.Write(flags);
+            writer.Write((int)mesh.indexFormat);
+            Write(writer, mesh.bounds.center);
+            Write(writer, mesh.bounds.extents);
+            var displayColor = entry.displayColor.GetValueOrDefault();
+            writer.Write(displayColor.r);
+            writer.Write(displayColor.g);
+            writer.Write(displayColor.b);
+            writer.Write(displayColor.a);
+
+            writer.Write(vertices.Length);
+            var uvDimensions = new int[kUvChannelCount];
+            for (int i = 0; i < kUvChannelCount; i++)
+            {
+                var attribute = VertexAttribute.TexCoord0 + i;
+                uvDimensions[i] = mesh.HasVertexAttribute(attribute) ? mesh.GetVertexAttributeDimension(attribute) : 0;
+                writer.Write(uvDimensions[i]);
+            }
+
+            var indices = new int[mesh.subMeshCount][];
+            writer.Write(indices.Length);
+            for (int i = 0; i < indices.Length; i++)
+            {
+                indices[i] = mesh.GetTriangles(i);
+                writer.Write(indices[i].Length);
+            }
+
+            writer.Write(entry.subsetPaths.Length);
+            foreach (var subsetPath in entry.subsetPaths)
+            {
+                var bytes = Encoding.UTF8.GetBytes(subsetPath);
+                writer.Write(bytes.Length);
+                writer.Write(bytes);
+            }
+
+            foreach (var vertex in vertices) Write(writer, vertex);
+            if ((flags & kHasNormals) != 0) foreach (var normal in normals) Write(writer, normal);
+            if ((flags & kHasTangents) != 0) foreach (var tangent in tangents) Write(writer, tangent);
+            if ((flags & kHasColors) != 0)
+            {
+                foreach (var color in colors)
+                {
+                    writer.Write(color.r);
+                    writer.Write(color.g);
+                    writer.Write(color.b);
+                    writer.Write(color.a);
+                }
+            }
+
+            var uvs = new List<Vector4>();
+            for (int i = 0; i < kUvChannelCount; i++)
+            {
+                if (uvDimensions[i] == 0)
+                {
+                    continue;
+                }
+
+                mesh.GetUVs(i, uvs);
+                foreach (var uv in uvs)
+                {
+                    for (int d = 0; d < uvDimensions[i]; d++)
+                    {
+                        writer.Write(uv[d]);
+                    }
+                }
+            }
+
+            foreach (var subMeshIndices in indices)
+            {
+                foreach (var index in subMeshIndices)
+                {
+                    writer.Write(index);
+                }
+            }
+        }
+
+        private static void Write(BinaryWriter writer, Vector3 value)
+        {
+            writer.Write(value.x);
+            writer.Write(value.y);
+            writer.Write(value.z);
+        }
+
+        private static void Write(BinaryWriter writer, Vector4 value)
+        {
+            writer.Write(value.x);
+            writer.Write(value.y);
+            writer.Write(value.z);
+            writer.Write(value.w);
+        }
+
+        // The whole entry is read and validated before the mesh is modified, so that an invalid
+        // entry leaves the mesh unchanged.
+        private static Entry Read(MemoryMappedViewAccessor view, long length, Mesh mesh)
+        {
+            long pos = 0;
+            if (ReadInt(view, length, ref pos) != kMagic || ReadInt(view, length, ref pos) != kVersion)
+            {
+                throw new InvalidDataException("Not a mesh import cache entry");
+            }
+
+            var entry = new Entry();
+            var flags = ReadInt(view, length, ref pos);
+            var indexFormat = (IndexFormat)ReadInt(view, length, ref pos);
+            if (indexFormat != IndexFormat.UInt16 && indexFormat != IndexFormat.UInt32)
+            {
+                throw new InvalidDataException("Unexpected index format: " + indexFormat);
+            }
+
+            var bounds = new Bounds();
+            bounds.center = ReadArray<Vector3>(view, length, ref pos, 1, 12)[0];
+            bounds.extents = ReadArray<Vector3>(view, length, ref pos, 1, 12)[0];
+            var displayColor = ReadArray<Color>(view, length, ref pos, 1, 16)[0];
+            entry.active = (flags & kInactive) == 0;
+            entry.displayColor = (flags & kHasDisplayColor) != 0 ? displayColor : (Color?)null;
+
+            var vertexCount = ReadInt(view, length, ref pos);
+            var uvDimensions = ReadArray<int>(view, length, ref pos, kUvChannelCount, 4);
+            var subMeshCount = ReadInt(view, length, ref pos);
+            var indexCounts = ReadArray<int>(view, length, ref pos, subMeshCount, 4);
+            var subsetPathCount = ReadInt(view, length, ref pos);
+            if (subsetPathCount < 0 || (long)subsetPathCount * 4 > length - pos)
+            {
+                throw new InvalidDataException("Truncated mesh import cache entry");
+            }
+
+            entry.subsetPaths = new string[subsetPathCount];
+            for (int i = 0; i < entry.subsetPaths.Length; i++)
+            {
+                var bytes = ReadArray<byte>(view, length, ref pos, ReadInt(view, length, ref pos), 1);
+                entry.subsetPaths[i] = Encoding.UTF8.GetString(bytes);
+            }
+
+            var vertices = ReadArray<Vector3>(view, length, ref pos, vertexCount, 12);
+            var normals = (flags & kHasNormals) != 0 ? ReadArray<Vector3>(view, length, ref pos, vertexCount, 12) : null;
+            var tangents = (flags & kHasTangents) != 0 ? ReadArray<Vector4>(view, length, ref pos, vertexCount, 16) : null;
+            var colors = (flags & kHasColors) != 0 ? ReadArray<Color>(view, length, ref pos, vertexCount, 16) : null;
+
+            var uvs = new Array[kUvChannelCount];
+            for (int i = 0; i < kUvChannelCount; i++)
+            {
+                switch (uvDimensions[i])
+                {
+                    case 0:
+                        break;
+                    case 2:
+                        uvs[i] = ReadArray<Vector2>(view, length, ref pos, vertexCount, 8);
+                        break;
+                    case 3:
+                        uvs[i] = ReadArray<Vector3>(view, length, ref pos, vertexCount, 12);
+                        break;
+                    case 4:
+                        uvs[i] = ReadArray<Vector4>(view, length, ref pos, vertexCount, 16);
+                        break;
+                    default:
+                        throw new InvalidDataException("Unexpected uv dimension: " + uvDimensions[i]);
+                }
+            }
+
+            var indices = new int[subMeshCount][];
+            for (int i = 0; i < subMeshCount; i++)
+            {
+                indices[i] = ReadArray<int>(view, length, ref pos, indexCounts[i], 4);
+                foreach (var index in indices[i])
+                {
+                    if (index < 0 || index >= vertexCount)
+                    {
+                        throw new InvalidDataException("Vertex index out of range: " + index);
+                    }
+                }
+            }
+
+            if (pos != length)
+            {
+                throw new InvalidDataException("Unexpected size of mesh import cache entry");
+            }
+
+            mesh.Clear();
+            mesh.indexFormat = indexFormat;
+            mesh.vertices = vertices;
+            if (normals != null) mesh.normals = normals;
+            if (tangents != null) mesh.tangents = tangents;
+            if (colors != null) mesh.colors = colors;
+
+            for (int i = 0; i < kUvChannelCount; i++)
+            {
+                if (uvs[i] is Vector2[]) mesh.SetUVs(i, (Vector2[])uvs[i]);
+                else if (uvs[i] is Vector3[]) mesh.SetUVs(i, (Vector3[])uvs[i]);
+                else if (uvs[i] is Vector4[]) mesh.SetUVs(i, (Vector4[])uvs[i]);
+            }
+
+            mesh.subMeshCount = subMeshCount;
+            for (int i = 0; i < subMeshCount; i++)
+            {
+                mesh.SetTriangles(indices[i], i, calculateBounds: false);
+            }
+
+            mesh.bounds = bounds;
+            return entry;
+        }
+
+        private static int ReadInt(MemoryMappedViewAccessor view, long length, ref long pos)
+        {
+            return ReadArray<int>(view, length, ref pos, 1, 4)[0];
+        }
+
+        // Reads count values, throwing when they extend past the length of the entry. The capacity
+        // of the view is not used, since it is rounded up to a whole page on some platforms.
+        private static T[] ReadArray<T>(MemoryMappedViewAccessor view, long length, ref long pos, int count, int elementSize) where T : struct
+        {
+            if (count < 0 || pos + (long)count * elementSize > length)
+            {
+                throw new InvalidDataException("Truncated mesh import cache entry");
+            }
+
+            var values = new T[count];
+            view.ReadArray(pos, values, 0, count);
+            pos += (long)count * elementSize;
+            return values;
+        }
+    }
+}
@@ -53,10 +53,45 @@ namespace Unity.Formats.USD
 
         ReadAllJob<SanitizedMeshSample> m_readMeshesJob;
 
+        // The import cache of the current import, when enabled, the meshes found in it, which are
+        // not read from USD, and the meshes to store in it once their materials are bound.
+        MeshImportCache m_importCache;
+        string m_sceneKey;
+        SdfPath[] m_cachedMeshPaths = new SdfPath[0];
+        List<KeyValuePair<SdfPath, MeshImportCache.Entry>> m_meshesToCache =
+            new List<KeyValuePair<SdfPath, MeshImportCache.Entry>>();
+
         public void BeginReading(Scene scene, PrimMap primMap, SceneImportOptions importOptions)
         {
-            m_readMeshesJob = new ReadAllJob<SanitizedMeshSample>(scene, primMap.Meshes, importOptions);
-            m_readMeshesJob.Schedule(primMap.Meshes.Length, 2);
+            var meshPaths = SceneImporter.GetPathsToRead(scene, primMap.Meshes);
+
+            // The cache holds the meshes built by MeshImporter.BuildMesh, a custom importer reads
+            // every mesh from USD.
+            m_importCache = UsesDefaultMeshImporter() ? MeshImportCache.FromOptions(importOptions) : null;
+            m_sceneKey = m_importCache == null ? null : MeshImportCache.ComputeSceneKey(scene, importOptions);
+            m_cachedMeshPaths = new SdfPath[0];
+            m_meshesToCache.Clear();
+            if (m_sceneKey != null)
+            {
+                var cachedPaths = new List<SdfPath>();
+                var uncachedPaths = new List<SdfPath>();
+                foreach (var path in meshPaths)
+                {
+                    var isCached = m_importCache.Contains(MeshImportCache.GetEntryKey(m_sceneKey, path));
+                    (isCached ? cachedPaths : uncachedPaths).Add(path);
+                }
+
+                m_cachedMeshPaths = cachedPaths.ToArray();
+                meshPaths = uncachedPaths.ToArray();
+            }
+
+            m_readMeshesJob = new ReadAllJob<SanitizedMeshSample>(scene, meshPaths, importOptions);
+            m_readMeshesJob.Schedule(meshPaths.Length, 2);
+        }
+
+        bool UsesDefaultMeshImporter()
+        {
+            return m_meshImporter == (MeshImportFunction<SanitizedMeshSample>)MeshImporter.BuildMesh;
         }
 
         public System.Collections.IEnumerator Import(Scene scene,
@@ -123,80 +158,234 @@ namespace Unity.Formats.USD
                     }
                 }
 
-                Profiler.BeginSample("USD: Build Meshes");
+                ImportMesh(scene, primMap, importOptions, pathAndSample.path, pathAndSample.sample, isDynamic);
+                yield return null;
+            } // foreach mesh
+
+            if (m_cachedMeshPaths.Length == 0)
+            {
+                yield break;
+            }
+
+            // The meshes found in the import cache are not read from USD, so their transforms are
+            // computed in a single call instead.
+            double[] localXforms = null;
+            int[] xformFlags = null;
+            if (importOptions.importTransforms)
+            {
+                localXforms = new double[m_cachedMeshPaths.Length * 16];
+                xformFlags = new int[m_cachedMeshPaths.Length];
+                scene.ComputeTransforms(m_cachedMeshPaths, localXforms, null, xformFlags);
+            }
+
+            var uncachedPaths = new List<SdfPath>();
+            for (int i = 0; i < m_cachedMeshPaths.Length; i++)
+            {
+                var path = m_cachedMeshPaths[i];
+
+                Profiler.BeginSample("USD: Build Cached Meshes");
                 try
                 {
-                    GameObject go = primMap[pathAndSample.path];
-                    NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
+                    GameObject go = primMap[path];
+                    NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(path), importOptions);
 
                     if (importOptions.importTransforms)
                     {
                         Profiler.BeginSample("Build Mesh Xform");
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
+                        XformImporter.BuildXform(localXforms, i, (TransformFlags)xformFlags[i], go, importOptions);
                         Profiler.EndSample();
                     }
 
-                    Profiler.BeginSample("Read Mesh Subsets");
-                    MeshImporter.GeometrySubsets subsets = null;
-                    if (primMap == null || !primMap.MeshSubsets.TryGetValue(pathAndSample.path, out subsets))
+                    try
                     {
-                        subsets = MeshImporter.ReadGeomSubsets(scene, pathAndSample.path);
+                        MeshImporter.BuildMeshFromCache(path,
+                            m_importCache,
+                            MeshImportCache.GetEntryKey(m_sceneKey, path),
+                            go,
+                            importOptions);
                     }
+                    catch (Exception ex)
+                    {
+                        // A cache entry which cannot be restored never fails the import, the mesh
+                        // is read from USD instead.
+                        Debug.LogWarning("Failed to restore cached mesh <" + path + ">, reading it from USD: " + ex.Message);
+                        uncachedPaths.Add(path);
+                    }
+                }
+                catch (Exception ex)
+                {
+                    Debug.LogException(
+                        new SceneImporter.ImportException(
+                            "Error restoring cached mesh <" + path + ">", ex));
+                    primMap.HasErrors = true;
+                }
+
+                Profiler.EndSample();
+                yield return null;
+            } // foreach cached mesh
+
+            if (uncachedPaths.Count == 0)
+            {
+                yield break;
+            }
+
+            var readUncachedJob = new ReadAllJob<SanitizedMeshSample>(scene, uncachedPaths.ToArray(), importOptions);
+            readUncachedJob.Run();
+            foreach (var pathAndSample in readUncachedJob)
+            {
+                ImportMesh(scene, primMap, importOptions, pathAndSample.path, pathAndSample.sample, isDynamic);
+                yield return null;
+            } // foreach mesh missing from the cache
+        }
+
+        void ImportMesh(Scene scene,
+            PrimMap primMap,
+            SceneImportOptions importOptions,
+            SdfPath path,
+            SanitizedMeshSample sample,
+            bool isDynamic)
+        {
+            Profiler.BeginSample("USD: Build Meshes");
+            try
+            {
+                GameObject go = primMap[path];
+                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(path), importOptions);
 
+                if (importOptions.importTransforms)
+                {
+                    Profiler.BeginSample("Build Mesh Xform");
+                    XformImporter.BuildXform(path, sample, go, importOptions, scene);
                     Profiler.EndSample();
+                }
+
+                Profiler.BeginSample("Read Mesh Subsets");
+                MeshImporter.GeometrySubsets subsets = null;
+                if (primMap == null || !primMap.MeshSubsets.TryGetValue(path, out subsets))
+                {
+                    subsets = MeshImporter.ReadGeomSubsets(scene, path);
+                }
 
-                    UsdSkelSkinningQuery skinningQuery;
-                    if (importOptions.importHierarchy)
+                Profiler.EndSample();
+
+                UsdSkelSkinningQuery skinningQuery;
+                if (importOptions.importHierarchy)
+                {
+                    if (importOptions.importSkinning && primMap.SkelCache != null)
                     {
-                        if (importOptions.importSkinning && primMap.SkelCache != null)
-                        {
-                            // This is pre-cached as part of calling skelCache.Populate and IsValid indicates if we
-                            // have the data required to setup a skinned mesh.
-                            Profiler.BeginSample("Get Skinning Query");
-                            skinningQuery = new UsdSkelSkinningQuery();
-                            primMap.SkinningQueries[pathAndSample.path] =
-                                primMap.SkelCache.GetSkinningQuery(scene.GetPrimAtPath(pathAndSample.path));
-                            Profiler.EndSample();
-                        }
+                        // This is pre-cached as part of calling skelCache.Populate and IsValid indicates if we
+                        // have the data required to setup a skinned mesh.
+                        Profiler.BeginSample("Get Skinning Query");
+                        skinningQuery = new UsdSkelSkinningQuery();
+                        primMap.SkinningQueries[path] =
+                            primMap.SkelCache.GetSkinningQuery(scene.GetPrimAtPath(path));
+                        Profiler.EndSample();
+                    }
 
-                        if (importOptions.importMeshes)
-                        {
-                            primMap.MeshSubsets[pathAndSample.path] =
-                                MeshImporter.ReadGeomSubsets(scene, pathAndSample.path);
-                        }
+                    if (importOptions.importMeshes)
+                    {
+                        primMap.MeshSubsets[path] =
+                            MeshImporter.ReadGeomSubsets(scene, path);
                     }
+                }
 
-                    if (importOptions.importSkinning
-                        && primMap.SkelCache != null
-                        && primMap.SkinningQueries.TryGetValue(pathAndSample.path, out skinningQuery)
-                        && skinningQuery.IsValid())
+                if (importOptions.importSkinning
+                    && primMap.SkelCache != null
+                    && primMap.SkinningQueries.TryGetValue(path, out skinningQuery)
+                    && skinningQuery.IsValid())
+                {
+                    Profiler.BeginSample("USD: Build Skinned Mesh");
+                    m_skinnedMeshImporter(path,
+                        sample,
+                        subsets, go, importOptions, isDynamic, skinningQuery);
+                    Profiler.EndSample();
+                }
+                else
+                {
+                    Profiler.BeginSample("USD: Build Mesh");
+                    m_meshImporter(path,
+                        sample,
+                        subsets, go, importOptions, isDynamic);
+                    Profiler.EndSample();
+
+                    if (m_sceneKey != null && sample.points != null)
                     {
-                        Profiler.BeginSample("USD: Build Skinned Mesh");
-                        m_skinnedMeshImporter(pathAndSample.path,
-                            pathAndSample.sample,
-                            subsets, go, importOptions, isDynamic, skinningQuery);
-                        Profiler.EndSample();
+                        m_meshesToCache.Add(new KeyValuePair<SdfPath, MeshImportCache.Entry>(
+                            path, CreateCacheEntry(sample, subsets)));
                     }
-                    else
+                }
+            }
+            catch (Exception ex)
+            {
+                Debug.LogException(
+                    new SceneImporter.ImportException(
+                        "Error processing mesh <" + path + ">", ex));
+                primMap.HasErrors = true;
+            }
+
+            Profiler.EndSample();
+        }
+
+        /// <summary>
+        /// Stores the meshes built by the last import in the import cache, if enabled, then evicts
+        /// the least recently used entries beyond its size limit.
+        /// </summary>
+        /// <remarks>
+        /// Must be called once the material bindings are processed, since the bound materials load
+        /// the UVs of the meshes.
+        /// </remarks>
+        public void StoreImportCache(PrimMap primMap)
+        {
+            if (m_sceneKey == null)
+            {
+                return;
+            }
+
+            Profiler.BeginSample("USD: Store Import Cache");
+            foreach (var pathAndEntry in m_meshesToCache)
+            {
+                try
+                {
+                    var mf = primMap[pathAndEntry.Key].GetComponent<MeshFilter>();
+                    if (mf == null || mf.sharedMesh == null)
                     {
-                        Profiler.BeginSample("USD: Build Mesh");
-                        m_meshImporter(pathAndSample.path,
-                            pathAndSample.sample,
-                            subsets, go, importOptions, isDynamic);
-                        Profiler.EndSample();
+                        continue;
                     }
+
+                    m_importCache.Store(MeshImportCache.GetEntryKey(m_sceneKey, pathAndEntry.Key),
+                        mf.sharedMesh, pathAndEntry.Value);
                 }
                 catch (Exception ex)
                 {
-                    Debug.LogException(
-                        new SceneImporter.ImportException(
-                            "Error processing mesh <" + pathAndSample.path + ">", ex));
-                    primMap.HasErrors = true;
+                    Debug.LogWarning("Failed to cache mesh <" + pathAndEntry.Key + ">: " + ex.Message);
                 }
+            }
 
-                Profiler.EndSample();
-                yield return null;
-            } // foreach mesh
+            m_meshesToCache.Clear();
+
+            try
+            {
+                m_importCache.Trim();
+            }
+            catch (Exception ex)
+            {
+                Debug.LogWarning("Failed to trim the import cache: " + ex.Message);
+            }
+
+            Profiler.EndSample();
+        }
+
+        static MeshImportCache.Entry CreateCacheEntry(SanitizedMeshSample usdMesh, MeshImporter.GeometrySubsets subsets)
+        {
+            var entry = new MeshImportCache.Entry();
+            entry.active = usdMesh.purpose == Purpose.Default;
+            if (usdMesh.colors.value != null && usdMesh.colors.Length == 1)
+            {
+                entry.displayColor = usdMesh.colors.value[0];
+            }
+
+            entry.subsetPaths = new string[subsets.Subsets.Count];
+            subsets.Subsets.Keys.CopyTo(entry.subsetPaths, 0);
+            return entry;
         }
     }
 
@@ -389,6 +578,44 @@ namespace Unity.Formats.USD
             boneWeights1.Dispose();
         }
 
+        /// <summary>
+        /// Restore a mesh stored in the import cache by a previous import, instead of reading it from
+        /// USD, and request the binding of its materials.
+        /// </summary>
+        public static void BuildMeshFromCache(string path,
+            MeshImportCache cache,
+            string entryKey,
+            GameObject go,
+            SceneImportOptions options)
+        {
+            var mf = ImporterBase.GetOrAddComponent<MeshFilter>(go);
+            var mr = ImporterBase.GetOrAddComponent<MeshRenderer>(go);
+            if (mf.sharedMesh == null)
+            {
+                mf.sharedMesh = new Mesh { name = UniqueMeshName(go.name) };
+            }
+
+            Profiler.BeginSample("Load Cached Mesh");
+            var entry = cache.Load(entryKey, mf.sharedMesh);
+            Profiler.EndSample();
+
+            if (!entry.active)
+            {
+                go.SetActive(false);
+            }
+
+            var mat = mr.sharedMaterial;
+            if (ShouldImport(options.meshOptions.color)
+                && entry.displayColor.HasValue
+                && options.useDisplayColorAsFallbackMaterial
+                && options.materialImportMode != MaterialImportMode.None)
+            {
+                mat = options.materialMap.InstantiateSolidColor(entry.displayColor.Value.gamma);
+            }
+
+            RequestMaterialBindings(path, mf.sharedMesh, mr, mat, entry.subsetPaths, options, null);
+        }
+
         /// <summary>
         /// Copy mesh data from USD to Unity with the given import options.
         /// </summary>
@@ -600,39 +827,7 @@ namespace Unity.Formats.USD
             // Materials.
             //
 
-            if (options.materialImportMode != MaterialImportMode.None)
-            {
-                if (mat == null) mat = options.materialMap.InstantiateSolidColor(Color.white);
-
-                if (unityMesh.subMeshCount == 1)
-                {
-                    renderer.sharedMaterial = mat;
-                    if (options.ShouldBindMaterials)
-                        options.materialMap.RequestBinding(
-                            path,
-                            (scene, boundMat, primvars) => BindMat(
-                                unityMesh, boundMat, renderer, path, primvars, usdMesh));
-                }
-                else
-                {
-                    var mats = new Material[unityMesh.subMeshCount];
-                    for (var i = 0; i < mats.Length; i++) mats[i] = mat;
-                    renderer.sharedMaterials = mats;
-                    if (options.ShouldBindMaterials)
-                    {
-                        Debug.Assert(geomSubsets.Subsets.Count == unityMesh.subMeshCount);
-                        var subIndex = 0;
-                        foreach (var kvp in geomSubsets.Subsets)
-                        {
-                            var idx = subIndex++;
-                            options.materialMap.RequestBinding(
-                                kvp.Key,
-                                (scene, boundMat, primvars) => BindMat(
-                                    unityMesh, boundMat, renderer, idx, path, primvars, usdMesh));
-                        }
-                    }
-                }
-            }
+            RequestMaterialBindings(path, unityMesh, renderer, mat, geomSubsets.Subsets.Keys, options, usdMesh);
 
             Profiler.EndSample();
 
@@ -665,13 +860,65 @@ namespace Unity.Formats.USD
 #endif
         }
 
+        /// <summary>
+        /// Assigns the given material, or a white material when null, to every sub-mesh and
+        /// requests the binding of the USD materials of the mesh, or of its geometry subsets when it
+        /// has several sub-meshes. The UV primvars required by the bound materials are read from
+        /// usdMesh, when not null.
+        /// </summary>
+        static void RequestMaterialBindings(string path,
+            Mesh unityMesh,
+            Renderer renderer,
+            Material mat,
+            ICollection<string> subsetPaths,
+            SceneImportOptions options,
+            MeshSample usdMesh)
+        {
+            if (options.materialImportMode == MaterialImportMode.None)
+            {
+                return;
+            }
+
+            if (mat == null) mat = options.materialMap.InstantiateSolidColor(Color.white);
+
+            if (unityMesh.subMeshCount == 1)
+            {
+                renderer.sharedMaterial = mat;
+                if (options.ShouldBindMaterials)
+                    options.materialMap.RequestBinding(
+                        path,
+                        (scene, boundMat, primvars) => BindMat(
+                            unityMesh, boundMat, renderer, path, primvars, usdMesh));
+            }
+            else
+            {
+                var mats = new Material[unityMesh.subMeshCount];
+                for (var i = 0; i < mats.Length; i++) mats[i] = mat;
+                renderer.sharedMaterials = mats;
+                if (options.ShouldBindMaterials)
+                {
+                    Debug.Assert(subsetPaths.Count == unityMesh.subMeshCount);
+                    var subIndex = 0;
+                    foreach (var subsetPath in subsetPaths)
+                    {
+                        var idx = subIndex++;
+                        options.materialMap.RequestBinding(
+                            subsetPath,
+                            (scene, boundMat, primvars) => BindMat(
+                                unityMesh, boundMat, renderer, idx, path, primvars, usdMesh));
+                    }
+                }
+            }
+        }
+
         static void LoadPrimvars(
             Mesh unityMesh,
             string usdMeshPath,
             List<string> primvars,
             MeshSample sample)
         {
-            if (primvars == null || primvars.Count == 0) return;
+            // Cached meshes already hold their UVs.
+            if (sample == null || primvars == null || primvars.Count == 0) return;
 
             for (var i = 0; i < primvars.Count; i++)
             {
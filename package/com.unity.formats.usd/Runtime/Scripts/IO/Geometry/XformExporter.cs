@@ -40,19 +40,27 @@ namespace Unity.Formats.USD
             // If exporting overrides, only export what changed
             if (exportContext.exportTransformOverrides)
             {
-                UnityEngine.Profiling.Profiler.BeginSample("USD: Xform override check");
-                var sourceSample = new XformSample();
-                float tolerance = 0.0001f;
-                exportContext.scene.Read(path, sourceSample);
-                bool areClose = true;
-                for (int i = 0; i < 16; i++)
+                if (exportContext.backgroundWriter != null)
                 {
-                    if (Mathf.Abs(sample.transform[i] - sourceSample.transform[i]) > tolerance)
+                    // The worker thread is writing the stage, so the source transform is read there,
+                    // in order with the samples of the previous frames.
+                    var transform = sample.transform;
+                    var time = exportContext.scene.Time;
+                    var writeMode = exportContext.scene.WriteMode;
+                    SceneExporter.EditStage(exportContext, scene =>
                     {
-                        areClose = false;
-                        break;
-                    }
+                        if (!IsSourceTransform(scene, path, transform, time))
+                        {
+                            var overrideSample = new XformSample();
+                            overrideSample.transform = transform;
+                            scene.WriteSample(path, overrideSample, typeof(XformSample), time, writeMode);
+                        }
+                    });
+                    return;
                 }
+
+                UnityEngine.Profiling.Profiler.BeginSample("USD: Xform override check");
+                bool areClose = IsSourceTransform(exportContext.scene, path, sample.transform, exportContext.scene.Time);
                 UnityEngine.Profiling.Profiler.EndSample();
                 if (areClose)
                 {
@@ -66,6 +74,24 @@ namespace Unity.Formats.USD
             UnityEngine.Profiling.Profiler.EndSample();
         }
 
+        // Returns true if the transform of the prim at the given time matches the given one.
+        static bool IsSourceTransform(Scene scene, pxr.SdfPath path, Matrix4x4 transform, double? time)
+        {
+            var sourceSample = new XformSample();
+            float tolerance = 0.0001f;
+            scene.ReadSample(path, sourceSample, time);
+            bool areClose = true;
+            for (int i = 0; i < 16; i++)
+            {
+                if (Mathf.Abs(transform[i] - sourceSample.transform[i]) > tolerance)
+                {
+                    areClose = false;
+                    break;
+                }
+            }
+            return areClose;
+        }
+
         public static void WriteSparseOverrides(Scene scene,
             PrimMap primMap,
             BasisTransformation changeHandedness,
@@ -52,6 +52,30 @@ namespace Unity.Formats.USD
             BuildXform(usdXf.transform, go, options);
         }
 
+        /// <summary>
+        /// Copies a local transform computed by Scene.ComputeTransforms() from USD to Unity,
+        /// optionally changing handedness in the process.
+        /// </summary>
+        /// <param name="localTransforms">The local transforms, 16 values per prim.</param>
+        /// <param name="index">The index of the prim in localTransforms.</param>
+        /// <param name="flags">The flags computed for the prim.</param>
+        public static void BuildXform(double[] localTransforms,
+            int index,
+            TransformFlags flags,
+            GameObject go,
+            SceneImportOptions options)
+        {
+            // The transform does not vary over time and was already imported.
+            if ((flags & TransformFlags.Skipped) != 0)
+            {
+                return;
+            }
+
+            var xf = UnityTypeConverter.FromMatrix(localTransforms, index * 16);
+            ImportXform(ref xf, options);
+            BuildXform(xf, go, options);
+        }
+
         public static void BuildXform(Matrix4x4 xf,
             GameObject go,
             SceneImportOptions options)
@@ -142,9 +142,10 @@ namespace Unity.Formats.USD
             var bind = new UsdShadeMaterialBindingAPI(m_scene.GetPrimAtPath(m_paths[index]));
             //what happens for materials per face?
             var rel = bind.GetDirectBindingRel();
-            if (rel.GetTargets().Count > 0)
+            var targets = IntrinsicTypeConverter.FromVector(rel.GetTargets());
+            if (targets.Length > 0)
             {
-                materialPath = rel.GetTargets()[0].GetPrimPath();
+                materialPath = targets[0].GetPrimPath();
             }
 
             var primvars = m_importOptions.materialMap.GetPrimvars(materialPath);
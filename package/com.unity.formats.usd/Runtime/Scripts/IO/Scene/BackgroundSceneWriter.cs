@@ -0,0 +1,359 @@
+// Copyright 2023 Unity Technologies. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Reflection;
+using System.Threading;
+using UnityEngine;
+using USD.NET;
+using Stopwatch = System.Diagnostics.Stopwatch;
+
+namespace Unity.Formats.USD
+{
+    /// <summary>
+    /// Serializes the samples written to a Scene on a worker thread, so that the thread sampling
+    /// the Unity scene only has to copy them.
+    /// </summary>
+    /// <remarks>
+    /// Between BeginFrame() and EndFrame(), samples passed to Scene.Write() are copied into pooled
+    /// buffers, along with the stage edits passed to Edit(). EndFrame() queues the frame for the
+    /// worker thread, which writes it to the scene and returns the buffers to the pool.
+    ///
+    /// At most maxQueuedFrames frames wait to be written. When the queue is full, EndFrame() waits
+    /// up to maxWaitMilliseconds for the worker thread to catch up. A frame which had to wait is
+    /// counted as late, a frame which could not be queued in time is discarded and counted as
+    /// dropped.
+    ///
+    /// Arrays of structs are copied, as are samples and the USD.NET objects they hold, such as
+    /// primvars. Other objects, e.g. strings, lists or USD handles, are shared with the worker
+    /// thread and must not be modified once written. While frames are being written, the stage must
+    /// only be edited through Edit().
+    /// </remarks>
+    public class BackgroundSceneWriter : IDisposable
+    {
+        class Record
+        {
+            public pxr.SdfPath path;
+            public SampleBase sample;
+            public Type sampleType;
+            public double? time;
+            public Scene.WriteModes writeMode;
+            public Action<Scene> edit;
+        }
+
+        class Frame
+        {
+            public List<Record> records = new List<Record>();
+            public List<Array> arrays = new List<Array>();
+            public bool isEditOnly;
+        }
+
+        static readonly MethodInfo sm_memberwiseClone =
+            typeof(object).GetMethod("MemberwiseClone", BindingFlags.Instance | BindingFlags.NonPublic);
+
+        readonly Scene m_scene;
+        readonly int m_maxWaitMilliseconds;
+        readonly BlockingCollection<Frame> m_queue;
+        readonly ConcurrentBag<Frame> m_freeFrames = new ConcurrentBag<Frame>();
+        readonly ArrayPool m_arrayPool = new ArrayPool();
+        readonly Dictionary<Type, FieldInfo[]> m_referenceFields = new Dictionary<Type, FieldInfo[]>();
+        readonly SceneWriteHandler m_onWrite;
+        readonly Thread m_thread;
+        Frame m_current;
+
+        long m_submittedFrames;
+        long m_writtenFrames;
+        long m_lateFrames;
+        long m_droppedFrames;
+        long m_waitTicks;
+
+        /// <summary>
+        /// The number of frames passed to EndFrame().
+        /// </summary>
+        public long SubmittedFrames { get { return Interlocked.Read(ref m_submittedFrames); } }
+
+        /// <summary>
+        /// The number of frames written to the scene by the worker thread.
+        /// </summary>
+        public long WrittenFrames { get { return Interlocked.Read(ref m_writtenFrames); } }
+
+        /// <summary>
+        /// The number of frames for which EndFrame() had to wait for the worker thread.
+        /// </summary>
+        public long LateFrames { get { return Interlocked.Read(ref m_lateFrames); } }
+
+        /// <summary>
+        /// The number of frames discarded because the worker thread did not catch up in time.
+        /// </summary>
+        public long DroppedFrames { get { return Interlocked.Read(ref m_droppedFrames); } }
+
+        /// <summary>
+        /// The total time EndFrame() spent waiting for the worker thread.
+        /// </summary>
+        public TimeSpan WaitTime { get { return TimeSpan.FromTicks(Interlocked.Read(ref m_waitTicks)); } }
+
+        /// <summary>
+        /// Starts the worker thread writing to the given scene.
+        /// </summary>
+        /// <param name="scene">The scene to write to</param>
+        /// <param name="maxQueuedFrames">The number of frames which may wait to be written</param>
+        /// <param name="maxWaitMilliseconds">
+        /// How long EndFrame() waits when the queue is full before dropping the frame, or
+        /// Timeout.Infinite to never drop frames
+        /// </param>
+        public BackgroundSceneWriter(Scene scene, int maxQueuedFrames = 2,
+                                     int maxWaitMilliseconds = Timeout.Infinite)
+        {
+            if (maxQueuedFrames < 1)
+            {
+                throw new ArgumentOutOfRangeException("maxQueuedFrames", "At least one frame must be queued");
+            }
+
+            m_scene = scene;
+            m_maxWaitMilliseconds = maxWaitMilliseconds;
+            m_queue = new BlockingCollection<Frame>(maxQueuedFrames);
+            m_onWrite = OnWrite;
+            m_thread = new Thread(Run);
+            m_thread.Name = "USD Scene Writer";
+            m_thread.IsBackground = true;
+            m_thread.Start();
+        }
+
+        /// <summary>
+        /// Starts capturing the samples written to the scene, until EndFrame() is called.
+        /// </summary>
+        public void BeginFrame()
+        {
+            if (m_current != null)
+            {
+                throw new InvalidOperationException("BeginFrame() called twice without EndFrame()");
+            }
+
+            m_current = TakeFrame();
+            m_scene.WriteHandler = m_onWrite;
+        }
+
+        /// <summary>
+        /// Queues the samples captured since BeginFrame() to be written by the worker thread, waiting
+        /// for it to catch up if the queue is full.
+        /// </summary>
+        /// <returns>False if the frame was dropped.</returns>
+        public bool EndFrame()
+        {
+            if (m_current == null)
+            {
+                throw new InvalidOperationException("EndFrame() called without BeginFrame()");
+            }
+
+            m_scene.WriteHandler = null;
+            var frame = m_current;
+            m_current = null;
+            Interlocked.Increment(ref m_submittedFrames);
+
+            if (m_queue.TryAdd(frame))
+            {
+                return true;
+            }
+
+            var stopwatch = Stopwatch.StartNew();
+            bool queued = m_queue.TryAdd(frame, m_maxWaitMilliseconds);
+            Interlocked.Add(ref m_waitTicks, stopwatch.Elapsed.Ticks);
+
+            if (queued)
+            {
+                Interlocked.Increment(ref m_lateFrames);
+                return true;
+            }
+
+            Interlocked.Increment(ref m_droppedFrames);
+            Release(frame);
+            return false;
+        }
+
+        /// <summary>
+        /// Edits the stage on the worker thread, in order with the samples of the current frame. When
+        /// no frame is being captured, the edit is queued on its own, waiting if the queue is full.
+        /// </summary>
+        public void Edit(Action<Scene> edit)
+        {
+            if (m_current == null)
+            {
+                var frame = TakeFrame();
+                frame.isEditOnly = true;
+                frame.records.Add(new Record { edit = edit });
+                m_queue.Add(frame);
+                return;
+            }
+
+            m_current.records.Add(new Record { edit = edit });
+        }
+
+        /// <summary>
+        /// Waits for the queued frames to be written and stops the worker thread.
+        /// </summary>
+        public void Dispose()
+        {
+            if (m_current != null)
+            {
+                EndFrame();
+            }
+
+            if (!m_queue.IsAddingCompleted)
+            {
+                m_queue.CompleteAdding();
+            }
+
+            m_thread.Join();
+        }
+
+        void OnWrite(pxr.SdfPath path, SampleBase sample, Type sampleType, double? time,
+            Scene.WriteModes writeMode)
+        {
+            m_current.records.Add(new Record
+            {
+                path = path,
+                sample = (SampleBase)Copy(sample, m_current),
+                sampleType = sampleType,
+                time = time,
+                writeMode = writeMode,
+            });
+        }
+
+        void Run()
+        {
+            foreach (var frame in m_queue.GetConsumingEnumerable())
+            {
+                foreach (var record in frame.records)
+                {
+                    try
+                    {
+                        if (record.edit != null)
+                        {
+                            record.edit(m_scene);
+                        }
+                        else
+                        {
+                            m_scene.WriteSample(record.path, record.sample, record.sampleType,
+                                record.time, record.writeMode);
+                        }
+                    }
+                    catch (Exception ex)
+                    {
+                        var path = record.path == null ? "stage edit" : record.path.ToString();
+                        Debug.LogException(new Exception("Error writing: " + path, ex));
+                    }
+                }
+
+                if (!frame.isEditOnly)
+                {
+                    Interlocked.Increment(ref m_writtenFrames);
+                }
+
+                Release(frame);
+            }
+        }
+
+        Frame TakeFrame()
+        {
+            Frame frame;
+            if (!m_freeFrames.TryTake(out frame))
+            {
+                frame = new Frame();
+            }
+
+            return frame;
+        }
+
+        void Release(Frame frame)
+        {
+            foreach (var array in frame.arrays)
+            {
+                m_arrayPool.Free(array.GetType(), (uint)array.Length, array);
+            }
+
+            frame.arrays.Clear();
+            frame.records.Clear();
+            frame.isEditOnly = false;
+            m_freeFrames.Add(frame);
+        }
+
+        /// <summary>
+        /// Returns a copy of the value which the caller may go on modifying, see remarks above.
+        /// </summary>
+        object Copy(object value, Frame frame)
+        {
+            if (value == null)
+            {
+                return null;
+            }
+
+            var type = value.GetType();
+            if (type.IsArray)
+            {
+                if (!type.GetElementType().IsValueType)
+                {
+                    return value;
+                }
+
+                var src = (Array)value;
+                var dst = m_arrayPool.Malloc(type, (uint)src.Length);
+                Array.Copy(src, dst, src.Length);
+                frame.arrays.Add(dst);
+                return dst;
+            }
+
+            if (!(value is SampleBase) && type.Namespace != "USD.NET")
+            {
+                return value;
+            }
+
+            var copy = sm_memberwiseClone.Invoke(value, null);
+            foreach (var field in GetReferenceFields(type))
+            {
+                field.SetValue(copy, Copy(field.GetValue(copy), frame));
+            }
+
+            return copy;
+        }
+
+        FieldInfo[] GetReferenceFields(Type type)
+        {
+            FieldInfo[] fields;
+            if (m_referenceFields.TryGetValue(type, out fields))
+            {
+                return fields;
+            }
+
+            var found = new List<FieldInfo>();
+            const BindingFlags kFlags = BindingFlags.Instance | BindingFlags.Public
+                | BindingFlags.NonPublic | BindingFlags.DeclaredOnly;
+            for (var t = type; t != null && t != typeof(object); t = t.BaseType)
+            {
+                foreach (var field in t.GetFields(kFlags))
+                {
+                    if (!field.FieldType.IsValueType && !typeof(Delegate).IsAssignableFrom(field.FieldType))
+                    {
+                        found.Add(field);
+                    }
+                }
+            }
+
+            fields = found.ToArray();
+            m_referenceFields.Add(type, fields);
+            return fields;
+        }
+    }
+}
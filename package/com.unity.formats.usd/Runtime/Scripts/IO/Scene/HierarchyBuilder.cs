@@ -31,13 +31,43 @@ namespace Unity.Formats.USD
     {
         static readonly SdfPath kAbsoluteRootPath = SdfPath.AbsoluteRootPath();
 
+        // The schema types matched by the prim hierarchy snapshot, by index.
+        const int kMaterial = 0;
+        const int kCamera = 1;
+        const int kMesh = 2;
+        const int kCube = 3;
+        const int kSphere = 4;
+        const int kSkelRoot = 5;
+        const int kSkeleton = 6;
+        const int kXform = 7;
+        const int kScope = 8;
+
+        static readonly Type[] kSampleTypes =
+        {
+            typeof(MaterialSample),
+            typeof(CameraSample),
+            typeof(MeshSample),
+            typeof(CubeSample),
+            typeof(SphereSample),
+            typeof(SkelRootSample),
+            typeof(SkeletonSample),
+            typeof(XformSample),
+            typeof(ScopeSample),
+        };
+
         struct HierInfo
         {
+            public int index;
+            public SdfPath path;
             public bool isVisible;
             public bool isInstance;
             public bool isAssembly;
             public bool isModel;
             public bool hasPayload;
+            public bool isLoaded;
+            public string masterPath;
+
+            // Only set for UsdSkelRoot prims.
             public UsdPrim prim;
 
             // Provides a list of all bound skeletons under a UsdSkelRoot.
@@ -53,12 +83,14 @@ namespace Unity.Formats.USD
         {
             public static HierInfo[] result;
             public static Scene scene;
+            public static PrimHierarchy hierarchy;
             public static UsdSkelCache skelCache; // Thread safe.
+            public static int[] prims;
             public static SdfPath[] paths;
 
             public void Run()
             {
-                for (int i = 0; i < paths.Length; i++)
+                for (int i = 0; i < prims.Length; i++)
                 {
                     Execute(i);
                 }
@@ -66,132 +98,132 @@ namespace Unity.Formats.USD
 
             public void Execute(int index)
             {
-                HierInfo info = new HierInfo();
-                info.prim = scene.Stage.GetPrimAtPath(paths[index]);
+                HierInfo info = HierarchyBuilder.ReadHierInfo(hierarchy, prims[index]);
+                info.path = paths[index];
 
-                if (!info.prim)
+                // Skeletons are the only prims which still need to be read from USD.
+                if (hierarchy.IsA(info.index, kSkelRoot))
                 {
-                    info.prim = null;
-                    return;
+                    info.prim = scene.Stage.GetPrimAtPath(info.path);
+                    if (info.prim)
+                    {
+                        HierarchyBuilder.PopulateSkelCache(ref info, ReadHierJob.skelCache);
+                        HierarchyBuilder.ReadSkeletonJoints(ref info);
+                    }
                 }
 
-                info.isVisible = HierarchyBuilder.IsVisible(info.prim);
-                info.isInstance = info.prim.IsInstance();
-                HierarchyBuilder.ReadModelInfo(ref info);
-                HierarchyBuilder.PopulateSkelCache(ref info, ReadHierJob.skelCache);
-                HierarchyBuilder.ReadSkeletonJoints(ref info);
-                info.hasPayload = info.prim.GetPrimIndex().HasAnyPayloads();
-
                 result[index] = info;
             }
         }
 
-        struct FindPathsJob : IJobParallelFor
-        {
-            public interface IQuery
-            {
-                SdfPath[] Find(Scene scene, SdfPath usdRoot);
-            }
-
-            public struct Query<T> : IQuery where T : SampleBase, new()
-            {
-                public SdfPath[] Find(Scene scene, SdfPath usdRoot)
-                {
-                    return scene.Find<T>(usdRoot);
-                }
-            }
-
-            public static SdfPath usdRoot;
-            public static Scene scene;
-            public static SdfPath[][] results;
-            public static IQuery[] queries;
-
-            public void Run()
-            {
-                for (int i = 0; i < queries.Length; i++)
-                {
-                    Execute(i);
-                }
-            }
-
-            public void Execute(int index)
-            {
-                var query = queries[index];
-                if (query == null)
-                {
-                    return;
-                }
-
-                results[index] = query.Find(scene, usdRoot);
-            }
-        }
-
         static JobHandle BeginReading(Scene scene,
             SdfPath usdRoot,
             PrimMap map,
             SceneImportOptions options)
         {
-            FindPathsJob.usdRoot = usdRoot;
-            FindPathsJob.scene = scene;
-            FindPathsJob.results = new SdfPath[9][];
-            FindPathsJob.queries = new FindPathsJob.IQuery[9];
+            // A single native traversal gathers the whole hierarchy under the root, replacing one
+            // query per schema type and several calls into USD per prim.
+            Profiler.BeginSample("Compute Prim Hierarchy");
+            var hierarchy = scene.ComputePrimHierarchy(usdRoot, kSampleTypes);
+            Profiler.EndSample();
+
+            var typeMask = (1 << kSkelRoot) | (1 << kScope);
 
             if (options.ShouldBindMaterials)
             {
-                FindPathsJob.queries[0] = (FindPathsJob.IQuery)new FindPathsJob.Query<MaterialSample>();
+                typeMask |= 1 << kMaterial;
             }
 
             if (options.importCameras)
             {
-                FindPathsJob.queries[1] = (FindPathsJob.IQuery)new FindPathsJob.Query<CameraSample>();
+                typeMask |= 1 << kCamera;
             }
 
             if (options.importMeshes)
             {
-                FindPathsJob.queries[2] = (FindPathsJob.IQuery)new FindPathsJob.Query<MeshSample>();
-                FindPathsJob.queries[3] = (FindPathsJob.IQuery)new FindPathsJob.Query<CubeSample>();
-                FindPathsJob.queries[4] = (FindPathsJob.IQuery)new FindPathsJob.Query<SphereSample>();
+                typeMask |= (1 << kMesh) | (1 << kCube) | (1 << kSphere);
             }
 
-            FindPathsJob.queries[5] = (FindPathsJob.IQuery)new FindPathsJob.Query<SkelRootSample>();
-
             if (options.importSkinning)
             {
-                FindPathsJob.queries[6] = (FindPathsJob.IQuery)new FindPathsJob.Query<SkeletonSample>();
+                typeMask |= 1 << kSkeleton;
             }
 
             if (options.importTransforms)
             {
-                FindPathsJob.queries[7] = (FindPathsJob.IQuery)new FindPathsJob.Query<XformSample>();
+                typeMask |= 1 << kXform;
             }
 
-            FindPathsJob.queries[8] = (FindPathsJob.IQuery)new FindPathsJob.Query<ScopeSample>();
-
-            var findPathsJob = new FindPathsJob();
-            var findHandle = findPathsJob.Schedule(FindPathsJob.queries.Length, 1);
-            findHandle.Complete();
-
             // Note that Scope prims are taken into account when building the hierarchy but not added to the PrimMap
             // This is because Scopes don't need specific import/export logic for now:
             //   * they don't hold any data ton convert on the way in
             //   * being represented as Xforms in Unity they get automatically exported (as Xform) as part of the parent hierarchy of any
             //     valid prim
             // This will need to change if/when we want proper round tripping.
-            map.Materials = FindPathsJob.results[0];
-            map.Cameras = FindPathsJob.results[1];
-            map.Meshes = FindPathsJob.results[2];
-            map.Cubes = FindPathsJob.results[3];
-            map.Spheres = FindPathsJob.results[4];
-            map.SkelRoots = FindPathsJob.results[5];
-            map.Skeletons = FindPathsJob.results[6];
-            map.Xforms = FindPathsJob.results[7];
-
-            ReadHierJob.paths = FindPathsJob.results.Where(i => i != null).SelectMany(i => i).ToArray();
-            ReadHierJob.result = new HierInfo[ReadHierJob.paths.Length];
+            map.Materials = FindAll(hierarchy, kMaterial, typeMask);
+            map.Cameras = FindAll(hierarchy, kCamera, typeMask);
+            map.Meshes = FindAll(hierarchy, kMesh, typeMask);
+            map.Cubes = FindAll(hierarchy, kCube, typeMask);
+            map.Spheres = FindAll(hierarchy, kSphere, typeMask);
+            map.SkelRoots = FindAll(hierarchy, kSkelRoot, typeMask);
+            map.Skeletons = FindAll(hierarchy, kSkeleton, typeMask);
+            map.Xforms = FindAll(hierarchy, kXform, typeMask);
+
+            // Paths are copied out of the snapshot here, since doing so is not thread safe.
+            var prims = new List<int>();
+            for (int i = 0; i < hierarchy.Count; i++)
+            {
+                if ((hierarchy.GetTypeMask(i) & typeMask) != 0)
+                {
+                    prims.Add(i);
+                }
+            }
+
+            ReadHierJob.prims = prims.ToArray();
+            ReadHierJob.paths = ReadHierJob.prims.Select(i => hierarchy.GetPath(i)).ToArray();
+            ReadHierJob.result = new HierInfo[ReadHierJob.prims.Length];
             ReadHierJob.scene = scene;
+            ReadHierJob.hierarchy = hierarchy;
             ReadHierJob.skelCache = map.SkelCache;
             var readHierInfo = new ReadHierJob();
-            return readHierInfo.Schedule(ReadHierJob.paths.Length, 8, dependsOn: findHandle);
+            return readHierInfo.Schedule(ReadHierJob.prims.Length, 8);
+        }
+
+        /// <summary>
+        /// Returns the paths of the prims of the given schema type, or null if the type is not in
+        /// typeMask.
+        /// </summary>
+        static SdfPath[] FindAll(PrimHierarchy hierarchy, int schemaIndex, int typeMask)
+        {
+            if ((typeMask & (1 << schemaIndex)) == 0)
+            {
+                return null;
+            }
+
+            return hierarchy.FindAll(schemaIndex).Select(i => hierarchy.GetPath(i)).ToArray();
+        }
+
+        static HierInfo ReadHierInfo(PrimHierarchy hierarchy, int prim)
+        {
+            var flags = hierarchy.GetFlags(prim);
+            var info = new HierInfo();
+            info.index = prim;
+            info.isVisible = (flags & PrimHierarchyFlags.Invisible) == 0;
+            info.isInstance = (flags & PrimHierarchyFlags.Instance) != 0;
+            info.hasPayload = (flags & PrimHierarchyFlags.HasPayload) != 0;
+            info.isLoaded = (flags & PrimHierarchyFlags.Loaded) != 0;
+            info.masterPath = hierarchy.GetMasterPath(prim);
+            info.isAssembly = (flags & PrimHierarchyFlags.Assembly) != 0;
+            info.isModel = (flags & PrimHierarchyFlags.HasAssetInfo) != 0;
+
+            if (info.isModel)
+            {
+                info.modelAssetPath = hierarchy.GetAssetIdentifier(prim);
+                info.modelName = hierarchy.GetAssetName(prim);
+                info.modelVersion = hierarchy.GetAssetVersion(prim);
+            }
+
+            return info;
         }
 
         static HierInfo[] BuildObjectLists(Scene scene,
@@ -211,7 +243,7 @@ namespace Unity.Formats.USD
             }
 
             BeginReading(scene, usdRoot, map, options).Complete();
-            ProcessPaths(ReadHierJob.result, scene, unityRoot, usdRoot, map, options);
+            ProcessPaths(ReadHierJob.result, ReadHierJob.hierarchy, unityRoot, map, options);
 
             return ReadHierJob.result;
         }
@@ -222,6 +254,9 @@ namespace Unity.Formats.USD
         /// <remarks>
         /// When forceRebuild is true, game objects will be destroyed and recreated. If buildHierarchy
         /// is false, the primMap will be populated, but missing game objects will not be created.
+        ///
+        /// The prims under usdRoot are discovered from a single Scene.ComputePrimHierarchy()
+        /// snapshot, paths is not used.
         /// </remarks>
         static public PrimMap BuildGameObjects(Scene scene,
             GameObject unityRoot,
@@ -250,67 +285,51 @@ namespace Unity.Formats.USD
                 Profiler.BeginSample("Build Masters");
                 foreach (var masterRootPrim in scene.Stage.GetMasters())
                 {
+                    var masterPath = masterRootPrim.GetPath();
                     var goMaster = FindOrCreateGameObject(unityRoot.transform,
-                        masterRootPrim.GetPath(),
+                        masterPath,
                         unityRoot.transform,
                         map,
                         options);
 
                     goMaster.hideFlags = HideFlags.HideInHierarchy;
                     goMaster.SetActive(false);
-                    map.AddMasterRoot(masterRootPrim.GetPath(), goMaster);
-                    try
-                    {
-                        var info = new HierInfo();
-                        info.prim = masterRootPrim;
-                        ReadModelInfo(ref info);
-                        AddModelRoot(goMaster, info);
-                        AddVariantSet(goMaster, masterRootPrim);
-                    }
-                    catch (Exception ex)
-                    {
-                        Debug.LogException(new Exception("Error processing " + masterRootPrim.GetPath(), ex));
-                        map.HasErrors = true;
-                    }
+                    map.AddMasterRoot(masterPath, goMaster);
 
-                    foreach (var usdPrim in masterRootPrim.GetAllDescendants())
+                    var master = scene.ComputePrimHierarchy(masterPath);
+                    var objects = new GameObject[master.Count];
+                    objects[0] = goMaster;
+
+                    for (int i = 0; i < master.Count; i++)
                     {
-                        var parentPath = usdPrim.GetPath().GetParentPath();
-                        Transform parentXf = null;
-                        if (parentPath == masterRootPrim.GetPath())
-                        {
-                            parentXf = goMaster.transform;
-                        }
-                        else
+                        var info = ReadHierInfo(master, i);
+                        info.path = master.GetPath(i);
+
+                        var goPrim = FindOrCreatePrim(master, i, objects, unityRoot, map, options);
+                        if (!goPrim)
                         {
-                            parentXf = map[parentPath].transform;
+                            continue;
                         }
 
-                        var goPrim = FindOrCreateGameObject(parentXf,
-                            usdPrim.GetPath(),
-                            unityRoot.transform,
-                            map,
-                            options);
-                        ApplySelfVisibility(goPrim, usdPrim);
-
-                        if (usdPrim.IsInstance())
+                        if (i > 0)
                         {
-                            map.AddInstanceRoot(usdPrim.GetPath(), goPrim, usdPrim.GetMaster().GetPath());
+                            ApplySelfVisibility(goPrim, info.isVisible);
+
+                            if (info.isInstance)
+                            {
+                                map.AddInstanceRoot(info.path, goPrim, new SdfPath(info.masterPath));
+                            }
                         }
 
                         try
                         {
-                            var info = new HierInfo();
-                            info.prim = usdPrim;
-                            ReadModelInfo(ref info);
                             AddModelRoot(goPrim, info);
-                            AddVariantSet(goPrim, usdPrim);
+                            AddVariantSet(goPrim, master, i);
                         }
                         catch (Exception ex)
                         {
-                            Debug.LogException(new Exception("Error processing " + usdPrim.GetPath(), ex));
+                            Debug.LogException(new Exception("Error processing " + info.path, ex));
                             map.HasErrors = true;
-                            continue;
                         }
                     }
                 }
@@ -334,7 +353,7 @@ namespace Unity.Formats.USD
                     }
                     catch (Exception ex)
                     {
-                        Debug.LogException(new Exception("Error expanding skeleton at " + info.prim.GetPath(), ex));
+                        Debug.LogException(new Exception("Error expanding skeleton at " + info.path, ex));
                         map.HasErrors = true;
                     }
                 }
@@ -345,46 +364,20 @@ namespace Unity.Formats.USD
             return map;
         }
 
-        static bool IsVisible(UsdPrim usdPrim)
-        {
-            if (!usdPrim)
-            {
-                return false;
-            }
-
-            var img = new UsdGeomImageable(usdPrim);
-            if (!img)
-            {
-                return true;
-            }
-
-            // Using time=0.0 will enable this to pickup a single animated value by virtue of
-            // interpolation, but correct handling of animated visibility would query it over time.
-
-            // Also note this code is intentionally not using ComputeVisibility(), since Unity will apply
-            // inherited visibility. This is technically incorrect, since USD supports "super vis",
-            // enabling visible children with invisible parents. The goal here is to avoid spamming all
-            // descendent children with active=false. A better implementation would check for visible
-            // children with invisible parents and somehow translate that to the Unity scenegraph, but
-            // is left as a future improvement.
-
-            VtValue visValue = new VtValue();
-            if (!img.GetVisibilityAttr().Get(visValue, 0.0))
-            {
-                return true;
-            }
-
-            return UsdCs.VtValueToTfToken(visValue) != UsdGeomTokens.invisible;
-        }
-
-        static void ApplySelfVisibility(GameObject go, UsdPrim usdPrim)
+        // Note that visibility is read at time 0 and is not inherited, since Unity will apply
+        // inherited visibility. This is technically incorrect, since USD supports "super vis",
+        // enabling visible children with invisible parents. The goal here is to avoid spamming all
+        // descendent children with active=false. A better implementation would check for visible
+        // children with invisible parents and somehow translate that to the Unity scenegraph, but
+        // is left as a future improvement.
+        static void ApplySelfVisibility(GameObject go, bool isVisible)
         {
             if (!go)
             {
                 return;
             }
 
-            if (IsVisible(usdPrim))
+            if (isVisible)
             {
                 return;
             }
@@ -446,58 +439,87 @@ namespace Unity.Formats.USD
                 options);
         }
 
+        /// <summary>
+        /// Returns the GameObject of a prim of the hierarchy, creating it and its missing ancestors,
+        /// which are found through the parent indices of the snapshot rather than by querying USD.
+        /// </summary>
+        /// <remarks>
+        /// objects caches the GameObject of each prim and must hold the GameObject of the root.
+        /// Like CreateAncestors, this does not apply visibility to the ancestors.
+        /// </remarks>
+        static GameObject FindOrCreatePrim(PrimHierarchy hierarchy,
+            int prim,
+            GameObject[] objects,
+            GameObject unityRoot,
+            PrimMap map,
+            SceneImportOptions options)
+        {
+            var go = objects[prim];
+            if (go)
+            {
+                return go;
+            }
+
+            var path = hierarchy.GetPath(prim);
+            if (!map.TryGetValue(path, out go) || !go)
+            {
+                var parent = hierarchy.GetParent(prim);
+                if (parent < 0)
+                {
+                    Debug.LogError("Failed to find ancestor for " + path);
+                    return null;
+                }
+
+                var parentGo = FindOrCreatePrim(hierarchy, parent, objects, unityRoot, map, options);
+                if (!parentGo)
+                {
+                    return null;
+                }
+
+                go = FindOrCreateGameObject(parentGo.transform,
+                    path,
+                    unityRoot.transform,
+                    map,
+                    options);
+            }
+
+            objects[prim] = go;
+            return go;
+        }
+
         static void ProcessPaths(HierInfo[] infos,
-            Scene scene,
+            PrimHierarchy hierarchy,
             GameObject unityRoot,
-            SdfPath usdRoot,
             PrimMap map,
             SceneImportOptions options)
         {
             Profiler.BeginSample("Process all paths");
+            var objects = new GameObject[hierarchy.Count];
+            objects[0] = unityRoot;
+
             foreach (var info in infos)
             {
-                var prim = info.prim;
-                var path = info.prim.GetPath();
+                var path = info.path;
 
                 if (info.skelBindings != null)
                 {
                     // Collect all discovered skelBindings back into the PrimMap.
-                    map.SkelBindings.Add(info.prim.GetPath(), info.skelBindings);
+                    map.SkelBindings.Add(path, info.skelBindings);
                 }
 
-                GameObject go;
-                if (path == usdRoot)
+                var go = FindOrCreatePrim(hierarchy, info.index, objects, unityRoot, map, options);
+                if (!go)
                 {
-                    go = unityRoot;
-                }
-                else
-                {
-                    GameObject parentGo = null;
-                    CreateAncestors(path, map, unityRoot, usdRoot, options, out parentGo);
-
-                    if (!parentGo)
-                    {
-                        Debug.LogWarning("Parent path not found for child: " + path.ToString());
-                        continue;
-                    }
-
-                    var parent = parentGo ? parentGo.transform : null;
-                    if (!map.TryGetValue(path, out go))
-                    {
-                        go = FindOrCreateGameObject(parent,
-                            path,
-                            unityRoot.transform,
-                            map,
-                            options);
-                    }
+                    Debug.LogWarning("Parent path not found for child: " + path.ToString());
+                    continue;
                 }
 
                 if (options.importSceneInstances)
                 {
                     Profiler.BeginSample("Add Scene Instance Root");
-                    if (prim.IsInstance())
+                    if (info.isInstance)
                     {
-                        map.AddInstanceRoot(prim.GetPath(), go, prim.GetMaster().GetPath());
+                        map.AddInstanceRoot(path, go, new SdfPath(info.masterPath));
                     }
 
                     Profiler.EndSample();
@@ -508,7 +530,7 @@ namespace Unity.Formats.USD
                     continue;
                 }
 
-                ApplySelfVisibility(go, prim);
+                ApplySelfVisibility(go, info.isVisible);
 
                 try
                 {
@@ -517,7 +539,7 @@ namespace Unity.Formats.USD
                     Profiler.EndSample();
 
                     Profiler.BeginSample("Add Variant Set");
-                    AddVariantSet(go, prim);
+                    AddVariantSet(go, hierarchy, info.index);
                     Profiler.EndSample();
 
                     Profiler.BeginSample("Add Payload");
@@ -526,7 +548,7 @@ namespace Unity.Formats.USD
                 }
                 catch (Exception ex)
                 {
-                    Debug.LogException(new Exception("Error processing " + prim.GetPath(), ex));
+                    Debug.LogException(new Exception("Error processing " + path, ex));
                     map.HasErrors = true;
                 }
             }
@@ -682,62 +704,6 @@ namespace Unity.Formats.USD
             }
         }
 
-        static void ReadModelInfo(ref HierInfo info)
-        {
-            if (!info.prim)
-            {
-                return;
-            }
-
-            var modelApi = new UsdModelAPI(info.prim);
-            if (!modelApi)
-            {
-                return;
-            }
-
-            var kindTok = new TfToken();
-            if (!modelApi.GetKind(kindTok))
-            {
-                return;
-            }
-
-            if (KindRegistry.IsA(kindTok, KindTokens.assembly))
-            {
-                info.isAssembly = true;
-            }
-            else if (!modelApi.IsModel() || modelApi.IsGroup())
-            {
-                return;
-            }
-
-            var modelInfo = new VtDictionary();
-            if (!modelApi.GetAssetInfo(modelInfo))
-            {
-                return;
-            }
-
-            info.isModel = true;
-
-            var valName = modelInfo.GetValueAtPath("name");
-            var valVersion = modelInfo.GetValueAtPath("version");
-            var valIdentifier = modelInfo.GetValueAtPath("identifier");
-
-            if (valIdentifier != null && !valIdentifier.IsEmpty())
-            {
-                info.modelAssetPath = UsdCs.VtValueToSdfAssetPath(valIdentifier).GetAssetPath().ToString();
-            }
-
-            if (valName != null && !valName.IsEmpty())
-            {
-                info.modelName = UsdCs.VtValueTostring(valName);
-            }
-
-            if (valVersion != null && !valVersion.IsEmpty())
-            {
-                info.modelVersion = UsdCs.VtValueTostring(valVersion);
-            }
-        }
-
         /// <summary>
         /// Exposes model root and asset metadata. The game object is primarily a tag which is useful
         /// for smart selection of models instead of geometry.
@@ -802,7 +768,7 @@ namespace Unity.Formats.USD
             if (!pl)
             {
                 pl = go.AddComponent<UsdPayload>();
-                pl.SetInitialState(info.prim.IsLoaded());
+                pl.SetInitialState(info.isLoaded);
             }
         }
 
@@ -810,12 +776,11 @@ namespace Unity.Formats.USD
         /// If there is a variant set authored on this prim, expose it so the user can change the
         /// variant selection.
         /// </summary>
-        static void AddVariantSet(GameObject go, UsdPrim prim)
+        static void AddVariantSet(GameObject go, PrimHierarchy hierarchy, int prim)
         {
-            var setNames = prim.GetVariantSets().GetNames();
             var vs = go.GetComponent<UsdVariantSet>();
 
-            if (setNames.Count == 0)
+            if (hierarchy.GetVariantSetCount(prim) == 0)
             {
                 if (vs)
                 {
@@ -830,7 +795,7 @@ namespace Unity.Formats.USD
                 vs = go.AddComponent<UsdVariantSet>();
             }
 
-            vs.LoadFromUsd(prim);
+            vs.LoadFromHierarchy(hierarchy, prim);
         }
 
         /// <summary>
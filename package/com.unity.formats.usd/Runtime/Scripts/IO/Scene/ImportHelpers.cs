@@ -185,10 +185,10 @@ namespace Unity.Formats.USD
             // always have a default prim set arbitrarily.
 
             // If there is only one root prim, reference this prim.
-            var children = scene.Stage.GetPseudoRoot().GetChildren().ToList();
-            if (children.Count == 1)
+            var children = IntrinsicTypeConverter.FromVector(scene.Stage.GetPseudoRoot().GetChildrenPaths());
+            if (children.Length == 1)
             {
-                return children[0].GetPath();
+                return children[0];
             }
 
             // Otherwise there are 0 or many root prims, in this case the best option is to reference
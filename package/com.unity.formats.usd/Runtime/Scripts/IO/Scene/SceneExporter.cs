@@ -82,6 +82,9 @@ namespace Unity.Formats.USD
         // Sample object instances, shared across multiple export methods.
         public Dictionary<Type, SampleBase> samples = new Dictionary<Type, SampleBase>();
 
+        // When set, samples are serialized by this writer on a worker thread, see SceneExporter.EditStage.
+        public BackgroundSceneWriter backgroundWriter;
+
         // For analytics purposes
         public Stopwatch analyticsTotalTimeStopwatch = new Stopwatch();
     }
@@ -182,11 +185,14 @@ namespace Unity.Formats.USD
             {
                 ExportImpl(root, context);
                 var path = new pxr.SdfPath(UnityTypeConverter.GetPath(root.transform));
-                var prim = context.scene.Stage.GetPrimAtPath(path);
-                if (prim)
+                EditStage(context, scene =>
                 {
-                    context.scene.Stage.SetDefaultPrim(prim);
-                }
+                    var prim = scene.Stage.GetPrimAtPath(path);
+                    if (prim)
+                    {
+                        scene.Stage.SetDefaultPrim(prim);
+                    }
+                });
             }
             finally
             {
@@ -286,31 +292,8 @@ namespace Unity.Formats.USD
                     {
                         if (!go.gameObject.activeSelf)
                         {
-                            switch (context.activePolicy)
-                            {
-                                case ActiveExportPolicy.Ignore:
-                                    // Nothing to see here.
-                                    break;
-
-                                case ActiveExportPolicy.ExportAsVisibility:
-                                    // Make the prim invisible.
-                                    var im = new pxr.UsdGeomImageable(scene.GetPrimAtPath(path));
-                                    if (im)
-                                    {
-                                        im.CreateVisibilityAttr().Set(pxr.UsdGeomTokens.invisible);
-                                    }
-
-                                    break;
-
-                                case ActiveExportPolicy.ExportAsActive:
-                                    // TODO: this may actually cause errors because exported prims will not exist in
-                                    // the USD scene graph. Right now, that's too much responsibility on the caller,
-                                    // because the error messages will be mysterious.
-
-                                    // Make the prim inactive.
-                                    scene.GetPrimAtPath(path).SetActive(false);
-                                    break;
-                            }
+                            var activePolicy = context.activePolicy;
+                            EditStage(context, s => ExportInactive(s, path, activePolicy));
                         }
                     }
                     catch (Exception ex)
@@ -326,6 +309,52 @@ namespace Unity.Formats.USD
             UnityEngine.Profiling.Profiler.EndSample();
         }
 
+        static void ExportInactive(Scene scene, string path, ActiveExportPolicy activePolicy)
+        {
+            switch (activePolicy)
+            {
+                case ActiveExportPolicy.Ignore:
+                    // Nothing to see here.
+                    break;
+
+                case ActiveExportPolicy.ExportAsVisibility:
+                    // Make the prim invisible.
+                    var im = new pxr.UsdGeomImageable(scene.GetPrimAtPath(path));
+                    if (im)
+                    {
+                        im.CreateVisibilityAttr().Set(pxr.UsdGeomTokens.invisible);
+                    }
+
+                    break;
+
+                case ActiveExportPolicy.ExportAsActive:
+                    // TODO: this may actually cause errors because exported prims will not exist in
+                    // the USD scene graph. Right now, that's too much responsibility on the caller,
+                    // because the error messages will be mysterious.
+
+                    // Make the prim inactive.
+                    scene.GetPrimAtPath(path).SetActive(false);
+                    break;
+            }
+        }
+
+        /// <summary>
+        /// Applies an edit to the USD stage other than writing a sample. When the context has a
+        /// background writer, the edit is applied by its worker thread, in order with the samples,
+        /// so that the stage is never edited from two threads at once.
+        /// </summary>
+        internal static void EditStage(ExportContext context, Action<Scene> edit)
+        {
+            if (context.backgroundWriter != null)
+            {
+                context.backgroundWriter.Edit(edit);
+            }
+            else
+            {
+                edit(context.scene);
+            }
+        }
+
         // ------------------------------------------------------------------------------------------ //
         // Init Hierarchy.
         // ------------------------------------------------------------------------------------------ //
@@ -153,6 +153,24 @@ namespace Unity.Formats.USD
         /// </summary>
         public MeshImportOptions meshOptions = new MeshImportOptions();
 
+        /// <summary>
+        /// When true, imported meshes are stored in a persistent cache on disk and restored from it
+        /// by later imports of the same, unchanged, layers with the same options, instead of being
+        /// read and converted again. The cache is not used during playback.
+        /// </summary>
+        public bool useImportCache = false;
+
+        /// <summary>
+        /// The directory of the import cache, MeshImportCache.DefaultDirectory when empty.
+        /// </summary>
+        public string importCacheDirectory = "";
+
+        /// <summary>
+        /// The total size in bytes of the import cache above which the least recently used meshes
+        /// are evicted.
+        /// </summary>
+        public long importCacheSizeLimit = 1L << 30;
+
         /// <summary>
         /// Indicates if the importer should attempt to bind materials.
         /// </summary>
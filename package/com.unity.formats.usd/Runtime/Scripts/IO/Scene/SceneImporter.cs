@@ -361,7 +361,7 @@ namespace Unity.Formats.USD
         {
             try
             {
-                Profiler.BeginSample("USD: Build Scene");
+                BeginSample("USD: Build Scene");
                 var builder = BuildScene(scene,
                     root,
                     importOptions,
@@ -376,7 +376,7 @@ namespace Unity.Formats.USD
             }
             finally
             {
-                Profiler.EndSample();
+                EndSample();
             }
         }
 
@@ -416,35 +416,42 @@ namespace Unity.Formats.USD
 
             // Reconstruct the USD hierarchy as Unity GameObjects.
             // A PrimMap is returned for tracking the USD <-> Unity mapping.
-            Profiler.BeginSample("USD: Build Hierarchy");
-            if (importOptions.importHierarchy || importOptions.forceRebuild)
+            BeginSample("USD: Build Hierarchy");
+            try
             {
-                // When a USD file is fully RE-imported, all exsiting USD data must be removed. The old
-                // assumption was that the root would never have much more than the UsdAsset component
-                // itself, however it's now clear that the root may also have meaningful USD data added
-                // too.
-                //
-                // TODO(jcowles): This feels like a workaround. What we really want here is an "undo"
-                // process for changes made to the root GameObject. For example, to clean up non-USD
-                // components which may have been added (e.g. what if a mesh is imported to the root?
-                // currently the MeshRenderer etc will remain after re-import).
-                RemoveComponent<UsdAssemblyRoot>(root);
-                RemoveComponent<UsdVariantSet>(root);
-                RemoveComponent<UsdModelRoot>(root);
-                RemoveComponent<UsdLayerStack>(root);
-                RemoveComponent<UsdPayload>(root);
-                RemoveComponent<UsdPrimSource>(root);
-
-                primMap.Clear();
-                HierarchyBuilder.BuildGameObjects(scene,
-                    root,
-                    usdPrimRoot,
-                    scene.Find(usdPrimRoot.ToString(), "UsdSchemaBase"),
-                    primMap,
-                    importOptions);
+                if (importOptions.importHierarchy || importOptions.forceRebuild)
+                {
+                    // When a USD file is fully RE-imported, all exsiting USD data must be removed. The old
+                    // assumption was that the root would never have much more than the UsdAsset component
+                    // itself, however it's now clear that the root may also have meaningful USD data added
+                    // too.
+                    //
+                    // TODO(jcowles): This feels like a workaround. What we really want here is an "undo"
+                    // process for changes made to the root GameObject. For example, to clean up non-USD
+                    // components which may have been added (e.g. what if a mesh is imported to the root?
+                    // currently the MeshRenderer etc will remain after re-import).
+                    RemoveComponent<UsdAssemblyRoot>(root);
+                    RemoveComponent<UsdVariantSet>(root);
+                    RemoveComponent<UsdModelRoot>(root);
+                    RemoveComponent<UsdLayerStack>(root);
+                    RemoveComponent<UsdPayload>(root);
+                    RemoveComponent<UsdPrimSource>(root);
+
+                    primMap.Clear();
+
+                    // The prims are discovered by the HierarchyBuilder itself, in a single traversal.
+                    HierarchyBuilder.BuildGameObjects(scene,
+                        root,
+                        usdPrimRoot,
+                        paths: null,
+                        primMap,
+                        importOptions);
+                }
+            }
+            finally
+            {
+                EndSample();
             }
-
-            Profiler.EndSample();
 
             if (ShouldYield(targetTime, timer))
             {
@@ -452,21 +459,26 @@ namespace Unity.Formats.USD
                 ResetTimer(timer);
             }
 
-            Profiler.BeginSample("USD: Post Process Hierarchy");
-            foreach (var processor in root.GetComponents<IImportPostProcessHierarchy>())
+            BeginSample("USD: Post Process Hierarchy");
+            try
             {
-                try
-                {
-                    processor.PostProcessHierarchy(primMap, importOptions);
-                }
-                catch (System.Exception ex)
+                foreach (var processor in root.GetComponents<IImportPostProcessHierarchy>())
                 {
-                    Debug.LogException(ex);
-                    primMap.HasErrors = true;
+                    try
+                    {
+                        processor.PostProcessHierarchy(primMap, importOptions);
+                    }
+                    catch (System.Exception ex)
+                    {
+                        Debug.LogException(ex);
+                        primMap.HasErrors = true;
+                    }
                 }
             }
-
-            Profiler.EndSample();
+            finally
+            {
+                EndSample();
+            }
 
             if (ShouldYield(targetTime, timer))
             {
@@ -481,45 +493,50 @@ namespace Unity.Formats.USD
             var skelRoots = new List<pxr.UsdSkelRoot>();
             if (importOptions.importSkinning)
             {
-                Profiler.BeginSample("USD: Process UsdSkelRoots");
-                foreach (var path in primMap.SkelRoots)
+                BeginSample("USD: Process UsdSkelRoots");
+                try
                 {
-                    try
+                    foreach (var path in primMap.SkelRoots)
                     {
-                        var skelRootPrim = scene.GetPrimAtPath(path);
-                        if (!skelRootPrim)
+                        try
                         {
-                            Debug.LogWarning("SkelRoot prim not found: " + path);
-                            continue;
-                        }
+                            var skelRootPrim = scene.GetPrimAtPath(path);
+                            if (!skelRootPrim)
+                            {
+                                Debug.LogWarning("SkelRoot prim not found: " + path);
+                                continue;
+                            }
 
-                        var skelRoot = new pxr.UsdSkelRoot(skelRootPrim);
-                        if (!skelRoot)
+                            var skelRoot = new pxr.UsdSkelRoot(skelRootPrim);
+                            if (!skelRoot)
+                            {
+                                Debug.LogWarning("SkelRoot prim not SkelRoot type: " + path);
+                                primMap.HasErrors = true;
+                                continue;
+                            }
+
+                            skelRoots.Add(skelRoot);
+                            GameObject go = primMap[path];
+                            ImporterBase.GetOrAddComponent<Animator>(go, true);
+                        }
+                        catch (System.Exception ex)
                         {
-                            Debug.LogWarning("SkelRoot prim not SkelRoot type: " + path);
+                            Debug.LogException(
+                                new ImportException("Error pre-processing SkelRoot <" + path + ">", ex));
                             primMap.HasErrors = true;
-                            continue;
                         }
 
-                        skelRoots.Add(skelRoot);
-                        GameObject go = primMap[path];
-                        ImporterBase.GetOrAddComponent<Animator>(go, true);
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error pre-processing SkelRoot <" + path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
-
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
             }
 
             //
@@ -527,49 +544,47 @@ namespace Unity.Formats.USD
             //
 
             // Materials.
-            Profiler.BeginSample("USD: Build Materials");
-            if (importOptions.ShouldBindMaterials)
+            BeginSample("USD: Build Materials");
+            try
             {
-                foreach (var pathAndSample in scene.ReadAll<MaterialSample>(primMap.Materials))
+                if (importOptions.ShouldBindMaterials)
                 {
-                    try
+                    foreach (var pathAndSample in scene.ReadAll<MaterialSample>(primMap.Materials))
                     {
-                        var mat = MaterialImporter.BuildMaterial(scene,
-                            pathAndSample.path,
-                            pathAndSample.sample,
-                            importOptions);
-                        if (mat != null)
+                        try
                         {
-                            importOptions.materialMap[pathAndSample.path] = mat;
+                            var mat = MaterialImporter.BuildMaterial(scene,
+                                pathAndSample.path,
+                                pathAndSample.sample,
+                                importOptions);
+                            if (mat != null)
+                            {
+                                importOptions.materialMap[pathAndSample.path] = mat;
+                            }
+                        }
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogException(
+                                new ImportException("Error processing material <" + pathAndSample.path + ">", ex));
+                            primMap.HasErrors = true;
                         }
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing material <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
 
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
             }
-
-            Profiler.EndSample();
+            finally
+            {
+                EndSample();
+            }
 
             //
             // Start threads.
             //
-            ReadAllJob<SanitizedXformSample> readXforms;
-            if (importOptions.importTransforms)
-            {
-                readXforms = new ReadAllJob<SanitizedXformSample>(scene, primMap.Xforms, importOptions);
-                readXforms.Schedule(primMap.Xforms.Length, 4);
-            }
-
             if (importOptions.importMeshes)
             {
                 ActiveMeshImporter.BeginReading(scene, primMap, importOptions);
@@ -584,66 +599,58 @@ namespace Unity.Formats.USD
             // Xforms are processed to avoid doing that work redundantly.
             if (importOptions.importTransforms)
             {
-                Profiler.BeginSample("USD: Build Xforms");
-                foreach (var pathAndSample in readXforms)
+                BeginSample("USD: Build Xforms");
+                try
                 {
+                    // The local transforms of all Xforms are computed in a single call, while the
+                    // meshes are read in the background.
+                    var xformPaths = GetPathsToRead(scene, primMap.Xforms);
+                    var localXforms = new double[xformPaths.Length * 16];
+                    var xformFlags = new int[xformPaths.Length];
+                    BeginSample("Compute Transforms");
                     try
                     {
-                        if (pathAndSample.path == usdPrimRoot)
-                        {
-                            // Never read the xform from the USD root, that will be authored in Unity.
-                            continue;
-                        }
-
-                        GameObject go = primMap[pathAndSample.path];
-                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
+                        scene.ComputeTransforms(xformPaths, localXforms, null, xformFlags);
                     }
-                    catch (System.Exception ex)
+                    finally
                     {
-                        Debug.LogException(
-                            new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
+                        EndSample();
                     }
 
-                    if (ShouldYield(targetTime, timer))
+                    for (int i = 0; i < xformPaths.Length; i++)
                     {
-                        yield return null;
-                        ResetTimer(timer);
-                    }
-                }
+                        var path = xformPaths[i];
+                        try
+                        {
+                            if (path == usdPrimRoot)
+                            {
+                                // Never read the xform from the USD root, that will be authored in Unity.
+                                continue;
+                            }
 
-                foreach (var pathAndSample in scene.ReadAll<XformSample>(primMap.SkelRoots))
-                {
-                    try
-                    {
-                        if (pathAndSample.path == usdPrimRoot)
+                            GameObject go = primMap[path];
+                            if (importOptions.importMonoBehaviours)
+                            {
+                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(path), importOptions);
+                            }
+
+                            XformImporter.BuildXform(localXforms, i, (TransformFlags)xformFlags[i], go, importOptions);
+                        }
+                        catch (System.Exception ex)
                         {
-                            // Never read the xform from the USD root, that will be authored in Unity.
-                            continue;
+                            Debug.LogException(
+                                new ImportException("Error processing xform <" + path + ">", ex));
+                            primMap.HasErrors = true;
                         }
 
-                        GameObject go = primMap[pathAndSample.path];
-                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
-
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
-                }
 
-                if (importOptions.importSkinning)
-                {
-                    foreach (var pathAndSample in scene.ReadAll<XformSample>(primMap.Skeletons))
+                    foreach (var pathAndSample in scene.ReadAll<XformSample>(GetPathsToRead(scene, primMap.SkelRoots)))
                     {
                         try
                         {
@@ -654,10 +661,8 @@ namespace Unity.Formats.USD
                             }
 
                             GameObject go = primMap[pathAndSample.path];
-                            NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                importOptions);
-                            XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                scene);
+                            NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
+                            XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
                         }
                         catch (System.Exception ex)
                         {
@@ -672,315 +677,400 @@ namespace Unity.Formats.USD
                             ResetTimer(timer);
                         }
                     }
-                }
 
-                Profiler.EndSample();
+                    if (importOptions.importSkinning)
+                    {
+                        foreach (var pathAndSample in scene.ReadAll<XformSample>(GetPathsToRead(scene, primMap.Skeletons)))
+                        {
+                            try
+                            {
+                                if (pathAndSample.path == usdPrimRoot)
+                                {
+                                    // Never read the xform from the USD root, that will be authored in Unity.
+                                    continue;
+                                }
+
+                                GameObject go = primMap[pathAndSample.path];
+                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                    importOptions);
+                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                    scene);
+                            }
+                            catch (System.Exception ex)
+                            {
+                                Debug.LogException(
+                                    new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
+                                primMap.HasErrors = true;
+                            }
+
+                            if (ShouldYield(targetTime, timer))
+                            {
+                                yield return null;
+                                ResetTimer(timer);
+                            }
+                        }
+                    }
+                }
+                finally
+                {
+                    EndSample();
+                }
             }
 
             // Meshes.
             if (importOptions.importMeshes)
             {
-                Profiler.BeginSample("USD: Build Meshes");
-                IEnumerator it = ActiveMeshImporter.Import(scene, primMap, importOptions);
-
-                while (it.MoveNext())
+                BeginSample("USD: Build Meshes");
+                try
                 {
-                    if (ShouldYield(targetTime, timer))
+                    IEnumerator it = ActiveMeshImporter.Import(scene, primMap, importOptions);
+
+                    while (it.MoveNext())
                     {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
 
                 // Cubes.
-                Profiler.BeginSample("USD: Build Cubes");
-                foreach (var pathAndSample in scene.ReadAll<CubeSample>(primMap.Cubes))
+                BeginSample("USD: Build Cubes");
+                try
                 {
-                    try
+                    foreach (var pathAndSample in scene.ReadAll<CubeSample>(GetPathsToRead(scene, primMap.Cubes)))
                     {
-                        GameObject go = primMap[pathAndSample.path];
-                        pxr.UsdPrim prim = scene.GetPrimAtPath(pathAndSample.path);
+                        try
+                        {
+                            GameObject go = primMap[pathAndSample.path];
+                            pxr.UsdPrim prim = scene.GetPrimAtPath(pathAndSample.path);
 
-                        NativeImporter.ImportObject(scene, go, prim, importOptions);
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
-                        bool skinnedMesh = IsSkinnedMesh(prim, primMap, importOptions);
-                        CubeImporter.BuildCube(pathAndSample.sample, go, importOptions, skinnedMesh);
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing cube <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
+                            NativeImporter.ImportObject(scene, go, prim, importOptions);
+                            XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
+                            bool skinnedMesh = IsSkinnedMesh(prim, primMap, importOptions);
+                            CubeImporter.BuildCube(pathAndSample.sample, go, importOptions, skinnedMesh);
+                        }
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogException(
+                                new ImportException("Error processing cube <" + pathAndSample.path + ">", ex));
+                            primMap.HasErrors = true;
+                        }
 
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
 
                 // Spheres.
-                Profiler.BeginSample("USD: Build Spheres");
-                foreach (var pathAndSample in scene.ReadAll<SphereSample>(primMap.Spheres))
+                BeginSample("USD: Build Spheres");
+                try
                 {
-                    try
+                    foreach (var pathAndSample in scene.ReadAll<SphereSample>(GetPathsToRead(scene, primMap.Spheres)))
                     {
-                        GameObject go = primMap[pathAndSample.path];
-                        pxr.UsdPrim prim = scene.GetPrimAtPath(pathAndSample.path);
+                        try
+                        {
+                            GameObject go = primMap[pathAndSample.path];
+                            pxr.UsdPrim prim = scene.GetPrimAtPath(pathAndSample.path);
 
-                        NativeImporter.ImportObject(scene, go, prim, importOptions);
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
-                        bool skinnedMesh = IsSkinnedMesh(prim, primMap, importOptions);
-                        SphereImporter.BuildSphere(pathAndSample.sample, go, importOptions, skinnedMesh);
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing sphere <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
+                            NativeImporter.ImportObject(scene, go, prim, importOptions);
+                            XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
+                            bool skinnedMesh = IsSkinnedMesh(prim, primMap, importOptions);
+                            SphereImporter.BuildSphere(pathAndSample.sample, go, importOptions, skinnedMesh);
+                        }
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogException(
+                                new ImportException("Error processing sphere <" + pathAndSample.path + ">", ex));
+                            primMap.HasErrors = true;
+                        }
 
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
             }
 
             // Cameras.
             if (importOptions.importCameras)
             {
-                Profiler.BeginSample("USD: Cameras");
-                foreach (var pathAndSample in scene.ReadAll<SanitizedCameraSample>(primMap.Cameras))
+                BeginSample("USD: Cameras");
+                try
                 {
-                    try
+                    foreach (var pathAndSample in scene.ReadAll<SanitizedCameraSample>(GetPathsToRead(scene, primMap.Cameras)))
                     {
-                        GameObject go = primMap[pathAndSample.path];
-                        pathAndSample.sample.Sanitize(scene, importOptions);
-                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
-                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
-
-                        // In order to match FBX importer buggy behavior, the camera xform need an extra rotation.
-                        // FBX importer is fixed in 2020 though with an option to do an axis bake on import.
-                        // If axis bake is used, no need to use the SlowAndSafeAsFBX mode.
-                        if (importOptions.changeHandedness == BasisTransformation.SlowAndSafeAsFBX)
+                        try
                         {
-                            go.transform.localRotation *= Quaternion.Euler(180.0f, 0.0f, 180.0f);
-                        }
+                            GameObject go = primMap[pathAndSample.path];
+                            pathAndSample.sample.Sanitize(scene, importOptions);
+                            NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path), importOptions);
+                            XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions, scene);
+
+                            // In order to match FBX importer buggy behavior, the camera xform need an extra rotation.
+                            // FBX importer is fixed in 2020 though with an option to do an axis bake on import.
+                            // If axis bake is used, no need to use the SlowAndSafeAsFBX mode.
+                            if (importOptions.changeHandedness == BasisTransformation.SlowAndSafeAsFBX)
+                            {
+                                go.transform.localRotation *= Quaternion.Euler(180.0f, 0.0f, 180.0f);
+                            }
 
-                        // The camera has many value-type parameters that need to be handled correctly when not
-                        // not animated. For now, only the camera transform will animate, until this is fixed.
-                        if (scene.AccessMask == null || scene.IsPopulatingAccessMask)
+                            // The camera has many value-type parameters that need to be handled correctly when not
+                            // not animated. For now, only the camera transform will animate, until this is fixed.
+                            if (scene.AccessMask == null || scene.IsPopulatingAccessMask)
+                            {
+                                CameraImporter.BuildCamera(pathAndSample.sample, go, importOptions);
+                            }
+                        }
+                        catch (System.Exception ex)
                         {
-                            CameraImporter.BuildCamera(pathAndSample.sample, go, importOptions);
+                            Debug.LogException(
+                                new ImportException("Error processing camera <" + pathAndSample.path + ">", ex));
+                            primMap.HasErrors = true;
                         }
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing camera <" + pathAndSample.path + ">", ex));
-                        primMap.HasErrors = true;
-                    }
 
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
             }
 
             // Build out masters for instancing.
-            Profiler.BeginSample("USD: Build Instances");
-            foreach (var masterRootPath in primMap.GetMasterRootPaths())
+            BeginSample("USD: Build Instances");
+            try
             {
-                try
+                foreach (var masterRootPath in primMap.GetMasterRootPaths())
                 {
-                    Transform masterRootXf = primMap[masterRootPath].transform;
-
-                    // Transforms
-                    if (importOptions.importTransforms)
+                    try
                     {
-                        Profiler.BeginSample("USD: Build Xforms");
-                        foreach (var pathAndSample in scene.ReadAll<SanitizedXformSample>(masterRootPath))
+                        Transform masterRootXf = primMap[masterRootPath].transform;
+
+                        // Transforms
+                        if (importOptions.importTransforms)
                         {
+                            BeginSample("USD: Build Xforms");
                             try
                             {
-                                GameObject go = primMap[pathAndSample.path];
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                pathAndSample.sample.Sanitize(scene, importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
+                                foreach (var pathAndSample in scene.ReadAll<SanitizedXformSample>(masterRootPath))
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        pathAndSample.sample.Sanitize(scene, importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
+
+                                foreach (var pathAndSample in scene.ReadAll<SanitizedXformSample>(primMap.Skeletons))
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        pathAndSample.sample.Sanitize(scene, importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
                             }
-                            catch (System.Exception ex)
+                            finally
                             {
-                                Debug.LogException(
-                                    new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
+                                EndSample();
                             }
                         }
 
-                        foreach (var pathAndSample in scene.ReadAll<SanitizedXformSample>(primMap.Skeletons))
+                        // Meshes.
+                        if (importOptions.importMeshes)
                         {
+                            BeginSample("USD: Build Meshes");
                             try
                             {
-                                GameObject go = primMap[pathAndSample.path];
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                pathAndSample.sample.Sanitize(scene, importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
+                                foreach (var pathAndSample in scene.ReadAll<SanitizedMeshSample>(masterRootPath))
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        // TODO: should we restore the DeserializationContext here?
+                                        pathAndSample.sample.Sanitize(scene, importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                        var subsets = MeshImporter.ReadGeomSubsets(scene, pathAndSample.path);
+                                        bool isDynamic = scene.AccessMask != null
+                                            ? scene.AccessMask.Included.ContainsKey(pathAndSample.path)
+                                            : false;
+                                        MeshImporter.BuildMesh(pathAndSample.path, pathAndSample.sample, subsets, go,
+                                            importOptions, isDynamic);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing mesh <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
                             }
-                            catch (System.Exception ex)
+                            finally
                             {
-                                Debug.LogException(
-                                    new ImportException("Error processing xform <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
+                                EndSample();
                             }
-                        }
-
-                        Profiler.EndSample();
-                    }
 
-                    // Meshes.
-                    if (importOptions.importMeshes)
-                    {
-                        Profiler.BeginSample("USD: Build Meshes");
-                        foreach (var pathAndSample in scene.ReadAll<SanitizedMeshSample>(masterRootPath))
-                        {
+                            // Cubes.
+                            BeginSample("USD: Build Cubes");
                             try
                             {
-                                GameObject go = primMap[pathAndSample.path];
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                // TODO: should we restore the DeserializationContext here?
-                                pathAndSample.sample.Sanitize(scene, importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
-                                var subsets = MeshImporter.ReadGeomSubsets(scene, pathAndSample.path);
-                                bool isDynamic = scene.AccessMask != null
-                                    ? scene.AccessMask.Included.ContainsKey(pathAndSample.path)
-                                    : false;
-                                MeshImporter.BuildMesh(pathAndSample.path, pathAndSample.sample, subsets, go,
-                                    importOptions, isDynamic);
+                                foreach (var pathAndSample in scene.ReadAll<CubeSample>(masterRootPath))
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                        CubeImporter.BuildCube(pathAndSample.sample, go, importOptions);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing cube <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
                             }
-                            catch (System.Exception ex)
+                            finally
                             {
-                                Debug.LogException(
-                                    new ImportException("Error processing mesh <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
+                                EndSample();
                             }
-                        }
-
-                        Profiler.EndSample();
 
-                        // Cubes.
-                        Profiler.BeginSample("USD: Build Cubes");
-                        foreach (var pathAndSample in scene.ReadAll<CubeSample>(masterRootPath))
-                        {
+                            // Spheres.
+                            BeginSample("USD: Build Spheres");
                             try
                             {
-                                GameObject go = primMap[pathAndSample.path];
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
-                                CubeImporter.BuildCube(pathAndSample.sample, go, importOptions);
+                                var sphereSamples = scene.ReadAll<SphereSample>(masterRootPath);
+                                foreach (var pathAndSample in sphereSamples)
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                        SphereImporter.BuildSphere(pathAndSample.sample, go, importOptions);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing sphere <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
                             }
-                            catch (System.Exception ex)
+                            finally
                             {
-                                Debug.LogException(
-                                    new ImportException("Error processing cube <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
+                                EndSample();
                             }
                         }
 
-                        Profiler.EndSample();
-
-                        // Spheres.
-                        Profiler.BeginSample("USD: Build Spheres");
-                        var sphereSamples = scene.ReadAll<SphereSample>(masterRootPath);
-                        foreach (var pathAndSample in sphereSamples)
+                        // Cameras.
+                        if (importOptions.importCameras)
                         {
+                            BeginSample("USD: Build Cameras");
                             try
                             {
-                                GameObject go = primMap[pathAndSample.path];
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
-                                SphereImporter.BuildSphere(pathAndSample.sample, go, importOptions);
+                                foreach (var pathAndSample in scene.ReadAll<SanitizedCameraSample>(masterRootPath))
+                                {
+                                    try
+                                    {
+                                        GameObject go = primMap[pathAndSample.path];
+                                        pathAndSample.sample.Sanitize(scene, importOptions);
+                                        NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
+                                            importOptions);
+                                        XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
+                                            scene);
+                                        CameraImporter.BuildCamera(pathAndSample.sample, go, importOptions);
+                                    }
+                                    catch (System.Exception ex)
+                                    {
+                                        Debug.LogException(
+                                            new ImportException("Error processing camera <" + pathAndSample.path + ">", ex));
+                                        primMap.HasErrors = true;
+                                    }
+                                }
                             }
-                            catch (System.Exception ex)
+                            finally
                             {
-                                Debug.LogException(
-                                    new ImportException("Error processing sphere <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
+                                EndSample();
                             }
                         }
-
-                        Profiler.EndSample();
                     }
-
-                    // Cameras.
-                    if (importOptions.importCameras)
+                    catch (System.Exception ex)
                     {
-                        Profiler.BeginSample("USD: Build Cameras");
-                        foreach (var pathAndSample in scene.ReadAll<SanitizedCameraSample>(masterRootPath))
-                        {
-                            try
-                            {
-                                GameObject go = primMap[pathAndSample.path];
-                                pathAndSample.sample.Sanitize(scene, importOptions);
-                                NativeImporter.ImportObject(scene, go, scene.GetPrimAtPath(pathAndSample.path),
-                                    importOptions);
-                                XformImporter.BuildXform(pathAndSample.path, pathAndSample.sample, go, importOptions,
-                                    scene);
-                                CameraImporter.BuildCamera(pathAndSample.sample, go, importOptions);
-                            }
-                            catch (System.Exception ex)
-                            {
-                                Debug.LogException(
-                                    new ImportException("Error processing camera <" + pathAndSample.path + ">", ex));
-                                primMap.HasErrors = true;
-                            }
-                        }
-
-                        Profiler.EndSample();
+                        Debug.LogException(
+                            new ImportException("Error processing master <" + masterRootPath + ">", ex));
+                        primMap.HasErrors = true;
                     }
-                }
-                catch (System.Exception ex)
-                {
-                    Debug.LogException(
-                        new ImportException("Error processing master <" + masterRootPath + ">", ex));
-                    primMap.HasErrors = true;
-                }
-
-                if (ShouldYield(targetTime, timer))
-                {
-                    yield return null;
-                    ResetTimer(timer);
-                }
-            } // Instances.
 
-            Profiler.EndSample();
+                    if (ShouldYield(targetTime, timer))
+                    {
+                        yield return null;
+                        ResetTimer(timer);
+                    }
+                } // Instances.
+            }
+            finally
+            {
+                EndSample();
+            }
 
             //
             // Post-process dependencies: materials and bones.
             //
 
-            Profiler.BeginSample("USD: Process Material Bindings");
+            BeginSample("USD: Process Material Bindings");
             try
             {
                 // TODO: Currently ProcessMaterialBindings runs too long and will go over budget for any
@@ -996,7 +1086,14 @@ namespace Unity.Formats.USD
                 primMap.HasErrors = true;
             }
 
-            Profiler.EndSample();
+            EndSample();
+
+            // The meshes are complete once their materials are bound, they can be cached.
+            var meshImportStrategy = ActiveMeshImporter as MeshImportStrategy;
+            if (importOptions.importMeshes && meshImportStrategy != null)
+            {
+                meshImportStrategy.StoreImportCache(primMap);
+            }
 
             if (ShouldYield(targetTime, timer))
             {
@@ -1009,121 +1106,160 @@ namespace Unity.Formats.USD
             //
             if (importOptions.importSkinning)
             {
-                Profiler.BeginSample("USD: Build Skeletons");
                 var skeletonSamples = new Dictionary<pxr.SdfPath, SkeletonSample>();
-                foreach (var skelRoot in skelRoots)
+                BeginSample("USD: Build Skeletons");
+                try
                 {
-                    try
+                    foreach (var skelRoot in skelRoots)
                     {
-                        var bindings = new pxr.UsdSkelBindingVector();
-                        if (!primMap.SkelBindings.TryGetValue(skelRoot.GetPath(), out bindings))
-                        {
-                            Debug.LogWarning("No bindings found skelRoot: " + skelRoot.GetPath());
-                            primMap.HasErrors = true;
-                        }
-
-                        if (bindings.Count == 0)
-                        {
-                            Debug.LogWarning("No bindings found skelRoot: " + skelRoot.GetPath());
-                            primMap.HasErrors = true;
-                        }
-
-                        foreach (var skelBinding in bindings)
+                        try
                         {
-                            // The SkelRoot will likely have a skeleton binding, but it's inherited, so the bound
-                            // skeleton isn't actually known until it's queried from the binding. Still, we would
-                            // like not to reprocess skeletons redundantly, so skeletons are cached into a
-                            // dictionary.
-
-                            Profiler.BeginSample("Build Bind Transforms");
-                            var skelPath = skelBinding.GetSkeleton().GetPath();
-                            SkeletonSample skelSample = null;
-                            if (!skeletonSamples.TryGetValue(skelPath, out skelSample))
+                            var bindings = new pxr.UsdSkelBindingVector();
+                            if (!primMap.SkelBindings.TryGetValue(skelRoot.GetPath(), out bindings))
                             {
-                                skelSample = new SkeletonSample();
-
-                                Profiler.BeginSample("Read Skeleton");
-                                scene.Read(skelPath, skelSample);
-                                Profiler.EndSample();
-
-                                skeletonSamples.Add(skelPath, skelSample);
-
-                                // The bind pose is bone's inverse transformation matrix. This is done once here, so each
-                                // skinned mesh doesn't need to do it redundantly.
-                                SkeletonImporter.BuildBindTransforms(skelPath, skelSample, importOptions);
-
-                                // Validate the binding transforms.
-                                var bindXforms = new pxr.VtMatrix4dArray();
-                                var prim = scene.GetPrimAtPath(skelPath);
-                                var skel = new pxr.UsdSkelSkeleton(prim);
+                                Debug.LogWarning("No bindings found skelRoot: " + skelRoot.GetPath());
+                                primMap.HasErrors = true;
+                            }
 
-                                Profiler.BeginSample("Get SkelQuery");
-                                pxr.UsdSkelSkeletonQuery skelQuery = primMap.SkelCache.GetSkelQuery(skel);
-                                Profiler.EndSample();
+                            if (bindings.Count == 0)
+                            {
+                                Debug.LogWarning("No bindings found skelRoot: " + skelRoot.GetPath());
+                                primMap.HasErrors = true;
+                            }
 
-                                Profiler.BeginSample("Get JointWorldBind Transforms");
-                                if (!skelQuery.GetJointWorldBindTransforms(bindXforms))
+                            foreach (var skelBinding in bindings)
+                            {
+                                // The SkelRoot will likely have a skeleton binding, but it's inherited, so the bound
+                                // skeleton isn't actually known until it's queried from the binding. Still, we would
+                                // like not to reprocess skeletons redundantly, so skeletons are cached into a
+                                // dictionary.
+
+                                var skelPath = skelBinding.GetSkeleton().GetPath();
+                                SkeletonSample skelSample = null;
+                                BeginSample("Build Bind Transforms");
+                                try
                                 {
-                                    throw new ImportException("Failed to compute binding transforms for <" + skelPath +
-                                        ">");
+                                    if (!skeletonSamples.TryGetValue(skelPath, out skelSample))
+                                    {
+                                        skelSample = new SkeletonSample();
+
+                                        BeginSample("Read Skeleton");
+                                        try
+                                        {
+                                            scene.Read(skelPath, skelSample);
+                                        }
+                                        finally
+                                        {
+                                            EndSample();
+                                        }
+
+                                        skeletonSamples.Add(skelPath, skelSample);
+
+                                        // The bind pose is bone's inverse transformation matrix. This is done once here, so each
+                                        // skinned mesh doesn't need to do it redundantly.
+                                        SkeletonImporter.BuildBindTransforms(skelPath, skelSample, importOptions);
+
+                                        // Validate the binding transforms.
+                                        var bindXforms = new pxr.VtMatrix4dArray();
+                                        var prim = scene.GetPrimAtPath(skelPath);
+                                        var skel = new pxr.UsdSkelSkeleton(prim);
+
+                                        pxr.UsdSkelSkeletonQuery skelQuery;
+                                        BeginSample("Get SkelQuery");
+                                        try
+                                        {
+                                            skelQuery = primMap.SkelCache.GetSkelQuery(skel);
+                                        }
+                                        finally
+                                        {
+                                            EndSample();
+                                        }
+
+                                        BeginSample("Get JointWorldBind Transforms");
+                                        try
+                                        {
+                                            if (!skelQuery.GetJointWorldBindTransforms(bindXforms))
+                                            {
+                                                throw new ImportException("Failed to compute binding transforms for <" + skelPath +
+                                                    ">");
+                                            }
+                                        }
+                                        finally
+                                        {
+                                            EndSample();
+                                        }
+
+                                        SkeletonImporter.BuildDebugBindTransforms(skelSample, primMap[skelPath], importOptions);
+                                    }
+                                }
+                                finally
+                                {
+                                    EndSample();
                                 }
 
-                                Profiler.EndSample();
-
-                                SkeletonImporter.BuildDebugBindTransforms(skelSample, primMap[skelPath], importOptions);
-                            }
-
-                            Profiler.EndSample();
-
-                            if (importOptions.importSkinWeights)
-                            {
-                                //
-                                // Apply skinning weights to each skinned mesh.
-                                //
-                                Profiler.BeginSample("Apply Skin Weights");
-                                foreach (var skinningQuery in skelBinding.GetSkinningTargetsAsVector())
+                                if (importOptions.importSkinWeights)
                                 {
-                                    pxr.SdfPath meshPath = skinningQuery.GetPrim().GetPath();
+                                    //
+                                    // Apply skinning weights to each skinned mesh.
+                                    //
+                                    BeginSample("Apply Skin Weights");
                                     try
                                     {
-                                        var goMesh = primMap[meshPath];
-
-                                        Profiler.BeginSample("Build Skinned Mesh");
-                                        SkeletonImporter.BuildSkinnedMesh(
-                                            meshPath,
-                                            skelPath,
-                                            skelSample,
-                                            skinningQuery,
-                                            goMesh,
-                                            primMap,
-                                            importOptions);
-                                        Profiler.EndSample();
-
-                                        // In terms of performance, this is almost free.
-                                        // TODO: Check if this is correct or should be something specific (not always the first child).
-                                        goMesh.GetComponent<SkinnedMeshRenderer>().rootBone =
-                                            primMap[skelPath].transform.GetChild(0);
+                                        foreach (var skinningQuery in skelBinding.GetSkinningTargetsAsVector())
+                                        {
+                                            pxr.SdfPath meshPath = skinningQuery.GetPrim().GetPath();
+                                            try
+                                            {
+                                                var goMesh = primMap[meshPath];
+
+                                                BeginSample("Build Skinned Mesh");
+                                                try
+                                                {
+                                                    SkeletonImporter.BuildSkinnedMesh(
+                                                        meshPath,
+                                                        skelPath,
+                                                        skelSample,
+                                                        skinningQuery,
+                                                        goMesh,
+                                                        primMap,
+                                                        importOptions);
+                                                }
+                                                finally
+                                                {
+                                                    EndSample();
+                                                }
+
+                                                // In terms of performance, this is almost free.
+                                                // TODO: Check if this is correct or should be something specific (not always the first child).
+                                                goMesh.GetComponent<SkinnedMeshRenderer>().rootBone =
+                                                    primMap[skelPath].transform.GetChild(0);
+                                            }
+                                            catch (System.Exception ex)
+                                            {
+                                                Debug.LogException(new ImportException("Error skinning mesh: " + meshPath, ex));
+                                                primMap.HasErrors = true;
+                                            }
+                                        }
                                     }
-                                    catch (System.Exception ex)
+                                    finally
                                     {
-                                        Debug.LogException(new ImportException("Error skinning mesh: " + meshPath, ex));
-                                        primMap.HasErrors = true;
+                                        EndSample();
                                     }
                                 }
-
-                                Profiler.EndSample();
                             }
                         }
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing SkelRoot <" + skelRoot.GetPath() + ">", ex));
-                        primMap.HasErrors = true;
-                    }
-                } // foreach SkelRoot
-
-                Profiler.EndSample();
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogException(
+                                new ImportException("Error processing SkelRoot <" + skelRoot.GetPath() + ">", ex));
+                            primMap.HasErrors = true;
+                        }
+                    } // foreach SkelRoot
+                }
+                finally
+                {
+                    EndSample();
+                }
 
                 if (ShouldYield(targetTime, timer))
                 {
@@ -1134,77 +1270,118 @@ namespace Unity.Formats.USD
                 //
                 // Bone transforms.
                 //
-                Profiler.BeginSample("USD: Pose Bones");
-                foreach (var pathAndSample in skeletonSamples)
+                BeginSample("USD: Pose Bones");
+                try
                 {
-                    var skelPath = pathAndSample.Key;
-
+                    // The joint transforms of all skeletons are computed at once, with the queries kept
+                    // by the UsdSkelCache populated when building the hierarchy, so that playback
+                    // only evaluates the transforms at every frame.
+                    SkeletonPoseTable poses = null;
                     try
                     {
-                        var prim = scene.GetPrimAtPath(skelPath);
-                        var skel = new pxr.UsdSkelSkeleton(prim);
-
-                        pxr.UsdSkelSkeletonQuery skelQuery = primMap.SkelCache.GetSkelQuery(skel);
-                        var joints = skelQuery.GetJointOrder();
-                        var restXforms = new pxr.VtMatrix4dArray();
-                        var time = scene.Time.HasValue ? scene.Time.Value : pxr.UsdTimeCode.Default();
+                        var skelPaths = new pxr.SdfPath[skeletonSamples.Count];
+                        skeletonSamples.Keys.CopyTo(skelPaths, 0);
 
-                        Profiler.BeginSample("Compute Joint Local Transforms");
-                        if (!skelQuery.ComputeJointLocalTransforms(restXforms, time, atRest: false))
+                        BeginSample("Compute Joint Local Transforms");
+                        try
                         {
-                            throw new ImportException("Failed to compute bind transforms for <" + skelPath + ">");
+                            poses = scene.ComputeSkeletonPoses(primMap.SkelCache, skelPaths,
+                                localTransforms: true, skinningTransforms: false);
                         }
+                        finally
+                        {
+                            EndSample();
+                        }
+                    }
+                    catch (System.Exception ex)
+                    {
+                        Debug.LogException(new ImportException("Failed to compute skeleton poses", ex));
+                        primMap.HasErrors = true;
+                    }
 
-                        Profiler.EndSample();
-
-                        Profiler.BeginSample("Build Bones");
-                        for (int i = 0; i < joints.size(); i++)
+                    for (int entry = 0; poses != null && entry < poses.Count; entry++)
+                    {
+                        var skelPath = poses.Paths[entry];
+                        try
                         {
-                            var jointPath = scene.GetSdfPath(joints[i]);
-                            if (joints[i] == "/")
-                            {
-                                jointPath = skelPath;
-                            }
-                            else if (jointPath.IsAbsolutePath())
+                            if ((poses.Flags[entry] & SkeletonPoseFlags.Failed) != 0)
                             {
-                                Debug.LogException(
-                                    new System.Exception("Unexpected absolute joint path: " + jointPath));
-                                jointPath = new pxr.SdfPath(joints[i].ToString().TrimStart('/'));
-                                jointPath = skelPath.AppendPath(jointPath);
+                                throw new ImportException("Failed to compute bind transforms for <" + skelPath + ">");
                             }
-                            else
+
+                            BeginSample("Build Bones");
+                            try
                             {
-                                jointPath = skelPath.AppendPath(jointPath);
-                            }
+                                var jointOffset = poses.JointOffsets[entry];
+                                var joints = poses.GetJoints(entry);
+                                for (int i = 0; i < joints.Count; i++)
+                                {
+                                    var joint = joints.Array[joints.Offset + i];
+                                    var jointPath = scene.GetSdfPath(joint);
+                                    if (joint == "/")
+                                    {
+                                        jointPath = skelPath;
+                                    }
+                                    else if (jointPath.IsAbsolutePath())
+                                    {
+                                        Debug.LogException(
+                                            new System.Exception("Unexpected absolute joint path: " + jointPath));
+                                        jointPath = new pxr.SdfPath(joint.TrimStart('/'));
+                                        jointPath = skelPath.AppendPath(jointPath);
+                                    }
+                                    else
+                                    {
+                                        jointPath = skelPath.AppendPath(jointPath);
+                                    }
 
-                            var goBone = primMap[jointPath];
+                                    var goBone = primMap[jointPath];
 
-                            Profiler.BeginSample("Convert Matrix");
-                            var restXform = UnityTypeConverter.FromMatrix(restXforms[i]);
-                            Profiler.EndSample();
+                                    Matrix4x4 restXform;
+                                    BeginSample("Convert Matrix");
+                                    try
+                                    {
+                                        restXform = UnityTypeConverter.FromMatrix(poses.LocalTransforms,
+                                            (jointOffset + i) * 16);
+                                    }
+                                    finally
+                                    {
+                                        EndSample();
+                                    }
 
-                            Profiler.BeginSample("Build Bone");
-                            SkeletonImporter.BuildSkeletonBone(skelPath, goBone, restXform, joints, importOptions);
-                            Profiler.EndSample();
+                                    BeginSample("Build Bone");
+                                    try
+                                    {
+                                        SkeletonImporter.BuildSkeletonBone(skelPath, goBone, restXform, importOptions);
+                                    }
+                                    finally
+                                    {
+                                        EndSample();
+                                    }
+                                }
+                            }
+                            finally
+                            {
+                                EndSample();
+                            }
+                        }
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogException(
+                                new ImportException("Error processing SkelRoot <" + skelPath + ">", ex));
+                            primMap.HasErrors = true;
                         }
 
-                        Profiler.EndSample();
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogException(
-                            new ImportException("Error processing SkelRoot <" + skelPath + ">", ex));
-                        primMap.HasErrors = true;
-                    }
-
-                    if (ShouldYield(targetTime, timer))
-                    {
-                        yield return null;
-                        ResetTimer(timer);
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
             }
 
             //
@@ -1212,7 +1389,7 @@ namespace Unity.Formats.USD
             //
             if (importOptions.importSceneInstances)
             {
-                Profiler.BeginSample("USD: Build Scene-Instances");
+                BeginSample("USD: Build Scene-Instances");
                 try
                 {
                     // Build scene instances.
@@ -1223,7 +1400,7 @@ namespace Unity.Formats.USD
                     Debug.LogException(new ImportException("Failed in BuildSceneInstances", ex));
                 }
 
-                Profiler.EndSample();
+                EndSample();
             }
 
             if (ShouldYield(targetTime, timer))
@@ -1235,84 +1412,129 @@ namespace Unity.Formats.USD
             // Build point instances.
             if (importOptions.importPointInstances)
             {
-                Profiler.BeginSample("USD: Build Point-Instances");
-                // TODO: right now all point instancer data is read, but we only need prototypes and indices.
-                var pointInstancerSamples = scene.ReadAll<PointInstancerSample>();
-                primMap.ContainsPointInstances = pointInstancerSamples.Length > 0;
-
-                foreach (var pathAndSample in pointInstancerSamples)
+                BeginSample("USD: Build Point-Instances");
+                try
                 {
-                    try
-                    {
-                        GameObject instancerGo = primMap[pathAndSample.path];
-
-                        // Now build the point instances.
-                        InstanceImporter.BuildPointInstances(scene,
-                            primMap,
-                            pathAndSample.path,
-                            pathAndSample.sample,
-                            instancerGo,
-                            importOptions);
-                    }
-                    catch (System.Exception ex)
-                    {
-                        Debug.LogError("Error processing point instancer <" + pathAndSample.path + ">: " + ex.Message);
-                        primMap.HasErrors = true;
-                    }
+                    // TODO: right now all point instancer data is read, but we only need prototypes and indices.
+                    var pointInstancerSamples = scene.ReadAll<PointInstancerSample>();
+                    primMap.ContainsPointInstances = pointInstancerSamples.Length > 0;
 
-                    if (ShouldYield(targetTime, timer))
+                    foreach (var pathAndSample in pointInstancerSamples)
                     {
-                        yield return null;
-                        ResetTimer(timer);
+                        try
+                        {
+                            GameObject instancerGo = primMap[pathAndSample.path];
+
+                            // Now build the point instances.
+                            InstanceImporter.BuildPointInstances(scene,
+                                primMap,
+                                pathAndSample.path,
+                                pathAndSample.sample,
+                                instancerGo,
+                                importOptions);
+                        }
+                        catch (System.Exception ex)
+                        {
+                            Debug.LogError("Error processing point instancer <" + pathAndSample.path + ">: " + ex.Message);
+                            primMap.HasErrors = true;
+                        }
+
+                        if (ShouldYield(targetTime, timer))
+                        {
+                            yield return null;
+                            ResetTimer(timer);
+                        }
                     }
                 }
-
-                Profiler.EndSample();
+                finally
+                {
+                    EndSample();
+                }
             }
 
             //
             // Apply root transform corrections.
             //
-            Profiler.BeginSample("USD: Build Root Transforms");
-            if (!composingSubtree)
+            BeginSample("USD: Build Root Transforms");
+            try
             {
-                if (!root)
+                if (!composingSubtree)
                 {
-                    // There is no single root,
-                    // Apply root transform corrections to all imported root prims.
-                    foreach (KeyValuePair<pxr.SdfPath, GameObject> kvp in primMap)
+                    if (!root)
                     {
-                        if (kvp.Key.IsRootPrimPath() && kvp.Value != null)
+                        // There is no single root,
+                        // Apply root transform corrections to all imported root prims.
+                        foreach (KeyValuePair<pxr.SdfPath, GameObject> kvp in primMap)
                         {
-                            // The root object at which the USD scene will be reconstructed.
-                            // It may need a Z-up to Y-up conversion and a right- to left-handed change of basis.
-                            XformImporter.BuildSceneRoot(scene, kvp.Value.transform, importOptions);
+                            if (kvp.Key.IsRootPrimPath() && kvp.Value != null)
+                            {
+                                // The root object at which the USD scene will be reconstructed.
+                                // It may need a Z-up to Y-up conversion and a right- to left-handed change of basis.
+                                XformImporter.BuildSceneRoot(scene, kvp.Value.transform, importOptions);
+                            }
                         }
                     }
-                }
-                else
-                {
-                    // There is only one root, apply a single transform correction.
-                    XformImporter.BuildSceneRoot(scene, root.transform, importOptions);
+                    else
+                    {
+                        // There is only one root, apply a single transform correction.
+                        XformImporter.BuildSceneRoot(scene, root.transform, importOptions);
+                    }
                 }
             }
+            finally
+            {
+                EndSample();
+            }
 
-            Profiler.EndSample();
-
-            Profiler.BeginSample("USD: Post Process Components");
-            foreach (var processor in root.GetComponents<IImportPostProcessComponents>())
+            BeginSample("USD: Post Process Components");
+            try
             {
-                try
+                foreach (var processor in root.GetComponents<IImportPostProcessComponents>())
                 {
-                    processor.PostProcessComponents(primMap, importOptions);
-                }
-                catch (System.Exception ex)
-                {
-                    Debug.LogException(ex);
-                    primMap.HasErrors = true;
+                    try
+                    {
+                        processor.PostProcessComponents(primMap, importOptions);
+                    }
+                    catch (System.Exception ex)
+                    {
+                        Debug.LogException(ex);
+                        primMap.HasErrors = true;
+                    }
                 }
             }
+            finally
+            {
+                EndSample();
+            }
+        }
+
+        /// <summary>
+        /// Returns the paths which need to be read at the current time. Once the access mask has been
+        /// populated, prims which are not time-varying are skipped entirely.
+        /// </summary>
+        internal static pxr.SdfPath[] GetPathsToRead(Scene scene, pxr.SdfPath[] paths)
+        {
+            var accessMask = scene.AccessMask;
+            if (accessMask == null || accessMask.TimeVarying == null || scene.IsPopulatingAccessMask)
+            {
+                return paths;
+            }
 
+            return accessMask.TimeVarying.Filter(paths);
+        }
+
+        /// <summary>
+        /// Begins a sample of the Unity profiler and an InteropProfiler phase of the same name.
+        /// </summary>
+        private static void BeginSample(string name)
+        {
+            Profiler.BeginSample(name);
+            InteropProfiler.BeginPhase(name);
+        }
+
+        private static void EndSample()
+        {
+            InteropProfiler.EndPhase();
             Profiler.EndSample();
         }
 
@@ -76,8 +76,11 @@ namespace Unity.Formats.USD
             scene.Write(objContext.path, sample);
 
             // Stop Skeleton from rendering bones in usdview by default.
-            var im = new pxr.UsdGeomImageable(scene.GetPrimAtPath(objContext.path));
-            im.CreatePurposeAttr().Set(pxr.UsdGeomTokens.guide);
+            SceneExporter.EditStage(exportContext, s =>
+            {
+                var im = new pxr.UsdGeomImageable(s.GetPrimAtPath(objContext.path));
+                im.CreatePurposeAttr().Set(pxr.UsdGeomTokens.guide);
+            });
         }
 
         public static void ExportSkelRoot(ObjectContext objContext, ExportContext exportContext)
@@ -120,8 +123,8 @@ namespace Unity.Formats.USD
                 sample.extent.center = UnityTypeConverter.ChangeBasis(sample.extent.center);
             }
 
-            pxr.UsdPrim usdPrim = exportContext.scene.GetPrimAtPath(objContext.path);
-            pxr.UsdSkelBindingAPI.Apply(usdPrim);
+            SceneExporter.EditStage(exportContext,
+                s => pxr.UsdSkelBindingAPI.Apply(s.GetPrimAtPath(objContext.path)));
 
             // Convert the transform
             var path = new pxr.SdfPath(objContext.path);
@@ -31,6 +31,14 @@ namespace Unity.Formats.USD
             Matrix4x4 restXform,
             VtTokenArray joints,
             SceneImportOptions importOptions)
+        {
+            BuildSkeletonBone(skelPath, go, restXform, importOptions);
+        }
+
+        public static void BuildSkeletonBone(string skelPath,
+            GameObject go,
+            Matrix4x4 restXform,
+            SceneImportOptions importOptions)
         {
             // Perform change of basis, if needed.
             XformImporter.ImportXform(ref restXform, importOptions);
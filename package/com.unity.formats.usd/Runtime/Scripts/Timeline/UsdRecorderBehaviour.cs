@@ -36,6 +36,7 @@ namespace Unity.Formats.USD
         string currentDir;
         DirectoryInfo usdzTemporaryDir;
         GameObject _root;
+        BackgroundSceneWriter m_backgroundWriter;
 
         // ------------------------------------------------------------------------------------------ //
         // Recording Control.
@@ -52,6 +53,7 @@ namespace Unity.Formats.USD
                 return;
             }
 
+            FinishBackgroundWriter();
             if (Clip.UsdScene != null)
             {
                 Clip.UsdScene.Close();
@@ -134,6 +136,15 @@ namespace Unity.Formats.USD
                 SceneExporter.Export(root,
                     Clip.Context,
                     zeroRootTransform: false);
+
+                // The time samples are written by a worker thread, while the main thread moves on.
+                if (Clip.m_writeInBackground)
+                {
+                    m_backgroundWriter = new BackgroundSceneWriter(Clip.UsdScene,
+                        Mathf.Max(1, Clip.m_maxQueuedFrames),
+                        Clip.m_maxFrameWaitMs < 0 ? System.Threading.Timeout.Infinite : Clip.m_maxFrameWaitMs);
+                    Clip.Context.backgroundWriter = m_backgroundWriter;
+                }
             }
             catch
             {
@@ -165,6 +176,9 @@ namespace Unity.Formats.USD
                 return;
             }
 
+            // Wait for the worker thread to write the remaining frames before saving.
+            FinishBackgroundWriter();
+
             try
             {
                 if (Clip.IsUSDZ && usdzTemporaryDir != null)
@@ -228,7 +242,46 @@ namespace Unity.Formats.USD
 
             Clip.UsdScene.Time = currentTime * kExportFrameRate;
             Clip.Context.exportMaterials = false;
-            SceneExporter.Export(root, Clip.Context, zeroRootTransform: false);
+
+            if (m_backgroundWriter == null)
+            {
+                SceneExporter.Export(root, Clip.Context, zeroRootTransform: false);
+                return;
+            }
+
+            m_backgroundWriter.BeginFrame();
+            try
+            {
+                SceneExporter.Export(root, Clip.Context, zeroRootTransform: false);
+            }
+            finally
+            {
+                m_backgroundWriter.EndFrame();
+            }
+        }
+
+        void FinishBackgroundWriter()
+        {
+            if (m_backgroundWriter == null)
+            {
+                return;
+            }
+
+            m_backgroundWriter.Dispose();
+            if (m_backgroundWriter.LateFrames > 0 || m_backgroundWriter.DroppedFrames > 0)
+            {
+                Debug.LogWarning(string.Format(
+                    "USD recording could not keep up: {0} of {1} frames were late and {2} were dropped, "
+                    + "waiting {3:F0} ms in total for frames to be written.",
+                    m_backgroundWriter.LateFrames, m_backgroundWriter.SubmittedFrames,
+                    m_backgroundWriter.DroppedFrames, m_backgroundWriter.WaitTime.TotalMilliseconds));
+            }
+
+            m_backgroundWriter = null;
+            if (Clip.Context != null)
+            {
+                Clip.Context.backgroundWriter = null;
+            }
         }
 
         bool IsPlaying()
@@ -34,6 +34,16 @@ namespace Unity.Formats.USD
         // If null/empty, the file will be created in memory only.
         public string m_usdFile = "Assets/recording.usd";
 
+        // When enabled, each frame is copied on the main thread and written to USD by a worker thread.
+        public bool m_writeInBackground = false;
+
+        // The number of copied frames which may wait for the worker thread.
+        public int m_maxQueuedFrames = 2;
+
+        // How long to wait for the worker thread when the queue is full before dropping the frame,
+        // in milliseconds. Negative values wait as long as needed and never drop frames.
+        public int m_maxFrameWaitMs = -1;
+
         // The scene object to which the recording will be saved.
         public Scene UsdScene { get; set; }
 
@@ -1,9 +1,11 @@
+using System;
 using System.IO;
 using NUnit.Framework;
 using pxr;
 using UnityEditor;
 using UnityEngine;
 using USD.NET;
+using USD.NET.Unity;
 
 namespace Unity.Formats.USD.Tests
 {
@@ -141,4 +143,195 @@ namespace Unity.Formats.USD.Tests
             }
         }
     }
+
+    public class ImportMeshCacheTests : BaseFixtureEditor
+    {
+        string CacheDirectory => Path.Combine(ArtifactsDirectoryFullPath, "MeshImportCache");
+
+        static Mesh CreateQuad()
+        {
+            var mesh = new Mesh();
+            mesh.vertices = new[]
+            {
+                new Vector3(0, 0, 0), new Vector3(1, 0, 0), new Vector3(1, 1, 0), new Vector3(0, 1, 0)
+            };
+            mesh.normals = new[] { Vector3.back, Vector3.back, Vector3.back, Vector3.back };
+            mesh.triangles = new[] { 0, 2, 1, 0, 3, 2 };
+            return mesh;
+        }
+
+        static void AssertMeshesEqual(Mesh expected, Mesh actual)
+        {
+            Assert.AreEqual(expected.vertices, actual.vertices);
+            Assert.AreEqual(expected.normals, actual.normals);
+            Assert.AreEqual(expected.colors, actual.colors);
+            Assert.AreEqual(expected.subMeshCount, actual.subMeshCount);
+            for (int i = 0; i < expected.subMeshCount; i++)
+            {
+                Assert.AreEqual(expected.GetTriangles(i), actual.GetTriangles(i));
+            }
+        }
+
+        [Test]
+        public void StoreAndLoad_RoundTrips()
+        {
+            var cache = new MeshImportCache(CacheDirectory, 1L << 20);
+            var mesh = CreateQuad();
+            var entry = new MeshImportCache.Entry
+            {
+                active = false,
+                displayColor = Color.red,
+                subsetPaths = new[] { "/Quad/subset" },
+            };
+
+            Assert.IsFalse(cache.Contains("quad"));
+            cache.Store("quad", mesh, entry);
+            Assert.IsTrue(cache.Contains("quad"));
+
+            var loadedMesh = new Mesh();
+            var loadedEntry = cache.Load("quad", loadedMesh);
+            AssertMeshesEqual(mesh, loadedMesh);
+            Assert.AreEqual(entry.active, loadedEntry.active);
+            Assert.AreEqual(entry.displayColor, loadedEntry.displayColor);
+            Assert.AreEqual(entry.subsetPaths, loadedEntry.subsetPaths);
+        }
+
+        [Test]
+        public void Load_CorruptEntry_LeavesMeshUnchanged()
+        {
+            var cache = new MeshImportCache(CacheDirectory, 1L << 20);
+            cache.Store("quad", CreateQuad(), new MeshImportCache.Entry());
+
+            // Truncate the entry in the middle of its vertex data.
+            var entryPath = Directory.GetFiles(CacheDirectory)[0];
+            var bytes = File.ReadAllBytes(entryPath);
+            Array.Resize(ref bytes, bytes.Length - 20);
+            File.WriteAllBytes(entryPath, bytes);
+
+            var mesh = CreateQuad();
+            Assert.Throws<InvalidDataException>(() => cache.Load("quad", mesh));
+            AssertMeshesEqual(CreateQuad(), mesh);
+            Assert.IsFalse(cache.Contains("quad"));
+        }
+
+        [Test]
+        public void ComputeSceneKey_ChangesWhenLayerIsEdited()
+        {
+            var options = new SceneImportOptions();
+            var scene = TestUtility.CreateTestUsdScene(ArtifactsDirectoryFullPath);
+            var savedKey = MeshImportCache.ComputeSceneKey(scene, options);
+            Assert.AreEqual(savedKey, MeshImportCache.ComputeSceneKey(scene, options));
+
+            scene.Write("/root/cube", new CubeSample());
+            var editedKey = MeshImportCache.ComputeSceneKey(scene, options);
+            Assert.AreNotEqual(savedKey, editedKey);
+
+            scene.Save();
+            var resavedKey = MeshImportCache.ComputeSceneKey(scene, options);
+            scene.Close();
+            Assert.AreNotEqual(savedKey, resavedKey);
+        }
+
+        [Test]
+        public void Trim_EvictsLeastRecentlyUsedEntries()
+        {
+            var cache = new MeshImportCache(CacheDirectory, 1L << 20);
+            var mesh = CreateQuad();
+            foreach (var key in new[] { "a", "b", "c" })
+            {
+                cache.Store(key, mesh, new MeshImportCache.Entry());
+            }
+
+            var files = Directory.GetFiles(CacheDirectory);
+            Assert.AreEqual(3, files.Length);
+            foreach (var file in files)
+            {
+                File.SetLastAccessTimeUtc(file, DateTime.UtcNow.AddDays(-1));
+            }
+
+            // Loading an entry marks it as the most recently used.
+            cache.Load("a", new Mesh());
+
+            var entrySize = new FileInfo(files[0]).Length;
+            new MeshImportCache(CacheDirectory, entrySize).Trim();
+            Assert.IsTrue(cache.Contains("a"));
+            Assert.IsFalse(cache.Contains("b"));
+            Assert.IsFalse(cache.Contains("c"));
+        }
+
+        [Test]
+        public void ImportWithCache_MatchesImportWithoutCache()
+        {
+            string usdPath;
+            var scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            var freshRoot = ImportHelpers.ImportSceneAsGameObject(scene);
+            scene.Close();
+
+            var options = new SceneImportOptions
+            {
+                useImportCache = true,
+                importCacheDirectory = CacheDirectory,
+            };
+
+            // The first import fills the cache, the second one restores its meshes from it.
+            scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            ImportHelpers.ImportSceneAsGameObject(scene, importOptions: options);
+            scene.Close();
+            Assert.IsNotEmpty(Directory.GetFiles(CacheDirectory));
+
+            scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            var cachedRoot = ImportHelpers.ImportSceneAsGameObject(scene, importOptions: options);
+            scene.Close();
+
+            AssertImportsEqual(freshRoot, cachedRoot);
+        }
+
+        [Test]
+        public void ImportWithCorruptCache_ReadsMeshesFromUsd()
+        {
+            string usdPath;
+            var scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            var freshRoot = ImportHelpers.ImportSceneAsGameObject(scene);
+            scene.Close();
+
+            var options = new SceneImportOptions
+            {
+                useImportCache = true,
+                importCacheDirectory = CacheDirectory,
+            };
+
+            scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            ImportHelpers.ImportSceneAsGameObject(scene, importOptions: options);
+            scene.Close();
+
+            // Overwrite the vertex counts of every entry, a cache must never fail an import.
+            var entryPaths = Directory.GetFiles(CacheDirectory);
+            Assert.IsNotEmpty(entryPaths);
+            foreach (var entryPath in entryPaths)
+            {
+                var bytes = File.ReadAllBytes(entryPath);
+                Array.Clear(bytes, 56, 4);
+                File.WriteAllBytes(entryPath, bytes);
+            }
+
+            scene = OpenUSDGUIDAssetScene(TestDataGuids.Variability.CubesUsd, out usdPath);
+            var recoveredRoot = ImportHelpers.ImportSceneAsGameObject(scene, importOptions: options);
+            scene.Close();
+
+            AssertImportsEqual(freshRoot, recoveredRoot);
+        }
+
+        static void AssertImportsEqual(GameObject expectedRoot, GameObject actualRoot)
+        {
+            var expectedMeshes = expectedRoot.GetComponentsInChildren<MeshFilter>(true);
+            var actualMeshes = actualRoot.GetComponentsInChildren<MeshFilter>(true);
+            Assert.AreEqual(expectedMeshes.Length, actualMeshes.Length);
+            Assert.IsNotEmpty(expectedMeshes);
+            for (int i = 0; i < expectedMeshes.Length; i++)
+            {
+                Assert.AreEqual(expectedMeshes[i].name, actualMeshes[i].name);
+                AssertMeshesEqual(expectedMeshes[i].sharedMesh, actualMeshes[i].sharedMesh);
+            }
+        }
+    }
 }
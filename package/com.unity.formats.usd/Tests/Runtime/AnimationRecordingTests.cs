@@ -15,6 +15,17 @@ namespace Unity.Formats.USD.Tests
     {
         [UnityTest]
         public IEnumerator TestExportSparseTimesampling()
+        {
+            return RecordSparseTimesampling(writeInBackground: false);
+        }
+
+        [UnityTest]
+        public IEnumerator TestExportSparseTimesampling_WriteInBackground()
+        {
+            return RecordSparseTimesampling(writeInBackground: true);
+        }
+
+        IEnumerator RecordSparseTimesampling(bool writeInBackground)
         {
             // Create the necessary objects
             // Cube is animated by an animation clip, Cylinder by a rigidbody,
@@ -51,6 +62,7 @@ namespace Unity.Formats.USD.Tests
             // set path to record to
             var recordedUsdFile = TestUtility.GetUSDScenePath(ArtifactsDirectoryFullPath);
             usdRecorderAsset.m_usdFile = recordedUsdFile;
+            usdRecorderAsset.m_writeInBackground = writeInBackground;
 
             usdRecorderAsset.m_exportRoot = new ExposedReference<GameObject> { exposedName = Guid.NewGuid().ToString() };
             director.SetReferenceValue(usdRecorderAsset.m_exportRoot.exposedName, cube);
@@ -0,0 +1,363 @@
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using NUnit.Framework;
+using pxr;
+using Unity.Formats.USD;
+using UnityEngine;
+using USD.NET.Tests;
+using Debug = UnityEngine.Debug;
+
+namespace USD.NET.Unity.Tests
+{
+    /// <summary>
+    /// Times USD.NET against the synthetic stages written by bin/benchmark.py.
+    /// </summary>
+    /// <remarks>
+    /// The benchmarks are excluded from regular test runs. They run when the Benchmark category is
+    /// selected and USD_BENCHMARK_STAGES is the path to a stage manifest, and write their timings as
+    /// JSON to USD_BENCHMARK_RESULTS. Run them with "python3 bin/benchmark.py run".
+    /// </remarks>
+    [Explicit, Category("Benchmark")]
+    class Benchmarks : UsdTests
+    {
+        const string kStagesVariable = "USD_BENCHMARK_STAGES";
+        const string kResultsVariable = "USD_BENCHMARK_RESULTS";
+        const string kIterationsVariable = "USD_BENCHMARK_ITERATIONS";
+
+        [Serializable]
+        class StageManifest
+        {
+            public string usdVersion;
+            public string preset;
+            public StageInfo[] stages;
+        }
+
+        [Serializable]
+        class StageInfo
+        {
+            public string name;
+            public string file;
+            public string kind;
+            public string format;
+            public string rootPath;
+            public string attribute;
+            public int prims;
+            public int meshes;
+            public int points;
+            public int joints;
+            public int frames;
+        }
+
+        [Serializable]
+        class BenchmarkResult
+        {
+            public string stage;
+            public string benchmark;
+            public int items;
+            public int iterations;
+            public double minMs;
+            public double medianMs;
+            public double meanMs;
+            public double maxMs;
+            public int gcCollections;
+        }
+
+        [Serializable]
+        class BenchmarkReport
+        {
+            public string usdVersion;
+            public string preset;
+            public string unityVersion;
+            public string platform;
+            public string timestamp;
+            public List<BenchmarkResult> results = new List<BenchmarkResult>();
+        }
+
+        StageManifest m_manifest;
+        string m_stagesDirectory;
+        int m_iterations;
+        BenchmarkReport m_report;
+
+        [OneTimeSetUp]
+        public void LoadManifest()
+        {
+            var manifestPath = Environment.GetEnvironmentVariable(kStagesVariable);
+            if (string.IsNullOrEmpty(manifestPath) || !File.Exists(manifestPath))
+            {
+                Assert.Ignore(kStagesVariable + " is not the path to a stage manifest, generate one with bin/benchmark.py.");
+            }
+
+            m_manifest = JsonUtility.FromJson<StageManifest>(File.ReadAllText(manifestPath));
+            m_stagesDirectory = Path.GetDirectoryName(Path.GetFullPath(manifestPath));
+
+            int iterations;
+            m_iterations = int.TryParse(Environment.GetEnvironmentVariable(kIterationsVariable), out iterations)
+                ? Math.Max(1, iterations)
+                : 5;
+
+            m_report = new BenchmarkReport
+            {
+                usdVersion = m_manifest.usdVersion,
+                preset = m_manifest.preset,
+                unityVersion = Application.unityVersion,
+                platform = SystemInfo.operatingSystem,
+                timestamp = DateTime.UtcNow.ToString("o"),
+            };
+        }
+
+        [OneTimeTearDown]
+        public void WriteResults()
+        {
+            if (m_report == null)
+            {
+                return;
+            }
+
+            var resultsPath = Environment.GetEnvironmentVariable(kResultsVariable);
+            if (string.IsNullOrEmpty(resultsPath))
+            {
+                resultsPath = Path.Combine(m_stagesDirectory, "benchmark_results.json");
+            }
+
+            File.WriteAllText(resultsPath, JsonUtility.ToJson(m_report, prettyPrint: true));
+            Debug.Log("USD: Wrote benchmark results to " + resultsPath);
+        }
+
+        [Test]
+        public void OpenTest()
+        {
+            foreach (var stage in m_manifest.stages)
+            {
+                var path = GetStagePath(stage);
+                Measure(stage, "Scene.Open", () =>
+                {
+                    var scene = Scene.Open(path);
+                    scene.Close();
+                    return stage.prims;
+                });
+            }
+        }
+
+        [Test]
+        public void ReadAllTest()
+        {
+            foreach (var stage in m_manifest.stages)
+            {
+                switch (stage.kind)
+                {
+                    case "meshes":
+                        MeasureReadAll<MeshSample>(stage);
+                        break;
+                    case "hierarchy":
+                    case "timesamples":
+                        MeasureReadAll<XformSample>(stage);
+                        break;
+                    case "crowd":
+                        MeasureReadAll<SkelAnimationSample>(stage);
+                        MeasureReadAll<SkeletonSample>(stage);
+                        break;
+                }
+            }
+        }
+
+        [Test]
+        public void WriteTest()
+        {
+            foreach (var stage in m_manifest.stages)
+            {
+                switch (stage.kind)
+                {
+                    case "meshes":
+                        MeasureWrite<MeshSample>(stage);
+                        break;
+                    case "hierarchy":
+                    case "timesamples":
+                        MeasureWrite<XformSample>(stage);
+                        break;
+                    case "crowd":
+                        MeasureWrite<SkelAnimationSample>(stage);
+                        break;
+                }
+            }
+        }
+
+        [Test]
+        public void ComputeKeyFramesTest()
+        {
+            foreach (var stage in m_manifest.stages)
+            {
+                if (string.IsNullOrEmpty(stage.attribute))
+                {
+                    continue;
+                }
+
+                var scene = Scene.Open(GetStagePath(stage));
+                try
+                {
+                    Measure(stage, "ComputeKeyFrames " + stage.attribute, () =>
+                    {
+                        var keyFrames = scene.ComputeKeyFrames(stage.rootPath, stage.attribute);
+                        return keyFrames.Count;
+                    });
+                }
+                finally
+                {
+                    scene.Close();
+                }
+            }
+        }
+
+        [Test]
+        public void FlattenAsTest()
+        {
+            foreach (var stage in m_manifest.stages)
+            {
+                var scene = Scene.Open(GetStagePath(stage));
+                var flattenedPath = GetTempFile(stage.format);
+                try
+                {
+                    Measure(stage, "FlattenAs", () =>
+                    {
+                        scene.FlattenAs(flattenedPath);
+                        return stage.prims;
+                    });
+                }
+                finally
+                {
+                    scene.Close();
+                    File.Delete(flattenedPath);
+                }
+            }
+        }
+
+        void MeasureReadAll<T>(StageInfo stage) where T : SampleBase, new()
+        {
+            var scene = Scene.Open(GetStagePath(stage));
+            try
+            {
+                scene.Time = GetSampleTime(stage);
+                Measure(stage, "ReadAll " + typeof(T).Name, () =>
+                {
+                    int count = 0;
+                    foreach (var pathAndSample in scene.ReadAll<T>(stage.rootPath))
+                    {
+                        count++;
+                    }
+
+                    return count;
+                });
+            }
+            finally
+            {
+                scene.Close();
+            }
+        }
+
+        /// <summary>
+        /// Times writing the samples of the stage to a new scene in memory, at every frame of the
+        /// stage when it is animated.
+        /// </summary>
+        void MeasureWrite<T>(StageInfo stage) where T : SampleBase, new()
+        {
+            var paths = new List<SdfPath>();
+            var samples = new List<T>();
+            var scene = Scene.Open(GetStagePath(stage));
+            try
+            {
+                scene.Time = GetSampleTime(stage);
+                foreach (var path in scene.Find<T>(stage.rootPath))
+                {
+                    var sample = new T();
+                    scene.Read(path, sample);
+                    paths.Add(path);
+                    samples.Add(sample);
+                }
+            }
+            finally
+            {
+                scene.Close();
+            }
+
+            var frames = Math.Max(1, stage.frames);
+            Measure(stage, "Write " + typeof(T).Name, () =>
+            {
+                var output = Scene.Create();
+                for (int frame = 0; frame < frames; frame++)
+                {
+                    output.Time = stage.frames > 0 ? frame : (double?)null;
+                    for (int i = 0; i < paths.Count; i++)
+                    {
+                        output.Write(paths[i], samples[i]);
+                    }
+                }
+
+                output.Close();
+                return paths.Count * frames;
+            });
+        }
+
+        /// <summary>
+        /// Runs the action once to warm up, then the configured number of times, and records the
+        /// timings. The action returns the number of items it processed.
+        /// </summary>
+        void Measure(StageInfo stage, string benchmark, Func<int> action)
+        {
+            var items = action();
+            var times = new double[m_iterations];
+
+            GC.Collect();
+            GC.WaitForPendingFinalizers();
+            var collections = GC.CollectionCount(0);
+            var stopwatch = new Stopwatch();
+            for (int i = 0; i < m_iterations; i++)
+            {
+                stopwatch.Restart();
+                action();
+                stopwatch.Stop();
+                times[i] = stopwatch.Elapsed.TotalMilliseconds;
+            }
+
+            collections = GC.CollectionCount(0) - collections;
+
+            var total = 0.0;
+            foreach (var time in times)
+            {
+                total += time;
+            }
+
+            Array.Sort(times);
+            var middle = times.Length / 2;
+            var result = new BenchmarkResult
+            {
+                stage = stage.name,
+                benchmark = benchmark,
+                items = items,
+                iterations = m_iterations,
+                minMs = times[0],
+                medianMs = times.Length % 2 == 1 ? times[middle] : (times[middle - 1] + times[middle]) * 0.5,
+                meanMs = total / times.Length,
+                maxMs = times[times.Length - 1],
+                gcCollections = collections,
+            };
+            m_report.results.Add(result);
+
+            Debug.Log(string.Format("USD benchmark {0} {1}: {2:F3} ms median over {3} iterations, {4} items",
+                stage.name, benchmark, result.medianMs, m_iterations, items));
+        }
+
+        string GetStagePath(StageInfo stage)
+        {
+            return Path.Combine(m_stagesDirectory, stage.file);
+        }
+
+        /// <summary>
+        /// Returns the middle frame of animated stages, or null to read the default time.
+        /// </summary>
+        static double? GetSampleTime(StageInfo stage)
+        {
+            return stage.frames > 0 ? stage.frames / 2 : (double?)null;
+        }
+    }
+}
@@ -189,6 +189,135 @@ namespace USD.NET.Unity.Tests
             Assert.Throws<System.Exception>(delegate () { UnityTypeConverter.GetPath(null, a.transform); });
         }
 
+        [Test]
+        public void NativeArrayViewTest()
+        {
+            var points = new[] { new Vector3(1, 2, 3), new Vector3(4, 5, 6) };
+            var vtPoints = UnityTypeConverter.ToVtArray(points);
+
+            var view = UnityTypeConverter.AsNativeArray(vtPoints);
+            Assert.AreEqual(points.Length, view.Length);
+            Assert.AreEqual(points[1], view[1]);
+
+            // Reinterpreting the storage with a different element size.
+            var floats = UnityTypeConverter.AsNativeArray<float>(vtPoints.GetConstDataPointer(),
+                vtPoints.size(), pxr.VtVec3fArray.GetElementSize());
+            Assert.AreEqual(6, floats.Length);
+            Assert.AreEqual(5, floats[4]);
+
+            Assert.Throws<System.ArgumentException>(delegate()
+            {
+                UnityTypeConverter.AsNativeArray<Vector4>(vtPoints.GetConstDataPointer(),
+                    vtPoints.size(), pxr.VtVec3fArray.GetElementSize());
+            });
+
+#if UNITY_2021_2_OR_NEWER
+            var span = vtPoints.AsReadOnlySpan<Vector3>();
+            Assert.AreEqual(points.Length, span.Length);
+            Assert.AreEqual(points[0], span[0]);
+#endif
+        }
+
+        [Test]
+        public void BulkConversionTest()
+        {
+            // Matrices are converted between float and double without being transposed.
+            var matrix = Matrix4x4.TRS(new Vector3(1, 2, 3), Quaternion.Euler(10, 20, 30), Vector3.one * 2);
+            var vtMatrices = UnityTypeConverter.ToVtArray(new[] { matrix, Matrix4x4.identity });
+            Assert.AreEqual(UnityTypeConverter.ToGfMatrix(matrix), vtMatrices[0]);
+            AssertEqual(new[] { matrix, Matrix4x4.identity }, UnityTypeConverter.FromVtArray(vtMatrices));
+
+            // Quaternions are reordered, leaving the input untouched.
+            var quats = new[] { new Quaternion(1, 2, 3, 4) };
+            var vtQuats = UnityTypeConverter.ToVtArray(quats);
+            Assert.AreEqual(4, vtQuats[0].GetReal());
+            Assert.AreEqual(new Quaternion(1, 2, 3, 4), quats[0]);
+            Assert.AreEqual(quats[0], UnityTypeConverter.FromVtArray(vtQuats)[0]);
+
+            var colors = new[] { new Color32(0, 64, 128, 255) };
+            var vtColors = UnityTypeConverter.ToVtArray(colors);
+            Assert.AreEqual(128 / 255f, vtColors[0][2], 1e-6f);
+            Assert.AreEqual(colors[0], UnityTypeConverter.Color32FromVtArray(vtColors)[0]);
+
+            // The generic registry converts any vector array with a matching layout.
+            var vtPoints = new pxr.VtVec3dArray(2, new pxr.GfVec3d(1, 2, 3));
+            Vector3[] points = null;
+            VtComponentArrays.CopyToArray(vtPoints, ref points);
+            Assert.AreEqual(new Vector3(1, 2, 3), points[1]);
+            VtComponentArrays.CopyFromArray(vtPoints, new[] { new Vector3(4, 5, 6) });
+            Assert.AreEqual(1, vtPoints.size());
+            Assert.AreEqual(new pxr.GfVec3d(4, 5, 6), vtPoints[0]);
+            Assert.AreEqual(3, VtComponentArrays.GetComponentCount(typeof(pxr.VtVec3dArray)));
+            Assert.Throws<System.ArgumentException>(delegate ()
+            {
+                VtComponentArrays.CopyToArray(vtPoints, ref quats);
+            });
+        }
+
+        [Test]
+        public void GfValueTest()
+        {
+            // The by-value conversions agree with the proxy class conversions.
+            var matrix = Matrix4x4.TRS(new Vector3(1, 2, 3), Quaternion.Euler(10, 20, 30), Vector3.one * 2);
+            var gfMatrix = UnityTypeConverter.ToGfMatrix(matrix);
+            var matrixValue = UnityTypeConverter.ToGfMatrix4dValue(matrix);
+            Assert.AreEqual(gfMatrix, (pxr.GfMatrix4d)matrixValue);
+            Assert.AreEqual(matrixValue, (pxr.GfMatrix4dValue)gfMatrix);
+            Assert.AreEqual(UnityTypeConverter.FromMatrix(gfMatrix), UnityTypeConverter.FromMatrix(matrixValue));
+
+            // Quaternions use the Unity layout, the real component is reordered in C++.
+            var quat = new pxr.GfQuatf(4, new pxr.GfVec3f(1, 2, 3));
+            Assert.AreEqual(new pxr.GfQuatfValue(1, 2, 3, 4), (pxr.GfQuatfValue)quat);
+            Assert.AreEqual(new Quaternion(1, 2, 3, 4), UnityTypeConverter.QuatfToQuaternion((pxr.GfQuatfValue)quat));
+
+            pxr.VtValue vtValue = new pxr.GfVec3fValue(1, 2, 3);
+            pxr.GfVec3fValue v3;
+            Assert.IsTrue(pxr.UsdCs.VtValueToGfVec3fValue(vtValue, out v3));
+            Assert.AreEqual(new Vector3(1, 2, 3), UnityTypeConverter.Vec3fToVector3(v3));
+
+            // A value of another type reads as zeros.
+            Assert.IsFalse(pxr.UsdCs.VtValueToGfVec3fValue(new pxr.VtValue(1.0f), out v3));
+            Assert.AreEqual(Vector3.zero, UnityTypeConverter.Vec3fToVector3(v3));
+
+            var range = (pxr.GfRange3dValue)new pxr.GfRange3d(new pxr.GfVec3d(1, 2, 3), new pxr.GfVec3d(4, 5, 6));
+            Assert.AreEqual(new pxr.GfVec3dValue(1, 2, 3), range.min);
+            Assert.AreEqual(new pxr.GfVec3dValue(4, 5, 6), range.max);
+        }
+
+        [Test]
+        public void TypedWriterTest()
+        {
+            // Vectors share the USD layout and are written without a VtValue, Quaternions do not.
+            UsdTypeBinding binding;
+            Assert.IsTrue(UsdIo.Bindings.GetBinding(typeof(Vector3[]), out binding));
+            Assert.IsNotNull(binding.attributeWriter);
+            Assert.IsTrue(UsdIo.Bindings.GetBinding(typeof(Quaternion[]), out binding));
+            Assert.IsNull(binding.attributeWriter);
+
+            var scene = Scene.Create();
+            var prim = scene.Stage.DefinePrim(new pxr.SdfPath("/Foo"), new pxr.TfToken("Xform"));
+            var attr = prim.CreateAttribute(new pxr.TfToken("points"), pxr.SdfValueTypeNames.Float3Array);
+            var points = new[] { new Vector3(1, 2, 3), new Vector3(4, 5, 6) };
+
+            var handle = System.Runtime.InteropServices.GCHandle.Alloc(points,
+                System.Runtime.InteropServices.GCHandleType.Pinned);
+            try
+            {
+                Assert.IsTrue(pxr.UsdCs.UsdAttributeSetVtVec3fArray(attr, pxr.UsdTimeCode.Default(),
+                    handle.AddrOfPinnedObject(), (uint)points.Length));
+            }
+            finally
+            {
+                handle.Free();
+            }
+
+            var vtValue = new pxr.VtValue();
+            Assert.IsTrue(attr.Get(vtValue, pxr.UsdTimeCode.Default()));
+            var vtPoints = pxr.UsdCs.VtValueToVtVec3fArray(vtValue);
+            AssertEqual(points, UnityTypeConverter.FromVtArray(vtPoints));
+            scene.Close();
+        }
+
         [Test]
         public void HasPreserveAttribute()
         {
@@ -43,6 +43,51 @@ namespace USD.NET.Unity.Tests
             AssertEqual(sample.xformOpOrder, sample2.xformOpOrder);
         }
 
+        [Test]
+        public static void ComputeTransformsTest()
+        {
+            var scene = Scene.Create();
+            var parent = new USD.NET.Unity.XformSample();
+            var child = new USD.NET.Unity.XformSample();
+
+            var m = new pxr.GfMatrix4d();
+            m.SetTranslate(new pxr.GfVec3d(1, 2, 3));
+            parent.transform = USD.NET.Unity.UnityTypeConverter.FromMatrix(m);
+            m.SetTranslate(new pxr.GfVec3d(10, 20, 30));
+            child.transform = USD.NET.Unity.UnityTypeConverter.FromMatrix(m);
+
+            scene.Write("/Parent", parent);
+            scene.Write("/Parent/Child", child);
+
+            var paths = new[] { new pxr.SdfPath("/Parent/Child"), new pxr.SdfPath("/Parent") };
+            var local = new double[paths.Length * 16];
+            var world = new double[paths.Length * 16];
+            var flags = new int[paths.Length];
+            scene.ComputeTransforms(paths, local, world, flags);
+
+            AssertEqual(child.transform, USD.NET.Unity.UnityTypeConverter.FromMatrix(local, 0));
+            AssertEqual(parent.transform, USD.NET.Unity.UnityTypeConverter.FromMatrix(local, 16));
+            AssertEqual(parent.transform, USD.NET.Unity.UnityTypeConverter.FromMatrix(world, 16));
+            Assert.AreEqual(new Vector3(11, 22, 33), (Vector3)USD.NET.Unity.UnityTypeConverter.FromMatrix(world, 0).GetColumn(3));
+            Assert.AreEqual((int)TransformFlags.None, flags[0]);
+
+            // With an access mask, static transforms are only computed while populating it.
+            scene.AccessMask = new AccessMask();
+            scene.IsPopulatingAccessMask = true;
+            scene.ComputeTransforms(paths, local, null, flags);
+            Assert.AreEqual(0, scene.AccessMask.TimeVaryingTransforms.Count);
+
+            scene.IsPopulatingAccessMask = false;
+            scene.ComputeTransforms(paths, local, null, flags);
+            Assert.AreEqual((int)TransformFlags.Skipped, flags[0]);
+            Assert.AreEqual((int)TransformFlags.Skipped, flags[1]);
+
+            // Without any geometry, the bounds are empty.
+            var bounds = new double[6];
+            scene.ComputeBounds(new[] { new pxr.SdfPath("/Parent") }, bounds, null);
+            Assert.Greater(bounds[0], bounds[3]);
+        }
+
         public static void Xform2Test()
         {
             var sample = new USD.NET.Unity.XformSample();
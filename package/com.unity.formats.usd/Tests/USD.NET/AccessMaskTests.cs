@@ -27,6 +27,7 @@ namespace USD.NET.Tests
             {
                 myValue = 1.0f
             };
+            scene.Write(new SdfPath("/bar"), sample);
             var primPath = new SdfPath("/foo");
             scene.Time = 1;
             scene.Write(primPath, sample);
@@ -65,5 +66,41 @@ namespace USD.NET.Tests
             Assert.NotNull(cachedData);
             Assert.AreSame(testData, cachedData);
         }
+
+        [Test]
+        public void ComputeTimeVaryingIndex_OnlyAnimatedPrimsAreIncluded()
+        {
+            var index = scene.ComputeTimeVaryingIndex("/");
+
+            Assert.AreEqual(1, index.Count);
+            Assert.IsTrue(index.Contains(new SdfPath("/foo")));
+            Assert.IsTrue(index.IsTimeVarying(new SdfPath("/foo"), "myValue"));
+            Assert.IsFalse(index.Contains(new SdfPath("/bar")));
+            Assert.IsFalse(index.IsTimeVarying(new SdfPath("/bar"), "myValue"));
+
+            var paths = new[] { new SdfPath("/bar"), new SdfPath("/foo") };
+            Assert.AreEqual(new[] { new SdfPath("/foo") }, index.Filter(paths));
+        }
+
+        [Test]
+        public void ReadSample_StaticPrimWithTimeVaryingIndex_IsOnlyReadWhilePopulating()
+        {
+            var staticPath = new SdfPath("/bar");
+            scene.AccessMask = new AccessMask();
+            scene.AccessMask.TimeVarying = scene.ComputeTimeVaryingIndex("/");
+
+            scene.Time = 1;
+            scene.IsPopulatingAccessMask = true;
+            var sample = new MySample();
+            scene.Read(staticPath, sample);
+            Assert.AreEqual(1.0f, sample.myValue);
+            Assert.IsFalse(scene.AccessMask.Included.ContainsKey(staticPath));
+
+            scene.Time = 2;
+            scene.IsPopulatingAccessMask = false;
+            sample = new MySample();
+            scene.Read(staticPath, sample);
+            Assert.AreEqual(0.0f, sample.myValue);
+        }
     }
 }
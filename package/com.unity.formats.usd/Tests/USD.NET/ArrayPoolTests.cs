@@ -0,0 +1,59 @@
+using NUnit.Framework;
+
+namespace USD.NET.Tests
+{
+    class ArrayPoolTests : UsdTests
+    {
+        [Test]
+        public void Malloc_FreedArrayOfSameLength_IsReused()
+        {
+            var pool = new ArrayPool();
+            var first = pool.Malloc<float>(100);
+            pool.Free(first.GetType(), (uint)first.Length, first);
+
+            Assert.AreSame(first, pool.Malloc<float>(100));
+            Assert.AreEqual(99, pool.Malloc<float>(99).Length);
+            Assert.AreEqual(1, pool.Hits);
+            Assert.AreEqual(2, pool.Misses);
+            Assert.AreEqual(0, pool.RetainedBytes);
+        }
+
+        [Test]
+        public void Free_OverBudget_EvictsLeastRecentlyFreed()
+        {
+            var pool = new ArrayPool(maxRetainedBytes: 1000);
+            var oldest = new float[100];
+            var newest = new float[100];
+            pool.Free(typeof(float[]), 100, oldest);
+            pool.Free(typeof(float[]), 100, new float[100]);
+            pool.Free(typeof(float[]), 100, newest);
+
+            Assert.AreEqual(800, pool.RetainedBytes);
+            Assert.AreEqual(1, pool.Evictions);
+            Assert.AreSame(newest, pool.Malloc<float>(100));
+            Assert.AreNotSame(oldest, pool.Malloc<float>(100));
+            Assert.AreNotSame(oldest, pool.Malloc<float>(100));
+
+            pool.Free(typeof(float[]), 1000, new float[1000]);
+            Assert.AreEqual(0, pool.RetainedBytes);
+        }
+
+        [Test]
+        public void MaxRetainedBytes_Lowered_EvictsImmediately()
+        {
+            var pool = new ArrayPool();
+            for (int i = 0; i < 4; i++)
+            {
+                pool.Free(typeof(int[]), 256, new int[256]);
+            }
+
+            Assert.AreEqual(4096, pool.RetainedBytes);
+            pool.MaxRetainedBytes = 2048;
+            Assert.AreEqual(2048, pool.RetainedBytes);
+            Assert.AreEqual(2, pool.Evictions);
+
+            pool.Clear();
+            Assert.AreEqual(0, pool.RetainedBytes);
+        }
+    }
+}
@@ -503,6 +503,99 @@ namespace USD.NET.Tests
             Assert.AreNotEqual(A, C);
         }
 
+        [Test]
+        public static void VtValueConvertersTest()
+        {
+            var toVec3f = VtValueConverters.GetConverter<pxr.GfVec3f>();
+            Assert.NotNull(toVec3f);
+            Assert.AreEqual(new pxr.GfVec3f(1, 2, 3), toVec3f(new pxr.VtValue(new pxr.GfVec3f(1, 2, 3))));
+
+            Func<pxr.VtValue, object> toFloat;
+            Assert.True(VtValueConverters.TryGetConverter(typeof(float), out toFloat));
+            Assert.AreEqual(1.5f, toFloat(new pxr.VtValue(1.5f)));
+
+            // Value types have no copy converter, VtArrays do.
+            Assert.Null(VtValueConverters.GetCopyConverter<float>());
+            var copyToArray = VtValueConverters.GetCopyConverter<pxr.VtIntArray>();
+            Assert.NotNull(copyToArray);
+            var vtInts = new pxr.VtIntArray(3, 7);
+            var output = new pxr.VtIntArray();
+            copyToArray(new pxr.VtValue(vtInts), output);
+            Assert.AreEqual(3, (int)output.size());
+            Assert.AreEqual(7, output[2]);
+
+            // Role types resolve to the type which holds them.
+            Type csType;
+            Assert.True(VtValueConverters.TryGetCsType(SdfValueTypeNames.Point3f, out csType));
+            Assert.AreEqual(typeof(pxr.GfVec3f), csType);
+            Assert.True(VtValueConverters.TryGetCsType(SdfValueTypeNames.TexCoord2fArray, out csType));
+            Assert.AreEqual(typeof(pxr.VtVec2fArray), csType);
+        }
+
+        [Test]
+        public static void LazyTokensTest()
+        {
+            // Tokens are only created when first accessed and are cached after that.
+            var before = pxr.UsdGeomTokens.MaterializedCount;
+            var token = pxr.UsdGeomTokens.catmullClark;
+            var after = pxr.UsdGeomTokens.MaterializedCount;
+            Assert.AreEqual("catmullClark", token.ToString());
+            Assert.AreSame(token, pxr.UsdGeomTokens.catmullClark);
+            Assert.AreEqual(after, pxr.UsdGeomTokens.MaterializedCount);
+            Assert.LessOrEqual(after - before, 1);
+            Assert.LessOrEqual(after, pxr.UsdGeomTokens.Count);
+
+            var typeName = SdfValueTypeNames.Float3Array;
+            Assert.AreSame(typeName, SdfValueTypeNames.Float3Array);
+            Assert.LessOrEqual(SdfValueTypeNames.MaterializedCount, SdfValueTypeNames.Count);
+        }
+
+        [Test]
+        public static void UsdSchemaTokensTest()
+        {
+            int id = UsdSchemaTokens.GetId("faceVertexIndices");
+            Assert.GreaterOrEqual(id, 0);
+            Assert.Less(id, UsdSchemaTokens.Count);
+            Assert.AreEqual("faceVertexIndices", UsdSchemaTokens.GetString(id));
+            Assert.AreEqual(pxr.UsdGeomTokens.faceVertexIndices, UsdSchemaTokens.GetToken(id));
+            Assert.AreSame(UsdSchemaTokens.GetToken(id), UsdSchemaTokens.GetToken(id));
+
+            Assert.AreEqual(-1, UsdSchemaTokens.GetId("notASchemaToken"));
+            Assert.AreEqual(-1, UsdSchemaTokens.GetId(null));
+            pxr.TfToken token;
+            Assert.False(UsdSchemaTokens.TryGetToken("notASchemaToken", out token));
+            Assert.True(UsdSchemaTokens.TryGetToken("skel:joints", out token));
+            Assert.AreEqual(pxr.UsdSkelTokens.skelJoints, token);
+        }
+
+        [Test]
+        public static void TokenCacheTest()
+        {
+            var cache = new TokenCache();
+
+            // Schema tokens come from the precomputed table.
+            Assert.AreSame(UsdSchemaTokens.GetToken(UsdSchemaTokens.GetId("points")), cache["points"]);
+            Assert.AreEqual(1, cache.SchemaHits);
+            Assert.AreEqual(0, cache.Count);
+
+            // Other tokens are created once, then cached.
+            var token = cache["myNamespace", "myAttr"];
+            Assert.AreEqual("myNamespace:myAttr", token.ToString());
+            Assert.AreEqual(1, cache.Misses);
+            Assert.AreSame(token, cache["myNamespace", "myAttr"]);
+            Assert.AreEqual(1, cache.Hits);
+            Assert.AreEqual(1, cache.Count);
+
+            // Concurrent lookups of the same name all get the same token.
+            var tokens = new pxr.TfToken[64];
+            System.Threading.Tasks.Parallel.For(0, tokens.Length, i => tokens[i] = cache["concurrent"]);
+            Assert.True(tokens.All(t => ReferenceEquals(t, tokens[0])));
+            Assert.AreEqual(2, cache.Count);
+
+            cache.ResetCounters();
+            Assert.AreEqual(0, cache.SchemaHits + cache.Hits + cache.Misses);
+        }
+
         [Test]
         public static void AssetPathTest()
         {
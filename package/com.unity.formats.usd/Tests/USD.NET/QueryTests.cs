@@ -97,5 +97,90 @@ namespace USD.NET.Tests
             UnityEngine.TestTools.LogAssert.Expect(LogType.Exception, "ApplicationException: USD ERROR: Base type 'BOGUS_TYPE_INTENDED_TO_THROW_ERROR' was not known to the TfType system");
             paths.Clear();
         }
+
+        [Test]
+        public static void PrimHierarchyTest()
+        {
+            var meshSample = new MeshSample();
+            meshSample.visibility = Visibility.Invisible;
+            var scene = Scene.Create();
+
+            scene.Write("/Root/Cube", new CubeSample());
+            scene.Write("/Root/Cube/Mesh", meshSample);
+            scene.Write("/Root/Mesh2", new MeshSample());
+
+            var variantSet = scene.GetPrimAtPath("/Root").GetVariantSets().AddVariantSet("shadingVariant");
+            variantSet.AddVariant("Red");
+            variantSet.AddVariant("Blue");
+            variantSet.SetVariantSelection("Blue");
+
+            var hierarchy = scene.ComputePrimHierarchy(new pxr.SdfPath("/Root"),
+                new[] { typeof(XformableQuery), typeof(MeshSample) });
+            Assert.AreEqual(4, hierarchy.Count);
+
+            // Prims are in depth-first order, with the root first.
+            Assert.AreEqual("/Root", (string)hierarchy.GetPath(0));
+            Assert.AreEqual("/Root/Cube", (string)hierarchy.GetPath(1));
+            Assert.AreEqual("/Root/Cube/Mesh", (string)hierarchy.GetPath(2));
+            Assert.AreEqual("/Root/Mesh2", (string)hierarchy.GetPath(3));
+            Assert.AreEqual(-1, hierarchy.GetParent(0));
+            Assert.AreEqual(0, hierarchy.GetParent(1));
+            Assert.AreEqual(1, hierarchy.GetParent(2));
+            Assert.AreEqual(0, hierarchy.GetParent(3));
+
+            Assert.AreEqual(new[] { 1, 2, 3 }, hierarchy.FindAll(0));
+            Assert.AreEqual(new[] { 2, 3 }, hierarchy.FindAll(1));
+            Assert.AreEqual("Cube", hierarchy.GetTypeName(1));
+            Assert.AreEqual("Mesh", hierarchy.GetTypeName(2));
+
+            Assert.IsTrue(hierarchy.HasFlags(2, PrimHierarchyFlags.Active | PrimHierarchyFlags.Invisible));
+            Assert.IsFalse(hierarchy.HasFlags(3, PrimHierarchyFlags.Invisible));
+            Assert.IsNull(hierarchy.GetKind(1));
+            Assert.IsNull(hierarchy.GetMasterPath(1));
+
+            Assert.AreEqual(1, hierarchy.GetVariantSetCount(0));
+            Assert.AreEqual(0, hierarchy.GetVariantSetCount(1));
+
+            string[] setNames;
+            string[] selections;
+            string[] variants;
+            int[] variantCounts;
+            hierarchy.GetVariantSets(0, out setNames, out selections, out variants, out variantCounts);
+            Assert.AreEqual(new[] { "shadingVariant" }, setNames);
+            Assert.AreEqual(new[] { "Blue" }, selections);
+            Assert.AreEqual(new[] { "Blue", "Red" }, variants);
+            Assert.AreEqual(new[] { 2 }, variantCounts);
+        }
+
+        [Test]
+        public static void VectorConversionTest()
+        {
+            var scene = Scene.Create();
+            scene.Write("/Root/Cube", new CubeSample());
+            scene.Write("/Root/Mesh", new MeshSample());
+            scene.Write("/Root/Mesh/Mesh2", new MeshSample());
+
+            var children = scene.GetPrimAtPath("/Root").GetChildrenPaths();
+            var paths = IntrinsicTypeConverter.FromVector(children);
+            Assert.AreEqual(new[] { "/Root/Cube", "/Root/Mesh" }, Array.ConvertAll(paths, p => (string)p));
+            Assert.AreEqual(new[] { "/Root/Cube", "/Root/Mesh" }, IntrinsicTypeConverter.ToStrings(children));
+            Assert.AreEqual(0, IntrinsicTypeConverter.FromVector(new pxr.SdfPathVector()).Length);
+
+            // The converted paths do not reference the vector.
+            children.Dispose();
+            Assert.AreEqual("/Root/Mesh", (string)paths[1]);
+
+            var tokens = new pxr.TfTokenVector();
+            tokens.Add(new pxr.TfToken("points"));
+            tokens.Add(new pxr.TfToken("\u00e9t\u00e9"));
+            Assert.AreEqual(new[] { "points", "\u00e9t\u00e9" }, IntrinsicTypeConverter.ToStrings(tokens));
+            Assert.AreEqual("\u00e9t\u00e9", (string)IntrinsicTypeConverter.FromVector(tokens)[1]);
+
+            var times = new pxr.StdDoubleVector();
+            times.Add(1.5);
+            times.Add(-2);
+            Assert.AreEqual(new[] { 1.5, -2 }, IntrinsicTypeConverter.FromVector(times));
+            Assert.Throws<ArgumentOutOfRangeException>(() => times.CopyToArray(1, 2, new double[2]));
+        }
     }
 }
@@ -181,4 +181,78 @@ namespace USD.NET.Tests
             Assert.AreEqual("", prim.GetTypeName().ToString(), "Prim type should be empty for " + prim.GetPath());
         }
     }
+
+    class AccessorSample : SampleBase
+    {
+        public int number;
+        public float[] values;
+        public string Label { get; set; }
+    }
+
+    class SampleAccessorTests : UsdTests
+    {
+        int m_getCount;
+        int m_setCount;
+
+        [SetUp]
+        public void RegisterAccessors()
+        {
+            m_getCount = 0;
+            m_setCount = 0;
+            var accessor = new SampleAccessor(typeof(AccessorSample));
+            accessor.AddField("number",
+                s => { m_getCount++; return ((AccessorSample)s).number; },
+                (s, v) => { m_setCount++; ((AccessorSample)s).number = v == null ? default(int) : (int)v; });
+            accessor.AddProperty("Label",
+                s => { m_getCount++; return ((AccessorSample)s).Label; },
+                (s, v) => { m_setCount++; ((AccessorSample)s).Label = (string)v; });
+            SampleAccessors.Register(accessor);
+        }
+
+        [TearDown]
+        public void UnregisterAccessors()
+        {
+            SampleAccessors.Register(new SampleAccessor(typeof(AccessorSample)));
+        }
+
+        [Test]
+        public void WriteRead_UsesRegisteredAccessors()
+        {
+            var scene = Scene.Create();
+            var sample = new AccessorSample { number = 42, values = new[] { 1.0f, 2.0f }, Label = "foo" };
+            scene.Write("/Foo", sample);
+            Assert.AreEqual(2, m_getCount);
+
+            var sample2 = new AccessorSample();
+            scene.Read("/Foo", sample2);
+
+            Assert.AreEqual(4, m_getCount);
+            Assert.AreEqual(2, m_setCount);
+            Assert.AreEqual(42, sample2.number);
+            Assert.AreEqual("foo", sample2.Label);
+            Assert.AreEqual(sample.values, sample2.values, "Members without accessors are read via reflection");
+            scene.Close();
+        }
+
+        [Test]
+        public void WriteRead_WhenDisabled_UsesReflection()
+        {
+            SampleAccessors.Enabled = false;
+            try
+            {
+                var scene = Scene.Create();
+                scene.Write("/Foo", new AccessorSample { number = 42, Label = "foo" });
+                var sample2 = new AccessorSample();
+                scene.Read("/Foo", sample2);
+                scene.Close();
+
+                Assert.AreEqual(0, m_getCount + m_setCount);
+                Assert.AreEqual(42, sample2.number);
+            }
+            finally
+            {
+                SampleAccessors.Enabled = true;
+            }
+        }
+    }
 }
@@ -65,5 +65,172 @@ namespace USD.NET.Tests
 
             scene.Close();
         }
+
+        [Test]
+        public static void ComputeKeyFramesAllPrimsTest()
+        {
+            var scene = Scene.Create();
+            var sample = new KeyFramesTestSample();
+            var baseline = new Dictionary<string, double[]>();
+            baseline["/Over"] = new double[] { 1.0, 2.0 };
+            baseline["/Inactive"] = new double[] { 3.0, 4.0 };
+            baseline["/Class"] = new double[] { 5.0, 6.0 };
+
+            // Keys on overs, inactive and abstract prims are reported, as by Stage.GetAllPrims().
+            scene.Stage.CreateClassPrim(new pxr.SdfPath("/Class"));
+            foreach (var kvp in baseline)
+            {
+                scene.WriteMode = kvp.Key == "/Inactive" ? Scene.WriteModes.Define : Scene.WriteModes.Over;
+                foreach (double time in kvp.Value)
+                {
+                    sample.intValue = (int)time;
+                    scene.Time = time;
+                    scene.Write(kvp.Key, sample);
+                }
+            }
+
+            scene.GetPrimAtPath("/Inactive").SetActive(false);
+
+            var dict = scene.ComputeKeyFrames("/", "intValue");
+            AssertEqual(baseline, dict);
+
+            scene.Close();
+        }
+
+        public class KeyFrameTableTestSample : SampleBase
+        {
+            public int intValue;
+            public float floatValue;
+        }
+
+        [Test]
+        public static void ComputeKeyFrameTableTest()
+        {
+            var scene = Scene.Create();
+            var sample = new KeyFrameTableTestSample();
+            foreach (double time in new[] { 1.0, 2.0, 3.0 })
+            {
+                scene.Time = time;
+                sample.intValue = (int)time;
+                sample.floatValue = (float)time;
+                scene.Write("/Foo", sample);
+                scene.Write("/Foo/Bar", sample);
+            }
+
+            scene.Time = 5.0;
+            sample.floatValue = 5.0f;
+            scene.Write("/Baz", sample);
+
+            var table = scene.ComputeKeyFrameTable("/", "intValue", "floatValue");
+            Assert.AreEqual(6, table.Count);
+            Assert.AreEqual(table.Count + 1, table.Offsets.Length);
+            Assert.AreEqual(14, table.Times.Length);
+
+            var found = new Dictionary<string, double[]>();
+            for (int i = 0; i < table.Count; i++)
+            {
+                var key = (string)table.Paths[i] + "." + table.Attributes[table.AttributeIndices[i]];
+                var times = table.GetTimes(i);
+                found[key] = new List<double>(times).ToArray();
+            }
+
+            var baseline = new Dictionary<string, double[]>();
+            baseline["/Foo.intValue"] = new double[] { 1.0, 2.0, 3.0 };
+            baseline["/Foo.floatValue"] = new double[] { 1.0, 2.0, 3.0 };
+            baseline["/Foo/Bar.intValue"] = new double[] { 1.0, 2.0, 3.0 };
+            baseline["/Foo/Bar.floatValue"] = new double[] { 1.0, 2.0, 3.0 };
+            baseline["/Baz.intValue"] = new double[] { 5.0 };
+            baseline["/Baz.floatValue"] = new double[] { 5.0 };
+            AssertEqual(baseline, found);
+
+            // The subtree under /Foo/Bar only.
+            table = scene.ComputeKeyFrameTable("/Foo/Bar", "floatValue");
+            Assert.AreEqual(1, table.Count);
+            Assert.AreEqual("/Foo/Bar", (string)table.Paths[0]);
+            Assert.AreEqual(new double[] { 1.0, 2.0, 3.0 }, table.Times);
+
+            scene.Close();
+        }
+
+        public class BatchReadTestSample : SampleBase
+        {
+            public float[] values;
+        }
+
+        [Test]
+        public static void BatchReadTest()
+        {
+            var scene = Scene.Create();
+            var sample = new BatchReadTestSample();
+            var paths = new string[] { "/Foo", "/Bar" };
+            var times = new double[] { 1.0, 2.0, 3.0 };
+
+            for (int p = 0; p < paths.Length; p++)
+            {
+                foreach (double time in times)
+                {
+                    sample.values = new float[p + (int)time];
+                    for (int i = 0; i < sample.values.Length; i++)
+                    {
+                        sample.values[i] = (float)(p * 100 + time * 10 + i);
+                    }
+                    scene.Time = time;
+                    scene.Write(paths[p], sample);
+                }
+            }
+
+            var attrs = new pxr.UsdAttributeVector();
+            foreach (string path in paths)
+            {
+                attrs.Add(scene.GetPrimAtPath(path).GetAttribute(new pxr.TfToken("values")));
+            }
+
+            var timeCodes = new pxr.UsdTimeCodeVector();
+            foreach (double time in times)
+            {
+                timeCodes.Add(new pxr.UsdTimeCode(time));
+            }
+
+            // First call with no buffer to query the required capacity.
+            int count = attrs.Count * timeCodes.Count;
+            var offsets = new long[count];
+            var lengths = new int[count];
+            uint required = pxr.UsdCs.UsdAttributeBatchGetVtFloatArray(attrs, timeCodes,
+                System.IntPtr.Zero, 0, offsets, lengths, (uint)count);
+            Assert.AreEqual(15, required);
+
+            // Tables too short for every attribute and time are rejected rather than overrun.
+            Assert.Throws<System.ArgumentOutOfRangeException>(() =>
+                pxr.UsdCs.UsdAttributeBatchGetVtFloatArray(attrs, timeCodes,
+                    System.IntPtr.Zero, 0, new long[count - 1], new int[count - 1], (uint)count - 1));
+
+            var buffer = new float[required];
+            var handle = System.Runtime.InteropServices.GCHandle.Alloc(buffer,
+                System.Runtime.InteropServices.GCHandleType.Pinned);
+            try
+            {
+                pxr.UsdCs.UsdAttributeBatchGetVtFloatArray(attrs, timeCodes,
+                    handle.AddrOfPinnedObject(), required, offsets, lengths, (uint)count);
+            }
+            finally
+            {
+                handle.Free();
+            }
+
+            for (int p = 0; p < paths.Length; p++)
+            {
+                for (int t = 0; t < times.Length; t++)
+                {
+                    int index = p * times.Length + t;
+                    Assert.AreEqual(p + (int)times[t], lengths[index]);
+                    for (int i = 0; i < lengths[index]; i++)
+                    {
+                        Assert.AreEqual((float)(p * 100 + times[t] * 10 + i), buffer[offsets[index] + i]);
+                    }
+                }
+            }
+
+            scene.Close();
+        }
     }
 }
@@ -18,10 +18,107 @@ using System.Linq;
 using pxr;
 using USD.NET;
 using UnityEngine;
+using NUnit.Framework;
 
 namespace USD.NET.Tests
 {
     class UsdSkelTests : UsdTests
     {
+        const string kSkelRootUsda = @"#usda 1.0
+
+def SkelRoot ""Root"" (
+    prepend apiSchemas = [""SkelBindingAPI""]
+)
+{
+    rel skel:skeleton = </Root/Skel>
+
+    def Skeleton ""Skel"" (
+        prepend apiSchemas = [""SkelBindingAPI""]
+    )
+    {
+        uniform token[] joints = [""A"", ""A/B""]
+        uniform matrix4d[] bindTransforms = [((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)), ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 1, 0, 1))]
+        uniform matrix4d[] restTransforms = [((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 0, 0, 1)), ((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0), (0, 1, 0, 1))]
+        rel skel:animationSource = </Root/Skel/Anim>
+
+        def SkelAnimation ""Anim""
+        {
+            uniform token[] joints = [""A"", ""A/B""]
+            float3[] translations.timeSamples = {
+                1: [(0, 0, 0), (0, 1, 0)],
+                2: [(0, 0, 0), (0, 2, 0)],
+            }
+            quatf[] rotations = [(1, 0, 0, 0), (1, 0, 0, 0)]
+            half3[] scales = [(1, 1, 1), (1, 1, 1)]
+            uniform token[] blendShapes = [""smile""]
+            float[] blendShapeWeights.timeSamples = {
+                1: [0.25],
+                2: [0.5],
+            }
+        }
+    }
+
+    def Mesh ""Mesh"" (
+        prepend apiSchemas = [""SkelBindingAPI""]
+    )
+    {
+        int[] faceVertexCounts = [3]
+        int[] faceVertexIndices = [0, 1, 2]
+        point3f[] points = [(0, 0, 0), (1, 0, 0), (0, 1, 0)]
+        int[] primvars:skel:jointIndices = [0, 1, 1] (
+            elementSize = 1
+            interpolation = ""vertex""
+        )
+        float[] primvars:skel:jointWeights = [1, 1, 1] (
+            elementSize = 1
+            interpolation = ""vertex""
+        )
+    }
+}
+";
+
+        [Test]
+        public static void ComputeSkeletonPosesTest()
+        {
+            var scene = Scene.Create();
+            Assert.IsTrue(scene.Stage.GetRootLayer().ImportFromString(kSkelRootUsda));
+            scene.Time = 2;
+
+            // Paths which are not skeletons get a failed entry.
+            var cache = new UsdSkelCache();
+            var skelPath = new SdfPath("/Root/Skel");
+            var poses = scene.ComputeSkeletonPoses(cache, new[] { new SdfPath("/Root/Mesh"), skelPath },
+                localTransforms: true, skinningTransforms: true);
+
+            Assert.AreEqual(2, poses.Count);
+            Assert.AreEqual(SkeletonPoseFlags.Failed, poses.Flags[0]);
+            Assert.AreEqual(0, poses.GetJoints(0).Count);
+
+            poses = scene.ComputeSkeletonPoses(cache, new[] { skelPath },
+                localTransforms: true, skinningTransforms: true);
+            Assert.AreEqual(1, poses.Count);
+            Assert.AreEqual(0, poses.IndexOf(skelPath));
+            Assert.AreEqual(SkeletonPoseFlags.HasAnimation | SkeletonPoseFlags.MightBeTimeVarying, poses.Flags[0]);
+            Assert.AreEqual(new[] { "A", "A/B" }, poses.GetJoints(0).ToArray());
+
+            // The matrices are in row-major order, the translation of joint 1 starts at 16 + 12.
+            Assert.AreEqual(2, poses.LocalTransforms[16 + 13]);
+            Assert.AreEqual(1, poses.SkinningTransforms[16 + 13]);
+
+            Assert.AreEqual(new[] { "smile" }, poses.GetBlendShapes(0).ToArray());
+            Assert.AreEqual(0.5f, poses.GetBlendShapeWeights(0).ToArray()[0]);
+
+            // The queries kept by the cache are evaluated at the current time.
+            scene.Time = 1;
+            poses = scene.ComputeSkeletonPoses(cache, new[] { skelPath }, localTransforms: true, skinningTransforms: false);
+            Assert.AreEqual(1, poses.LocalTransforms[16 + 13]);
+            Assert.AreEqual(0.25f, poses.GetBlendShapeWeights(0).ToArray()[0]);
+
+            // Matrices which are not requested are not computed.
+            poses = scene.ComputeSkeletonPoses(cache, new[] { skelPath }, localTransforms: false, skinningTransforms: false);
+            Assert.IsNull(poses.LocalTransforms);
+            Assert.IsNull(poses.SkinningTransforms);
+            Assert.AreEqual(2, poses.Joints.Length);
+        }
     }
 }
@@ -88,3 +88,5 @@
 %include "gfFrustum.i"
 %include "gfCamera.i"
 
+%include "gfValueTypes.i"
+
@@ -0,0 +1,669 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+%{
+// Plain storage with the layout of the C# pxr.GfMatrix2dValue struct.
+struct GfMatrix2dValue {
+  double data[4];
+};
+%}
+%typemap(ctype)  GfMatrix2dValue "GfMatrix2dValue"
+%typemap(imtype) GfMatrix2dValue "pxr.GfMatrix2dValue"
+%typemap(cstype) GfMatrix2dValue "pxr.GfMatrix2dValue"
+%typemap(out)    GfMatrix2dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfMatrix2dValue {
+    pxr.GfMatrix2dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfMatrix2dValue const& "GfMatrix2dValue const*"
+%typemap(imtype) GfMatrix2dValue const& "ref pxr.GfMatrix2dValue"
+%typemap(cstype) GfMatrix2dValue const& "pxr.GfMatrix2dValue"
+%typemap(in)     GfMatrix2dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfMatrix2dValue const& "ref $csinput"
+%typemap(ctype)  GfMatrix2dValue* "GfMatrix2dValue*"
+%typemap(imtype) GfMatrix2dValue* "out pxr.GfMatrix2dValue"
+%typemap(cstype) GfMatrix2dValue* "out pxr.GfMatrix2dValue"
+%typemap(in)     GfMatrix2dValue* %{ $1 = $input; %}
+%typemap(csin)   GfMatrix2dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfMatrix3dValue struct.
+struct GfMatrix3dValue {
+  double data[9];
+};
+%}
+%typemap(ctype)  GfMatrix3dValue "GfMatrix3dValue"
+%typemap(imtype) GfMatrix3dValue "pxr.GfMatrix3dValue"
+%typemap(cstype) GfMatrix3dValue "pxr.GfMatrix3dValue"
+%typemap(out)    GfMatrix3dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfMatrix3dValue {
+    pxr.GfMatrix3dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfMatrix3dValue const& "GfMatrix3dValue const*"
+%typemap(imtype) GfMatrix3dValue const& "ref pxr.GfMatrix3dValue"
+%typemap(cstype) GfMatrix3dValue const& "pxr.GfMatrix3dValue"
+%typemap(in)     GfMatrix3dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfMatrix3dValue const& "ref $csinput"
+%typemap(ctype)  GfMatrix3dValue* "GfMatrix3dValue*"
+%typemap(imtype) GfMatrix3dValue* "out pxr.GfMatrix3dValue"
+%typemap(cstype) GfMatrix3dValue* "out pxr.GfMatrix3dValue"
+%typemap(in)     GfMatrix3dValue* %{ $1 = $input; %}
+%typemap(csin)   GfMatrix3dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfMatrix4dValue struct.
+struct GfMatrix4dValue {
+  double data[16];
+};
+%}
+%typemap(ctype)  GfMatrix4dValue "GfMatrix4dValue"
+%typemap(imtype) GfMatrix4dValue "pxr.GfMatrix4dValue"
+%typemap(cstype) GfMatrix4dValue "pxr.GfMatrix4dValue"
+%typemap(out)    GfMatrix4dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfMatrix4dValue {
+    pxr.GfMatrix4dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfMatrix4dValue const& "GfMatrix4dValue const*"
+%typemap(imtype) GfMatrix4dValue const& "ref pxr.GfMatrix4dValue"
+%typemap(cstype) GfMatrix4dValue const& "pxr.GfMatrix4dValue"
+%typemap(in)     GfMatrix4dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfMatrix4dValue const& "ref $csinput"
+%typemap(ctype)  GfMatrix4dValue* "GfMatrix4dValue*"
+%typemap(imtype) GfMatrix4dValue* "out pxr.GfMatrix4dValue"
+%typemap(cstype) GfMatrix4dValue* "out pxr.GfMatrix4dValue"
+%typemap(in)     GfMatrix4dValue* %{ $1 = $input; %}
+%typemap(csin)   GfMatrix4dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfQuatdValue struct.
+struct GfQuatdValue {
+  double data[4];
+};
+%}
+%typemap(ctype)  GfQuatdValue "GfQuatdValue"
+%typemap(imtype) GfQuatdValue "pxr.GfQuatdValue"
+%typemap(cstype) GfQuatdValue "pxr.GfQuatdValue"
+%typemap(out)    GfQuatdValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfQuatdValue {
+    pxr.GfQuatdValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfQuatdValue const& "GfQuatdValue const*"
+%typemap(imtype) GfQuatdValue const& "ref pxr.GfQuatdValue"
+%typemap(cstype) GfQuatdValue const& "pxr.GfQuatdValue"
+%typemap(in)     GfQuatdValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfQuatdValue const& "ref $csinput"
+%typemap(ctype)  GfQuatdValue* "GfQuatdValue*"
+%typemap(imtype) GfQuatdValue* "out pxr.GfQuatdValue"
+%typemap(cstype) GfQuatdValue* "out pxr.GfQuatdValue"
+%typemap(in)     GfQuatdValue* %{ $1 = $input; %}
+%typemap(csin)   GfQuatdValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfQuatfValue struct.
+struct GfQuatfValue {
+  float data[4];
+};
+%}
+%typemap(ctype)  GfQuatfValue "GfQuatfValue"
+%typemap(imtype) GfQuatfValue "pxr.GfQuatfValue"
+%typemap(cstype) GfQuatfValue "pxr.GfQuatfValue"
+%typemap(out)    GfQuatfValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfQuatfValue {
+    pxr.GfQuatfValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfQuatfValue const& "GfQuatfValue const*"
+%typemap(imtype) GfQuatfValue const& "ref pxr.GfQuatfValue"
+%typemap(cstype) GfQuatfValue const& "pxr.GfQuatfValue"
+%typemap(in)     GfQuatfValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfQuatfValue const& "ref $csinput"
+%typemap(ctype)  GfQuatfValue* "GfQuatfValue*"
+%typemap(imtype) GfQuatfValue* "out pxr.GfQuatfValue"
+%typemap(cstype) GfQuatfValue* "out pxr.GfQuatfValue"
+%typemap(in)     GfQuatfValue* %{ $1 = $input; %}
+%typemap(csin)   GfQuatfValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfRange1dValue struct.
+struct GfRange1dValue {
+  double data[2];
+};
+%}
+%typemap(ctype)  GfRange1dValue "GfRange1dValue"
+%typemap(imtype) GfRange1dValue "pxr.GfRange1dValue"
+%typemap(cstype) GfRange1dValue "pxr.GfRange1dValue"
+%typemap(out)    GfRange1dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfRange1dValue {
+    pxr.GfRange1dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfRange1dValue const& "GfRange1dValue const*"
+%typemap(imtype) GfRange1dValue const& "ref pxr.GfRange1dValue"
+%typemap(cstype) GfRange1dValue const& "pxr.GfRange1dValue"
+%typemap(in)     GfRange1dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfRange1dValue const& "ref $csinput"
+%typemap(ctype)  GfRange1dValue* "GfRange1dValue*"
+%typemap(imtype) GfRange1dValue* "out pxr.GfRange1dValue"
+%typemap(cstype) GfRange1dValue* "out pxr.GfRange1dValue"
+%typemap(in)     GfRange1dValue* %{ $1 = $input; %}
+%typemap(csin)   GfRange1dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfRange1fValue struct.
+struct GfRange1fValue {
+  float data[2];
+};
+%}
+%typemap(ctype)  GfRange1fValue "GfRange1fValue"
+%typemap(imtype) GfRange1fValue "pxr.GfRange1fValue"
+%typemap(cstype) GfRange1fValue "pxr.GfRange1fValue"
+%typemap(out)    GfRange1fValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfRange1fValue {
+    pxr.GfRange1fValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfRange1fValue const& "GfRange1fValue const*"
+%typemap(imtype) GfRange1fValue const& "ref pxr.GfRange1fValue"
+%typemap(cstype) GfRange1fValue const& "pxr.GfRange1fValue"
+%typemap(in)     GfRange1fValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfRange1fValue const& "ref $csinput"
+%typemap(ctype)  GfRange1fValue* "GfRange1fValue*"
+%typemap(imtype) GfRange1fValue* "out pxr.GfRange1fValue"
+%typemap(cstype) GfRange1fValue* "out pxr.GfRange1fValue"
+%typemap(in)     GfRange1fValue* %{ $1 = $input; %}
+%typemap(csin)   GfRange1fValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfRange2dValue struct.
+struct GfRange2dValue {
+  double data[4];
+};
+%}
+%typemap(ctype)  GfRange2dValue "GfRange2dValue"
+%typemap(imtype) GfRange2dValue "pxr.GfRange2dValue"
+%typemap(cstype) GfRange2dValue "pxr.GfRange2dValue"
+%typemap(out)    GfRange2dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfRange2dValue {
+    pxr.GfRange2dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfRange2dValue const& "GfRange2dValue const*"
+%typemap(imtype) GfRange2dValue const& "ref pxr.GfRange2dValue"
+%typemap(cstype) GfRange2dValue const& "pxr.GfRange2dValue"
+%typemap(in)     GfRange2dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfRange2dValue const& "ref $csinput"
+%typemap(ctype)  GfRange2dValue* "GfRange2dValue*"
+%typemap(imtype) GfRange2dValue* "out pxr.GfRange2dValue"
+%typemap(cstype) GfRange2dValue* "out pxr.GfRange2dValue"
+%typemap(in)     GfRange2dValue* %{ $1 = $input; %}
+%typemap(csin)   GfRange2dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfRange3dValue struct.
+struct GfRange3dValue {
+  double data[6];
+};
+%}
+%typemap(ctype)  GfRange3dValue "GfRange3dValue"
+%typemap(imtype) GfRange3dValue "pxr.GfRange3dValue"
+%typemap(cstype) GfRange3dValue "pxr.GfRange3dValue"
+%typemap(out)    GfRange3dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfRange3dValue {
+    pxr.GfRange3dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfRange3dValue const& "GfRange3dValue const*"
+%typemap(imtype) GfRange3dValue const& "ref pxr.GfRange3dValue"
+%typemap(cstype) GfRange3dValue const& "pxr.GfRange3dValue"
+%typemap(in)     GfRange3dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfRange3dValue const& "ref $csinput"
+%typemap(ctype)  GfRange3dValue* "GfRange3dValue*"
+%typemap(imtype) GfRange3dValue* "out pxr.GfRange3dValue"
+%typemap(cstype) GfRange3dValue* "out pxr.GfRange3dValue"
+%typemap(in)     GfRange3dValue* %{ $1 = $input; %}
+%typemap(csin)   GfRange3dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec2dValue struct.
+struct GfVec2dValue {
+  double data[2];
+};
+%}
+%typemap(ctype)  GfVec2dValue "GfVec2dValue"
+%typemap(imtype) GfVec2dValue "pxr.GfVec2dValue"
+%typemap(cstype) GfVec2dValue "pxr.GfVec2dValue"
+%typemap(out)    GfVec2dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec2dValue {
+    pxr.GfVec2dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec2dValue const& "GfVec2dValue const*"
+%typemap(imtype) GfVec2dValue const& "ref pxr.GfVec2dValue"
+%typemap(cstype) GfVec2dValue const& "pxr.GfVec2dValue"
+%typemap(in)     GfVec2dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec2dValue const& "ref $csinput"
+%typemap(ctype)  GfVec2dValue* "GfVec2dValue*"
+%typemap(imtype) GfVec2dValue* "out pxr.GfVec2dValue"
+%typemap(cstype) GfVec2dValue* "out pxr.GfVec2dValue"
+%typemap(in)     GfVec2dValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec2dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec2fValue struct.
+struct GfVec2fValue {
+  float data[2];
+};
+%}
+%typemap(ctype)  GfVec2fValue "GfVec2fValue"
+%typemap(imtype) GfVec2fValue "pxr.GfVec2fValue"
+%typemap(cstype) GfVec2fValue "pxr.GfVec2fValue"
+%typemap(out)    GfVec2fValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec2fValue {
+    pxr.GfVec2fValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec2fValue const& "GfVec2fValue const*"
+%typemap(imtype) GfVec2fValue const& "ref pxr.GfVec2fValue"
+%typemap(cstype) GfVec2fValue const& "pxr.GfVec2fValue"
+%typemap(in)     GfVec2fValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec2fValue const& "ref $csinput"
+%typemap(ctype)  GfVec2fValue* "GfVec2fValue*"
+%typemap(imtype) GfVec2fValue* "out pxr.GfVec2fValue"
+%typemap(cstype) GfVec2fValue* "out pxr.GfVec2fValue"
+%typemap(in)     GfVec2fValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec2fValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec2iValue struct.
+struct GfVec2iValue {
+  int data[2];
+};
+%}
+%typemap(ctype)  GfVec2iValue "GfVec2iValue"
+%typemap(imtype) GfVec2iValue "pxr.GfVec2iValue"
+%typemap(cstype) GfVec2iValue "pxr.GfVec2iValue"
+%typemap(out)    GfVec2iValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec2iValue {
+    pxr.GfVec2iValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec2iValue const& "GfVec2iValue const*"
+%typemap(imtype) GfVec2iValue const& "ref pxr.GfVec2iValue"
+%typemap(cstype) GfVec2iValue const& "pxr.GfVec2iValue"
+%typemap(in)     GfVec2iValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec2iValue const& "ref $csinput"
+%typemap(ctype)  GfVec2iValue* "GfVec2iValue*"
+%typemap(imtype) GfVec2iValue* "out pxr.GfVec2iValue"
+%typemap(cstype) GfVec2iValue* "out pxr.GfVec2iValue"
+%typemap(in)     GfVec2iValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec2iValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec3dValue struct.
+struct GfVec3dValue {
+  double data[3];
+};
+%}
+%typemap(ctype)  GfVec3dValue "GfVec3dValue"
+%typemap(imtype) GfVec3dValue "pxr.GfVec3dValue"
+%typemap(cstype) GfVec3dValue "pxr.GfVec3dValue"
+%typemap(out)    GfVec3dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec3dValue {
+    pxr.GfVec3dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec3dValue const& "GfVec3dValue const*"
+%typemap(imtype) GfVec3dValue const& "ref pxr.GfVec3dValue"
+%typemap(cstype) GfVec3dValue const& "pxr.GfVec3dValue"
+%typemap(in)     GfVec3dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec3dValue const& "ref $csinput"
+%typemap(ctype)  GfVec3dValue* "GfVec3dValue*"
+%typemap(imtype) GfVec3dValue* "out pxr.GfVec3dValue"
+%typemap(cstype) GfVec3dValue* "out pxr.GfVec3dValue"
+%typemap(in)     GfVec3dValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec3dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec3fValue struct.
+struct GfVec3fValue {
+  float data[3];
+};
+%}
+%typemap(ctype)  GfVec3fValue "GfVec3fValue"
+%typemap(imtype) GfVec3fValue "pxr.GfVec3fValue"
+%typemap(cstype) GfVec3fValue "pxr.GfVec3fValue"
+%typemap(out)    GfVec3fValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec3fValue {
+    pxr.GfVec3fValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec3fValue const& "GfVec3fValue const*"
+%typemap(imtype) GfVec3fValue const& "ref pxr.GfVec3fValue"
+%typemap(cstype) GfVec3fValue const& "pxr.GfVec3fValue"
+%typemap(in)     GfVec3fValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec3fValue const& "ref $csinput"
+%typemap(ctype)  GfVec3fValue* "GfVec3fValue*"
+%typemap(imtype) GfVec3fValue* "out pxr.GfVec3fValue"
+%typemap(cstype) GfVec3fValue* "out pxr.GfVec3fValue"
+%typemap(in)     GfVec3fValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec3fValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec3iValue struct.
+struct GfVec3iValue {
+  int data[3];
+};
+%}
+%typemap(ctype)  GfVec3iValue "GfVec3iValue"
+%typemap(imtype) GfVec3iValue "pxr.GfVec3iValue"
+%typemap(cstype) GfVec3iValue "pxr.GfVec3iValue"
+%typemap(out)    GfVec3iValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec3iValue {
+    pxr.GfVec3iValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec3iValue const& "GfVec3iValue const*"
+%typemap(imtype) GfVec3iValue const& "ref pxr.GfVec3iValue"
+%typemap(cstype) GfVec3iValue const& "pxr.GfVec3iValue"
+%typemap(in)     GfVec3iValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec3iValue const& "ref $csinput"
+%typemap(ctype)  GfVec3iValue* "GfVec3iValue*"
+%typemap(imtype) GfVec3iValue* "out pxr.GfVec3iValue"
+%typemap(cstype) GfVec3iValue* "out pxr.GfVec3iValue"
+%typemap(in)     GfVec3iValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec3iValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec4dValue struct.
+struct GfVec4dValue {
+  double data[4];
+};
+%}
+%typemap(ctype)  GfVec4dValue "GfVec4dValue"
+%typemap(imtype) GfVec4dValue "pxr.GfVec4dValue"
+%typemap(cstype) GfVec4dValue "pxr.GfVec4dValue"
+%typemap(out)    GfVec4dValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec4dValue {
+    pxr.GfVec4dValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec4dValue const& "GfVec4dValue const*"
+%typemap(imtype) GfVec4dValue const& "ref pxr.GfVec4dValue"
+%typemap(cstype) GfVec4dValue const& "pxr.GfVec4dValue"
+%typemap(in)     GfVec4dValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec4dValue const& "ref $csinput"
+%typemap(ctype)  GfVec4dValue* "GfVec4dValue*"
+%typemap(imtype) GfVec4dValue* "out pxr.GfVec4dValue"
+%typemap(cstype) GfVec4dValue* "out pxr.GfVec4dValue"
+%typemap(in)     GfVec4dValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec4dValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec4fValue struct.
+struct GfVec4fValue {
+  float data[4];
+};
+%}
+%typemap(ctype)  GfVec4fValue "GfVec4fValue"
+%typemap(imtype) GfVec4fValue "pxr.GfVec4fValue"
+%typemap(cstype) GfVec4fValue "pxr.GfVec4fValue"
+%typemap(out)    GfVec4fValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec4fValue {
+    pxr.GfVec4fValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec4fValue const& "GfVec4fValue const*"
+%typemap(imtype) GfVec4fValue const& "ref pxr.GfVec4fValue"
+%typemap(cstype) GfVec4fValue const& "pxr.GfVec4fValue"
+%typemap(in)     GfVec4fValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec4fValue const& "ref $csinput"
+%typemap(ctype)  GfVec4fValue* "GfVec4fValue*"
+%typemap(imtype) GfVec4fValue* "out pxr.GfVec4fValue"
+%typemap(cstype) GfVec4fValue* "out pxr.GfVec4fValue"
+%typemap(in)     GfVec4fValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec4fValue* "out $csinput"
+
+%{
+// Plain storage with the layout of the C# pxr.GfVec4iValue struct.
+struct GfVec4iValue {
+  int data[4];
+};
+%}
+%typemap(ctype)  GfVec4iValue "GfVec4iValue"
+%typemap(imtype) GfVec4iValue "pxr.GfVec4iValue"
+%typemap(cstype) GfVec4iValue "pxr.GfVec4iValue"
+%typemap(out)    GfVec4iValue %{ $result = $1; %}
+%typemap(csout, excode=SWIGEXCODE) GfVec4iValue {
+    pxr.GfVec4iValue ret = $imcall;$excode
+    return ret;
+  }
+%typemap(ctype)  GfVec4iValue const& "GfVec4iValue const*"
+%typemap(imtype) GfVec4iValue const& "ref pxr.GfVec4iValue"
+%typemap(cstype) GfVec4iValue const& "pxr.GfVec4iValue"
+%typemap(in)     GfVec4iValue const& %{ $1 = ($1_ltype)$input; %}
+%typemap(csin)   GfVec4iValue const& "ref $csinput"
+%typemap(ctype)  GfVec4iValue* "GfVec4iValue*"
+%typemap(imtype) GfVec4iValue* "out pxr.GfVec4iValue"
+%typemap(cstype) GfVec4iValue* "out pxr.GfVec4iValue"
+%typemap(in)     GfVec4iValue* %{ $1 = $input; %}
+%typemap(csin)   GfVec4iValue* "out $csinput"
+
+%{
+#include <algorithm>
+%}
+
+%inline %{
+// This code manifests in UsdCs class.
+
+extern GfMatrix2dValue GfMatrix2dToValue(GfMatrix2d const& value) {
+  GfMatrix2dValue ret;
+  std::copy(value.data(), value.data() + 4, ret.data);
+  return ret;
+}
+extern GfMatrix2d GfMatrix2dFromValue(GfMatrix2dValue const& value) {
+  GfMatrix2d ret;
+  std::copy(value.data, value.data + 4, ret.data());
+  return ret;
+}
+
+extern GfMatrix3dValue GfMatrix3dToValue(GfMatrix3d const& value) {
+  GfMatrix3dValue ret;
+  std::copy(value.data(), value.data() + 9, ret.data);
+  return ret;
+}
+extern GfMatrix3d GfMatrix3dFromValue(GfMatrix3dValue const& value) {
+  GfMatrix3d ret;
+  std::copy(value.data, value.data + 9, ret.data());
+  return ret;
+}
+
+extern GfMatrix4dValue GfMatrix4dToValue(GfMatrix4d const& value) {
+  GfMatrix4dValue ret;
+  std::copy(value.data(), value.data() + 16, ret.data);
+  return ret;
+}
+extern GfMatrix4d GfMatrix4dFromValue(GfMatrix4dValue const& value) {
+  GfMatrix4d ret;
+  std::copy(value.data, value.data + 16, ret.data());
+  return ret;
+}
+
+extern GfQuatdValue GfQuatdToValue(GfQuatd const& value) {
+  GfQuatdValue ret;
+  GfVec3d const& im = value.GetImaginary();
+  ret.data[0] = im[0];
+  ret.data[1] = im[1];
+  ret.data[2] = im[2];
+  ret.data[3] = value.GetReal();
+  return ret;
+}
+extern GfQuatd GfQuatdFromValue(GfQuatdValue const& value) {
+  return GfQuatd(value.data[3], GfVec3d(value.data[0], value.data[1], value.data[2]));
+}
+
+extern GfQuatfValue GfQuatfToValue(GfQuatf const& value) {
+  GfQuatfValue ret;
+  GfVec3f const& im = value.GetImaginary();
+  ret.data[0] = im[0];
+  ret.data[1] = im[1];
+  ret.data[2] = im[2];
+  ret.data[3] = value.GetReal();
+  return ret;
+}
+extern GfQuatf GfQuatfFromValue(GfQuatfValue const& value) {
+  return GfQuatf(value.data[3], GfVec3f(value.data[0], value.data[1], value.data[2]));
+}
+
+extern GfRange1dValue GfRange1dToValue(GfRange1d const& value) {
+  GfRange1dValue ret;
+  ret.data[0] = value.GetMin();
+  ret.data[1] = value.GetMax();
+  return ret;
+}
+extern GfRange1d GfRange1dFromValue(GfRange1dValue const& value) {
+  return GfRange1d(value.data[0], value.data[1]);
+}
+
+extern GfRange1fValue GfRange1fToValue(GfRange1f const& value) {
+  GfRange1fValue ret;
+  ret.data[0] = value.GetMin();
+  ret.data[1] = value.GetMax();
+  return ret;
+}
+extern GfRange1f GfRange1fFromValue(GfRange1fValue const& value) {
+  return GfRange1f(value.data[0], value.data[1]);
+}
+
+extern GfRange2dValue GfRange2dToValue(GfRange2d const& value) {
+  GfRange2dValue ret;
+  std::copy(value.GetMin().data(), value.GetMin().data() + 2, ret.data);
+  std::copy(value.GetMax().data(), value.GetMax().data() + 2, ret.data + 2);
+  return ret;
+}
+extern GfRange2d GfRange2dFromValue(GfRange2dValue const& value) {
+  return GfRange2d(GfVec2d(value.data), GfVec2d(value.data + 2));
+}
+
+extern GfRange3dValue GfRange3dToValue(GfRange3d const& value) {
+  GfRange3dValue ret;
+  std::copy(value.GetMin().data(), value.GetMin().data() + 3, ret.data);
+  std::copy(value.GetMax().data(), value.GetMax().data() + 3, ret.data + 3);
+  return ret;
+}
+extern GfRange3d GfRange3dFromValue(GfRange3dValue const& value) {
+  return GfRange3d(GfVec3d(value.data), GfVec3d(value.data + 3));
+}
+
+extern GfVec2dValue GfVec2dToValue(GfVec2d const& value) {
+  GfVec2dValue ret;
+  std::copy(value.data(), value.data() + 2, ret.data);
+  return ret;
+}
+extern GfVec2d GfVec2dFromValue(GfVec2dValue const& value) {
+  GfVec2d ret;
+  std::copy(value.data, value.data + 2, ret.data());
+  return ret;
+}
+
+extern GfVec2fValue GfVec2fToValue(GfVec2f const& value) {
+  GfVec2fValue ret;
+  std::copy(value.data(), value.data() + 2, ret.data);
+  return ret;
+}
+extern GfVec2f GfVec2fFromValue(GfVec2fValue const& value) {
+  GfVec2f ret;
+  std::copy(value.data, value.data + 2, ret.data());
+  return ret;
+}
+
+extern GfVec2iValue GfVec2iToValue(GfVec2i const& value) {
+  GfVec2iValue ret;
+  std::copy(value.data(), value.data() + 2, ret.data);
+  return ret;
+}
+extern GfVec2i GfVec2iFromValue(GfVec2iValue const& value) {
+  GfVec2i ret;
+  std::copy(value.data, value.data + 2, ret.data());
+  return ret;
+}
+
+extern GfVec3dValue GfVec3dToValue(GfVec3d const& value) {
+  GfVec3dValue ret;
+  std::copy(value.data(), value.data() + 3, ret.data);
+  return ret;
+}
+extern GfVec3d GfVec3dFromValue(GfVec3dValue const& value) {
+  GfVec3d ret;
+  std::copy(value.data, value.data + 3, ret.data());
+  return ret;
+}
+
+extern GfVec3fValue GfVec3fToValue(GfVec3f const& value) {
+  GfVec3fValue ret;
+  std::copy(value.data(), value.data() + 3, ret.data);
+  return ret;
+}
+extern GfVec3f GfVec3fFromValue(GfVec3fValue const& value) {
+  GfVec3f ret;
+  std::copy(value.data, value.data + 3, ret.data());
+  return ret;
+}
+
+extern GfVec3iValue GfVec3iToValue(GfVec3i const& value) {
+  GfVec3iValue ret;
+  std::copy(value.data(), value.data() + 3, ret.data);
+  return ret;
+}
+extern GfVec3i GfVec3iFromValue(GfVec3iValue const& value) {
+  GfVec3i ret;
+  std::copy(value.data, value.data + 3, ret.data());
+  return ret;
+}
+
+extern GfVec4dValue GfVec4dToValue(GfVec4d const& value) {
+  GfVec4dValue ret;
+  std::copy(value.data(), value.data() + 4, ret.data);
+  return ret;
+}
+extern GfVec4d GfVec4dFromValue(GfVec4dValue const& value) {
+  GfVec4d ret;
+  std::copy(value.data, value.data + 4, ret.data());
+  return ret;
+}
+
+extern GfVec4fValue GfVec4fToValue(GfVec4f const& value) {
+  GfVec4fValue ret;
+  std::copy(value.data(), value.data() + 4, ret.data);
+  return ret;
+}
+extern GfVec4f GfVec4fFromValue(GfVec4fValue const& value) {
+  GfVec4f ret;
+  std::copy(value.data, value.data + 4, ret.data());
+  return ret;
+}
+
+extern GfVec4iValue GfVec4iToValue(GfVec4i const& value) {
+  GfVec4iValue ret;
+  std::copy(value.data(), value.data() + 4, ret.data);
+  return ret;
+}
+extern GfVec4i GfVec4iFromValue(GfVec4iValue const& value) {
+  GfVec4i ret;
+  std::copy(value.data, value.data + 4, ret.data());
+  return ret;
+}
+%}
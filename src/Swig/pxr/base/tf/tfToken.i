@@ -30,6 +30,36 @@ WRAP_EQUAL(TfToken)
     }
 %}
 
+%include <arrays_csharp.i>
+%apply long long OUTPUT[] { long long* tokenHandles, long long* tokenTexts }
+%apply int OUTPUT[] { int* tokenLengths }
+
+%extend std::vector<TfToken> {
+  // Writes the addresses of new copies of count tokens, starting at index, to tokenHandles. The
+  // caller owns the copies, which lets it create their proxies without a call per token.
+  void CopyToHandles(int index, int count, long long* tokenHandles) throw (std::out_of_range) {
+    if (index < 0 || count < 0 || index + count > (int)self->size()) {
+      throw std::out_of_range("index");
+    }
+    for (int i = 0; i < count; i++) {
+      tokenHandles[i] = reinterpret_cast<long long>(new TfToken((*self)[index + i]));
+    }
+  }
+
+  // Writes the addresses and lengths of the UTF-8 text of count tokens, starting at index. The
+  // text is interned, and remains valid as long as the vector holds the tokens.
+  void CopyToTextPointers(int index, int count, long long* tokenTexts, int* tokenLengths) throw (std::out_of_range) {
+    if (index < 0 || count < 0 || index + count > (int)self->size()) {
+      throw std::out_of_range("index");
+    }
+    for (int i = 0; i < count; i++) {
+      std::string const& text = (*self)[index + i].GetString();
+      tokenTexts[i] = reinterpret_cast<long long>(text.c_str());
+      tokenLengths[i] = static_cast<int>(text.size());
+    }
+  }
+}
+
 %include "std_vector.i"
 namespace std {
   %template(TfTokenVector) vector<TfToken>;
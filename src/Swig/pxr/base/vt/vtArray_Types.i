@@ -13,6 +13,13 @@
 // limitations under the License.
 
 
+%{
+inline unsigned char Vt_FloatToUnorm8(float x) {
+  x = x < 0.0f ? 0.0f : (x > 1.0f ? 1.0f : x);
+  return static_cast<unsigned char>(x * 255.0f + 0.5f);
+}
+%}
+
 CSHARP_ARRAYS(SdfAssetPath, SdfAssetPath);
 WRAP_EQUAL(SdfAssetPathArray)
 %template (SdfAssetPathArray) VtArray<SdfAssetPath>;
@@ -23,16 +30,160 @@ WRAP_EQUAL(SdfTimeCodeArray)
 %template (SdfTimeCodeArray) VtArray<SdfTimeCode>;
 typedef VtArray<SdfTimeCode> SdfTimeCodeArray;
 
+%extend VtArray<bool> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(bool);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(bool, bool);
 WRAP_EQUAL(VtBoolArray)
 %template (VtBoolArray) VtArray<bool>;
 typedef VtArray<bool> VtBoolArray;
 
+%extend VtArray<double> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(double);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(double, double);
 WRAP_EQUAL(VtDoubleArray)
 %template (VtDoubleArray) VtArray<double>;
 typedef VtArray<double> VtDoubleArray;
 
+%extend VtArray<float> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(float);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(float, float);
 WRAP_EQUAL(VtFloatArray)
 %template (VtFloatArray) VtArray<float>;
@@ -43,41 +194,467 @@ WRAP_EQUAL(VtHalfArray)
 %template (VtHalfArray) VtArray<GfHalf>;
 typedef VtArray<GfHalf> VtHalfArray;
 
+%extend VtArray<int64_t> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(int64_t);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(int64_t, long);
 WRAP_EQUAL(VtInt64Array)
 %template (VtInt64Array) VtArray<int64_t>;
 typedef VtArray<int64_t> VtInt64Array;
 
+%extend VtArray<int> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(int);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(int, int);
 WRAP_EQUAL(VtIntArray)
 %template (VtIntArray) VtArray<int>;
 typedef VtArray<int> VtIntArray;
 
+%extend VtArray<GfMatrix2d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfMatrix2d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfMatrix2d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfMatrix2d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfMatrix2d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<double>(s[i * 4 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfMatrix2d, GfMatrix2d);
 WRAP_EQUAL(VtMatrix2dArray)
 %template (VtMatrix2dArray) VtArray<GfMatrix2d>;
 typedef VtArray<GfMatrix2d> VtMatrix2dArray;
 
+%extend VtArray<GfMatrix3d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfMatrix3d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfMatrix3d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 9;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfMatrix3d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 9; k++) {
+        d[i * 9 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfMatrix3d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 9; k++) {
+        c[k] = static_cast<double>(s[i * 9 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfMatrix3d, GfMatrix3d);
 WRAP_EQUAL(VtMatrix3dArray)
 %template (VtMatrix3dArray) VtArray<GfMatrix3d>;
 typedef VtArray<GfMatrix3d> VtMatrix3dArray;
 
+%extend VtArray<GfMatrix4d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfMatrix4d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfMatrix4d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 16;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfMatrix4d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 16; k++) {
+        d[i * 16 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfMatrix4d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 16; k++) {
+        c[k] = static_cast<double>(s[i * 16 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfMatrix4d, GfMatrix4d);
 WRAP_EQUAL(VtMatrix4dArray)
 %template (VtMatrix4dArray) VtArray<GfMatrix4d>;
 typedef VtArray<GfMatrix4d> VtMatrix4dArray;
 
+%extend VtArray<GfQuatd> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfQuatd const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfVec3d const& im = s[i].GetImaginary();
+      d[i * 4 + 0] = static_cast<float>(im[0]);
+      d[i * 4 + 1] = static_cast<float>(im[1]);
+      d[i * 4 + 2] = static_cast<float>(im[2]);
+      d[i * 4 + 3] = static_cast<float>(s[i].GetReal());
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfQuatd* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      float const* q = s + i * 4;
+      d[i] = GfQuatd(static_cast<double>(q[3]),
+                          GfVec3d(static_cast<double>(q[0]),
+                                      static_cast<double>(q[1]),
+                                      static_cast<double>(q[2])));
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfQuatd, GfQuatd);
 WRAP_EQUAL(VtQuatdArray)
 %template (VtQuatdArray) VtArray<GfQuatd>;
 typedef VtArray<GfQuatd> VtQuatdArray;
 
+%extend VtArray<GfQuatf> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfQuatf const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfVec3f const& im = s[i].GetImaginary();
+      d[i * 4 + 0] = static_cast<float>(im[0]);
+      d[i * 4 + 1] = static_cast<float>(im[1]);
+      d[i * 4 + 2] = static_cast<float>(im[2]);
+      d[i * 4 + 3] = static_cast<float>(s[i].GetReal());
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfQuatf* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      float const* q = s + i * 4;
+      d[i] = GfQuatf(static_cast<float>(q[3]),
+                          GfVec3f(static_cast<float>(q[0]),
+                                      static_cast<float>(q[1]),
+                                      static_cast<float>(q[2])));
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfQuatf, GfQuatf);
 WRAP_EQUAL(VtQuatfArray)
 %template (VtQuatfArray) VtArray<GfQuatf>;
 typedef VtArray<GfQuatf> VtQuatfArray;
 
+%extend VtArray<GfQuath> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfQuath const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfVec3h const& im = s[i].GetImaginary();
+      d[i * 4 + 0] = static_cast<float>(im[0]);
+      d[i * 4 + 1] = static_cast<float>(im[1]);
+      d[i * 4 + 2] = static_cast<float>(im[2]);
+      d[i * 4 + 3] = static_cast<float>(s[i].GetReal());
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfQuath* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      float const* q = s + i * 4;
+      d[i] = GfQuath(static_cast<GfHalf>(q[3]),
+                          GfVec3h(static_cast<GfHalf>(q[0]),
+                                      static_cast<GfHalf>(q[1]),
+                                      static_cast<GfHalf>(q[2])));
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfQuath, GfQuath);
 WRAP_EQUAL(VtQuathArray)
 %template (VtQuathArray) VtArray<GfQuath>;
@@ -93,76 +670,1030 @@ WRAP_EQUAL(VtTokenArray)
 %template (VtTokenArray) VtArray<TfToken>;
 typedef VtArray<TfToken> VtTokenArray;
 
+%extend VtArray<unsigned char> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(unsigned char);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(unsigned char, byte);
 WRAP_EQUAL(VtUCharArray)
 %template (VtUCharArray) VtArray<unsigned char>;
 typedef VtArray<unsigned char> VtUCharArray;
 
+%extend VtArray<uint64_t> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(uint64_t);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(uint64_t, ulong);
 WRAP_EQUAL(VtUInt64Array)
 %template (VtUInt64Array) VtArray<uint64_t>;
 typedef VtArray<uint64_t> VtUInt64Array;
 
+%extend VtArray<unsigned int> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(unsigned int);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
 CSHARP_ARRAYS(unsigned int, uint);
 WRAP_EQUAL(VtUIntArray)
 %template (VtUIntArray) VtArray<unsigned int>;
 typedef VtArray<unsigned int> VtUIntArray;
 
+%extend VtArray<GfVec2d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec2d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec2d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 2;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec2d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        d[i * 2 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec2d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        c[k] = static_cast<double>(s[i * 2 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec2d, GfVec2d);
 WRAP_EQUAL(VtVec2dArray)
 %template (VtVec2dArray) VtArray<GfVec2d>;
 typedef VtArray<GfVec2d> VtVec2dArray;
 
+%extend VtArray<GfVec2f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec2f);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec2f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 2;
+  }
+  void CopyToFloatArray(void* dest) {
+    memcpy(dest, self->cdata(), self->size() * sizeof(GfVec2f));
+  }
+  void CopyFromFloatArray(void* src) {
+    memcpy(self->data(), src, self->size() * sizeof(GfVec2f));
+  }
+}
+
 CSHARP_ARRAYS(GfVec2f, GfVec2f);
 WRAP_EQUAL(VtVec2fArray)
 %template (VtVec2fArray) VtArray<GfVec2f>;
 typedef VtArray<GfVec2f> VtVec2fArray;
 
+%extend VtArray<GfVec2h> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 2;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec2h const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf const* c = s[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        d[i * 2 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec2h* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf* c = d[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        c[k] = static_cast<GfHalf>(s[i * 2 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec2h, GfVec2h);
 WRAP_EQUAL(VtVec2hArray)
 %template (VtVec2hArray) VtArray<GfVec2h>;
 typedef VtArray<GfVec2h> VtVec2hArray;
 
+%extend VtArray<GfVec2i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec2i);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec2i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 2;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec2i const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      int const* c = s[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        d[i * 2 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec2i* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      int* c = d[i].data();
+      for (size_t k = 0; k < 2; k++) {
+        c[k] = static_cast<int>(s[i * 2 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec2i, GfVec2i);
 WRAP_EQUAL(VtVec2iArray)
 %template (VtVec2iArray) VtArray<GfVec2i>;
 typedef VtArray<GfVec2i> VtVec2iArray;
 
+%extend VtArray<GfVec3d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec3d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec3d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 3;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec3d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        d[i * 3 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec3d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        c[k] = static_cast<double>(s[i * 3 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec3d, GfVec3d);
 WRAP_EQUAL(VtVec3dArray)
 %template (VtVec3dArray) VtArray<GfVec3d>;
 typedef VtArray<GfVec3d> VtVec3dArray;
 
+%extend VtArray<GfVec3f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec3f);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec3f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 3;
+  }
+  void CopyToFloatArray(void* dest) {
+    memcpy(dest, self->cdata(), self->size() * sizeof(GfVec3f));
+  }
+  void CopyFromFloatArray(void* src) {
+    memcpy(self->data(), src, self->size() * sizeof(GfVec3f));
+  }
+}
+
 CSHARP_ARRAYS(GfVec3f, GfVec3f);
 WRAP_EQUAL(VtVec3fArray)
 %template (VtVec3fArray) VtArray<GfVec3f>;
 typedef VtArray<GfVec3f> VtVec3fArray;
 
+%extend VtArray<GfVec3h> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 3;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec3h const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf const* c = s[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        d[i * 3 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec3h* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf* c = d[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        c[k] = static_cast<GfHalf>(s[i * 3 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec3h, GfVec3h);
 WRAP_EQUAL(VtVec3hArray)
 %template (VtVec3hArray) VtArray<GfVec3h>;
 typedef VtArray<GfVec3h> VtVec3hArray;
 
+%extend VtArray<GfVec3i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec3i);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec3i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 3;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec3i const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      int const* c = s[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        d[i * 3 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec3i* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      int* c = d[i].data();
+      for (size_t k = 0; k < 3; k++) {
+        c[k] = static_cast<int>(s[i * 3 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec3i, GfVec3i);
 WRAP_EQUAL(VtVec3iArray)
 %template (VtVec3iArray) VtArray<GfVec3i>;
 typedef VtArray<GfVec3i> VtVec3iArray;
 
+%extend VtArray<GfVec4d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec4d);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec4d> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec4d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec4d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<double>(s[i * 4 + k]);
+      }
+    }
+  }
+  void CopyToUnorm8Array(void* dest) {
+    unsigned char* d = static_cast<unsigned char*>(dest);
+    GfVec4d const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      double const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = Vt_FloatToUnorm8(static_cast<float>(c[k]));
+      }
+    }
+  }
+  void CopyFromUnorm8Array(void* src) {
+    unsigned char const* s = static_cast<unsigned char const*>(src);
+    GfVec4d* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      double* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<double>(s[i * 4 + k] / 255.0f);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec4d, GfVec4d);
 WRAP_EQUAL(VtVec4dArray)
 %template (VtVec4dArray) VtArray<GfVec4d>;
 typedef VtArray<GfVec4d> VtVec4dArray;
 
+%extend VtArray<GfVec4f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec4f);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec4f> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    memcpy(dest, self->cdata(), self->size() * sizeof(GfVec4f));
+  }
+  void CopyFromFloatArray(void* src) {
+    memcpy(self->data(), src, self->size() * sizeof(GfVec4f));
+  }
+  void CopyToUnorm8Array(void* dest) {
+    unsigned char* d = static_cast<unsigned char*>(dest);
+    GfVec4f const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      float const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = Vt_FloatToUnorm8(static_cast<float>(c[k]));
+      }
+    }
+  }
+  void CopyFromUnorm8Array(void* src) {
+    unsigned char const* s = static_cast<unsigned char const*>(src);
+    GfVec4f* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      float* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<float>(s[i * 4 + k] / 255.0f);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec4f, GfVec4f);
 WRAP_EQUAL(VtVec4fArray)
 %template (VtVec4fArray) VtArray<GfVec4f>;
 typedef VtArray<GfVec4f> VtVec4fArray;
 
+%extend VtArray<GfVec4h> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec4h const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec4h* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<GfHalf>(s[i * 4 + k]);
+      }
+    }
+  }
+  void CopyToUnorm8Array(void* dest) {
+    unsigned char* d = static_cast<unsigned char*>(dest);
+    GfVec4h const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = Vt_FloatToUnorm8(static_cast<float>(c[k]));
+      }
+    }
+  }
+  void CopyFromUnorm8Array(void* src) {
+    unsigned char const* s = static_cast<unsigned char const*>(src);
+    GfVec4h* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      GfHalf* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<GfHalf>(s[i * 4 + k] / 255.0f);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec4h, GfVec4h);
 WRAP_EQUAL(VtVec4hArray)
 %template (VtVec4hArray) VtArray<GfVec4h>;
 typedef VtArray<GfVec4h> VtVec4hArray;
 
+%extend VtArray<GfVec4i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }
+  static size_t GetElementSize() {
+    return sizeof(GfVec4i);
+  }
+  void* GetDataPointer() {
+    return self->data();
+  }
+  void* GetConstDataPointer() {
+    return (void*)self->cdata();
+  }
+  %proxycode %{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }
+
+  int GetViewLength(int viewElementSize) {
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }
+    return (int)(byteLength / viewElementSize);
+  }
+#endif
+  %}
+}
+
+%extend VtArray<GfVec4i> {
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {
+    return 4;
+  }
+  void CopyToFloatArray(void* dest) {
+    float* d = static_cast<float*>(dest);
+    GfVec4i const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {
+      int const* c = s[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        d[i * 4 + k] = static_cast<float>(c[k]);
+      }
+    }
+  }
+  void CopyFromFloatArray(void* src) {
+    float const* s = static_cast<float const*>(src);
+    GfVec4i* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {
+      int* c = d[i].data();
+      for (size_t k = 0; k < 4; k++) {
+        c[k] = static_cast<int>(s[i * 4 + k]);
+      }
+    }
+  }
+}
+
 CSHARP_ARRAYS(GfVec4i, GfVec4i);
 WRAP_EQUAL(VtVec4iArray)
 %template (VtVec4iArray) VtArray<GfVec4i>;
@@ -40,6 +40,8 @@
 
 %include "vtValue_Accessors.i"
 
+%include "vtValue_GfValues.i"
+
 WRAP_EQUAL(VtValue)
 
 
@@ -0,0 +1,186 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+%inline %{
+// This code manifests in UsdCs class.
+
+extern bool VtValueToGfMatrix2dValue(VtValue const& value, GfMatrix2dValue* output) {
+  if (!value.IsHolding<GfMatrix2d>()) {
+    *output = GfMatrix2dValue();
+    return false;
+  }
+  *output = GfMatrix2dToValue(value.UncheckedGet<GfMatrix2d>());
+  return true;
+}
+extern VtValue VtValueFromGfMatrix2dValue(GfMatrix2dValue const& value) {
+  return VtValue(GfMatrix2dFromValue(value));
+}
+
+extern bool VtValueToGfMatrix3dValue(VtValue const& value, GfMatrix3dValue* output) {
+  if (!value.IsHolding<GfMatrix3d>()) {
+    *output = GfMatrix3dValue();
+    return false;
+  }
+  *output = GfMatrix3dToValue(value.UncheckedGet<GfMatrix3d>());
+  return true;
+}
+extern VtValue VtValueFromGfMatrix3dValue(GfMatrix3dValue const& value) {
+  return VtValue(GfMatrix3dFromValue(value));
+}
+
+extern bool VtValueToGfMatrix4dValue(VtValue const& value, GfMatrix4dValue* output) {
+  if (!value.IsHolding<GfMatrix4d>()) {
+    *output = GfMatrix4dValue();
+    return false;
+  }
+  *output = GfMatrix4dToValue(value.UncheckedGet<GfMatrix4d>());
+  return true;
+}
+extern VtValue VtValueFromGfMatrix4dValue(GfMatrix4dValue const& value) {
+  return VtValue(GfMatrix4dFromValue(value));
+}
+
+extern bool VtValueToGfQuatdValue(VtValue const& value, GfQuatdValue* output) {
+  if (!value.IsHolding<GfQuatd>()) {
+    *output = GfQuatdValue();
+    return false;
+  }
+  *output = GfQuatdToValue(value.UncheckedGet<GfQuatd>());
+  return true;
+}
+extern VtValue VtValueFromGfQuatdValue(GfQuatdValue const& value) {
+  return VtValue(GfQuatdFromValue(value));
+}
+
+extern bool VtValueToGfQuatfValue(VtValue const& value, GfQuatfValue* output) {
+  if (!value.IsHolding<GfQuatf>()) {
+    *output = GfQuatfValue();
+    return false;
+  }
+  *output = GfQuatfToValue(value.UncheckedGet<GfQuatf>());
+  return true;
+}
+extern VtValue VtValueFromGfQuatfValue(GfQuatfValue const& value) {
+  return VtValue(GfQuatfFromValue(value));
+}
+
+extern bool VtValueToGfVec2dValue(VtValue const& value, GfVec2dValue* output) {
+  if (!value.IsHolding<GfVec2d>()) {
+    *output = GfVec2dValue();
+    return false;
+  }
+  *output = GfVec2dToValue(value.UncheckedGet<GfVec2d>());
+  return true;
+}
+extern VtValue VtValueFromGfVec2dValue(GfVec2dValue const& value) {
+  return VtValue(GfVec2dFromValue(value));
+}
+
+extern bool VtValueToGfVec2fValue(VtValue const& value, GfVec2fValue* output) {
+  if (!value.IsHolding<GfVec2f>()) {
+    *output = GfVec2fValue();
+    return false;
+  }
+  *output = GfVec2fToValue(value.UncheckedGet<GfVec2f>());
+  return true;
+}
+extern VtValue VtValueFromGfVec2fValue(GfVec2fValue const& value) {
+  return VtValue(GfVec2fFromValue(value));
+}
+
+extern bool VtValueToGfVec2iValue(VtValue const& value, GfVec2iValue* output) {
+  if (!value.IsHolding<GfVec2i>()) {
+    *output = GfVec2iValue();
+    return false;
+  }
+  *output = GfVec2iToValue(value.UncheckedGet<GfVec2i>());
+  return true;
+}
+extern VtValue VtValueFromGfVec2iValue(GfVec2iValue const& value) {
+  return VtValue(GfVec2iFromValue(value));
+}
+
+extern bool VtValueToGfVec3dValue(VtValue const& value, GfVec3dValue* output) {
+  if (!value.IsHolding<GfVec3d>()) {
+    *output = GfVec3dValue();
+    return false;
+  }
+  *output = GfVec3dToValue(value.UncheckedGet<GfVec3d>());
+  return true;
+}
+extern VtValue VtValueFromGfVec3dValue(GfVec3dValue const& value) {
+  return VtValue(GfVec3dFromValue(value));
+}
+
+extern bool VtValueToGfVec3fValue(VtValue const& value, GfVec3fValue* output) {
+  if (!value.IsHolding<GfVec3f>()) {
+    *output = GfVec3fValue();
+    return false;
+  }
+  *output = GfVec3fToValue(value.UncheckedGet<GfVec3f>());
+  return true;
+}
+extern VtValue VtValueFromGfVec3fValue(GfVec3fValue const& value) {
+  return VtValue(GfVec3fFromValue(value));
+}
+
+extern bool VtValueToGfVec3iValue(VtValue const& value, GfVec3iValue* output) {
+  if (!value.IsHolding<GfVec3i>()) {
+    *output = GfVec3iValue();
+    return false;
+  }
+  *output = GfVec3iToValue(value.UncheckedGet<GfVec3i>());
+  return true;
+}
+extern VtValue VtValueFromGfVec3iValue(GfVec3iValue const& value) {
+  return VtValue(GfVec3iFromValue(value));
+}
+
+extern bool VtValueToGfVec4dValue(VtValue const& value, GfVec4dValue* output) {
+  if (!value.IsHolding<GfVec4d>()) {
+    *output = GfVec4dValue();
+    return false;
+  }
+  *output = GfVec4dToValue(value.UncheckedGet<GfVec4d>());
+  return true;
+}
+extern VtValue VtValueFromGfVec4dValue(GfVec4dValue const& value) {
+  return VtValue(GfVec4dFromValue(value));
+}
+
+extern bool VtValueToGfVec4fValue(VtValue const& value, GfVec4fValue* output) {
+  if (!value.IsHolding<GfVec4f>()) {
+    *output = GfVec4fValue();
+    return false;
+  }
+  *output = GfVec4fToValue(value.UncheckedGet<GfVec4f>());
+  return true;
+}
+extern VtValue VtValueFromGfVec4fValue(GfVec4fValue const& value) {
+  return VtValue(GfVec4fFromValue(value));
+}
+
+extern bool VtValueToGfVec4iValue(VtValue const& value, GfVec4iValue* output) {
+  if (!value.IsHolding<GfVec4i>()) {
+    *output = GfVec4iValue();
+    return false;
+  }
+  *output = GfVec4iToValue(value.UncheckedGet<GfVec4i>());
+  return true;
+}
+extern VtValue VtValueFromGfVec4iValue(GfVec4iValue const& value) {
+  return VtValue(GfVec4iFromValue(value));
+}
+%}
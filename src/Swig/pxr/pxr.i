@@ -20,6 +20,7 @@
 
 %{
 #include "pxr/base/tf/hash.h"
+#include <algorithm>
 %}
 %include "stl.i"
 
@@ -59,6 +60,19 @@ namespace std {
 }
 typedef vector< vector<float> > StdFloatVectorVector;
 
+%include <arrays_csharp.i>
+%apply double OUTPUT[] { double* doubleBuffer }
+
+%extend std::vector<double> {
+  // Copies count values, starting at index, in a single call instead of one call per value.
+  void CopyToArray(int index, int count, double* doubleBuffer) throw (std::out_of_range) {
+    if (index < 0 || count < 0 || index + count > (int)self->size()) {
+      throw std::out_of_range("index");
+    }
+    std::copy(self->begin() + index, self->begin() + index + count, doubleBuffer);
+  }
+}
+
 namespace std {
   %template(StdDoubleVector) vector<double>;
 }
@@ -13,9 +13,36 @@
 // limitations under the License.
 
 %typemap(cscode) KindTokens %{
-  public static TfToken assembly = new TfToken("assembly");
-  public static TfToken component = new TfToken("component");
-  public static TfToken group = new TfToken("group");
-  public static TfToken model = new TfToken("model");
-  public static TfToken subcomponent = new TfToken("subcomponent");
+  static int sm_materializedCount;
+
+  /// <summary>
+  /// The number of tokens in this class which have been created so far.
+  /// </summary>
+  public static int MaterializedCount { get { return sm_materializedCount; } }
+
+  /// <summary>
+  /// The total number of tokens in this class.
+  /// </summary>
+  public const int Count = 5;
+
+  static TfToken Materialize(ref TfToken field, string value) {
+    var token = new TfToken(value);
+    if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null) {
+      global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+      return token;
+    }
+    token.Dispose();
+    return field;
+  }
+
+  static TfToken sm_assembly;
+  public static TfToken assembly { get { return sm_assembly ?? Materialize(ref sm_assembly, "assembly"); } }
+  static TfToken sm_component;
+  public static TfToken component { get { return sm_component ?? Materialize(ref sm_component, "component"); } }
+  static TfToken sm_group;
+  public static TfToken group { get { return sm_group ?? Materialize(ref sm_group, "group"); } }
+  static TfToken sm_model;
+  public static TfToken model { get { return sm_model ?? Materialize(ref sm_model, "model"); } }
+  static TfToken sm_subcomponent;
+  public static TfToken subcomponent { get { return sm_subcomponent ?? Materialize(ref sm_subcomponent, "subcomponent"); } }
 %}
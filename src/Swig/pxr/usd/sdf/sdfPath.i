@@ -57,6 +57,36 @@
   }
 %}
 
+%include <arrays_csharp.i>
+%apply long long OUTPUT[] { long long* pathHandles, long long* pathTexts }
+%apply int OUTPUT[] { int* pathLengths }
+
+%extend std::vector<SdfPath> {
+  // Writes the addresses of new copies of count paths, starting at index, to pathHandles. The
+  // caller owns the copies, which lets it create their proxies without a call per path.
+  void CopyToHandles(int index, int count, long long* pathHandles) throw (std::out_of_range) {
+    if (index < 0 || count < 0 || index + count > (int)self->size()) {
+      throw std::out_of_range("index");
+    }
+    for (int i = 0; i < count; i++) {
+      pathHandles[i] = reinterpret_cast<long long>(new SdfPath((*self)[index + i]));
+    }
+  }
+
+  // Writes the addresses and lengths of the UTF-8 text of count paths, starting at index. Path
+  // strings are cached with the path, and remain valid as long as the vector holds the paths.
+  void CopyToTextPointers(int index, int count, long long* pathTexts, int* pathLengths) throw (std::out_of_range) {
+    if (index < 0 || count < 0 || index + count > (int)self->size()) {
+      throw std::out_of_range("index");
+    }
+    for (int i = 0; i < count; i++) {
+      std::string const& text = (*self)[index + i].GetString();
+      pathTexts[i] = reinterpret_cast<long long>(text.c_str());
+      pathLengths[i] = static_cast<int>(text.size());
+    }
+  }
+}
+
 %include "std_vector.i"
 namespace std {
   %template(SdfPathVector) vector<SdfPath>;
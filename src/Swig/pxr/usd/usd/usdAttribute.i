@@ -60,4 +60,10 @@ typedef std::vector<UsdAttribute> UsdAttributeVector;
 %ignore UsdAttribute::Set(const char* value) const;
 %ignore UsdAttribute::Set(const char* value, UsdTimeCode time = UsdTimeCode::Default()) const;
 
-%include "pxr/usd/usd/attribute.h"
\ No newline at end of file
+%include "pxr/usd/usd/attribute.h"
+
+%include "usdAttribute_BatchReaders.i"
+
+%include "usdAttribute_TypedWriters.i"
+
+%include "usdAttribute_GfValues.i"
@@ -0,0 +1,798 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+%{
+#include <algorithm>
+#include <stdexcept>
+%}
+
+%typemap(ctype)  void* buffer "void *"
+%typemap(imtype) void* buffer "System.IntPtr"
+%typemap(cstype) void* buffer "System.IntPtr"
+%typemap(csin)   void* buffer "$csinput"
+%apply long long OUTPUT[] { long long* offsets }
+%apply int OUTPUT[] { int* lengths }
+
+%inline %{
+// This code manifests in UsdCs class.
+//
+// Every attribute is read at every time code, in attribute-major order. For the entry
+// i = attrIndex * times.size() + timeIndex, offsets[i] and lengths[i] give the position and number
+// of elements in the buffer, lengths[i] is -1 when the attribute has no value of this type.
+// offsets and lengths hold entryCapacity values, std::out_of_range is thrown when this is less
+// than attrs.size() * times.size(). Returns the number of elements required. Values which do not
+// fit within capacity are not written, so the caller can grow the buffer and read again.
+
+
+extern size_t UsdAttributeBatchGetSdfTimeCodeArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<SdfTimeCode> value;
+  SdfTimeCode* dest = static_cast<SdfTimeCode*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtBoolArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<bool> value;
+  bool* dest = static_cast<bool*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtDoubleArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<double> value;
+  double* dest = static_cast<double*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtFloatArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<float> value;
+  float* dest = static_cast<float*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtHalfArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfHalf> value;
+  GfHalf* dest = static_cast<GfHalf*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtInt64Array(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<int64_t> value;
+  int64_t* dest = static_cast<int64_t*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtIntArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<int> value;
+  int* dest = static_cast<int*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtMatrix2dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfMatrix2d> value;
+  GfMatrix2d* dest = static_cast<GfMatrix2d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtMatrix3dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfMatrix3d> value;
+  GfMatrix3d* dest = static_cast<GfMatrix3d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtMatrix4dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfMatrix4d> value;
+  GfMatrix4d* dest = static_cast<GfMatrix4d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtQuatdArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfQuatd> value;
+  GfQuatd* dest = static_cast<GfQuatd*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtQuatfArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfQuatf> value;
+  GfQuatf* dest = static_cast<GfQuatf*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtQuathArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfQuath> value;
+  GfQuath* dest = static_cast<GfQuath*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtUCharArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<unsigned char> value;
+  unsigned char* dest = static_cast<unsigned char*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtUInt64Array(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<uint64_t> value;
+  uint64_t* dest = static_cast<uint64_t*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtUIntArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<unsigned int> value;
+  unsigned int* dest = static_cast<unsigned int*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec2dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec2d> value;
+  GfVec2d* dest = static_cast<GfVec2d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec2fArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec2f> value;
+  GfVec2f* dest = static_cast<GfVec2f*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec2hArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec2h> value;
+  GfVec2h* dest = static_cast<GfVec2h*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec2iArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec2i> value;
+  GfVec2i* dest = static_cast<GfVec2i*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec3dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec3d> value;
+  GfVec3d* dest = static_cast<GfVec3d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec3fArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec3f> value;
+  GfVec3f* dest = static_cast<GfVec3f*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec3hArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec3h> value;
+  GfVec3h* dest = static_cast<GfVec3h*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec3iArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec3i> value;
+  GfVec3i* dest = static_cast<GfVec3i*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec4dArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec4d> value;
+  GfVec4d* dest = static_cast<GfVec4d*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec4fArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec4f> value;
+  GfVec4f* dest = static_cast<GfVec4f*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec4hArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec4h> value;
+  GfVec4h* dest = static_cast<GfVec4h*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+
+extern size_t UsdAttributeBatchGetVtVec4iArray(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {
+  if (attrs.size() * times.size() > entryCapacity) {
+    throw std::out_of_range("entryCapacity");
+  }
+  VtArray<GfVec4i> value;
+  GfVec4i* dest = static_cast<GfVec4i*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {
+    for (size_t t = 0; t < times.size(); t++) {
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {
+        lengths[i] = -1;
+        continue;
+      }
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }
+      used += value.size();
+    }
+  }
+  return used;
+}
+%}
+
+%clear void* buffer;
+%clear long long* offsets;
+%clear int* lengths;
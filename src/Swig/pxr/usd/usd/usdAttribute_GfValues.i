@@ -0,0 +1,200 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+%inline %{
+// This code manifests in UsdCs class.
+
+extern bool UsdAttributeGetGfMatrix2dValue(UsdAttribute const& attr, GfMatrix2dValue* output, UsdTimeCode time) {
+  GfMatrix2d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfMatrix2dValue();
+    return false;
+  }
+  *output = GfMatrix2dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfMatrix2dValue(UsdAttribute const& attr, GfMatrix2dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfMatrix2dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfMatrix3dValue(UsdAttribute const& attr, GfMatrix3dValue* output, UsdTimeCode time) {
+  GfMatrix3d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfMatrix3dValue();
+    return false;
+  }
+  *output = GfMatrix3dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfMatrix3dValue(UsdAttribute const& attr, GfMatrix3dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfMatrix3dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfMatrix4dValue(UsdAttribute const& attr, GfMatrix4dValue* output, UsdTimeCode time) {
+  GfMatrix4d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfMatrix4dValue();
+    return false;
+  }
+  *output = GfMatrix4dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfMatrix4dValue(UsdAttribute const& attr, GfMatrix4dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfMatrix4dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfQuatdValue(UsdAttribute const& attr, GfQuatdValue* output, UsdTimeCode time) {
+  GfQuatd value;
+  if (!attr.Get(&value, time)) {
+    *output = GfQuatdValue();
+    return false;
+  }
+  *output = GfQuatdToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfQuatdValue(UsdAttribute const& attr, GfQuatdValue const& value, UsdTimeCode time) {
+  return attr.Set(GfQuatdFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfQuatfValue(UsdAttribute const& attr, GfQuatfValue* output, UsdTimeCode time) {
+  GfQuatf value;
+  if (!attr.Get(&value, time)) {
+    *output = GfQuatfValue();
+    return false;
+  }
+  *output = GfQuatfToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfQuatfValue(UsdAttribute const& attr, GfQuatfValue const& value, UsdTimeCode time) {
+  return attr.Set(GfQuatfFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec2dValue(UsdAttribute const& attr, GfVec2dValue* output, UsdTimeCode time) {
+  GfVec2d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec2dValue();
+    return false;
+  }
+  *output = GfVec2dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec2dValue(UsdAttribute const& attr, GfVec2dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec2dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec2fValue(UsdAttribute const& attr, GfVec2fValue* output, UsdTimeCode time) {
+  GfVec2f value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec2fValue();
+    return false;
+  }
+  *output = GfVec2fToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec2fValue(UsdAttribute const& attr, GfVec2fValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec2fFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec2iValue(UsdAttribute const& attr, GfVec2iValue* output, UsdTimeCode time) {
+  GfVec2i value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec2iValue();
+    return false;
+  }
+  *output = GfVec2iToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec2iValue(UsdAttribute const& attr, GfVec2iValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec2iFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec3dValue(UsdAttribute const& attr, GfVec3dValue* output, UsdTimeCode time) {
+  GfVec3d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec3dValue();
+    return false;
+  }
+  *output = GfVec3dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec3dValue(UsdAttribute const& attr, GfVec3dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec3dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec3fValue(UsdAttribute const& attr, GfVec3fValue* output, UsdTimeCode time) {
+  GfVec3f value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec3fValue();
+    return false;
+  }
+  *output = GfVec3fToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec3fValue(UsdAttribute const& attr, GfVec3fValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec3fFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec3iValue(UsdAttribute const& attr, GfVec3iValue* output, UsdTimeCode time) {
+  GfVec3i value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec3iValue();
+    return false;
+  }
+  *output = GfVec3iToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec3iValue(UsdAttribute const& attr, GfVec3iValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec3iFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec4dValue(UsdAttribute const& attr, GfVec4dValue* output, UsdTimeCode time) {
+  GfVec4d value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec4dValue();
+    return false;
+  }
+  *output = GfVec4dToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec4dValue(UsdAttribute const& attr, GfVec4dValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec4dFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec4fValue(UsdAttribute const& attr, GfVec4fValue* output, UsdTimeCode time) {
+  GfVec4f value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec4fValue();
+    return false;
+  }
+  *output = GfVec4fToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec4fValue(UsdAttribute const& attr, GfVec4fValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec4fFromValue(value), time);
+}
+
+extern bool UsdAttributeGetGfVec4iValue(UsdAttribute const& attr, GfVec4iValue* output, UsdTimeCode time) {
+  GfVec4i value;
+  if (!attr.Get(&value, time)) {
+    *output = GfVec4iValue();
+    return false;
+  }
+  *output = GfVec4iToValue(value);
+  return true;
+}
+extern bool UsdAttributeSetGfVec4iValue(UsdAttribute const& attr, GfVec4iValue const& value, UsdTimeCode time) {
+  return attr.Set(GfVec4iFromValue(value), time);
+}
+%}
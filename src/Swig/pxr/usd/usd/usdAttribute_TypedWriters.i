@@ -0,0 +1,649 @@
+// Copyright 2017 Google Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+
+%{
+#include "pxr/usd/usdUtils/sparseValueWriter.h"
+%}
+
+%typemap(ctype)  void* data "void *"
+%typemap(imtype) void* data "System.IntPtr"
+%typemap(cstype) void* data "System.IntPtr"
+%typemap(csin)   void* data "$csinput"
+
+%inline %{
+// This code manifests in UsdCs class.
+//
+// data points to count elements with the layout of the C++ element type, scalar values are only
+// written when count is 1. The sparse variants skip values equal to the previous time sample.
+
+
+extern bool UsdAttributeSetGfHalf(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfHalf*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfHalf(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfHalf*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfMatrix2d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfMatrix2d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfMatrix2d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfMatrix2d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfMatrix3d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfMatrix3d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfMatrix3d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfMatrix3d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfMatrix4d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfMatrix4d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfMatrix4d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfMatrix4d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfQuatd(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfQuatd*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfQuatd(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfQuatd*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfQuatf(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfQuatf*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfQuatf(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfQuatf*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfQuath(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfQuath*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfQuath(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfQuath*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec2d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec2d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec2d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec2d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec2f(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec2f*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec2f(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec2f*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec2h(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec2h*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec2h(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec2h*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec2i(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec2i*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec2i(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec2i*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec3d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec3d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec3d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec3d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec3f(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec3f*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec3f(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec3f*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec3h(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec3h*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec3h(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec3h*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec3i(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec3i*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec3i(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec3i*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec4d(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec4d*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec4d(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec4d*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec4f(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec4f*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec4f(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec4f*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec4h(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec4h*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec4h(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec4h*>(data)), time);
+}
+
+extern bool UsdAttributeSetGfVec4i(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const GfVec4i*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetGfVec4i(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const GfVec4i*>(data)), time);
+}
+
+extern bool UsdAttributeSetSdfTimeCode(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const SdfTimeCode*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetSdfTimeCode(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const SdfTimeCode*>(data)), time);
+}
+
+extern bool UsdAttributeSetSdfTimeCodeArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const SdfTimeCode* src = static_cast<const SdfTimeCode*>(data);
+  return attr.Set(VtArray<SdfTimeCode>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetSdfTimeCodeArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const SdfTimeCode* src = static_cast<const SdfTimeCode*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<SdfTimeCode>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtBoolArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const bool* src = static_cast<const bool*>(data);
+  return attr.Set(VtArray<bool>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtBoolArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const bool* src = static_cast<const bool*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<bool>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtDoubleArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const double* src = static_cast<const double*>(data);
+  return attr.Set(VtArray<double>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtDoubleArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const double* src = static_cast<const double*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<double>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtFloatArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const float* src = static_cast<const float*>(data);
+  return attr.Set(VtArray<float>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtFloatArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const float* src = static_cast<const float*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<float>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtHalfArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfHalf* src = static_cast<const GfHalf*>(data);
+  return attr.Set(VtArray<GfHalf>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtHalfArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfHalf* src = static_cast<const GfHalf*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfHalf>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtInt64Array(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const int64_t* src = static_cast<const int64_t*>(data);
+  return attr.Set(VtArray<int64_t>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtInt64Array(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const int64_t* src = static_cast<const int64_t*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<int64_t>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtIntArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const int* src = static_cast<const int*>(data);
+  return attr.Set(VtArray<int>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtIntArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const int* src = static_cast<const int*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<int>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtMatrix2dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix2d* src = static_cast<const GfMatrix2d*>(data);
+  return attr.Set(VtArray<GfMatrix2d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtMatrix2dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix2d* src = static_cast<const GfMatrix2d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfMatrix2d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtMatrix3dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix3d* src = static_cast<const GfMatrix3d*>(data);
+  return attr.Set(VtArray<GfMatrix3d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtMatrix3dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix3d* src = static_cast<const GfMatrix3d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfMatrix3d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtMatrix4dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix4d* src = static_cast<const GfMatrix4d*>(data);
+  return attr.Set(VtArray<GfMatrix4d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtMatrix4dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfMatrix4d* src = static_cast<const GfMatrix4d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfMatrix4d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtQuatdArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuatd* src = static_cast<const GfQuatd*>(data);
+  return attr.Set(VtArray<GfQuatd>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtQuatdArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuatd* src = static_cast<const GfQuatd*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfQuatd>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtQuatfArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuatf* src = static_cast<const GfQuatf*>(data);
+  return attr.Set(VtArray<GfQuatf>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtQuatfArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuatf* src = static_cast<const GfQuatf*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfQuatf>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtQuathArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuath* src = static_cast<const GfQuath*>(data);
+  return attr.Set(VtArray<GfQuath>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtQuathArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfQuath* src = static_cast<const GfQuath*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfQuath>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtUCharArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const unsigned char* src = static_cast<const unsigned char*>(data);
+  return attr.Set(VtArray<unsigned char>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtUCharArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const unsigned char* src = static_cast<const unsigned char*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<unsigned char>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtUInt64Array(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const uint64_t* src = static_cast<const uint64_t*>(data);
+  return attr.Set(VtArray<uint64_t>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtUInt64Array(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const uint64_t* src = static_cast<const uint64_t*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<uint64_t>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtUIntArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const unsigned int* src = static_cast<const unsigned int*>(data);
+  return attr.Set(VtArray<unsigned int>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtUIntArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const unsigned int* src = static_cast<const unsigned int*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<unsigned int>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec2dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2d* src = static_cast<const GfVec2d*>(data);
+  return attr.Set(VtArray<GfVec2d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec2dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2d* src = static_cast<const GfVec2d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec2d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec2fArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2f* src = static_cast<const GfVec2f*>(data);
+  return attr.Set(VtArray<GfVec2f>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec2fArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2f* src = static_cast<const GfVec2f*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec2f>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec2hArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2h* src = static_cast<const GfVec2h*>(data);
+  return attr.Set(VtArray<GfVec2h>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec2hArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2h* src = static_cast<const GfVec2h*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec2h>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec2iArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2i* src = static_cast<const GfVec2i*>(data);
+  return attr.Set(VtArray<GfVec2i>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec2iArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec2i* src = static_cast<const GfVec2i*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec2i>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec3dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3d* src = static_cast<const GfVec3d*>(data);
+  return attr.Set(VtArray<GfVec3d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec3dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3d* src = static_cast<const GfVec3d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec3d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec3fArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3f* src = static_cast<const GfVec3f*>(data);
+  return attr.Set(VtArray<GfVec3f>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec3fArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3f* src = static_cast<const GfVec3f*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec3f>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec3hArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3h* src = static_cast<const GfVec3h*>(data);
+  return attr.Set(VtArray<GfVec3h>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec3hArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3h* src = static_cast<const GfVec3h*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec3h>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec3iArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3i* src = static_cast<const GfVec3i*>(data);
+  return attr.Set(VtArray<GfVec3i>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec3iArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec3i* src = static_cast<const GfVec3i*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec3i>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec4dArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4d* src = static_cast<const GfVec4d*>(data);
+  return attr.Set(VtArray<GfVec4d>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec4dArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4d* src = static_cast<const GfVec4d*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec4d>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec4fArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4f* src = static_cast<const GfVec4f*>(data);
+  return attr.Set(VtArray<GfVec4f>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec4fArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4f* src = static_cast<const GfVec4f*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec4f>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec4hArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4h* src = static_cast<const GfVec4h*>(data);
+  return attr.Set(VtArray<GfVec4h>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec4hArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4h* src = static_cast<const GfVec4h*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec4h>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetVtVec4iArray(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4i* src = static_cast<const GfVec4i*>(data);
+  return attr.Set(VtArray<GfVec4i>(src, src + count), time);
+}
+extern bool UsdUtilsSparseValueWriterSetVtVec4iArray(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  const GfVec4i* src = static_cast<const GfVec4i*>(data);
+  return writer.SetAttribute(attr, VtValue(VtArray<GfVec4i>(src, src + count)), time);
+}
+
+extern bool UsdAttributeSetbool(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const bool*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetbool(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const bool*>(data)), time);
+}
+
+extern bool UsdAttributeSetdouble(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const double*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetdouble(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const double*>(data)), time);
+}
+
+extern bool UsdAttributeSetfloat(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const float*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetfloat(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const float*>(data)), time);
+}
+
+extern bool UsdAttributeSetint(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const int*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetint(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const int*>(data)), time);
+}
+
+extern bool UsdAttributeSetlong(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const int64_t*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetlong(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const int64_t*>(data)), time);
+}
+
+extern bool UsdAttributeSetulong(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const uint64_t*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetulong(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const uint64_t*>(data)), time);
+}
+
+extern bool UsdAttributeSetbyte(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const unsigned char*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetbyte(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const unsigned char*>(data)), time);
+}
+
+extern bool UsdAttributeSetuint(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return attr.Set(*static_cast<const unsigned int*>(data), time);
+}
+extern bool UsdUtilsSparseValueWriterSetuint(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {
+  if (count != 1) {
+    return false;
+  }
+  return writer.SetAttribute(attr, VtValue(*static_cast<const unsigned int*>(data)), time);
+}
+%}
+
+%clear void* data;
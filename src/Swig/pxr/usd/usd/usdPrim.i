@@ -43,6 +43,15 @@ typedef std::vector<UsdPrim> UsdPrimVector;
     if (!attr) { return false; }
     return attr.Get(valueOut, time);
   }
+
+  // The paths of GetChildren(), in one call instead of one call and prim per child.
+  std::vector<SdfPath> GetChildrenPaths() const {
+    std::vector<SdfPath> paths;
+    for (UsdPrim const& child : self->GetChildren()) {
+      paths.push_back(child.GetPath());
+    }
+    return paths;
+  }
 }
 
 %ignore UsdPrim::FindAllRelationshipTargetPaths;
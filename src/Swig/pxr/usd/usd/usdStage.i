@@ -18,7 +18,22 @@
 #include "pxr/usd/usd/stage.h"
 #include "pxr/usd/usd/prim.h"
 #include "pxr/usd/usd/primRange.h"
+#include "pxr/usd/usd/modelAPI.h"
+#include "pxr/usd/usd/variantSets.h"
+#include "pxr/usd/usdGeom/imageable.h"
+#include "pxr/usd/usdGeom/xformable.h"
+#include "pxr/usd/usdGeom/xformCache.h"
+#include "pxr/usd/usdGeom/bboxCache.h"
+#include "pxr/usd/usdGeom/tokens.h"
+#include "pxr/usd/usdSkel/animQuery.h"
+#include "pxr/usd/usdSkel/cache.h"
+#include "pxr/usd/usdSkel/skeleton.h"
+#include "pxr/usd/usdSkel/skeletonQuery.h"
+#include "pxr/usd/kind/registry.h"
+#include "pxr/usd/pcp/primIndex.h"
+#include <algorithm>
 #include <string>
+#include <unordered_map>
 %}
 
 namespace std {
@@ -63,6 +78,15 @@ class string;
 
 %include "pxr/usd/usd/stage.h"
 
+%apply int OUTPUT[] { int* attrIndices, int* offsets }
+%apply double OUTPUT[] { double* times }
+%apply int OUTPUT[] { int* records, int* variants }
+%apply int OUTPUT[] { int* flags }
+%apply double OUTPUT[] { double* localXforms, double* worldXforms, double* worldBounds, double* localBounds }
+%apply int OUTPUT[] { int* jointOffsets, int* blendShapeOffsets }
+%apply double OUTPUT[] { double* skinningXforms }
+%apply float OUTPUT[] { float* blendShapeWeights }
+
 %extend UsdStage {
   std::vector<UsdPrim> GetAllPrims() {
     std::vector<UsdPrim> targets;
@@ -130,4 +154,419 @@ class string;
 
     return targets;
   }
+
+  // Finds the time samples of the given attributes on the prims under rootPath, inclusive, in a
+  // single traversal. Every prim and attribute with time samples adds an entry i, in traversal
+  // order: paths[i] is the prim, attrIndices[i] the index of the attribute in attrNames, and its
+  // times are times[offsets[i]] to times[offsets[i + 1]].
+  // Returns the number of times required. attrIndices and offsets hold entryCapacity and
+  // entryCapacity + 1 values, entries and times which do not fit are not written, so the caller
+  // can grow the buffers and compute again.
+  size_t ComputeKeyFrames(SdfPath rootPath, std::vector<TfToken> const& attrNames,
+                          std::vector<SdfPath>* paths, int* attrIndices, int* offsets,
+                          size_t entryCapacity, double* times, size_t timesCapacity) {
+    paths->clear();
+    UsdPrim rootPrim = self->GetPrimAtPath(rootPath);
+    if (!rootPrim.IsValid()) {
+      TF_CODING_ERROR("Invalid root path <%s>", rootPath.GetText());
+      return 0;
+    }
+
+    std::vector<double> samples;
+    size_t used = 0;
+    for (UsdPrim const& p : UsdPrimRange(rootPrim, UsdPrimAllPrimsPredicate)) {
+      for (size_t a = 0; a < attrNames.size(); a++) {
+        UsdAttribute attr = p.GetAttribute(attrNames[a]);
+        if (!attr || !attr.GetTimeSamples(&samples) || samples.empty()) {
+          continue;
+        }
+        size_t i = paths->size();
+        paths->push_back(p.GetPath());
+        if (i < entryCapacity) {
+          attrIndices[i] = static_cast<int>(a);
+          offsets[i] = static_cast<int>(used);
+        }
+        if (used + samples.size() <= timesCapacity) {
+          std::copy(samples.begin(), samples.end(), times + used);
+        }
+        used += samples.size();
+      }
+    }
+
+    if (paths->size() <= entryCapacity) {
+      offsets[paths->size()] = static_cast<int>(used);
+    }
+    return used;
+  }
+
+  // Flattens the prims under rootPath, inclusive, into a packed snapshot in a single traversal.
+  // Every prim adds an entry i, in depth-first order: paths[i] is the prim and
+  // records[i * 10] to records[i * 10 + 9] hold, in order, the index of its parent entry (-1 for
+  // the root), a mask with bit t set when the prim is a non-abstract typeNames[t], the
+  // PrimHierarchyFlags, then the strings index of the type name, kind, master path, asset
+  // identifier, asset name and asset version (-1 when not authored), and the offset of its
+  // variant sets in variants (-1 when it has none).
+  // The variant sets of a prim are the number of sets, followed for each set by the strings index
+  // of its name and selection, the number of variants and the strings index of each variant.
+  // Returns the number of variant values required. records holds 10 * primCapacity values,
+  // entries and variant values which do not fit are not written, so the caller can grow the
+  // buffers and compute again.
+  size_t ComputePrimHierarchy(SdfPath rootPath, std::vector<std::string> const& typeNames,
+                              std::vector<SdfPath>* paths, std::vector<std::string>* strings,
+                              int* records, size_t primCapacity,
+                              int* variants, size_t variantCapacity) {
+    const int kStride = 10;
+    enum {
+      kActive = 1 << 0,
+      kLoaded = 1 << 1,
+      kAbstract = 1 << 2,
+      kInstance = 1 << 3,
+      kHasPayload = 1 << 4,
+      kInvisible = 1 << 5,
+      kModel = 1 << 6,
+      kGroup = 1 << 7,
+      kAssembly = 1 << 8,
+      kHasAssetInfo = 1 << 9,
+    };
+
+    paths->clear();
+    strings->clear();
+    UsdPrim rootPrim = self->GetPrimAtPath(rootPath);
+    if (!rootPrim.IsValid()) {
+      TF_CODING_ERROR("Invalid root path <%s>", rootPath.GetText());
+      return 0;
+    }
+    if (typeNames.size() > 32) {
+      TF_CODING_ERROR("At most 32 type names are supported, got %zu", typeNames.size());
+      return 0;
+    }
+
+    // Required so type aliases work (e.g. "Mesh" vs "UsdGeomMesh");
+    TfType schemaBaseType = TfType::Find<UsdSchemaBase>();
+    std::vector<TfType> baseTypes;
+    for (auto&& typeName : typeNames) {
+      TfType baseType = schemaBaseType.FindDerivedByName(typeName);
+      if (baseType == TfType::GetUnknownType()) {
+        TF_CODING_ERROR("Base type '%s' was not known to the TfType system", typeName.c_str());
+      }
+      baseTypes.push_back(baseType);
+    }
+
+    std::unordered_map<std::string, int> stringIndices;
+    auto intern = [&](std::string const& str) {
+      auto it = stringIndices.emplace(str, static_cast<int>(strings->size()));
+      if (it.second) {
+        strings->push_back(str);
+      }
+      return it.first->second;
+    };
+
+    size_t variantCount = 0;
+    auto pushVariant = [&](int value) {
+      if (variantCount < variantCapacity) {
+        variants[variantCount] = value;
+      }
+      variantCount++;
+    };
+
+    std::vector<int> ancestors;
+    TfToken kind;
+    TfToken visibility;
+    VtDictionary assetInfo;
+    for (UsdPrim const& p : UsdPrimRange(rootPrim, UsdPrimAllPrimsPredicate)) {
+      size_t i = paths->size();
+      SdfPath path = p.GetPath();
+      paths->push_back(path);
+
+      SdfPath parentPath = path.GetParentPath();
+      while (!ancestors.empty() && (*paths)[ancestors.back()] != parentPath) {
+        ancestors.pop_back();
+      }
+      int parent = ancestors.empty() ? -1 : ancestors.back();
+      ancestors.push_back(static_cast<int>(i));
+
+      unsigned int typeMask = 0;
+      TfType curType = schemaBaseType.FindDerivedByName(p.GetTypeName().GetString());
+      if (curType != TfType::GetUnknownType() && (i == 0 || !p.IsAbstract())) {
+        for (size_t t = 0; t < baseTypes.size(); t++) {
+          if (baseTypes[t] != TfType::GetUnknownType() && curType.IsA(baseTypes[t])) {
+            typeMask |= 1u << t;
+          }
+        }
+      }
+
+      int flags = 0;
+      int typeNameIndex = intern(p.GetTypeName().GetString());
+      int kindIndex = -1;
+      int masterIndex = -1;
+      int assetIdentifier = -1;
+      int assetName = -1;
+      int assetVersion = -1;
+      int variantOffset = -1;
+
+      if (p.IsActive()) { flags |= kActive; }
+      if (p.IsLoaded()) { flags |= kLoaded; }
+      if (p.IsAbstract()) { flags |= kAbstract; }
+      if (p.GetPrimIndex().HasAnyPayloads()) { flags |= kHasPayload; }
+      if (p.IsInstance()) {
+        flags |= kInstance;
+        masterIndex = intern(p.GetMaster().GetPath().GetString());
+      }
+
+      // Visibility is read at time 0 and not inherited, as in HierarchyBuilder.
+      UsdGeomImageable img(p);
+      if (img && img.GetVisibilityAttr().Get(&visibility, 0.0)
+          && visibility == UsdGeomTokens->invisible) {
+        flags |= kInvisible;
+      }
+
+      UsdModelAPI modelApi(p);
+      if (modelApi.GetKind(&kind)) {
+        kindIndex = intern(kind.GetString());
+        bool isAssembly = KindRegistry::IsA(kind, KindTokens->assembly);
+        bool isModel = modelApi.IsModel();
+        bool isGroup = modelApi.IsGroup();
+        if (isAssembly) { flags |= kAssembly; }
+        if (isModel) { flags |= kModel; }
+        if (isGroup) { flags |= kGroup; }
+
+        assetInfo.clear();
+        if ((isAssembly || (isModel && !isGroup)) && modelApi.GetAssetInfo(&assetInfo)) {
+          flags |= kHasAssetInfo;
+          VtValue const* value = assetInfo.GetValueAtPath("identifier");
+          if (value && value->IsHolding<SdfAssetPath>()) {
+            assetIdentifier = intern(value->UncheckedGet<SdfAssetPath>().GetAssetPath());
+          }
+          value = assetInfo.GetValueAtPath("name");
+          if (value && value->IsHolding<std::string>()) {
+            assetName = intern(value->UncheckedGet<std::string>());
+          }
+          value = assetInfo.GetValueAtPath("version");
+          if (value && value->IsHolding<std::string>()) {
+            assetVersion = intern(value->UncheckedGet<std::string>());
+          }
+        }
+      }
+
+      UsdVariantSets variantSets = p.GetVariantSets();
+      std::vector<std::string> setNames = variantSets.GetNames();
+      if (!setNames.empty()) {
+        variantOffset = static_cast<int>(variantCount);
+        pushVariant(static_cast<int>(setNames.size()));
+        for (auto&& setName : setNames) {
+          UsdVariantSet variantSet = variantSets.GetVariantSet(setName);
+          std::vector<std::string> variantNames = variantSet.GetVariantNames();
+          pushVariant(intern(setName));
+          pushVariant(intern(variantSet.GetVariantSelection()));
+          pushVariant(static_cast<int>(variantNames.size()));
+          for (auto&& variantName : variantNames) {
+            pushVariant(intern(variantName));
+          }
+        }
+      }
+
+      if (i < primCapacity) {
+        int* record = records + i * kStride;
+        record[0] = parent;
+        record[1] = static_cast<int>(typeMask);
+        record[2] = flags;
+        record[3] = typeNameIndex;
+        record[4] = kindIndex;
+        record[5] = masterIndex;
+        record[6] = assetIdentifier;
+        record[7] = assetName;
+        record[8] = assetVersion;
+        record[9] = variantOffset;
+      }
+    }
+
+    return variantCount;
+  }
+
+  // Computes the transforms of the given prims at the given time with a single
+  // UsdGeomXformCache, so the ancestors shared by several prims are only computed once.
+  // The 16 values of the local and local-to-world matrices of prim i are written in row-major
+  // order from 16 * i in localXforms and worldXforms, either of which may be null when not
+  // required. flags[i] holds the TransformFlags of prim i. Prims which are not xformable get
+  // identity matrices.
+  void ComputeTransforms(std::vector<SdfPath> const& paths, UsdTimeCode time,
+                         double* localXforms, double* worldXforms, int* flags) {
+    enum {
+      kResetsXformStack = 1 << 0,
+      kMightBeTimeVarying = 1 << 1,
+      kNotXformable = 1 << 2,
+    };
+
+    UsdGeomXformCache cache(time);
+    GfMatrix4d identity(1.0);
+    for (size_t i = 0; i < paths.size(); i++) {
+      UsdPrim prim = self->GetPrimAtPath(paths[i]);
+      GfMatrix4d const* local = &identity;
+      GfMatrix4d const* world = &identity;
+      GfMatrix4d localValue;
+      GfMatrix4d worldValue;
+      int primFlags = 0;
+
+      if (!prim || !prim.IsA<UsdGeomXformable>()) {
+        primFlags |= kNotXformable;
+      } else {
+        bool resetsXformStack = false;
+        if (localXforms) {
+          localValue = cache.GetLocalTransformation(prim, &resetsXformStack);
+          local = &localValue;
+        } else {
+          resetsXformStack = cache.GetResetXformStack(prim);
+        }
+        if (worldXforms) {
+          worldValue = cache.GetLocalToWorldTransform(prim);
+          world = &worldValue;
+        }
+        if (resetsXformStack) { primFlags |= kResetsXformStack; }
+        if (cache.TransformMightBeTimeVarying(prim)) { primFlags |= kMightBeTimeVarying; }
+      }
+
+      if (localXforms) {
+        std::copy(local->GetArray(), local->GetArray() + 16, localXforms + i * 16);
+      }
+      if (worldXforms) {
+        std::copy(world->GetArray(), world->GetArray() + 16, worldXforms + i * 16);
+      }
+      flags[i] = primFlags;
+    }
+  }
+
+  // Computes the bounds of the given prims at the given time with a single UsdGeomBBoxCache,
+  // including the given purposes, or the default purpose when empty. The minimum then maximum
+  // corners of prim i are written from 6 * i in worldBounds, aligned to the world axes, and in
+  // localBounds, aligned to the axes of the prim without its own transform. Either may be null
+  // when not required. Empty bounds have a minimum greater than their maximum.
+  void ComputeBounds(std::vector<SdfPath> const& paths, UsdTimeCode time,
+                     std::vector<TfToken> const& purposes,
+                     double* worldBounds, double* localBounds) {
+    TfTokenVector includedPurposes = purposes;
+    if (includedPurposes.empty()) {
+      includedPurposes.push_back(UsdGeomTokens->default_);
+    }
+
+    UsdGeomBBoxCache cache(time, includedPurposes);
+    GfRange3d empty;
+    for (size_t i = 0; i < paths.size(); i++) {
+      UsdPrim prim = self->GetPrimAtPath(paths[i]);
+      if (worldBounds) {
+        GfRange3d range = prim ? cache.ComputeWorldBound(prim).ComputeAlignedRange() : empty;
+        std::copy(range.GetMin().data(), range.GetMin().data() + 3, worldBounds + i * 6);
+        std::copy(range.GetMax().data(), range.GetMax().data() + 3, worldBounds + i * 6 + 3);
+      }
+      if (localBounds) {
+        GfRange3d range = prim ? cache.ComputeUntransformedBound(prim).ComputeAlignedRange() : empty;
+        std::copy(range.GetMin().data(), range.GetMin().data() + 3, localBounds + i * 6);
+        std::copy(range.GetMax().data(), range.GetMax().data() + 3, localBounds + i * 6 + 3);
+      }
+    }
+  }
+
+  // Evaluates the given skeletons at the given time with the skeleton and animation queries of
+  // the given UsdSkelCache, which persist across calls, so evaluating the same skeletons at every
+  // frame only computes their transforms and blend shape weights.
+  // Every skeleton path adds an entry i: flags[i] is its SkeletonPoseFlags, its joints are
+  // joints[jointOffsets[i]] to joints[jointOffsets[i + 1]] and the blend shapes of its animation
+  // are blendShapes[blendShapeOffsets[i]] to blendShapes[blendShapeOffsets[i + 1]].
+  // The 16 values of the local and skinning matrices of joint j are written in row-major order
+  // from 16 * j in localXforms and skinningXforms, either of which may be null when not required,
+  // and the weight of blend shape b in blendShapeWeights[b], which may also be null. Joints whose
+  // transforms could not be computed get identity matrices.
+  // jointOffsets and blendShapeOffsets hold skeletonPaths.size() + 1 values and flags
+  // skeletonPaths.size() values. joints and blendShapes are always complete, but matrices and
+  // weights which do not fit are not written, so the caller can grow the buffers and compute again.
+  void ComputeSkeletonPoses(UsdSkelCache const& cache, std::vector<SdfPath> const& skeletonPaths,
+                            UsdTimeCode time,
+                            std::vector<std::string>* joints, std::vector<std::string>* blendShapes,
+                            int* jointOffsets, int* blendShapeOffsets, int* flags,
+                            double* localXforms, double* skinningXforms, size_t jointCapacity,
+                            float* blendShapeWeights, size_t blendShapeCapacity) {
+    enum {
+      kHasAnimation = 1 << 0,
+      kMightBeTimeVarying = 1 << 1,
+      kFailed = 1 << 2,
+    };
+
+    joints->clear();
+    blendShapes->clear();
+
+    VtMatrix4dArray xforms;
+    VtFloatArray weights;
+    GfMatrix4d identity(1.0);
+
+    // Writes the matrices computed last for the joints of the current skeleton, identities when
+    // the computation failed.
+    auto writeXforms = [&](double* dest, size_t jointOffset, size_t jointCount, bool computed) {
+      for (size_t j = 0; j < jointCount; j++) {
+        GfMatrix4d const& xf = computed && j < xforms.size() ? xforms[j] : identity;
+        std::copy(xf.GetArray(), xf.GetArray() + 16, dest + (jointOffset + j) * 16);
+      }
+    };
+
+    for (size_t i = 0; i < skeletonPaths.size(); i++) {
+      jointOffsets[i] = static_cast<int>(joints->size());
+      blendShapeOffsets[i] = static_cast<int>(blendShapes->size());
+      flags[i] = kFailed;
+
+      UsdSkelSkeleton skel(self->GetPrimAtPath(skeletonPaths[i]));
+      UsdSkelSkeletonQuery skelQuery = skel ? cache.GetSkelQuery(skel) : UsdSkelSkeletonQuery();
+      if (!skelQuery) {
+        continue;
+      }
+
+      size_t jointOffset = joints->size();
+      size_t blendShapeOffset = blendShapes->size();
+      int skelFlags = 0;
+
+      VtTokenArray jointOrder = skelQuery.GetJointOrder();
+      for (auto&& joint : jointOrder) {
+        joints->push_back(joint.GetString());
+      }
+
+      if (jointOffset + jointOrder.size() <= jointCapacity) {
+        if (localXforms) {
+          bool computed = skelQuery.ComputeJointLocalTransforms(&xforms, time);
+          if (!computed) { skelFlags |= kFailed; }
+          writeXforms(localXforms, jointOffset, jointOrder.size(), computed);
+        }
+        if (skinningXforms) {
+          bool computed = skelQuery.ComputeSkinningTransforms(&xforms, time);
+          if (!computed) { skelFlags |= kFailed; }
+          writeXforms(skinningXforms, jointOffset, jointOrder.size(), computed);
+        }
+      }
+
+      UsdSkelAnimQuery const& animQuery = skelQuery.GetAnimQuery();
+      if (animQuery) {
+        skelFlags |= kHasAnimation;
+        if (animQuery.JointTransformsMightBeTimeVarying()
+            || animQuery.BlendShapeWeightsMightBeTimeVarying()) {
+          skelFlags |= kMightBeTimeVarying;
+        }
+
+        VtTokenArray blendShapeOrder = animQuery.GetBlendShapeOrder();
+        for (auto&& blendShape : blendShapeOrder) {
+          blendShapes->push_back(blendShape.GetString());
+        }
+
+        if (blendShapeWeights && !blendShapeOrder.empty()
+            && blendShapeOffset + blendShapeOrder.size() <= blendShapeCapacity) {
+          bool computed = animQuery.ComputeBlendShapeWeights(&weights, time);
+          if (!computed) { skelFlags |= kFailed; }
+          for (size_t b = 0; b < blendShapeOrder.size(); b++) {
+            blendShapeWeights[blendShapeOffset + b] =
+                computed && b < weights.size() ? weights[b] : 0.0f;
+          }
+        }
+      }
+
+      flags[i] = skelFlags;
+    }
+
+    jointOffsets[skeletonPaths.size()] = static_cast<int>(joints->size());
+    blendShapeOffsets[skeletonPaths.size()] = static_cast<int>(blendShapes->size());
+  }
 }
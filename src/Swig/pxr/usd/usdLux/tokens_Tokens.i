@@ -13,53 +13,124 @@
 // limitations under the License.
 
 %typemap(cscode) UsdLuxTokens %{
-  public static TfToken angle = new TfToken("angle");
-  public static TfToken angular = new TfToken("angular");
-  public static TfToken automatic = new TfToken("automatic");
-  public static TfToken collectionFilterLinkIncludeRoot = new TfToken("collection:filterLink:includeRoot");
-  public static TfToken collectionLightLinkIncludeRoot = new TfToken("collection:lightLink:includeRoot");
-  public static TfToken collectionShadowLinkIncludeRoot = new TfToken("collection:shadowLink:includeRoot");
-  public static TfToken color = new TfToken("color");
-  public static TfToken colorTemperature = new TfToken("colorTemperature");
-  public static TfToken consumeAndContinue = new TfToken("consumeAndContinue");
-  public static TfToken consumeAndHalt = new TfToken("consumeAndHalt");
-  public static TfToken cubeMapVerticalCross = new TfToken("cubeMapVerticalCross");
-  public static TfToken diffuse = new TfToken("diffuse");
-  public static TfToken enableColorTemperature = new TfToken("enableColorTemperature");
-  public static TfToken exposure = new TfToken("exposure");
-  public static TfToken filterLink = new TfToken("filterLink");
-  public static TfToken filters = new TfToken("filters");
-  public static TfToken geometry = new TfToken("geometry");
-  public static TfToken height = new TfToken("height");
-  public static TfToken ignore = new TfToken("ignore");
-  public static TfToken intensity = new TfToken("intensity");
-  public static TfToken latlong = new TfToken("latlong");
-  public static TfToken length = new TfToken("length");
-  public static TfToken lightLink = new TfToken("lightLink");
-  public static TfToken lightList = new TfToken("lightList");
-  public static TfToken lightListCacheBehavior = new TfToken("lightList:cacheBehavior");
-  public static TfToken mirroredBall = new TfToken("mirroredBall");
-  public static TfToken normalize = new TfToken("normalize");
-  public static TfToken orientToStageUpAxis = new TfToken("orientToStageUpAxis");
-  public static TfToken portals = new TfToken("portals");
-  public static TfToken radius = new TfToken("radius");
-  public static TfToken shadowColor = new TfToken("shadow:color");
-  public static TfToken shadowDistance = new TfToken("shadow:distance");
-  public static TfToken shadowEnable = new TfToken("shadow:enable");
-  public static TfToken shadowFalloff = new TfToken("shadow:falloff");
-  public static TfToken shadowFalloffGamma = new TfToken("shadow:falloffGamma");
-  public static TfToken shadowLink = new TfToken("shadowLink");
-  public static TfToken shapingConeAngle = new TfToken("shaping:cone:angle");
-  public static TfToken shapingConeSoftness = new TfToken("shaping:cone:softness");
-  public static TfToken shapingFocus = new TfToken("shaping:focus");
-  public static TfToken shapingFocusTint = new TfToken("shaping:focusTint");
-  public static TfToken shapingIesAngleScale = new TfToken("shaping:ies:angleScale");
-  public static TfToken shapingIesFile = new TfToken("shaping:ies:file");
-  public static TfToken shapingIesNormalize = new TfToken("shaping:ies:normalize");
-  public static TfToken specular = new TfToken("specular");
-  public static TfToken textureFile = new TfToken("texture:file");
-  public static TfToken textureFormat = new TfToken("texture:format");
-  public static TfToken treatAsLine = new TfToken("treatAsLine");
-  public static TfToken treatAsPoint = new TfToken("treatAsPoint");
-  public static TfToken width = new TfToken("width");
+  static int sm_materializedCount;
+
+  /// <summary>
+  /// The number of tokens in this class which have been created so far.
+  /// </summary>
+  public static int MaterializedCount { get { return sm_materializedCount; } }
+
+  /// <summary>
+  /// The total number of tokens in this class.
+  /// </summary>
+  public const int Count = 49;
+
+  static TfToken Materialize(ref TfToken field, string value) {
+    var token = new TfToken(value);
+    if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null) {
+      global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+      return token;
+    }
+    token.Dispose();
+    return field;
+  }
+
+  static TfToken sm_angle;
+  public static TfToken angle { get { return sm_angle ?? Materialize(ref sm_angle, "angle"); } }
+  static TfToken sm_angular;
+  public static TfToken angular { get { return sm_angular ?? Materialize(ref sm_angular, "angular"); } }
+  static TfToken sm_automatic;
+  public static TfToken automatic { get { return sm_automatic ?? Materialize(ref sm_automatic, "automatic"); } }
+  static TfToken sm_collectionFilterLinkIncludeRoot;
+  public static TfToken collectionFilterLinkIncludeRoot { get { return sm_collectionFilterLinkIncludeRoot ?? Materialize(ref sm_collectionFilterLinkIncludeRoot, "collection:filterLink:includeRoot"); } }
+  static TfToken sm_collectionLightLinkIncludeRoot;
+  public static TfToken collectionLightLinkIncludeRoot { get { return sm_collectionLightLinkIncludeRoot ?? Materialize(ref sm_collectionLightLinkIncludeRoot, "collection:lightLink:includeRoot"); } }
+  static TfToken sm_collectionShadowLinkIncludeRoot;
+  public static TfToken collectionShadowLinkIncludeRoot { get { return sm_collectionShadowLinkIncludeRoot ?? Materialize(ref sm_collectionShadowLinkIncludeRoot, "collection:shadowLink:includeRoot"); } }
+  static TfToken sm_color;
+  public static TfToken color { get { return sm_color ?? Materialize(ref sm_color, "color"); } }
+  static TfToken sm_colorTemperature;
+  public static TfToken colorTemperature { get { return sm_colorTemperature ?? Materialize(ref sm_colorTemperature, "colorTemperature"); } }
+  static TfToken sm_consumeAndContinue;
+  public static TfToken consumeAndContinue { get { return sm_consumeAndContinue ?? Materialize(ref sm_consumeAndContinue, "consumeAndContinue"); } }
+  static TfToken sm_consumeAndHalt;
+  public static TfToken consumeAndHalt { get { return sm_consumeAndHalt ?? Materialize(ref sm_consumeAndHalt, "consumeAndHalt"); } }
+  static TfToken sm_cubeMapVerticalCross;
+  public static TfToken cubeMapVerticalCross { get { return sm_cubeMapVerticalCross ?? Materialize(ref sm_cubeMapVerticalCross, "cubeMapVerticalCross"); } }
+  static TfToken sm_diffuse;
+  public static TfToken diffuse { get { return sm_diffuse ?? Materialize(ref sm_diffuse, "diffuse"); } }
+  static TfToken sm_enableColorTemperature;
+  public static TfToken enableColorTemperature { get { return sm_enableColorTemperature ?? Materialize(ref sm_enableColorTemperature, "enableColorTemperature"); } }
+  static TfToken sm_exposure;
+  public static TfToken exposure { get { return sm_exposure ?? Materialize(ref sm_exposure, "exposure"); } }
+  static TfToken sm_filterLink;
+  public static TfToken filterLink { get { return sm_filterLink ?? Materialize(ref sm_filterLink, "filterLink"); } }
+  static TfToken sm_filters;
+  public static TfToken filters { get { return sm_filters ?? Materialize(ref sm_filters, "filters"); } }
+  static TfToken sm_geometry;
+  public static TfToken geometry { get { return sm_geometry ?? Materialize(ref sm_geometry, "geometry"); } }
+  static TfToken sm_height;
+  public static TfToken height { get { return sm_height ?? Materialize(ref sm_height, "height"); } }
+  static TfToken sm_ignore;
+  public static TfToken ignore { get { return sm_ignore ?? Materialize(ref sm_ignore, "ignore"); } }
+  static TfToken sm_intensity;
+  public static TfToken intensity { get { return sm_intensity ?? Materialize(ref sm_intensity, "intensity"); } }
+  static TfToken sm_latlong;
+  public static TfToken latlong { get { return sm_latlong ?? Materialize(ref sm_latlong, "latlong"); } }
+  static TfToken sm_length;
+  public static TfToken length { get { return sm_length ?? Materialize(ref sm_length, "length"); } }
+  static TfToken sm_lightLink;
+  public static TfToken lightLink { get { return sm_lightLink ?? Materialize(ref sm_lightLink, "lightLink"); } }
+  static TfToken sm_lightList;
+  public static TfToken lightList { get { return sm_lightList ?? Materialize(ref sm_lightList, "lightList"); } }
+  static TfToken sm_lightListCacheBehavior;
+  public static TfToken lightListCacheBehavior { get { return sm_lightListCacheBehavior ?? Materialize(ref sm_lightListCacheBehavior, "lightList:cacheBehavior"); } }
+  static TfToken sm_mirroredBall;
+  public static TfToken mirroredBall { get { return sm_mirroredBall ?? Materialize(ref sm_mirroredBall, "mirroredBall"); } }
+  static TfToken sm_normalize;
+  public static TfToken normalize { get { return sm_normalize ?? Materialize(ref sm_normalize, "normalize"); } }
+  static TfToken sm_orientToStageUpAxis;
+  public static TfToken orientToStageUpAxis { get { return sm_orientToStageUpAxis ?? Materialize(ref sm_orientToStageUpAxis, "orientToStageUpAxis"); } }
+  static TfToken sm_portals;
+  public static TfToken portals { get { return sm_portals ?? Materialize(ref sm_portals, "portals"); } }
+  static TfToken sm_radius;
+  public static TfToken radius { get { return sm_radius ?? Materialize(ref sm_radius, "radius"); } }
+  static TfToken sm_shadowColor;
+  public static TfToken shadowColor { get { return sm_shadowColor ?? Materialize(ref sm_shadowColor, "shadow:color"); } }
+  static TfToken sm_shadowDistance;
+  public static TfToken shadowDistance { get { return sm_shadowDistance ?? Materialize(ref sm_shadowDistance, "shadow:distance"); } }
+  static TfToken sm_shadowEnable;
+  public static TfToken shadowEnable { get { return sm_shadowEnable ?? Materialize(ref sm_shadowEnable, "shadow:enable"); } }
+  static TfToken sm_shadowFalloff;
+  public static TfToken shadowFalloff { get { return sm_shadowFalloff ?? Materialize(ref sm_shadowFalloff, "shadow:falloff"); } }
+  static TfToken sm_shadowFalloffGamma;
+  public static TfToken shadowFalloffGamma { get { return sm_shadowFalloffGamma ?? Materialize(ref sm_shadowFalloffGamma, "shadow:falloffGamma"); } }
+  static TfToken sm_shadowLink;
+  public static TfToken shadowLink { get { return sm_shadowLink ?? Materialize(ref sm_shadowLink, "shadowLink"); } }
+  static TfToken sm_shapingConeAngle;
+  public static TfToken shapingConeAngle { get { return sm_shapingConeAngle ?? Materialize(ref sm_shapingConeAngle, "shaping:cone:angle"); } }
+  static TfToken sm_shapingConeSoftness;
+  public static TfToken shapingConeSoftness { get { return sm_shapingConeSoftness ?? Materialize(ref sm_shapingConeSoftness, "shaping:cone:softness"); } }
+  static TfToken sm_shapingFocus;
+  public static TfToken shapingFocus { get { return sm_shapingFocus ?? Materialize(ref sm_shapingFocus, "shaping:focus"); } }
+  static TfToken sm_shapingFocusTint;
+  public static TfToken shapingFocusTint { get { return sm_shapingFocusTint ?? Materialize(ref sm_shapingFocusTint, "shaping:focusTint"); } }
+  static TfToken sm_shapingIesAngleScale;
+  public static TfToken shapingIesAngleScale { get { return sm_shapingIesAngleScale ?? Materialize(ref sm_shapingIesAngleScale, "shaping:ies:angleScale"); } }
+  static TfToken sm_shapingIesFile;
+  public static TfToken shapingIesFile { get { return sm_shapingIesFile ?? Materialize(ref sm_shapingIesFile, "shaping:ies:file"); } }
+  static TfToken sm_shapingIesNormalize;
+  public static TfToken shapingIesNormalize { get { return sm_shapingIesNormalize ?? Materialize(ref sm_shapingIesNormalize, "shaping:ies:normalize"); } }
+  static TfToken sm_specular;
+  public static TfToken specular { get { return sm_specular ?? Materialize(ref sm_specular, "specular"); } }
+  static TfToken sm_textureFile;
+  public static TfToken textureFile { get { return sm_textureFile ?? Materialize(ref sm_textureFile, "texture:file"); } }
+  static TfToken sm_textureFormat;
+  public static TfToken textureFormat { get { return sm_textureFormat ?? Materialize(ref sm_textureFormat, "texture:format"); } }
+  static TfToken sm_treatAsLine;
+  public static TfToken treatAsLine { get { return sm_treatAsLine ?? Materialize(ref sm_treatAsLine, "treatAsLine"); } }
+  static TfToken sm_treatAsPoint;
+  public static TfToken treatAsPoint { get { return sm_treatAsPoint ?? Materialize(ref sm_treatAsPoint, "treatAsPoint"); } }
+  static TfToken sm_width;
+  public static TfToken width { get { return sm_width ?? Materialize(ref sm_width, "width"); } }
 %}
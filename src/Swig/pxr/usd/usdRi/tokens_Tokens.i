@@ -13,145 +13,308 @@
 // limitations under the License.
 
 %typemap(cscode) UsdRiTokens %{
-  public static TfToken analytic = new TfToken("analytic");
-  public static TfToken analyticApex = new TfToken("analytic:apex");
-  public static TfToken analyticBlurAmount = new TfToken("analytic:blur:amount");
-  public static TfToken analyticBlurExponent = new TfToken("analytic:blur:exponent");
-  public static TfToken analyticBlurFarDistance = new TfToken("analytic:blur:farDistance");
-  public static TfToken analyticBlurFarValue = new TfToken("analytic:blur:farValue");
-  public static TfToken analyticBlurMidValue = new TfToken("analytic:blur:midValue");
-  public static TfToken analyticBlurMidpoint = new TfToken("analytic:blur:midpoint");
-  public static TfToken analyticBlurNearDistance = new TfToken("analytic:blur:nearDistance");
-  public static TfToken analyticBlurNearValue = new TfToken("analytic:blur:nearValue");
-  public static TfToken analyticBlurSMult = new TfToken("analytic:blur:sMult");
-  public static TfToken analyticBlurTMult = new TfToken("analytic:blur:tMult");
-  public static TfToken analyticDensityExponent = new TfToken("analytic:density:exponent");
-  public static TfToken analyticDensityFarDistance = new TfToken("analytic:density:farDistance");
-  public static TfToken analyticDensityFarValue = new TfToken("analytic:density:farValue");
-  public static TfToken analyticDensityMidValue = new TfToken("analytic:density:midValue");
-  public static TfToken analyticDensityMidpoint = new TfToken("analytic:density:midpoint");
-  public static TfToken analyticDensityNearDistance = new TfToken("analytic:density:nearDistance");
-  public static TfToken analyticDensityNearValue = new TfToken("analytic:density:nearValue");
-  public static TfToken analyticDirectional = new TfToken("analytic:directional");
-  public static TfToken analyticShearX = new TfToken("analytic:shearX");
-  public static TfToken analyticShearY = new TfToken("analytic:shearY");
-  public static TfToken analyticUseLightDirection = new TfToken("analytic:useLightDirection");
-  public static TfToken aovName = new TfToken("aovName");
-  public static TfToken argsPath = new TfToken("argsPath");
-  public static TfToken barnMode = new TfToken("barnMode");
-  public static TfToken beginDistance = new TfToken("beginDistance");
-  public static TfToken bspline = new TfToken("bspline");
-  public static TfToken catmullRom = new TfToken("catmull-rom");
-  public static TfToken catmull_rom = new TfToken("catmull-rom");
-  public static TfToken clamp = new TfToken("clamp");
-  public static TfToken colorContrast = new TfToken("color:contrast");
-  public static TfToken colorMidpoint = new TfToken("color:midpoint");
-  public static TfToken colorRamp = new TfToken("colorRamp");
-  public static TfToken colorRampColors = new TfToken("colorRamp:colors");
-  public static TfToken colorRampInterpolation = new TfToken("colorRamp:interpolation");
-  public static TfToken colorRampKnots = new TfToken("colorRamp:knots");
-  public static TfToken colorSaturation = new TfToken("color:saturation");
-  public static TfToken colorTint = new TfToken("color:tint");
-  public static TfToken colorWhitepoint = new TfToken("color:whitepoint");
-  public static TfToken cone = new TfToken("cone");
-  public static TfToken constant = new TfToken("constant");
-  public static TfToken cookieMode = new TfToken("cookieMode");
-  public static TfToken day = new TfToken("day");
-  public static TfToken depth = new TfToken("depth");
-  public static TfToken distanceToLight = new TfToken("distanceToLight");
-  public static TfToken edgeScaleBack = new TfToken("edgeScale:back");
-  public static TfToken edgeScaleBottom = new TfToken("edgeScale:bottom");
-  public static TfToken edgeScaleFront = new TfToken("edgeScale:front");
-  public static TfToken edgeScaleLeft = new TfToken("edgeScale:left");
-  public static TfToken edgeScaleRight = new TfToken("edgeScale:right");
-  public static TfToken edgeScaleTop = new TfToken("edgeScale:top");
-  public static TfToken edgeThickness = new TfToken("edgeThickness");
-  public static TfToken endDistance = new TfToken("endDistance");
-  public static TfToken falloff = new TfToken("falloff");
-  public static TfToken falloffFloats = new TfToken("falloff:floats");
-  public static TfToken falloffInterpolation = new TfToken("falloff:interpolation");
-  public static TfToken falloffKnots = new TfToken("falloff:knots");
-  public static TfToken filePath = new TfToken("filePath");
-  public static TfToken haziness = new TfToken("haziness");
-  public static TfToken height = new TfToken("height");
-  public static TfToken hour = new TfToken("hour");
-  public static TfToken inPrimaryHit = new TfToken("inPrimaryHit");
-  public static TfToken inReflection = new TfToken("inReflection");
-  public static TfToken inRefraction = new TfToken("inRefraction");
-  public static TfToken infoArgsPath = new TfToken("info:argsPath");
-  public static TfToken infoFilePath = new TfToken("info:filePath");
-  public static TfToken infoOslPath = new TfToken("info:oslPath");
-  public static TfToken infoSloPath = new TfToken("info:sloPath");
-  public static TfToken interpolation = new TfToken("interpolation");
-  public static TfToken invert = new TfToken("invert");
-  public static TfToken latitude = new TfToken("latitude");
-  public static TfToken linear = new TfToken("linear");
-  public static TfToken longitude = new TfToken("longitude");
-  public static TfToken max = new TfToken("max");
-  public static TfToken min = new TfToken("min");
-  public static TfToken month = new TfToken("month");
-  public static TfToken multiply = new TfToken("multiply");
-  public static TfToken noEffect = new TfToken("noEffect");
-  public static TfToken noLight = new TfToken("noLight");
-  public static TfToken off = new TfToken("off");
-  public static TfToken onVolumeBoundaries = new TfToken("onVolumeBoundaries");
-  public static TfToken outputsRiDisplacement = new TfToken("outputs:ri:displacement");
-  public static TfToken outputsRiSurface = new TfToken("outputs:ri:surface");
-  public static TfToken outputsRiVolume = new TfToken("outputs:ri:volume");
-  public static TfToken physical = new TfToken("physical");
-  public static TfToken positions = new TfToken("positions");
-  public static TfToken preBarnEffect = new TfToken("preBarnEffect");
-  public static TfToken radial = new TfToken("radial");
-  public static TfToken radius = new TfToken("radius");
-  public static TfToken rampMode = new TfToken("rampMode");
-  public static TfToken refineBack = new TfToken("refine:back");
-  public static TfToken refineBottom = new TfToken("refine:bottom");
-  public static TfToken refineFront = new TfToken("refine:front");
-  public static TfToken refineLeft = new TfToken("refine:left");
-  public static TfToken refineRight = new TfToken("refine:right");
-  public static TfToken refineTop = new TfToken("refine:top");
-  public static TfToken repeat = new TfToken("repeat");
-  public static TfToken riCombineMode = new TfToken("ri:combineMode");
-  public static TfToken riDensity = new TfToken("ri:density");
-  public static TfToken riDiffuse = new TfToken("ri:diffuse");
-  public static TfToken riExposure = new TfToken("ri:exposure");
-  public static TfToken riIntensity = new TfToken("ri:intensity");
-  public static TfToken riIntensityNearDist = new TfToken("ri:intensityNearDist");
-  public static TfToken riInvert = new TfToken("ri:invert");
-  public static TfToken riLightGroup = new TfToken("ri:lightGroup");
-  public static TfToken riPortalIntensity = new TfToken("ri:portal:intensity");
-  public static TfToken riPortalTint = new TfToken("ri:portal:tint");
-  public static TfToken riSamplingFixedSampleCount = new TfToken("ri:sampling:fixedSampleCount");
-  public static TfToken riSamplingImportanceMultiplier = new TfToken("ri:sampling:importanceMultiplier");
-  public static TfToken riShadowThinShadow = new TfToken("ri:shadow:thinShadow");
-  public static TfToken riSpecular = new TfToken("ri:specular");
-  public static TfToken riTextureGamma = new TfToken("ri:texture:gamma");
-  public static TfToken riTextureSaturation = new TfToken("ri:texture:saturation");
-  public static TfToken riTraceLightPaths = new TfToken("ri:trace:lightPaths");
-  public static TfToken scaleDepth = new TfToken("scale:depth");
-  public static TfToken scaleHeight = new TfToken("scale:height");
-  public static TfToken scaleWidth = new TfToken("scale:width");
-  public static TfToken screen = new TfToken("screen");
-  public static TfToken skyTint = new TfToken("skyTint");
-  public static TfToken spherical = new TfToken("spherical");
-  public static TfToken spline = new TfToken("spline");
-  public static TfToken sunDirection = new TfToken("sunDirection");
-  public static TfToken sunSize = new TfToken("sunSize");
-  public static TfToken sunTint = new TfToken("sunTint");
-  public static TfToken textureFillColor = new TfToken("texture:fillColor");
-  public static TfToken textureInvertU = new TfToken("texture:invertU");
-  public static TfToken textureInvertV = new TfToken("texture:invertV");
-  public static TfToken textureMap = new TfToken("texture:map");
-  public static TfToken textureOffsetU = new TfToken("texture:offsetU");
-  public static TfToken textureOffsetV = new TfToken("texture:offsetV");
-  public static TfToken texturePremultipliedAlpha = new TfToken("texture:premultipliedAlpha");
-  public static TfToken textureScaleU = new TfToken("texture:scaleU");
-  public static TfToken textureScaleV = new TfToken("texture:scaleV");
-  public static TfToken textureWrapMode = new TfToken("texture:wrapMode");
-  public static TfToken useColor = new TfToken("useColor");
-  public static TfToken useThroughput = new TfToken("useThroughput");
-  public static TfToken values = new TfToken("values");
-  public static TfToken width = new TfToken("width");
-  public static TfToken year = new TfToken("year");
-  public static TfToken zone = new TfToken("zone");
+  static int sm_materializedCount;
+
+  /// <summary>
+  /// The number of tokens in this class which have been created so far.
+  /// </summary>
+  public static int MaterializedCount { get { return sm_materializedCount; } }
+
+  /// <summary>
+  /// The total number of tokens in this class.
+  /// </summary>
+  public const int Count = 141;
+
+  static TfToken Materialize(ref TfToken field, string value) {
+    var token = new TfToken(value);
+    if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null) {
+      global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+      return token;
+    }
+    token.Dispose();
+    return field;
+  }
+
+  static TfToken sm_analytic;
+  public static TfToken analytic { get { return sm_analytic ?? Materialize(ref sm_analytic, "analytic"); } }
+  static TfToken sm_analyticApex;
+  public static TfToken analyticApex { get { return sm_analyticApex ?? Materialize(ref sm_analyticApex, "analytic:apex"); } }
+  static TfToken sm_analyticBlurAmount;
+  public static TfToken analyticBlurAmount { get { return sm_analyticBlurAmount ?? Materialize(ref sm_analyticBlurAmount, "analytic:blur:amount"); } }
+  static TfToken sm_analyticBlurExponent;
+  public static TfToken analyticBlurExponent { get { return sm_analyticBlurExponent ?? Materialize(ref sm_analyticBlurExponent, "analytic:blur:exponent"); } }
+  static TfToken sm_analyticBlurFarDistance;
+  public static TfToken analyticBlurFarDistance { get { return sm_analyticBlurFarDistance ?? Materialize(ref sm_analyticBlurFarDistance, "analytic:blur:farDistance"); } }
+  static TfToken sm_analyticBlurFarValue;
+  public static TfToken analyticBlurFarValue { get { return sm_analyticBlurFarValue ?? Materialize(ref sm_analyticBlurFarValue, "analytic:blur:farValue"); } }
+  static TfToken sm_analyticBlurMidValue;
+  public static TfToken analyticBlurMidValue { get { return sm_analyticBlurMidValue ?? Materialize(ref sm_analyticBlurMidValue, "analytic:blur:midValue"); } }
+  static TfToken sm_analyticBlurMidpoint;
+  public static TfToken analyticBlurMidpoint { get { return sm_analyticBlurMidpoint ?? Materialize(ref sm_analyticBlurMidpoint, "analytic:blur:midpoint"); } }
+  static TfToken sm_analyticBlurNearDistance;
+  public static TfToken analyticBlurNearDistance { get { return sm_analyticBlurNearDistance ?? Materialize(ref sm_analyticBlurNearDistance, "analytic:blur:nearDistance"); } }
+  static TfToken sm_analyticBlurNearValue;
+  public static TfToken analyticBlurNearValue { get { return sm_analyticBlurNearValue ?? Materialize(ref sm_analyticBlurNearValue, "analytic:blur:nearValue"); } }
+  static TfToken sm_analyticBlurSMult;
+  public static TfToken analyticBlurSMult { get { return sm_analyticBlurSMult ?? Materialize(ref sm_analyticBlurSMult, "analytic:blur:sMult"); } }
+  static TfToken sm_analyticBlurTMult;
+  public static TfToken analyticBlurTMult { get { return sm_analyticBlurTMult ?? Materialize(ref sm_analyticBlurTMult, "analytic:blur:tMult"); } }
+  static TfToken sm_analyticDensityExponent;
+  public static TfToken analyticDensityExponent { get { return sm_analyticDensityExponent ?? Materialize(ref sm_analyticDensityExponent, "analytic:density:exponent"); } }
+  static TfToken sm_analyticDensityFarDistance;
+  public static TfToken analyticDensityFarDistance { get { return sm_analyticDensityFarDistance ?? Materialize(ref sm_analyticDensityFarDistance, "analytic:density:farDistance"); } }
+  static TfToken sm_analyticDensityFarValue;
+  public static TfToken analyticDensityFarValue { get { return sm_analyticDensityFarValue ?? Materialize(ref sm_analyticDensityFarValue, "analytic:density:farValue"); } }
+  static TfToken sm_analyticDensityMidValue;
+  public static TfToken analyticDensityMidValue { get { return sm_analyticDensityMidValue ?? Materialize(ref sm_analyticDensityMidValue, "analytic:density:midValue"); } }
+  static TfToken sm_analyticDensityMidpoint;
+  public static TfToken analyticDensityMidpoint { get { return sm_analyticDensityMidpoint ?? Materialize(ref sm_analyticDensityMidpoint, "analytic:density:midpoint"); } }
+  static TfToken sm_analyticDensityNearDistance;
+  public static TfToken analyticDensityNearDistance { get { return sm_analyticDensityNearDistance ?? Materialize(ref sm_analyticDensityNearDistance, "analytic:density:nearDistance"); } }
+  static TfToken sm_analyticDensityNearValue;
+  public static TfToken analyticDensityNearValue { get { return sm_analyticDensityNearValue ?? Materialize(ref sm_analyticDensityNearValue, "analytic:density:nearValue"); } }
+  static TfToken sm_analyticDirectional;
+  public static TfToken analyticDirectional { get { return sm_analyticDirectional ?? Materialize(ref sm_analyticDirectional, "analytic:directional"); } }
+  static TfToken sm_analyticShearX;
+  public static TfToken analyticShearX { get { return sm_analyticShearX ?? Materialize(ref sm_analyticShearX, "analytic:shearX"); } }
+  static TfToken sm_analyticShearY;
+  public static TfToken analyticShearY { get { return sm_analyticShearY ?? Materialize(ref sm_analyticShearY, "analytic:shearY"); } }
+  static TfToken sm_analyticUseLightDirection;
+  public static TfToken analyticUseLightDirection { get { return sm_analyticUseLightDirection ?? Materialize(ref sm_analyticUseLightDirection, "analytic:useLightDirection"); } }
+  static TfToken sm_aovName;
+  public static TfToken aovName { get { return sm_aovName ?? Materialize(ref sm_aovName, "aovName"); } }
+  static TfToken sm_argsPath;
+  public static TfToken argsPath { get { return sm_argsPath ?? Materialize(ref sm_argsPath, "argsPath"); } }
+  static TfToken sm_barnMode;
+  public static TfToken barnMode { get { return sm_barnMode ?? Materialize(ref sm_barnMode, "barnMode"); } }
+  static TfToken sm_beginDistance;
+  public static TfToken beginDistance { get { return sm_beginDistance ?? Materialize(ref sm_beginDistance, "beginDistance"); } }
+  static TfToken sm_bspline;
+  public static TfToken bspline { get { return sm_bspline ?? Materialize(ref sm_bspline, "bspline"); } }
+  static TfToken sm_catmullRom;
+  public static TfToken catmullRom { get { return sm_catmullRom ?? Materialize(ref sm_catmullRom, "catmull-rom"); } }
+  static TfToken sm_catmull_rom;
+  public static TfToken catmull_rom { get { return sm_catmull_rom ?? Materialize(ref sm_catmull_rom, "catmull-rom"); } }
+  static TfToken sm_clamp;
+  public static TfToken clamp { get { return sm_clamp ?? Materialize(ref sm_clamp, "clamp"); } }
+  static TfToken sm_colorContrast;
+  public static TfToken colorContrast { get { return sm_colorContrast ?? Materialize(ref sm_colorContrast, "color:contrast"); } }
+  static TfToken sm_colorMidpoint;
+  public static TfToken colorMidpoint { get { return sm_colorMidpoint ?? Materialize(ref sm_colorMidpoint, "color:midpoint"); } }
+  static TfToken sm_colorRamp;
+  public static TfToken colorRamp { get { return sm_colorRamp ?? Materialize(ref sm_colorRamp, "colorRamp"); } }
+  static TfToken sm_colorRampColors;
+  public static TfToken colorRampColors { get { return sm_colorRampColors ?? Materialize(ref sm_colorRampColors, "colorRamp:colors"); } }
+  static TfToken sm_colorRampInterpolation;
+  public static TfToken colorRampInterpolation { get { return sm_colorRampInterpolation ?? Materialize(ref sm_colorRampInterpolation, "colorRamp:interpolation"); } }
+  static TfToken sm_colorRampKnots;
+  public static TfToken colorRampKnots { get { return sm_colorRampKnots ?? Materialize(ref sm_colorRampKnots, "colorRamp:knots"); } }
+  static TfToken sm_colorSaturation;
+  public static TfToken colorSaturation { get { return sm_colorSaturation ?? Materialize(ref sm_colorSaturation, "color:saturation"); } }
+  static TfToken sm_colorTint;
+  public static TfToken colorTint { get { return sm_colorTint ?? Materialize(ref sm_colorTint, "color:tint"); } }
+  static TfToken sm_colorWhitepoint;
+  public static TfToken colorWhitepoint { get { return sm_colorWhitepoint ?? Materialize(ref sm_colorWhitepoint, "color:whitepoint"); } }
+  static TfToken sm_cone;
+  public static TfToken cone { get { return sm_cone ?? Materialize(ref sm_cone, "cone"); } }
+  static TfToken sm_constant;
+  public static TfToken constant { get { return sm_constant ?? Materialize(ref sm_constant, "constant"); } }
+  static TfToken sm_cookieMode;
+  public static TfToken cookieMode { get { return sm_cookieMode ?? Materialize(ref sm_cookieMode, "cookieMode"); } }
+  static TfToken sm_day;
+  public static TfToken day { get { return sm_day ?? Materialize(ref sm_day, "day"); } }
+  static TfToken sm_depth;
+  public static TfToken depth { get { return sm_depth ?? Materialize(ref sm_depth, "depth"); } }
+  static TfToken sm_distanceToLight;
+  public static TfToken distanceToLight { get { return sm_distanceToLight ?? Materialize(ref sm_distanceToLight, "distanceToLight"); } }
+  static TfToken sm_edgeScaleBack;
+  public static TfToken edgeScaleBack { get { return sm_edgeScaleBack ?? Materialize(ref sm_edgeScaleBack, "edgeScale:back"); } }
+  static TfToken sm_edgeScaleBottom;
+  public static TfToken edgeScaleBottom { get { return sm_edgeScaleBottom ?? Materialize(ref sm_edgeScaleBottom, "edgeScale:bottom"); } }
+  static TfToken sm_edgeScaleFront;
+  public static TfToken edgeScaleFront { get { return sm_edgeScaleFront ?? Materialize(ref sm_edgeScaleFront, "edgeScale:front"); } }
+  static TfToken sm_edgeScaleLeft;
+  public static TfToken edgeScaleLeft { get { return sm_edgeScaleLeft ?? Materialize(ref sm_edgeScaleLeft, "edgeScale:left"); } }
+  static TfToken sm_edgeScaleRight;
+  public static TfToken edgeScaleRight { get { return sm_edgeScaleRight ?? Materialize(ref sm_edgeScaleRight, "edgeScale:right"); } }
+  static TfToken sm_edgeScaleTop;
+  public static TfToken edgeScaleTop { get { return sm_edgeScaleTop ?? Materialize(ref sm_edgeScaleTop, "edgeScale:top"); } }
+  static TfToken sm_edgeThickness;
+  public static TfToken edgeThickness { get { return sm_edgeThickness ?? Materialize(ref sm_edgeThickness, "edgeThickness"); } }
+  static TfToken sm_endDistance;
+  public static TfToken endDistance { get { return sm_endDistance ?? Materialize(ref sm_endDistance, "endDistance"); } }
+  static TfToken sm_falloff;
+  public static TfToken falloff { get { return sm_falloff ?? Materialize(ref sm_falloff, "falloff"); } }
+  static TfToken sm_falloffFloats;
+  public static TfToken falloffFloats { get { return sm_falloffFloats ?? Materialize(ref sm_falloffFloats, "falloff:floats"); } }
+  static TfToken sm_falloffInterpolation;
+  public static TfToken falloffInterpolation { get { return sm_falloffInterpolation ?? Materialize(ref sm_falloffInterpolation, "falloff:interpolation"); } }
+  static TfToken sm_falloffKnots;
+  public static TfToken falloffKnots { get { return sm_falloffKnots ?? Materialize(ref sm_falloffKnots, "falloff:knots"); } }
+  static TfToken sm_filePath;
+  public static TfToken filePath { get { return sm_filePath ?? Materialize(ref sm_filePath, "filePath"); } }
+  static TfToken sm_haziness;
+  public static TfToken haziness { get { return sm_haziness ?? Materialize(ref sm_haziness, "haziness"); } }
+  static TfToken sm_height;
+  public static TfToken height { get { return sm_height ?? Materialize(ref sm_height, "height"); } }
+  static TfToken sm_hour;
+  public static TfToken hour { get { return sm_hour ?? Materialize(ref sm_hour, "hour"); } }
+  static TfToken sm_inPrimaryHit;
+  public static TfToken inPrimaryHit { get { return sm_inPrimaryHit ?? Materialize(ref sm_inPrimaryHit, "inPrimaryHit"); } }
+  static TfToken sm_inReflection;
+  public static TfToken inReflection { get { return sm_inReflection ?? Materialize(ref sm_inReflection, "inReflection"); } }
+  static TfToken sm_inRefraction;
+  public static TfToken inRefraction { get { return sm_inRefraction ?? Materialize(ref sm_inRefraction, "inRefraction"); } }
+  static TfToken sm_infoArgsPath;
+  public static TfToken infoArgsPath { get { return sm_infoArgsPath ?? Materialize(ref sm_infoArgsPath, "info:argsPath"); } }
+  static TfToken sm_infoFilePath;
+  public static TfToken infoFilePath { get { return sm_infoFilePath ?? Materialize(ref sm_infoFilePath, "info:filePath"); } }
+  static TfToken sm_infoOslPath;
+  public static TfToken infoOslPath { get { return sm_infoOslPath ?? Materialize(ref sm_infoOslPath, "info:oslPath"); } }
+  static TfToken sm_infoSloPath;
+  public static TfToken infoSloPath { get { return sm_infoSloPath ?? Materialize(ref sm_infoSloPath, "info:sloPath"); } }
+  static TfToken sm_interpolation;
+  public static TfToken interpolation { get { return sm_interpolation ?? Materialize(ref sm_interpolation, "interpolation"); } }
+  static TfToken sm_invert;
+  public static TfToken invert { get { return sm_invert ?? Materialize(ref sm_invert, "invert"); } }
+  static TfToken sm_latitude;
+  public static TfToken latitude { get { return sm_latitude ?? Materialize(ref sm_latitude, "latitude"); } }
+  static TfToken sm_linear;
+  public static TfToken linear { get { return sm_linear ?? Materialize(ref sm_linear, "linear"); } }
+  static TfToken sm_longitude;
+  public static TfToken longitude { get { return sm_longitude ?? Materialize(ref sm_longitude, "longitude"); } }
+  static TfToken sm_max;
+  public static TfToken max { get { return sm_max ?? Materialize(ref sm_max, "max"); } }
+  static TfToken sm_min;
+  public static TfToken min { get { return sm_min ?? Materialize(ref sm_min, "min"); } }
+  static TfToken sm_month;
+  public static TfToken month { get { return sm_month ?? Materialize(ref sm_month, "month"); } }
+  static TfToken sm_multiply;
+  public static TfToken multiply { get { return sm_multiply ?? Materialize(ref sm_multiply, "multiply"); } }
+  static TfToken sm_noEffect;
+  public static TfToken noEffect { get { return sm_noEffect ?? Materialize(ref sm_noEffect, "noEffect"); } }
+  static TfToken sm_noLight;
+  public static TfToken noLight { get { return sm_noLight ?? Materialize(ref sm_noLight, "noLight"); } }
+  static TfToken sm_off;
+  public static TfToken off { get { return sm_off ?? Materialize(ref sm_off, "off"); } }
+  static TfToken sm_onVolumeBoundaries;
+  public static TfToken onVolumeBoundaries { get { return sm_onVolumeBoundaries ?? Materialize(ref sm_onVolumeBoundaries, "onVolumeBoundaries"); } }
+  static TfToken sm_outputsRiDisplacement;
+  public static TfToken outputsRiDisplacement { get { return sm_outputsRiDisplacement ?? Materialize(ref sm_outputsRiDisplacement, "outputs:ri:displacement"); } }
+  static TfToken sm_outputsRiSurface;
+  public static TfToken outputsRiSurface { get { return sm_outputsRiSurface ?? Materialize(ref sm_outputsRiSurface, "outputs:ri:surface"); } }
+  static TfToken sm_outputsRiVolume;
+  public static TfToken outputsRiVolume { get { return sm_outputsRiVolume ?? Materialize(ref sm_outputsRiVolume, "outputs:ri:volume"); } }
+  static TfToken sm_physical;
+  public static TfToken physical { get { return sm_physical ?? Materialize(ref sm_physical, "physical"); } }
+  static TfToken sm_positions;
+  public static TfToken positions { get { return sm_positions ?? Materialize(ref sm_positions, "positions"); } }
+  static TfToken sm_preBarnEffect;
+  public static TfToken preBarnEffect { get { return sm_preBarnEffect ?? Materialize(ref sm_preBarnEffect, "preBarnEffect"); } }
+  static TfToken sm_radial;
+  public static TfToken radial { get { return sm_radial ?? Materialize(ref sm_radial, "radial"); } }
+  static TfToken sm_radius;
+  public static TfToken radius { get { return sm_radius ?? Materialize(ref sm_radius, "radius"); } }
+  static TfToken sm_rampMode;
+  public static TfToken rampMode { get { return sm_rampMode ?? Materialize(ref sm_rampMode, "rampMode"); } }
+  static TfToken sm_refineBack;
+  public static TfToken refineBack { get { return sm_refineBack ?? Materialize(ref sm_refineBack, "refine:back"); } }
+  static TfToken sm_refineBottom;
+  public static TfToken refineBottom { get { return sm_refineBottom ?? Materialize(ref sm_refineBottom, "refine:bottom"); } }
+  static TfToken sm_refineFront;
+  public static TfToken refineFront { get { return sm_refineFront ?? Materialize(ref sm_refineFront, "refine:front"); } }
+  static TfToken sm_refineLeft;
+  public static TfToken refineLeft { get { return sm_refineLeft ?? Materialize(ref sm_refineLeft, "refine:left"); } }
+  static TfToken sm_refineRight;
+  public static TfToken refineRight { get { return sm_refineRight ?? Materialize(ref sm_refineRight, "refine:right"); } }
+  static TfToken sm_refineTop;
+  public static TfToken refineTop { get { return sm_refineTop ?? Materialize(ref sm_refineTop, "refine:top"); } }
+  static TfToken sm_repeat;
+  public static TfToken repeat { get { return sm_repeat ?? Materialize(ref sm_repeat, "repeat"); } }
+  static TfToken sm_riCombineMode;
+  public static TfToken riCombineMode { get { return sm_riCombineMode ?? Materialize(ref sm_riCombineMode, "ri:combineMode"); } }
+  static TfToken sm_riDensity;
+  public static TfToken riDensity { get { return sm_riDensity ?? Materialize(ref sm_riDensity, "ri:density"); } }
+  static TfToken sm_riDiffuse;
+  public static TfToken riDiffuse { get { return sm_riDiffuse ?? Materialize(ref sm_riDiffuse, "ri:diffuse"); } }
+  static TfToken sm_riExposure;
+  public static TfToken riExposure { get { return sm_riExposure ?? Materialize(ref sm_riExposure, "ri:exposure"); } }
+  static TfToken sm_riIntensity;
+  public static TfToken riIntensity { get { return sm_riIntensity ?? Materialize(ref sm_riIntensity, "ri:intensity"); } }
+  static TfToken sm_riIntensityNearDist;
+  public static TfToken riIntensityNearDist { get { return sm_riIntensityNearDist ?? Materialize(ref sm_riIntensityNearDist, "ri:intensityNearDist"); } }
+  static TfToken sm_riInvert;
+  public static TfToken riInvert { get { return sm_riInvert ?? Materialize(ref sm_riInvert, "ri:invert"); } }
+  static TfToken sm_riLightGroup;
+  public static TfToken riLightGroup { get { return sm_riLightGroup ?? Materialize(ref sm_riLightGroup, "ri:lightGroup"); } }
+  static TfToken sm_riPortalIntensity;
+  public static TfToken riPortalIntensity { get { return sm_riPortalIntensity ?? Materialize(ref sm_riPortalIntensity, "ri:portal:intensity"); } }
+  static TfToken sm_riPortalTint;
+  public static TfToken riPortalTint { get { return sm_riPortalTint ?? Materialize(ref sm_riPortalTint, "ri:portal:tint"); } }
+  static TfToken sm_riSamplingFixedSampleCount;
+  public static TfToken riSamplingFixedSampleCount { get { return sm_riSamplingFixedSampleCount ?? Materialize(ref sm_riSamplingFixedSampleCount, "ri:sampling:fixedSampleCount"); } }
+  static TfToken sm_riSamplingImportanceMultiplier;
+  public static TfToken riSamplingImportanceMultiplier { get { return sm_riSamplingImportanceMultiplier ?? Materialize(ref sm_riSamplingImportanceMultiplier, "ri:sampling:importanceMultiplier"); } }
+  static TfToken sm_riShadowThinShadow;
+  public static TfToken riShadowThinShadow { get { return sm_riShadowThinShadow ?? Materialize(ref sm_riShadowThinShadow, "ri:shadow:thinShadow"); } }
+  static TfToken sm_riSpecular;
+  public static TfToken riSpecular { get { return sm_riSpecular ?? Materialize(ref sm_riSpecular, "ri:specular"); } }
+  static TfToken sm_riTextureGamma;
+  public static TfToken riTextureGamma { get { return sm_riTextureGamma ?? Materialize(ref sm_riTextureGamma, "ri:texture:gamma"); } }
+  static TfToken sm_riTextureSaturation;
+  public static TfToken riTextureSaturation { get { return sm_riTextureSaturation ?? Materialize(ref sm_riTextureSaturation, "ri:texture:saturation"); } }
+  static TfToken sm_riTraceLightPaths;
+  public static TfToken riTraceLightPaths { get { return sm_riTraceLightPaths ?? Materialize(ref sm_riTraceLightPaths, "ri:trace:lightPaths"); } }
+  static TfToken sm_scaleDepth;
+  public static TfToken scaleDepth { get { return sm_scaleDepth ?? Materialize(ref sm_scaleDepth, "scale:depth"); } }
+  static TfToken sm_scaleHeight;
+  public static TfToken scaleHeight { get { return sm_scaleHeight ?? Materialize(ref sm_scaleHeight, "scale:height"); } }
+  static TfToken sm_scaleWidth;
+  public static TfToken scaleWidth { get { return sm_scaleWidth ?? Materialize(ref sm_scaleWidth, "scale:width"); } }
+  static TfToken sm_screen;
+  public static TfToken screen { get { return sm_screen ?? Materialize(ref sm_screen, "screen"); } }
+  static TfToken sm_skyTint;
+  public static TfToken skyTint { get { return sm_skyTint ?? Materialize(ref sm_skyTint, "skyTint"); } }
+  static TfToken sm_spherical;
+  public static TfToken spherical { get { return sm_spherical ?? Materialize(ref sm_spherical, "spherical"); } }
+  static TfToken sm_spline;
+  public static TfToken spline { get { return sm_spline ?? Materialize(ref sm_spline, "spline"); } }
+  static TfToken sm_sunDirection;
+  public static TfToken sunDirection { get { return sm_sunDirection ?? Materialize(ref sm_sunDirection, "sunDirection"); } }
+  static TfToken sm_sunSize;
+  public static TfToken sunSize { get { return sm_sunSize ?? Materialize(ref sm_sunSize, "sunSize"); } }
+  static TfToken sm_sunTint;
+  public static TfToken sunTint { get { return sm_sunTint ?? Materialize(ref sm_sunTint, "sunTint"); } }
+  static TfToken sm_textureFillColor;
+  public static TfToken textureFillColor { get { return sm_textureFillColor ?? Materialize(ref sm_textureFillColor, "texture:fillColor"); } }
+  static TfToken sm_textureInvertU;
+  public static TfToken textureInvertU { get { return sm_textureInvertU ?? Materialize(ref sm_textureInvertU, "texture:invertU"); } }
+  static TfToken sm_textureInvertV;
+  public static TfToken textureInvertV { get { return sm_textureInvertV ?? Materialize(ref sm_textureInvertV, "texture:invertV"); } }
+  static TfToken sm_textureMap;
+  public static TfToken textureMap { get { return sm_textureMap ?? Materialize(ref sm_textureMap, "texture:map"); } }
+  static TfToken sm_textureOffsetU;
+  public static TfToken textureOffsetU { get { return sm_textureOffsetU ?? Materialize(ref sm_textureOffsetU, "texture:offsetU"); } }
+  static TfToken sm_textureOffsetV;
+  public static TfToken textureOffsetV { get { return sm_textureOffsetV ?? Materialize(ref sm_textureOffsetV, "texture:offsetV"); } }
+  static TfToken sm_texturePremultipliedAlpha;
+  public static TfToken texturePremultipliedAlpha { get { return sm_texturePremultipliedAlpha ?? Materialize(ref sm_texturePremultipliedAlpha, "texture:premultipliedAlpha"); } }
+  static TfToken sm_textureScaleU;
+  public static TfToken textureScaleU { get { return sm_textureScaleU ?? Materialize(ref sm_textureScaleU, "texture:scaleU"); } }
+  static TfToken sm_textureScaleV;
+  public static TfToken textureScaleV { get { return sm_textureScaleV ?? Materialize(ref sm_textureScaleV, "texture:scaleV"); } }
+  static TfToken sm_textureWrapMode;
+  public static TfToken textureWrapMode { get { return sm_textureWrapMode ?? Materialize(ref sm_textureWrapMode, "texture:wrapMode"); } }
+  static TfToken sm_useColor;
+  public static TfToken useColor { get { return sm_useColor ?? Materialize(ref sm_useColor, "useColor"); } }
+  static TfToken sm_useThroughput;
+  public static TfToken useThroughput { get { return sm_useThroughput ?? Materialize(ref sm_useThroughput, "useThroughput"); } }
+  static TfToken sm_values;
+  public static TfToken values { get { return sm_values ?? Materialize(ref sm_values, "values"); } }
+  static TfToken sm_width;
+  public static TfToken width { get { return sm_width ?? Materialize(ref sm_width, "width"); } }
+  static TfToken sm_year;
+  public static TfToken year { get { return sm_year ?? Materialize(ref sm_year, "year"); } }
+  static TfToken sm_zone;
+  public static TfToken zone { get { return sm_zone ?? Materialize(ref sm_zone, "zone"); } }
 %}
@@ -12,9 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import sys, os
-import vt, sdf
-import usdGeom, usdShade, usdSkel, usdLux, usdRi, usdVol, kind
+import sys, os, glob
+import concurrent.futures
+import vt, sdf, gf, tokens, manifest, snapshot
 
 basePath = "src/Swig/pxr/base/"
 usdPath = "src/Swig/pxr/usd/"
@@ -35,6 +35,45 @@ copyright = """// Copyright 2017 Google Inc. All rights reserved.
 // limitations under the License.
 """
 
+def getInputs(schema, lazy):
+    """Returns everything the generated files depend on, used to skip generation when nothing
+    has changed since the previous run."""
+    inputs = {
+        "usdVersion": schema["usdVersion"],
+        "valueTypes": schema["valueTypes"],
+        "options": {"lazy": lazy},
+        "scripts": manifest.digestFiles(glob.glob(os.path.join(os.path.dirname(__file__), "*.py"))),
+    }
+    for module, toks in schema["tokens"].items():
+        inputs["tokens." + module] = toks
+    return inputs
+
+def getTasks(schema, lazy):
+    """Returns the (description, generator, arguments) of each independent generator."""
+    return [
+        ("Sdf", sdf.genSdfValueTypeNames, (schema, usdPath, usdInstPath, copyright, lazy)),
+        ("Vt", vt.genVtValue, (schema, basePath, usdInstPath, copyright)),
+        ("Usd batch readers", vt.genUsdAttributeBatchReaders, (schema, usdPath, copyright)),
+        ("Usd typed writers", vt.genUsdAttributeTypedWriters, (schema, usdPath, usdInstPath, copyright)),
+        ("Gf value types", gf.genGfValueTypes, (schema, basePath, usdPath, usdInstPath, copyright)),
+        ("Schema token table", tokens.genTokenTable, (schema, usdPath, usdInstPath, copyright)),
+    ] + [
+        (module, tokens.genSchemaTokens, (schema, module, path, copyright, lazy))
+        for module, path in tokens.getEnabledModules(schema, usdPath)
+    ]
+
+def runTask(generator, args):
+    """Runs one generator in a worker process and hands back the files it wrote."""
+    generator(*args)
+    return manifest.takeResults()
+
+def getOption(name, default=None):
+    if name in sys.argv[2:]:
+        i = sys.argv.index(name)
+        if i + 1 < len(sys.argv):
+            return sys.argv[i + 1]
+    return default
+
 # TODO: add proper argument handling
 if __name__ == "__main__":
     if not os.path.exists(basePath):
@@ -44,38 +83,41 @@ if __name__ == "__main__":
         print("Output path does not exist: " + usdPath)
         sys.exit(1)
     instPath = sys.argv[1]
+    # Pass --eager to initialize all tokens and value type names up front, as before.
+    lazy = "--eager" not in sys.argv[2:]
     usdInstPath = os.path.join(instPath, "generated")
     if not os.path.exists(usdInstPath):
         os.makedirs(usdInstPath)
 
-    print("Generating Sdf ")
-    sdf.genSdfValueTypeNames(usdPath, usdInstPath, copyright)
-
-    print("Generating Vt ")
-    vt.genVtValue(basePath, copyright)
-
-    print("Generating UsdGeom ")
-    usdGeom.genUsdGeomTokens(usdPath, copyright)
-
-    print("Generating UsdLux ")
-    usdLux.genUsdLuxTokens(usdPath, copyright)
-
-    print("Generating UsdRi ")
-    usdRi.genUsdRiTokens(usdPath, copyright)
-
-    print("Generating UsdShade ")
-    usdShade.genUsdShadeTokens(usdPath, copyright)
-
-    print("Generating UsdSkel ")
-    usdSkel.genUsdSkelTokens(usdPath, copyright)
-
-    print("Generating Kind ")
-    kind.genKindTokens(usdPath, copyright)
+    # USD python is only needed to capture the schema snapshot. With --snapshot, a previously
+    # captured snapshot is used instead, so no USD python install is required.
+    snapshotPath = getOption("--snapshot")
+    if snapshotPath:
+        schema = snapshot.load(snapshotPath)
+    else:
+        print("Capturing schema snapshot ")
+        schema = snapshot.capture()
+        snapshot.save(schema, os.path.join(instPath, "schema_snapshot.json"))
 
-    # Disabled until this issue is resolved:
-    # https://github.com/PixarAnimationStudios/USD/issues/658
-    #
-    #print "Generating UsdVol "
-    #usdVol.genUsdVolTokens(usdPath, copyright)
+    # Only files whose content changed are rewritten, so their timestamps don't trigger SWIG and
+    # a full rebuild. Pass --force to regenerate even when the inputs are unchanged.
+    manifest.load(os.path.join(instPath, "gen_manifest.json"))
+    manifest.setInputs(getInputs(schema, lazy))
+    if "--force" not in sys.argv[2:] and manifest.isUpToDate():
+        print("Generated files are up to date")
+        sys.exit(0)
+    changed = manifest.changedInputs()
+    if changed:
+        print("Changed inputs: " + ", ".join(changed))
 
+    jobs = int(getOption("--jobs", 0)) or None
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {}
+        for name, generator, args in getTasks(schema, lazy):
+            futures[pool.submit(runTask, generator, args)] = name
+        for future in concurrent.futures.as_completed(futures):
+            manifest.addResults(future.result())
+            print("Generated " + futures[future])
 
+    manifest.save()
+    print("Wrote {0} files, {1} unchanged".format(len(manifest.written), len(manifest.unchanged)))
@@ -0,0 +1,297 @@
+﻿# Copyright 2023 Unity Technologies. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+# Gf vectors, matrices, quaternions and ranges are wrapped as SWIG proxy classes, so every value
+# read from USD is a native allocation with a finalizer. This generates blittable C# structs with
+# the layout of the native components (pxr.GfVec3fValue for GfVec3f...), along with the typemaps
+# and accessors needed to pass them across the boundary by value.
+#
+# The native side copies through plain component arrays rather than relying on the memory layout
+# of the Gf classes, e.g. quaternions are always copied as [i0, i1, i2, real]. Like the VtValue
+# accessors, reading a value of another type yields zeros.
+#
+
+import os
+import manifest
+import vt
+
+# Ranges are not Sdf value types, but are how bounds are returned: (type, component, dimension).
+rangeTypes = [("GfRange1d", "double", 1), ("GfRange1f", "float", 1),
+              ("GfRange2d", "double", 2), ("GfRange3d", "double", 3)]
+
+vectorFields = ["x", "y", "z", "w"]
+
+class valueType:
+    name = ""
+    kind = ""
+    component = ""
+    count = 0
+    # (csType, name) of each field of the C# struct.
+    fields = []
+    # True when the type is an Sdf value type, which can be held by a VtValue or an attribute.
+    isSdfType = False
+
+def getValueTypes(snapshot):
+    """Returns the Gf types which can be passed by value, sorted by name."""
+    valueTypes = {}
+    for vtn in snapshot["valueTypes"]:
+        if vtn["isArray"]:
+            continue
+        name = vt.translateTypes(vtn["typeName"])
+        info = vt.getComponentInfo(name)
+        # GfHalf is a proxy class in C#, so half types have no blittable equivalent.
+        if info is None or info[0] == "GfHalf" or name in valueTypes:
+            continue
+        t = valueType()
+        t.name = name
+        t.component, t.count, t.kind = info
+        t.isSdfType = True
+        if t.kind == "Matrix":
+            n = int(round(t.count ** 0.5))
+            t.fields = [(t.component, "m{0}{1}".format(r, c)) for r in range(n) for c in range(n)]
+        else:
+            t.fields = [(t.component, f) for f in vectorFields[:t.count]]
+        valueTypes[name] = t
+
+    for name, component, dim in rangeTypes:
+        t = valueType()
+        t.name = name
+        t.kind = "Range"
+        t.component = component
+        t.count = 2 * dim
+        if dim == 1:
+            t.fields = [(component, "min"), (component, "max")]
+        else:
+            vec = "GfVec{0}{1}Value".format(dim, name[-1])
+            t.fields = [(vec, "min"), (vec, "max")]
+        valueTypes[name] = t
+
+    return [valueTypes[n] for n in sorted(valueTypes.keys())]
+
+storageDecl = """%{{
+// Plain storage with the layout of the C# pxr.{name}Value struct.
+struct {name}Value {{
+  {component} data[{count}];
+}};
+%}}
+%typemap(ctype)  {name}Value "{name}Value"
+%typemap(imtype) {name}Value "pxr.{name}Value"
+%typemap(cstype) {name}Value "pxr.{name}Value"
+%typemap(out)    {name}Value %{{ $result = $1; %}}
+%typemap(csout, excode=SWIGEXCODE) {name}Value {{
+    pxr.{name}Value ret = $imcall;$excode
+    return ret;
+  }}
+%typemap(ctype)  {name}Value const& "{name}Value const*"
+%typemap(imtype) {name}Value const& "ref pxr.{name}Value"
+%typemap(cstype) {name}Value const& "pxr.{name}Value"
+%typemap(in)     {name}Value const& %{{ $1 = ($1_ltype)$input; %}}
+%typemap(csin)   {name}Value const& "ref $csinput"
+%typemap(ctype)  {name}Value* "{name}Value*"
+%typemap(imtype) {name}Value* "out pxr.{name}Value"
+%typemap(cstype) {name}Value* "out pxr.{name}Value"
+%typemap(in)     {name}Value* %{{ $1 = $input; %}}
+%typemap(csin)   {name}Value* "out $csinput"
+"""
+
+convertersPre = """%{
+#include <algorithm>
+%}
+
+%inline %{
+// This code manifests in UsdCs class."""
+converters = """
+extern {name}Value {name}ToValue({name} const& value) {{
+  {name}Value ret;
+{toValue}
+  return ret;
+}}
+extern {name} {name}FromValue({name}Value const& value) {{
+{fromValue}
+}}"""
+convertersPost = "%}"
+
+toValue = {
+    "Vec": """  std::copy(value.data(), value.data() + {count}, ret.data);""",
+    "Matrix": """  std::copy(value.data(), value.data() + {count}, ret.data);""",
+    "Quat": """  {imaginary} const& im = value.GetImaginary();
+  ret.data[0] = im[0];
+  ret.data[1] = im[1];
+  ret.data[2] = im[2];
+  ret.data[3] = value.GetReal();""",
+    "Range1": """  ret.data[0] = value.GetMin();
+  ret.data[1] = value.GetMax();""",
+    "Range": """  std::copy(value.GetMin().data(), value.GetMin().data() + {dim}, ret.data);
+  std::copy(value.GetMax().data(), value.GetMax().data() + {dim}, ret.data + {dim});""",
+}
+fromValue = {
+    "Vec": """  {name} ret;
+  std::copy(value.data, value.data + {count}, ret.data());
+  return ret;""",
+    "Matrix": """  {name} ret;
+  std::copy(value.data, value.data + {count}, ret.data());
+  return ret;""",
+    "Quat": """  return {name}(value.data[3], {imaginary}(value.data[0], value.data[1], value.data[2]));""",
+    "Range1": """  return {name}(value.data[0], value.data[1]);""",
+    "Range": """  return {name}({vec}(value.data), {vec}(value.data + {dim}));""",
+}
+
+vtAccessorsPre = """
+%inline %{
+// This code manifests in UsdCs class."""
+vtAccessors = """
+extern bool VtValueTo{name}Value(VtValue const& value, {name}Value* output) {{
+  if (!value.IsHolding<{name}>()) {{
+    *output = {name}Value();
+    return false;
+  }}
+  *output = {name}ToValue(value.UncheckedGet<{name}>());
+  return true;
+}}
+extern VtValue VtValueFrom{name}Value({name}Value const& value) {{
+  return VtValue({name}FromValue(value));
+}}"""
+vtAccessorsPost = "%}"
+
+attrAccessorsPre = """
+%inline %{
+// This code manifests in UsdCs class."""
+attrAccessors = """
+extern bool UsdAttributeGet{name}Value(UsdAttribute const& attr, {name}Value* output, UsdTimeCode time) {{
+  {name} value;
+  if (!attr.Get(&value, time)) {{
+    *output = {name}Value();
+    return false;
+  }}
+  *output = {name}ToValue(value);
+  return true;
+}}
+extern bool UsdAttributeSet{name}Value(UsdAttribute const& attr, {name}Value const& value, UsdTimeCode time) {{
+  return attr.Set({name}FromValue(value), time);
+}}"""
+attrAccessorsPost = "%}"
+
+structPre = """using System.Runtime.InteropServices;
+
+namespace pxr
+{"""
+struct = """    /// <summary>
+    /// A {name} passed by value, laid out as {layout}.
+    /// Reading one does not allocate, unlike the {name} proxy class, which it can be explicitly
+    /// converted to and from.
+    /// </summary>
+    [StructLayout(LayoutKind.Sequential)]
+    public struct {name}Value
+    {{
+{fields}
+{ctor}
+        public static explicit operator {name}({name}Value value)
+        {{
+            return UsdCs.{name}FromValue(value);
+        }}
+
+        public static explicit operator {name}Value({name} value)
+        {{
+            return UsdCs.{name}ToValue(value);
+        }}{vtValue}
+    }}
+"""
+structCtor = """        public {name}Value({params})
+        {{
+{assignments}
+        }}
+"""
+structVtValue = """
+
+        public static implicit operator VtValue({name}Value value)
+        {{
+            return UsdCs.VtValueFrom{name}Value(value);
+        }}"""
+structPost = "}"
+
+layouts = {
+    "Vec": "{count} consecutive components",
+    "Matrix": "rows of components (row-major)",
+    "Quat": "the imaginary components followed by the real component, like UnityEngine.Quaternion",
+    "Range": "the minimum followed by the maximum",
+}
+
+def formatArgs(t):
+    args = {"name": t.name, "component": t.component, "count": t.count}
+    if t.kind == "Quat":
+        args["imaginary"] = "GfVec3" + t.name[-1]
+    if t.kind == "Range":
+        args["dim"] = t.count // 2
+        args["vec"] = "GfVec{0}{1}".format(t.count // 2, t.name[-1])
+    return args
+
+def getKind(t):
+    if t.kind == "Range" and t.count == 2:
+        return "Range1"
+    return t.kind
+
+def genStruct(t):
+    fields = "\n".join("        public {0} {1};".format(csType, name) for csType, name in t.fields)
+    ctor = ""
+    if t.kind in ["Vec", "Quat", "Range"]:
+        ctor = "\n" + structCtor.format(
+            name=t.name,
+            params=", ".join("{0} {1}".format(csType, name) for csType, name in t.fields),
+            assignments="\n".join("            this.{0} = {0};".format(name) for _, name in t.fields))
+    vtValue = structVtValue.format(name=t.name) if t.isSdfType else ""
+    layout = layouts[t.kind].format(count=t.count)
+    return struct.format(name=t.name, layout=layout, fields=fields, ctor=ctor, vtValue=vtValue)
+
+def genGfValueTypes(snapshot, basePath, usdPath, usdInstPath, copyright):
+    gfValueTypes = basePath + "gf/gfValueTypes.i"
+    vtValueAccessors = basePath + "vt/vtValue_GfValues.i"
+    attrAccessorsPath = usdPath + "usd/usdAttribute_GfValues.i"
+    structsPath = os.path.join(usdInstPath, "GfValueTypes.cs")
+
+    valueTypes = getValueTypes(snapshot)
+
+    with manifest.openOutput(gfValueTypes) as f:
+        print(copyright, file=f)
+        for t in valueTypes:
+            print(storageDecl.format(name=t.name, component=t.component, count=t.count), file=f)
+        print(convertersPre, file=f)
+        for t in valueTypes:
+            args = formatArgs(t)
+            print(converters.format(name=t.name,
+                                    toValue=toValue[getKind(t)].format(**args),
+                                    fromValue=fromValue[getKind(t)].format(**args)), file=f)
+        print(convertersPost, file=f)
+
+    with manifest.openOutput(vtValueAccessors) as f:
+        print(copyright, file=f)
+        print(vtAccessorsPre, file=f)
+        for t in valueTypes:
+            if t.isSdfType:
+                print(vtAccessors.format(name=t.name), file=f)
+        print(vtAccessorsPost, file=f)
+
+    with manifest.openOutput(attrAccessorsPath) as f:
+        print(copyright, file=f)
+        print(attrAccessorsPre, file=f)
+        for t in valueTypes:
+            if t.isSdfType:
+                print(attrAccessors.format(name=t.name), file=f)
+        print(attrAccessorsPost, file=f)
+
+    with manifest.openOutput(structsPath) as f:
+        print(copyright, file=f)
+        print(structPre, file=f)
+        print("\n".join(genStruct(t) for t in valueTypes), end="", file=f)
+        print(structPost, file=f)
@@ -0,0 +1,147 @@
+﻿# Copyright 2023 Unity Technologies. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+# Tracks the inputs and outputs of code generation, so that generated files are only rewritten
+# when their content changes. Rewriting a file bumps its timestamp, which makes CMake run SWIG
+# and recompile all of the generated C# and C++ even if nothing actually changed.
+#
+# The manifest stores a digest of each input (USD version, Sdf value types, schema tokens and
+# the generator scripts) and of each output file written by the previous run.
+#
+
+import hashlib
+import io
+import json
+import os
+
+_path = None
+_inputs = {}
+_outputs = {}
+_previous = {"inputs": {}, "outputs": {}}
+written = []
+unchanged = []
+
+
+def digest(value):
+    """Returns a stable hex digest of a string or of any JSON serializable value."""
+    if not isinstance(value, str):
+        value = json.dumps(value, sort_keys=True)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def digestFiles(paths):
+    h = hashlib.sha256()
+    for path in sorted(paths):
+        with open(path, "rb") as f:
+            h.update(os.path.basename(path).encode("utf-8"))
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def load(path):
+    """Loads the manifest written by the previous run, if any."""
+    global _path, _previous
+    _path = path
+    if os.path.exists(path):
+        try:
+            with open(path) as f:
+                _previous = json.load(f)
+        except ValueError:
+            print("Ignoring invalid manifest: " + path)
+
+
+def setInputs(inputs):
+    """Records the digests of the generator inputs for this run."""
+    global _inputs
+    _inputs = {k: digest(v) for k, v in inputs.items()}
+
+
+def changedInputs():
+    """Returns the names of the inputs which differ from the previous run."""
+    previous = _previous.get("inputs", {})
+    keys = set(previous.keys()) | set(_inputs.keys())
+    return sorted(k for k in keys if previous.get(k) != _inputs.get(k))
+
+
+def isUpToDate():
+    """True when no input changed and every output still has the content it was generated with."""
+    outputs = _previous.get("outputs", {})
+    if not outputs or changedInputs():
+        return False
+    for path, hash in outputs.items():
+        if not os.path.exists(path) or _fileDigest(path) != hash:
+            return False
+    return True
+
+
+def takeResults():
+    """Returns and clears the outputs recorded by this process, to hand them back from a worker."""
+    results = (dict(_outputs), list(written), list(unchanged))
+    _outputs.clear()
+    del written[:]
+    del unchanged[:]
+    return results
+
+
+def addResults(results):
+    """Records the outputs returned by takeResults in another process."""
+    outputs, w, u = results
+    _outputs.update(outputs)
+    written.extend(w)
+    unchanged.extend(u)
+
+
+def save():
+    if _path is None:
+        return
+    with open(_path, "w") as f:
+        json.dump({"inputs": _inputs, "outputs": _outputs}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def _fileDigest(path):
+    with open(path, "r") as f:
+        return digest(f.read())
+
+
+class _GeneratedFile(io.StringIO):
+    def __init__(self, path):
+        io.StringIO.__init__(self)
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            _commit(self.path, self.getvalue())
+        io.StringIO.close(self)
+
+
+def openOutput(path):
+    """Opens a generated file for writing, which is only written to disk if its content changed.
+
+    Use in place of open(path, "w"). The content is buffered and compared to the file on disk
+    when the file is closed.
+    """
+    return _GeneratedFile(path)
+
+
+def _commit(path, content):
+    hash = digest(content)
+    _outputs[path] = hash
+    if os.path.exists(path) and _fileDigest(path) == hash:
+        unchanged.append(path)
+        return
+    with open(path, "w") as f:
+        f.write(content)
+    written.append(path)
@@ -12,9 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import os
-from pxr import Sdf
-
-values = Sdf.ValueTypeNames.__dict__
+import manifest
 
 accessorPre = "%inline %{"
 accessor = """    SdfValueTypeName SdfGetValueType{valueTypeName}() {{ return SdfValueTypeNames->{valueTypeName}; }}"""
@@ -27,22 +25,62 @@ public static class SdfValueTypeNames {"""
 klass = """    static public SdfValueTypeName {valueTypeName} = UsdCs.SdfGetValueType{valueTypeName}();"""
 klassPost = "}"
 
-def genSdfValueTypeNames(usdPath, usdInstPath, copyright):
+lazyKlassPre = """
+using System;
+using System.Threading;
+using pxr;
+
+/// <summary>
+/// The Sdf value type names, each of which is fetched from native code the first time it is used.
+/// </summary>
+public static class SdfValueTypeNames
+{{
+    static int sm_materializedCount;
+
+    /// <summary>
+    /// The number of value type names which have been fetched so far.
+    /// </summary>
+    public static int MaterializedCount {{ get {{ return sm_materializedCount; }} }}
+
+    /// <summary>
+    /// The total number of value type names.
+    /// </summary>
+    public const int Count = {count};
+
+    static SdfValueTypeName Materialize(ref SdfValueTypeName field, SdfValueTypeName value)
+    {{
+        if (Interlocked.CompareExchange(ref field, value, null) == null)
+        {{
+            Interlocked.Increment(ref sm_materializedCount);
+            return value;
+        }}
+        value.Dispose();
+        return field;
+    }}
+"""
+lazyKlass = """    static SdfValueTypeName sm_{valueTypeName};
+    static public SdfValueTypeName {valueTypeName} {{ get {{ return sm_{valueTypeName} ?? Materialize(ref sm_{valueTypeName}, UsdCs.SdfGetValueType{valueTypeName}()); }} }}"""
+
+def genSdfValueTypeNames(snapshot, usdPath, usdInstPath, copyright, lazy=True):
   sdfValueTypes = usdPath + "sdf/sdfValueTypeNames_Types.i"
   sdfClass = os.path.join(usdInstPath, "SdfValueTypeNames.cs")
 
-  values = [k for k in Sdf.ValueTypeNames.__dict__ if isinstance(Sdf.ValueTypeNames.__dict__[k],
-            type(Sdf.ValueTypeNames.__dict__["Token"]))]
-  with open(sdfValueTypes, "w") as f:
+  values = [vtn["name"] for vtn in snapshot["valueTypes"]]
+  with manifest.openOutput(sdfValueTypes) as f:
     print(copyright, file=f)
     print(accessorPre, file=f)
     for vtn in values:
       print(accessor.format(valueTypeName=vtn), file=f)
     print(accessorPost, file=f)
 
-  with open(sdfClass, "w") as f:
+  with manifest.openOutput(sdfClass) as f:
     print(copyright, file=f)
-    print(klassPre, file=f)
-    for vtn in values:
-      print(klass.format(valueTypeName=vtn), file=f)
+    if lazy:
+      print(lazyKlassPre.format(count=len(values)), file=f)
+      for vtn in values:
+        print(lazyKlass.format(valueTypeName=vtn), file=f)
+    else:
+      print(klassPre, file=f)
+      for vtn in values:
+        print(klass.format(valueTypeName=vtn), file=f)
     print(klassPost, file=f)
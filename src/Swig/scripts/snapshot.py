@@ -0,0 +1,74 @@
+﻿# Copyright 2023 Unity Technologies. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#
+# A schema snapshot holds everything the generators need to know about USD: the Sdf value types
+# and the tokens of each schema module. It is captured from the USD python modules in a single
+# pass and saved as JSON, so the generators themselves never import pxr and can run on machines
+# which only have a USD build without python.
+#
+
+import json
+import tokens
+
+
+def capture():
+    """Introspects the USD python modules and returns the snapshot as a dictionary."""
+    import importlib
+    from pxr import Usd, Sdf
+
+    valueTypes = []
+    values = Sdf.ValueTypeNames.__dict__
+    for n in values:
+        if not isinstance(values[n], type(values["Token"])):
+            continue
+        vtn = values[n].fget()
+        pythonClass = None
+        if vtn.type.pythonClass is not None:
+            pythonClass = [vtn.type.pythonClass.__module__, vtn.type.pythonClass.__name__]
+        valueTypes.append({
+            "name": n,
+            "typeName": vtn.type.typeName,
+            "isArray": vtn.isArray,
+            "pythonClass": pythonClass,
+            "scalarTypeName": vtn.scalarType.type.typeName,
+            "scalarIsPod": vtn.scalarType.type.isPlainOldDataType,
+        })
+
+    schemaTokens = {}
+    for name, path in tokens.schemaModules:
+        try:
+            module = importlib.import_module("pxr." + name)
+        except ImportError:
+            # Not part of this version of USD.
+            continue
+        toks = [x for x in dir(module.Tokens) if not x.startswith("_")]
+        schemaTokens[name] = [[t, module.Tokens.__dict__[t].fget()] for t in toks]
+
+    return {
+        "usdVersion": list(Usd.GetVersion()),
+        "valueTypes": valueTypes,
+        "tokens": schemaTokens,
+    }
+
+
+def save(snapshot, path):
+    with open(path, "w") as f:
+        json.dump(snapshot, f, indent=1)
+        f.write("\n")
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,275 @@
+﻿# Copyright 2023 Unity Technologies. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import manifest
+
+#
+# The schema modules with a Tokens class, along with the interface file declaring the tokens,
+# relative to the usd swig directory. A module is skipped when it is missing from the schema
+# snapshot (i.e. it is not part of the USD version being wrapped), when the directory of its
+# interface file does not exist (there are no bindings for it yet) or when it is disabled.
+#
+schemaModules = [
+    ("UsdGeom", "usdGeom/usdGeomTokens_Tokens.i"),
+    ("UsdLux", "usdLux/tokens_Tokens.i"),
+    ("UsdRi", "usdRi/tokens_Tokens.i"),
+    ("UsdShade", "usdShade/usdShadeTokens_Tokens.i"),
+    ("UsdSkel", "usdSkel/usdSkelTokens_Tokens.i"),
+    ("UsdVol", "usdVol/tokens_Tokens.i"),
+    ("UsdPhysics", "usdPhysics/tokens_Tokens.i"),
+    ("UsdMedia", "usdMedia/tokens_Tokens.i"),
+    ("UsdRender", "usdRender/tokens_Tokens.i"),
+    ("Kind", "kind/kindTokens_Tokens.i"),
+]
+
+# Modules which must not be generated, with the reason why.
+disabledModules = {
+    "UsdVol": "https://github.com/PixarAnimationStudios/USD/issues/658",
+}
+
+csKeywords = ["abstract", "as", "base", "bool", "break", "byte", "case", "catch", "char", "checked",
+              "class", "const", "continue", "decimal", "default", "delegate", "do", "double", "else",
+              "enum", "event", "explicit", "extern", "false", "finally", "fixed", "float", "for",
+              "foreach", "goto", "if", "implicit", "in", "int", "interface", "internal", "is", "lock",
+              "long", "namespace", "new", "null", "object", "operator", "out", "override", "params",
+              "private", "protected", "public", "readonly", "ref", "return", "sbyte", "sealed",
+              "short", "sizeof", "stackalloc", "static", "string", "struct", "switch", "this",
+              "throw", "true", "try", "typeof", "uint", "ulong", "unchecked", "unsafe", "ushort",
+              "using", "virtual", "void", "volatile", "while"]
+
+tokenPre = '%typemap(cscode) {className} %{{'
+tokenDecl = '  public static TfToken {name} = new TfToken("{value}");'
+tokenPost = '%}'
+
+lazyTokenPre = """%typemap(cscode) {className} %{{
+  static int sm_materializedCount;
+
+  /// <summary>
+  /// The number of tokens in this class which have been created so far.
+  /// </summary>
+  public static int MaterializedCount {{ get {{ return sm_materializedCount; }} }}
+
+  /// <summary>
+  /// The total number of tokens in this class.
+  /// </summary>
+  public const int Count = {count};
+
+  static TfToken Materialize(ref TfToken field, string value) {{
+    var token = new TfToken(value);
+    if (global::System.Threading.Interlocked.CompareExchange(ref field, token, null) == null) {{
+      global::System.Threading.Interlocked.Increment(ref sm_materializedCount);
+      return token;
+    }}
+    token.Dispose();
+    return field;
+  }}
+"""
+lazyTokenDecl = """  static TfToken sm_{field};
+  public static TfToken {name} {{ get {{ return sm_{field} ?? Materialize(ref sm_{field}, "{value}"); }} }}"""
+
+def getEnabledModules(schema, usdPath):
+    """Returns the (module, interface file path) of each schema module to generate tokens for."""
+    modules = []
+    for module, path in schemaModules:
+        if module in disabledModules or module not in schema["tokens"]:
+            continue
+        path = usdPath + path
+        if not os.path.isdir(os.path.dirname(path)):
+            continue
+        modules.append((module, path))
+    return modules
+
+def csIdentifier(name):
+    return "@" + name if name in csKeywords else name
+
+def genSchemaTokens(schema, module, tokenPath, copyright, lazy=True):
+    genTokens(tokenPath, module + "Tokens", schema["tokens"][module], copyright, lazy)
+
+def genTokens(tokenPath, className, toks, copyright, lazy):
+    """Writes the cscode typemap declaring the static TfTokens of className, given a list of
+    (name, value) pairs.
+
+    When lazy is set, each token is created the first time it is accessed rather than
+    when the class is first touched, and MaterializedCount reports how many were used.
+    """
+    with manifest.openOutput(tokenPath) as f:
+        print(copyright, file=f)
+        if lazy:
+            print(lazyTokenPre.format(className=className, count=len(toks)), file=f)
+            for name, value in toks:
+                print(lazyTokenDecl.format(name=csIdentifier(name), field=name, value=value), file=f)
+        else:
+            print(tokenPre.format(className=className), file=f)
+            for name, value in toks:
+                print(tokenDecl.format(name=csIdentifier(name), value=value), file=f)
+        print(tokenPost, file=f)
+
+#
+# The token table interns the tokens of all generated schema modules. Each distinct token string
+# gets an integer id, which is its slot in a minimal perfect hash table built at generation time,
+# so looking up a string costs one hash, one table read and one string comparison, without locks.
+#
+tablePre = """
+using System.Threading;
+using pxr;
+
+/// <summary>
+/// All tokens declared by the generated schema token classes, interned by id. Looking up a token
+/// string is lock free and allocation free, and each TfToken is created once, on first use.
+/// </summary>
+public static class UsdSchemaTokens
+{{
+    /// <summary>
+    /// The number of interned tokens. Ids range from 0 to Count - 1.
+    /// </summary>
+    public const int Count = {count};
+
+    static readonly TfToken[] sm_tokens = new TfToken[Count];
+
+    /// <summary>
+    /// Returns the id of the given token string, or -1 if it is not a schema token.
+    /// </summary>
+    public static int GetId(string value)
+    {{
+        if (value == null)
+        {{
+            return -1;
+        }}
+        int displacement = sm_displacements[Hash(0, value) % Count];
+        int id = displacement < 0 ? -displacement - 1 : (int)(Hash((uint)displacement, value) % Count);
+        return sm_strings[id] == value ? id : -1;
+    }}
+
+    /// <summary>
+    /// Returns the token string with the given id.
+    /// </summary>
+    public static string GetString(int id)
+    {{
+        return sm_strings[id];
+    }}
+
+    /// <summary>
+    /// Returns the TfToken with the given id, creating it the first time it is requested.
+    /// </summary>
+    public static TfToken GetToken(int id)
+    {{
+        var token = sm_tokens[id];
+        if (token == null)
+        {{
+            token = new TfToken(sm_strings[id]);
+            var existing = Interlocked.CompareExchange(ref sm_tokens[id], token, null);
+            if (existing != null)
+            {{
+                token.Dispose();
+                token = existing;
+            }}
+        }}
+        return token;
+    }}
+
+    /// <summary>
+    /// Finds the interned TfToken for the given string, returns false if it is not a schema token.
+    /// </summary>
+    public static bool TryGetToken(string value, out TfToken token)
+    {{
+        int id = GetId(value);
+        token = id < 0 ? null : GetToken(id);
+        return token != null;
+    }}
+
+    // FNV-1 order (multiply, then xor), starting from the FNV prime rather than the offset basis
+    // and seeded by the displacement. Must match hashToken in tokens.py.
+    static uint Hash(uint seed, string value)
+    {{
+        uint hash = seed == 0 ? 0x01000193u : seed;
+        for (int i = 0; i < value.Length; i++)
+        {{
+            hash = unchecked((hash * 0x01000193u) ^ value[i]);
+        }}
+        return hash;
+    }}
+"""
+tableStrings = """
+    static readonly string[] sm_strings =
+    {"""
+tableDisplacements = """    };
+
+    static readonly int[] sm_displacements =
+    {"""
+tablePost = """    };
+}"""
+
+def hashToken(seed, value):
+    h = seed if seed != 0 else 0x01000193
+    for c in value:
+        h = ((h * 0x01000193) ^ ord(c)) & 0xffffffff
+    return h
+
+def buildPerfectHash(keys):
+    """Builds a minimal perfect hash using hash and displace: keys are grouped into buckets by
+    their unseeded hash, then each bucket, largest first, searches for a seed which sends all of
+    its keys to free slots. Buckets holding a single key are sent straight to a free slot, which
+    is stored as a negative displacement.
+
+    Returns the (slots, displacements) tables, where slots[i] is the key stored in slot i.
+    """
+    size = len(keys)
+    buckets = [[] for _ in range(size)]
+    for key in keys:
+        buckets[hashToken(0, key) % size].append(key)
+    buckets.sort(key=len, reverse=True)
+
+    slots = [None] * size
+    displacements = [0] * size
+    i = 0
+    while i < size and len(buckets[i]) > 1:
+        bucket = buckets[i]
+        seed = 1
+        while True:
+            placed = [hashToken(seed, key) % size for key in bucket]
+            if len(set(placed)) == len(placed) and all(slots[p] is None for p in placed):
+                break
+            seed += 1
+        displacements[hashToken(0, bucket[0]) % size] = seed
+        for key, p in zip(bucket, placed):
+            slots[p] = key
+        i += 1
+
+    free = [p for p in range(size) if slots[p] is None]
+    while i < size and buckets[i]:
+        key = buckets[i][0]
+        p = free.pop()
+        slots[p] = key
+        displacements[hashToken(0, key) % size] = -p - 1
+        i += 1
+    return slots, displacements
+
+def genTokenTable(schema, usdPath, usdInstPath, copyright):
+    tablePath = os.path.join(usdInstPath, "UsdSchemaTokens.cs")
+    values = set()
+    for module, path in getEnabledModules(schema, usdPath):
+        values.update(value for name, value in schema["tokens"][module])
+    slots, displacements = buildPerfectHash(sorted(values))
+
+    with manifest.openOutput(tablePath) as f:
+        print(copyright, file=f)
+        print(tablePre.format(count=len(slots)), file=f)
+        print(tableStrings, file=f)
+        for value in slots:
+            print('        "{0}",'.format(value), file=f)
+        print(tableDisplacements, file=f)
+        for i in range(0, len(displacements), 16):
+            print("        " + " ".join("{0},".format(d) for d in displacements[i:i + 16]), file=f)
+        print(tablePost, file=f)
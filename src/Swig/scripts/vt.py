@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from pxr import Sdf
-
-values = Sdf.ValueTypeNames.__dict__
+import os
+import manifest
 
 castFromPre = "%typemap(cscode) VtValue %{"
 castFrom = """
@@ -75,8 +74,609 @@ typedef {cppTypeName} {typeName};
 """
 arrayDeclPost = ""
 
+#
+# Arrays of POD types additionally expose their storage, so the data can be consumed in place
+# rather than copied into a managed array first. The C# members use %proxycode: a cscode typemap
+# on VtArray<T> would replace the one of VtArray, which declares the indexer.
+#
+podArrayDecl = """%extend VtArray<{scalarType}> {{
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csout, excode=SWIGEXCODE) void* {{
+    System.IntPtr ret = $imcall;$excode
+    return ret;
+  }}
+  static size_t GetElementSize() {{
+    return sizeof({scalarType});
+  }}
+  void* GetDataPointer() {{
+    return self->data();
+  }}
+  void* GetConstDataPointer() {{
+    return (void*)self->cdata();
+  }}
+  %proxycode %{{
+#if UNITY_2021_2_OR_NEWER
+  /// <summary>
+  /// Returns a read-only view of the array storage, reinterpreted as T. T must match the
+  /// memory layout of the element type, e.g. UnityEngine.Vector3 for GfVec3f. The view is only
+  /// valid while this array is alive and is not resized.
+  /// </summary>
+  public unsafe System.ReadOnlySpan<T> AsReadOnlySpan<T>() where T : unmanaged {{
+    return new System.ReadOnlySpan<T>(GetConstDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }}
+
+  /// <summary>
+  /// Returns a writable view of the array storage, reinterpreted as T. If the storage is shared
+  /// with another array, it is detached (copied) first, as with any other write.
+  /// </summary>
+  public unsafe System.Span<T> AsSpan<T>() where T : unmanaged {{
+    return new System.Span<T>(GetDataPointer().ToPointer(), GetViewLength(sizeof(T)));
+  }}
+
+  int GetViewLength(int viewElementSize) {{
+    long byteLength = (long)size() * GetElementSize();
+    if (byteLength % viewElementSize != 0) {{
+      throw new System.ArgumentException("Array of " + byteLength + " bytes cannot be viewed as elements of "
+                                         + viewElementSize + " bytes");
+    }}
+    return (int)(byteLength / viewElementSize);
+  }}
+#endif
+  %}}
+}}
+"""
+
+#
+# Arrays of vector, matrix and quaternion elements are converted in bulk to and from flat arrays of
+# float components, which match the layout of the Unity types (Vector3, Matrix4x4, Quaternion...).
+# When the components are already float, the copy is a plain memcpy. Matrices are copied row by
+# row, which is the column-major layout Unity uses for the transposed matrix; quaternions are
+# copied as [i0, i1, i2, real].
+#
+componentArrayPre = """%{
+inline unsigned char Vt_FloatToUnorm8(float x) {
+  x = x < 0.0f ? 0.0f : (x > 1.0f ? 1.0f : x);
+  return static_cast<unsigned char>(x * 255.0f + 0.5f);
+}
+%}
+"""
+componentArrayDecl = """%extend VtArray<{scalarType}> {{
+  %typemap(ctype)  void* "void *"
+  %typemap(imtype) void* "System.IntPtr"
+  %typemap(cstype) void* "System.IntPtr"
+  %typemap(csin)   void* "$csinput"
+  static size_t GetComponentCount() {{
+    return {count};
+  }}
+  void CopyToFloatArray(void* dest) {{
+{copyTo}
+  }}
+  void CopyFromFloatArray(void* src) {{
+{copyFrom}
+  }}{unorm8}
+}}
+"""
+componentMemcpyTo = """    memcpy(dest, self->cdata(), self->size() * sizeof({scalarType}));"""
+componentMemcpyFrom = """    memcpy(self->data(), src, self->size() * sizeof({scalarType}));"""
+componentCopyTo = """    float* d = static_cast<float*>(dest);
+    {scalarType} const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {{
+      {component} const* c = s[i].data();
+      for (size_t k = 0; k < {count}; k++) {{
+        d[i * {count} + k] = static_cast<float>(c[k]);
+      }}
+    }}"""
+componentCopyFrom = """    float const* s = static_cast<float const*>(src);
+    {scalarType}* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {{
+      {component}* c = d[i].data();
+      for (size_t k = 0; k < {count}; k++) {{
+        c[k] = static_cast<{component}>(s[i * {count} + k]);
+      }}
+    }}"""
+quatCopyTo = """    float* d = static_cast<float*>(dest);
+    {scalarType} const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {{
+      {imaginary} const& im = s[i].GetImaginary();
+      d[i * 4 + 0] = static_cast<float>(im[0]);
+      d[i * 4 + 1] = static_cast<float>(im[1]);
+      d[i * 4 + 2] = static_cast<float>(im[2]);
+      d[i * 4 + 3] = static_cast<float>(s[i].GetReal());
+    }}"""
+quatCopyFrom = """    float const* s = static_cast<float const*>(src);
+    {scalarType}* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {{
+      float const* q = s + i * 4;
+      d[i] = {scalarType}(static_cast<{component}>(q[3]),
+                          {imaginary}(static_cast<{component}>(q[0]),
+                                      static_cast<{component}>(q[1]),
+                                      static_cast<{component}>(q[2])));
+    }}"""
+# Four component vectors are also converted to and from 8 bit unsigned normalized components, the
+# layout of UnityEngine.Color32.
+unorm8Decl = """
+  void CopyToUnorm8Array(void* dest) {{
+    unsigned char* d = static_cast<unsigned char*>(dest);
+    {scalarType} const* s = self->cdata();
+    for (size_t i = 0; i < self->size(); i++) {{
+      {component} const* c = s[i].data();
+      for (size_t k = 0; k < {count}; k++) {{
+        d[i * {count} + k] = Vt_FloatToUnorm8(static_cast<float>(c[k]));
+      }}
+    }}
+  }}
+  void CopyFromUnorm8Array(void* src) {{
+    unsigned char const* s = static_cast<unsigned char const*>(src);
+    {scalarType}* d = self->data();
+    for (size_t i = 0; i < self->size(); i++) {{
+      {component}* c = d[i].data();
+      for (size_t k = 0; k < {count}; k++) {{
+        c[k] = static_cast<{component}>(s[i * {count} + k] / 255.0f);
+      }}
+    }}
+  }}"""
+
+componentTypes = {"d": "double", "f": "float", "h": "GfHalf", "i": "int"}
+
+#
+# The component registry exposes the bulk conversions above by VtArray type, so that generic code
+# can convert any of them without knowing the concrete proxy class.
+#
+componentRegistryPre = """
+using System;
+using System.Collections.Generic;
+using System.Runtime.InteropServices;
+using pxr;
+
+/// <summary>
+/// Bulk conversions between VtArrays of vector, matrix and quaternion elements and managed arrays
+/// of structs made of float components, e.g. VtVec3fArray and UnityEngine.Vector3[].
+/// </summary>
+public static class VtComponentArrays
+{
+    class Converter
+    {
+        public uint ComponentCount;
+        public Func<Vt_ArrayBase, uint> Size;
+        public Action<Vt_ArrayBase, uint> Resize;
+        public Action<Vt_ArrayBase, IntPtr> CopyTo;
+        public Action<Vt_ArrayBase, IntPtr> CopyFrom;
+    }
+
+    static Dictionary<Type, Converter> sm_converters = new Dictionary<Type, Converter>();
+
+    /// <summary>
+    /// Returns the number of float components of each element of the given VtArray type, or zero
+    /// if the type has no bulk conversion.
+    /// </summary>
+    public static uint GetComponentCount(Type vtArrayType)
+    {
+        Converter converter;
+        return sm_converters.TryGetValue(vtArrayType, out converter) ? converter.ComponentCount : 0;
+    }
+
+    /// <summary>
+    /// Copies the elements of the array into output, converting each component to float. T must be
+    /// a struct of GetComponentCount() floats, the output array is reallocated if its length does
+    /// not match the size of the input.
+    /// </summary>
+    public static void CopyToArray<T>(Vt_ArrayBase input, ref T[] output) where T : struct
+    {
+        Converter converter = GetConverter(input, typeof(T));
+        uint size = converter.Size(input);
+        if (output == null || output.Length != size)
+        {
+            output = new T[size];
+        }
+        var handle = GCHandle.Alloc(output, GCHandleType.Pinned);
+        try
+        {
+            converter.CopyTo(input, handle.AddrOfPinnedObject());
+        }
+        finally
+        {
+            handle.Free();
+        }
+    }
+
+    /// <summary>
+    /// Copies the elements of input into the array, converting each component from float. T must
+    /// be a struct of GetComponentCount() floats, the array is resized to the length of the input.
+    /// </summary>
+    public static void CopyFromArray<T>(Vt_ArrayBase output, T[] input) where T : struct
+    {
+        Converter converter = GetConverter(output, typeof(T));
+        converter.Resize(output, (uint)input.Length);
+        var handle = GCHandle.Alloc(input, GCHandleType.Pinned);
+        try
+        {
+            converter.CopyFrom(output, handle.AddrOfPinnedObject());
+        }
+        finally
+        {
+            handle.Free();
+        }
+    }
+
+    static Converter GetConverter(Vt_ArrayBase array, Type elementType)
+    {
+        Converter converter;
+        if (!sm_converters.TryGetValue(array.GetType(), out converter))
+        {
+            throw new ArgumentException("No bulk conversion for " + array.GetType().Name);
+        }
+        if (Marshal.SizeOf(elementType) != converter.ComponentCount * sizeof(float))
+        {
+            throw new ArgumentException(elementType.Name + " does not have the layout of "
+                + converter.ComponentCount + " floats required by " + array.GetType().Name);
+        }
+        return converter;
+    }
+
+    static void Register<T>(uint componentCount,
+        Func<T, uint> size,
+        Action<T, uint> resize,
+        Action<T, IntPtr> copyTo,
+        Action<T, IntPtr> copyFrom) where T : Vt_ArrayBase
+    {
+        sm_converters[typeof(T)] = new Converter
+        {
+            ComponentCount = componentCount,
+            Size = (array) => size((T)array),
+            Resize = (array, n) => resize((T)array, n),
+            CopyTo = (array, dest) => copyTo((T)array, dest),
+            CopyFrom = (array, src) => copyFrom((T)array, src),
+        };
+    }
+
+    static VtComponentArrays()
+    {"""
+componentRegistry = """        Register<{typeName}>({count}, (a) => a.size(), (a, n) => a.resize(n),
+            (a, p) => a.CopyToFloatArray(p), (a, p) => a.CopyFromFloatArray(p));"""
+componentRegistryPost = """    }
+}"""
+
+def getComponentInfo(scalarType):
+    """Returns the (component type, component count, kind) of a Gf vector, matrix or quaternion
+    type, or None for any other type."""
+    for kind in ["Vec", "Matrix", "Quat"]:
+        prefix = "Gf" + kind
+        if not scalarType.startswith(prefix):
+            continue
+        rest = scalarType[len(prefix):]
+        component = componentTypes.get(rest[-1:])
+        if component is None:
+            return None
+        if kind == "Quat":
+            return component, 4, kind
+        if not rest[:-1].isdigit():
+            return None
+        n = int(rest[:-1])
+        return component, n * n if kind == "Matrix" else n, kind
+    return None
+
+def genComponentArrayDecl(scalarType):
+    component, count, kind = getComponentInfo(scalarType)
+    args = {"scalarType": scalarType, "component": component, "count": count,
+            "imaginary": "GfVec3" + scalarType[-1]}
+    if kind == "Quat":
+        copyTo, copyFrom = quatCopyTo, quatCopyFrom
+    elif component == "float":
+        copyTo, copyFrom = componentMemcpyTo, componentMemcpyFrom
+    else:
+        copyTo, copyFrom = componentCopyTo, componentCopyFrom
+    unorm8 = ""
+    if kind == "Vec" and component != "int" and count == 4:
+        unorm8 = unorm8Decl.format(**args)
+    return componentArrayDecl.format(scalarType=scalarType, count=count,
+                                     copyTo=copyTo.format(**args),
+                                     copyFrom=copyFrom.format(**args),
+                                     unorm8=unorm8)
+
 valueCtor = "%template(VtValue) VtValue::VtValue<{typeName}>;"
 
+#
+# The converter registry maps C# types and SdfValueTypeNames to the strongly typed VtValueTo*
+# accessors above, so the serialization layer never needs to find them via reflection.
+#
+registryPre = """
+using System;
+using System.Collections.Generic;
+using pxr;
+
+/// <summary>
+/// Strongly typed VtValueTo* accessors, indexed by C# type and by SdfValueTypeName.
+/// </summary>
+public static class VtValueConverters
+{
+    static Dictionary<Type, Delegate> sm_toCs = new Dictionary<Type, Delegate>();
+    static Dictionary<Type, Delegate> sm_copyToCs = new Dictionary<Type, Delegate>();
+    static Dictionary<Type, Func<VtValue, object>> sm_toObject = new Dictionary<Type, Func<VtValue, object>>();
+    static Dictionary<Type, Action<VtValue, object>> sm_copyToObject = new Dictionary<Type, Action<VtValue, object>>();
+
+    // Built on first use, since it touches every member of SdfValueTypeNames.
+    static Dictionary<string, Type> sm_sdfTypes;
+
+    /// <summary>
+    /// Returns the VtValueTo{T} accessor, or null if T is not held by any Sdf value type.
+    /// </summary>
+    public static Func<VtValue, T> GetConverter<T>()
+    {
+        Delegate converter;
+        return sm_toCs.TryGetValue(typeof(T), out converter) ? (Func<VtValue, T>)converter : null;
+    }
+
+    /// <summary>
+    /// Returns the VtValueTo{T} accessor which copies into an existing object, or null if T is
+    /// a value type, string or is not held by any Sdf value type.
+    /// </summary>
+    public static Action<VtValue, T> GetCopyConverter<T>()
+    {
+        Delegate converter;
+        return sm_copyToCs.TryGetValue(typeof(T), out converter) ? (Action<VtValue, T>)converter : null;
+    }
+
+    /// <summary>
+    /// Returns the strongly typed copy accessor for the given type as an untyped delegate, which
+    /// is useful when the underlying method is required, or null if no accessor exists.
+    /// </summary>
+    public static Delegate GetCopyConverter(Type csType)
+    {
+        Delegate converter;
+        return sm_copyToCs.TryGetValue(csType, out converter) ? converter : null;
+    }
+
+    /// <summary>
+    /// Finds the accessor returning the given type, boxed as an object.
+    /// </summary>
+    public static bool TryGetConverter(Type csType, out Func<VtValue, object> converter)
+    {
+        return sm_toObject.TryGetValue(csType, out converter);
+    }
+
+    /// <summary>
+    /// Finds the accessor copying into an existing object of the given type.
+    /// </summary>
+    public static bool TryGetCopyConverter(Type csType, out Action<VtValue, object> converter)
+    {
+        return sm_copyToObject.TryGetValue(csType, out converter);
+    }
+
+    /// <summary>
+    /// Finds the C# type used to hold values of the given Sdf type, e.g. Point3f is held by GfVec3f.
+    /// </summary>
+    public static bool TryGetCsType(SdfValueTypeName sdfTypeName, out Type csType)
+    {
+        if (sm_sdfTypes == null)
+        {
+            var sdfTypes = new Dictionary<string, Type>();
+            RegisterSdfTypes(sdfTypes);
+            sm_sdfTypes = sdfTypes;
+        }
+        return sm_sdfTypes.TryGetValue(sdfTypeName.GetAsToken().ToString(), out csType);
+    }
+
+    static void Register<T>(Func<VtValue, T> toCs, Action<VtValue, T> copyToCs)
+    {
+        sm_toCs[typeof(T)] = toCs;
+        sm_toObject[typeof(T)] = (value) => toCs(value);
+        if (copyToCs != null)
+        {
+            sm_copyToCs[typeof(T)] = copyToCs;
+            sm_copyToObject[typeof(T)] = (value, output) => copyToCs(value, (T)output);
+        }
+    }
+
+    static void RegisterSdfType(Dictionary<string, Type> sdfTypes, SdfValueTypeName sdfTypeName, Type csType)
+    {
+        sdfTypes[sdfTypeName.GetAsToken().ToString()] = csType;
+    }
+
+    static VtValueConverters()
+    {"""
+registry = """        Register<{csTypeName}>(UsdCs.VtValueTo{csTypeName}, {copyToCs});"""
+registrySdfPre = """    }
+
+    static void RegisterSdfTypes(Dictionary<string, Type> sdfTypes)
+    {"""
+registrySdf = """        RegisterSdfType(sdfTypes, SdfValueTypeNames.{valueTypeName}, typeof({csTypeName}));"""
+registryPost = """    }
+}"""
+
+# C# types whose VtValueTo* output overload does not take a proxy object (ref params or
+# SWIGTYPE pointers), these cannot be registered as copy converters.
+csValueTypes = ["bool", "byte", "int", "uint", "long", "ulong", "float", "double", "string"]
+
+#
+# Batch readers fill a caller provided buffer with the values of many attributes at many times in a
+# single call, avoiding one round trip per attribute per time code. They are emitted for every
+# array type with elements which can be copied into unmanaged memory.
+#
+batchReaderPre = """
+%{
+#include <algorithm>
+#include <stdexcept>
+%}
+
+%typemap(ctype)  void* buffer "void *"
+%typemap(imtype) void* buffer "System.IntPtr"
+%typemap(cstype) void* buffer "System.IntPtr"
+%typemap(csin)   void* buffer "$csinput"
+%apply long long OUTPUT[] { long long* offsets }
+%apply int OUTPUT[] { int* lengths }
+
+%inline %{
+// This code manifests in UsdCs class.
+//
+// Every attribute is read at every time code, in attribute-major order. For the entry
+// i = attrIndex * times.size() + timeIndex, offsets[i] and lengths[i] give the position and number
+// of elements in the buffer, lengths[i] is -1 when the attribute has no value of this type.
+// offsets and lengths hold entryCapacity values, std::out_of_range is thrown when this is less
+// than attrs.size() * times.size(). Returns the number of elements required. Values which do not
+// fit within capacity are not written, so the caller can grow the buffer and read again.
+"""
+batchReader = """
+extern size_t UsdAttributeBatchGet{csTypeName}(
+    std::vector<UsdAttribute> const& attrs, std::vector<UsdTimeCode> const& times,
+    void* buffer, size_t capacity, long long* offsets, int* lengths, size_t entryCapacity) throw (std::out_of_range) {{
+  if (attrs.size() * times.size() > entryCapacity) {{
+    throw std::out_of_range("entryCapacity");
+  }}
+  {cppTypeName} value;
+  {scalarType}* dest = static_cast<{scalarType}*>(buffer);
+  size_t used = 0;
+  for (size_t a = 0; a < attrs.size(); a++) {{
+    for (size_t t = 0; t < times.size(); t++) {{
+      size_t i = a * times.size() + t;
+      offsets[i] = static_cast<long long>(used);
+      if (!attrs[a].Get(&value, times[t])) {{
+        lengths[i] = -1;
+        continue;
+      }}
+      lengths[i] = static_cast<int>(value.size());
+      if (used + value.size() <= capacity) {{
+        std::copy(value.cdata(), value.cdata() + value.size(), dest + used);
+      }}
+      used += value.size();
+    }}
+  }}
+  return used;
+}}"""
+batchReaderPost = """%}
+
+%clear void* buffer;
+%clear long long* offsets;
+%clear int* lengths;"""
+
+# Element types which own heap memory and so cannot be copied into a flat buffer.
+nonBlittableTypes = ["std::string", "TfToken", "SdfAssetPath"]
+
+# Size in bytes of the blittable element types, Gf types are sized from their components. The 64 bit
+# integers are named long on Linux.
+elementSizes = {"bool": 1, "unsigned char": 1, "GfHalf": 2, "int": 4, "unsigned int": 4, "float": 4,
+                "int64_t": 8, "uint64_t": 8, "long": 8, "unsigned long": 8, "double": 8, "SdfTimeCode": 8}
+
+def getElementSize(scalarType):
+    """Returns the size in bytes of a blittable element type, or None if it is unknown."""
+    info = getComponentInfo(scalarType)
+    if info is not None:
+        return info[1] * elementSizes[info[0]]
+    return elementSizes.get(scalarType)
+
+def isBlittable(ti):
+    """True if values of the type can be copied to and from a flat buffer. Types of unknown size,
+    e.g. added by a newer USD, are left to the VtValue conversions."""
+    return ti.scalarType not in nonBlittableTypes and getElementSize(ti.scalarType) is not None
+
+#
+# Typed writers set an attribute from values in (pinned) caller memory, constructing the VtArray or
+# value natively, so no VtValue or VtArray proxy is created per write. They are emitted for every
+# value type with blittable elements, along with a variant going through a sparse value writer.
+#
+typedWriterPre = """
+%{
+#include "pxr/usd/usdUtils/sparseValueWriter.h"
+%}
+
+%typemap(ctype)  void* data "void *"
+%typemap(imtype) void* data "System.IntPtr"
+%typemap(cstype) void* data "System.IntPtr"
+%typemap(csin)   void* data "$csinput"
+
+%inline %{
+// This code manifests in UsdCs class.
+//
+// data points to count elements with the layout of the C++ element type, scalar values are only
+// written when count is 1. The sparse variants skip values equal to the previous time sample.
+"""
+typedArrayWriter = """
+extern bool UsdAttributeSet{csTypeName}(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {{
+  const {scalarType}* src = static_cast<const {scalarType}*>(data);
+  return attr.Set({cppTypeName}(src, src + count), time);
+}}
+extern bool UsdUtilsSparseValueWriterSet{csTypeName}(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {{
+  const {scalarType}* src = static_cast<const {scalarType}*>(data);
+  return writer.SetAttribute(attr, VtValue({cppTypeName}(src, src + count)), time);
+}}"""
+typedScalarWriter = """
+extern bool UsdAttributeSet{csTypeName}(UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {{
+  if (count != 1) {{
+    return false;
+  }}
+  return attr.Set(*static_cast<const {cppTypeName}*>(data), time);
+}}
+extern bool UsdUtilsSparseValueWriterSet{csTypeName}(UsdUtilsSparseValueWriter& writer, UsdAttribute const& attr, UsdTimeCode time, void* data, size_t count) {{
+  if (count != 1) {{
+    return false;
+  }}
+  return writer.SetAttribute(attr, VtValue(*static_cast<const {cppTypeName}*>(data)), time);
+}}"""
+typedWriterPost = """%}
+
+%clear void* data;"""
+
+typedWriterRegistryPre = """using System;
+using System.Collections.Generic;
+using pxr;
+
+/// <summary>
+/// Typed attribute setters, indexed by the C# type holding the USD value, e.g. VtVec3fArray. They
+/// write values straight from (pinned) memory with the layout of the C++ elements, rather than
+/// through a VtValue.
+/// </summary>
+public static class UsdAttributeWriters
+{
+    /// <summary>
+    /// Writes count elements read from data to the attribute at the given time. When sparseWriter
+    /// is not null, values equal to the previous time sample are skipped.
+    /// </summary>
+    public delegate bool Writer(UsdAttribute attr, UsdTimeCode time, IntPtr data, uint count,
+        UsdUtilsSparseValueWriter sparseWriter);
+
+    struct Entry
+    {
+        public Writer writer;
+        public uint elementSize;
+        public bool isArray;
+    }
+
+    static Dictionary<Type, Entry> sm_writers = new Dictionary<Type, Entry>();
+
+    /// <summary>
+    /// Finds the writer for the given type, along with the size in bytes of its elements and
+    /// whether it is an array type.
+    /// </summary>
+    public static bool TryGetWriter(Type vtType, out Writer writer, out uint elementSize, out bool isArray)
+    {
+        Entry entry;
+        bool found = sm_writers.TryGetValue(vtType, out entry);
+        writer = entry.writer;
+        elementSize = entry.elementSize;
+        isArray = entry.isArray;
+        return found;
+    }
+
+    static void Register<T>(Func<UsdAttribute, UsdTimeCode, IntPtr, uint, bool> set,
+        Func<UsdUtilsSparseValueWriter, UsdAttribute, UsdTimeCode, IntPtr, uint, bool> sparseSet,
+        uint elementSize, bool isArray)
+    {
+        var entry = new Entry();
+        entry.writer = (attr, time, data, count, sparseWriter) => sparseWriter == null
+            ? set(attr, time, data, count)
+            : sparseSet(sparseWriter, attr, time, data, count);
+        entry.elementSize = elementSize;
+        entry.isArray = isArray;
+        sm_writers[typeof(T)] = entry;
+    }
+
+    static UsdAttributeWriters()
+    {"""
+typedWriterRegistry = """        Register<{csTypeName}>(UsdCs.UsdAttributeSet{csTypeName}, UsdCs.UsdUtilsSparseValueWriterSet{csTypeName}, {elementSize}, {isArray});"""
+typedWriterRegistryPost = """    }
+}"""
+
 def translateTypeIds(tn):
     return tn.replace("__int64", "int64_t").replace(" ", "")
 
@@ -97,52 +697,61 @@ def translateCsTypes(tn):
               replace("pxr_half::half", "GfHalf").\
               replace("long long", "long")
 
-def genVtValue(basePath, copyright):
-    vtValueTypes = basePath + "vt/vtValue_Types.i"
-    vtValueCasts = basePath + "vt/vtValue_Casts.i"
-    vtValueAccessors = basePath + "vt/vtValue_Accessors.i"
-
-    vtArrayTypes = basePath + "vt/vtArray_Types.i"
+class typeInfo:
+    typeId = ""
+    cppTypeName = ""
+    csTypeName = ""
+    scalarType = ""
+    scalarTypeCs = ""
+    isPod = False
+    isArray = False
 
+def getTypeInfos(snapshot):
+    """Returns the type info for each C++ value type, keyed by type name, along with the
+    (SdfValueTypeName, typeInfo) pairs in Sdf registration order."""
     typeInfos = {}
-    class typeInfo:
-        typeId = ""
-        cppTypeName = ""
-        csTypeName = ""
-        scalarType = ""
-        scalarTypeCs = ""
-        isPod = False
-        isArray = False
-
-    for n in values:
-        if not isinstance(values[n], type(values["Token"])):
-            continue
+    sdfTypeNames = []
 
+    for vtn in snapshot["valueTypes"]:
         ti = typeInfo()
-        ti.isPod = values[n].fget().type.isPlainOldDataType
-        ti.isArray = values[n].fget().isArray
-        ti.scalarType = translateTypes(values[n].fget().scalarType.type.typeName)
-        ti.scalarTypeCs = translateCsTypes(values[n].fget().scalarType.type.typeName)
-        if values[n].fget().type.pythonClass is None:
-            tn = values[n].fget().type.typeName
+        # A VtArray is never POD itself, so arrays are classified by their elements.
+        ti.isPod = vtn["scalarIsPod"]
+        ti.isArray = vtn["isArray"]
+        ti.scalarType = translateTypes(vtn["scalarTypeName"])
+        ti.scalarTypeCs = translateCsTypes(vtn["scalarTypeName"])
+        if vtn["pythonClass"] is None:
+            tn = vtn["typeName"]
             ti.cppTypeName = translateTypes(tn)
             ti.csTypeName = translateCsTypes(tn)
         else:
-            module = values[n].fget().type.pythonClass.__module__
+            module, friendlyName = vtn["pythonClass"]
             module = module.replace("pxr.", "")
-            friendlyName = values[n].fget().type.pythonClass.__name__
             tn = module + friendlyName
-            ti.cppTypeName = translateTypes(values[n].fget().type.typeName)
+            ti.cppTypeName = translateTypes(vtn["typeName"])
             ti.csTypeName = translateCsTypes(tn)
         ti.typeId = translateTypeIds(tn)
         typeInfos[translateTypes(tn)] = ti
+        sdfTypeNames.append((vtn["name"], ti))
 
-    with open(vtValueTypes, "w") as f:
+    return typeInfos, sdfTypeNames
+
+def genVtValue(snapshot, basePath, usdInstPath, copyright):
+    vtValueTypes = basePath + "vt/vtValue_Types.i"
+    vtValueCasts = basePath + "vt/vtValue_Casts.i"
+    vtValueAccessors = basePath + "vt/vtValue_Accessors.i"
+
+    vtArrayTypes = basePath + "vt/vtArray_Types.i"
+    vtValueConverters = os.path.join(usdInstPath, "VtValueConverters.cs")
+    vtComponentArrays = os.path.join(usdInstPath, "VtComponentArrays.cs")
+
+    typeInfos, sdfTypeNames = getTypeInfos(snapshot)
+
+    with manifest.openOutput(vtValueTypes) as f:
         print(copyright, file=f)
         for tn in sorted(typeInfos.keys()):
             print(valueCtor.format(typeName=tn), file=f)
 
-    with open(vtValueCasts, "w") as f:
+    with manifest.openOutput(vtValueCasts) as f:
         print(copyright, file=f)
         print(castFromPre, file=f)
         for tn in sorted(typeInfos.keys()):
@@ -151,7 +760,7 @@ def genVtValue(basePath, copyright):
             print(castTo.format(csTypeName=typeInfos[tn].csTypeName), file=f)
         print(castToPost, file=f)
 
-    with open(vtValueAccessors, "w") as f:
+    with manifest.openOutput(vtValueAccessors) as f:
         print(copyright, file=f)
 
         for tn in sorted(typeInfos.keys()):
@@ -168,12 +777,83 @@ def genVtValue(basePath, copyright):
               print(accessor.format(typeName=tn, typeNameId=ti.typeId, csTypeName=ti.csTypeName), file=f)
         print(accessorPost, file=f)
 
-    with open(vtArrayTypes, "w") as f:
+    with manifest.openOutput(vtArrayTypes) as f:
         print(copyright, file=f)
         print(arrayDeclPre, file=f)
+        print(componentArrayPre, file=f)
         for tn in sorted(typeInfos.keys()):
             ti = typeInfos[tn]
             if not ti.isArray:
                 continue
+            if ti.isPod:
+                print(podArrayDecl.format(scalarType=ti.scalarType), file=f)
+            if getComponentInfo(ti.scalarType) is not None:
+                print(genComponentArrayDecl(ti.scalarType), file=f)
             print(arrayDecl.format(typeName=tn, cppTypeName=ti.cppTypeName, scalarType=ti.scalarType, scalarTypeCs=ti.scalarTypeCs), file=f)
         print(arrayDeclPost, file=f)
+
+    with manifest.openOutput(vtValueConverters) as f:
+        print(copyright, file=f)
+        print(registryPre, file=f)
+        for tn in sorted(typeInfos.keys()):
+            ti = typeInfos[tn]
+            copyToCs = "null"
+            if ti.csTypeName not in csValueTypes:
+                copyToCs = "UsdCs.VtValueTo" + ti.csTypeName
+            print(registry.format(csTypeName=ti.csTypeName, copyToCs=copyToCs), file=f)
+        print(registrySdfPre, file=f)
+        for n, ti in sdfTypeNames:
+            print(registrySdf.format(valueTypeName=n, csTypeName=ti.csTypeName), file=f)
+        print(registryPost, file=f)
+
+    with manifest.openOutput(vtComponentArrays) as f:
+        print(copyright, file=f)
+        print(componentRegistryPre, file=f)
+        for tn in sorted(typeInfos.keys()):
+            ti = typeInfos[tn]
+            info = getComponentInfo(ti.scalarType)
+            if not ti.isArray or info is None:
+                continue
+            print(componentRegistry.format(typeName=tn, count=info[1]), file=f)
+        print(componentRegistryPost, file=f)
+
+def genUsdAttributeTypedWriters(snapshot, usdPath, usdInstPath, copyright):
+    typedWriters = usdPath + "usd/usdAttribute_TypedWriters.i"
+    writerRegistry = os.path.join(usdInstPath, "UsdAttributeWriters.cs")
+
+    typeInfos, _ = getTypeInfos(snapshot)
+    blittable = [typeInfos[tn] for tn in sorted(typeInfos.keys()) if isBlittable(typeInfos[tn])]
+
+    with manifest.openOutput(typedWriters) as f:
+        print(copyright, file=f)
+        print(typedWriterPre, file=f)
+        for ti in blittable:
+            template = typedArrayWriter if ti.isArray else typedScalarWriter
+            print(template.format(csTypeName=ti.csTypeName, cppTypeName=ti.cppTypeName,
+                                  scalarType=ti.scalarType), file=f)
+        print(typedWriterPost, file=f)
+
+    with manifest.openOutput(writerRegistry) as f:
+        print(copyright, file=f)
+        print(typedWriterRegistryPre, file=f)
+        for ti in blittable:
+            print(typedWriterRegistry.format(csTypeName=ti.csTypeName,
+                                             elementSize=getElementSize(ti.scalarType),
+                                             isArray="true" if ti.isArray else "false"), file=f)
+        print(typedWriterRegistryPost, file=f)
+
+def genUsdAttributeBatchReaders(snapshot, usdPath, copyright):
+    batchReaders = usdPath + "usd/usdAttribute_BatchReaders.i"
+
+    typeInfos, _ = getTypeInfos(snapshot)
+
+    with manifest.openOutput(batchReaders) as f:
+        print(copyright, file=f)
+        print(batchReaderPre, file=f)
+        for tn in sorted(typeInfos.keys()):
+            ti = typeInfos[tn]
+            if not ti.isArray or not isBlittable(ti):
+                continue
+            print(batchReader.format(csTypeName=ti.csTypeName, cppTypeName=ti.cppTypeName,
+                                     scalarType=ti.scalarType), file=f)
+        print(batchReaderPost, file=f)